@@ -14,19 +14,33 @@ print(f"assembler.py: sys.path = {sys.path}")
 
 if __package__:
     print(f"assembler.py: Paket '{__package__}' olarak algılandı. Göreceli importlar deneniyor (.lexer vb.)...")
-    from .lexer import parse_line, LABEL_REGEX
-    from .m6800_opcodes import OPCODE_TABLE, ADDR_MODE_IMMEDIATE, ADDR_MODE_DIRECT, \
+    from .lexer import parse_line_fast, LABEL_REGEX
+    from .include import IncludeExpander, include_file_name
+    from .incbin import split_incbin_operand, default_binary_cache
+    from .m6800_opcodes import ADDR_MODE_IMMEDIATE, ADDR_MODE_DIRECT, \
                                ADDR_MODE_EXTENDED, ADDR_MODE_INDEXED, ADDR_MODE_RELATIVE, \
-                               ADDR_MODE_INHERENT, PSEUDO_OPS # PSEUDO_OPS buradan gelmeli
+                               ADDR_MODE_INHERENT, ENCODING_INDEX, MODE_INDEX
     from .symbol_table import SymbolTable
+    from .line_table import ListingEntry
+    from .memory_image import SegmentBuilder
+    from .expressions import compile_expression, compile_operand, ExpressionError, UndefinedSymbolError
+    from .diagnostics import Diagnostic, DiagnosticStore, PHASE_LEXER, PHASE_PASS1, PHASE_PASS2, \
+                             label_column, operand_column
     print("assembler.py: Göreceli importlar denendi.")
 else:
     print("assembler.py: Paket bilgisi yok. Doğrudan importlar deneniyor...")
-    from lexer import parse_line, LABEL_REGEX
-    from m6800_opcodes import OPCODE_TABLE, ADDR_MODE_IMMEDIATE, ADDR_MODE_DIRECT, \
+    from lexer import parse_line_fast, LABEL_REGEX
+    from include import IncludeExpander, include_file_name
+    from incbin import split_incbin_operand, default_binary_cache
+    from m6800_opcodes import ADDR_MODE_IMMEDIATE, ADDR_MODE_DIRECT, \
                                ADDR_MODE_EXTENDED, ADDR_MODE_INDEXED, ADDR_MODE_RELATIVE, \
-                               ADDR_MODE_INHERENT, PSEUDO_OPS
+                               ADDR_MODE_INHERENT, ENCODING_INDEX, MODE_INDEX
     from symbol_table import SymbolTable
+    from line_table import ListingEntry
+    from memory_image import SegmentBuilder
+    from expressions import compile_expression, compile_operand, ExpressionError, UndefinedSymbolError
+    from diagnostics import Diagnostic, DiagnosticStore, PHASE_LEXER, PHASE_PASS1, PHASE_PASS2, \
+                            label_column, operand_column
     print("assembler.py: Doğrudan importlar tamamlandı.")
 
 # --- Sabitler ve Regex'ler ---
@@ -53,403 +67,532 @@ def is_label_like(operand_str):
            LABEL_REGEX.match(operand_str)
 
 def determine_addressing_mode_and_size(mnemonic, operand_str, symbol_table=None, current_lc_for_pass1=0):
-    # Bu fonksiyon bir önceki versiyonunuzdaki gibi kalabilir.
-    # ... (fonksiyon içeriği öncekiyle aynı) ...
-    if mnemonic not in OPCODE_TABLE:
+    # Boyutlar MODE_INDEX'ten (derlenmiş tamsayı indeksi) okunur; satır başına
+    # int(...) dönüşümü yapılmaz. Dönüş: (mod, boyut, hata_mesajı)
+    modes = MODE_INDEX.get(mnemonic)
+    if modes is None:
         return None, 0, f"Bilinmeyen komut: {mnemonic}"
-    op_details_for_mnemonic = OPCODE_TABLE[mnemonic]
     if operand_str is None:
-        if ADDR_MODE_INHERENT in op_details_for_mnemonic:
-            return ADDR_MODE_INHERENT, int(op_details_for_mnemonic[ADDR_MODE_INHERENT][1]), None
+        if ADDR_MODE_INHERENT in modes:
+            return ADDR_MODE_INHERENT, modes[ADDR_MODE_INHERENT][1], None
         else:
             return None, 0, f"'{mnemonic}' komutu operandsız kullanılamaz."
+    try:
+        # Operand burada bir kez derlenir; Pass 2 önbellekteki derlenmiş hali değerlendirir.
+        expression = compile_operand(operand_str)
+    except ExpressionError:
+        expression = None # Hata mesajı Pass 2'de üretilir
     if IMM_REGEX.match(operand_str):
-        if ADDR_MODE_IMMEDIATE in op_details_for_mnemonic:
-            return ADDR_MODE_IMMEDIATE, int(op_details_for_mnemonic[ADDR_MODE_IMMEDIATE][1]), None
+        if ADDR_MODE_IMMEDIATE in modes:
+            return ADDR_MODE_IMMEDIATE, modes[ADDR_MODE_IMMEDIATE][1], None
         else:
             return None, 0, f"'{mnemonic}' komutu Immediate adresleme modunu desteklemiyor: {operand_str}"
     indexed_match = IND_REGEX.match(operand_str)
     if indexed_match:
-        if ADDR_MODE_INDEXED in op_details_for_mnemonic:
-            return ADDR_MODE_INDEXED, int(op_details_for_mnemonic[ADDR_MODE_INDEXED][1]), None
+        if ADDR_MODE_INDEXED in modes:
+            return ADDR_MODE_INDEXED, modes[ADDR_MODE_INDEXED][1], None
         else:
             return None, 0, f"'{mnemonic}' komutu Indexed adresleme modunu desteklemiyor: {operand_str}"
     if mnemonic in RELATIVE_MNEMONICS:
-        if ADDR_MODE_RELATIVE in op_details_for_mnemonic:
-            return ADDR_MODE_RELATIVE, int(op_details_for_mnemonic[ADDR_MODE_RELATIVE][1]), None
+        if ADDR_MODE_RELATIVE in modes:
+            return ADDR_MODE_RELATIVE, modes[ADDR_MODE_RELATIVE][1], None
         else:
             return None, 0, f"'{mnemonic}' için Relative adresleme tanımı bulunamadı."
     if HEX_REGEX.match(operand_str):
         hex_val_str = operand_str[1:]
         try:
             value = int(hex_val_str, 16)
-            if ADDR_MODE_DIRECT in op_details_for_mnemonic and 0 <= value <= 0xFF:
-                return ADDR_MODE_DIRECT, int(op_details_for_mnemonic[ADDR_MODE_DIRECT][1]), None
-            elif ADDR_MODE_EXTENDED in op_details_for_mnemonic and 0 <= value <= 0xFFFF:
-                return ADDR_MODE_EXTENDED, int(op_details_for_mnemonic[ADDR_MODE_EXTENDED][1]), None
+            if ADDR_MODE_DIRECT in modes and 0 <= value <= 0xFF:
+                return ADDR_MODE_DIRECT, modes[ADDR_MODE_DIRECT][1], None
+            elif ADDR_MODE_EXTENDED in modes and 0 <= value <= 0xFFFF:
+                return ADDR_MODE_EXTENDED, modes[ADDR_MODE_EXTENDED][1], None
         except ValueError: pass
     is_potentially_label = is_label_like(operand_str)
     if is_potentially_label:
-        if ADDR_MODE_EXTENDED in op_details_for_mnemonic:
-            return ADDR_MODE_EXTENDED, int(op_details_for_mnemonic[ADDR_MODE_EXTENDED][1]), None
-        elif ADDR_MODE_DIRECT in op_details_for_mnemonic:
-            return ADDR_MODE_DIRECT, int(op_details_for_mnemonic[ADDR_MODE_DIRECT][1]), None
+        if ADDR_MODE_EXTENDED in modes:
+            return ADDR_MODE_EXTENDED, modes[ADDR_MODE_EXTENDED][1], None
+        elif ADDR_MODE_DIRECT in modes:
+            return ADDR_MODE_DIRECT, modes[ADDR_MODE_DIRECT][1], None
     elif DEC_REGEX.match(operand_str):
         try:
             value = int(operand_str)
-            if ADDR_MODE_DIRECT in op_details_for_mnemonic and 0 <= value <= 0xFF:
-                return ADDR_MODE_DIRECT, int(op_details_for_mnemonic[ADDR_MODE_DIRECT][1]), None
-            elif ADDR_MODE_EXTENDED in op_details_for_mnemonic and 0 <= value <= 0xFFFF:
-                return ADDR_MODE_EXTENDED, int(op_details_for_mnemonic[ADDR_MODE_EXTENDED][1]), None
+            if ADDR_MODE_DIRECT in modes and 0 <= value <= 0xFF:
+                return ADDR_MODE_DIRECT, modes[ADDR_MODE_DIRECT][1], None
+            elif ADDR_MODE_EXTENDED in modes and 0 <= value <= 0xFFFF:
+                return ADDR_MODE_EXTENDED, modes[ADDR_MODE_EXTENDED][1], None
         except ValueError: pass
-    if ADDR_MODE_EXTENDED in op_details_for_mnemonic:
-        return ADDR_MODE_EXTENDED, int(op_details_for_mnemonic[ADDR_MODE_EXTENDED][1]), None
-    elif ADDR_MODE_DIRECT in op_details_for_mnemonic:
-        return ADDR_MODE_DIRECT, int(op_details_for_mnemonic[ADDR_MODE_DIRECT][1]), None
+    elif expression is not None and (expression.byte_sized or expression.constant is not None):
+        # Sabit ifadeler ve '<'/'>' ile 8-bit'e indirgenen ifadeler sembol değerinden bağımsız boyutlanır.
+        value = 0 if expression.byte_sized else expression.constant
+        if ADDR_MODE_DIRECT in modes and 0 <= value <= 0xFF:
+            return ADDR_MODE_DIRECT, modes[ADDR_MODE_DIRECT][1], None
+        elif ADDR_MODE_EXTENDED in modes and 0 <= value <= 0xFFFF:
+            return ADDR_MODE_EXTENDED, modes[ADDR_MODE_EXTENDED][1], None
+    if ADDR_MODE_EXTENDED in modes:
+        return ADDR_MODE_EXTENDED, modes[ADDR_MODE_EXTENDED][1], None
+    elif ADDR_MODE_DIRECT in modes:
+        return ADDR_MODE_DIRECT, modes[ADDR_MODE_DIRECT][1], None
     return None, 0, f"'{mnemonic}' için operand '{operand_str}' ile uygun adresleme modu bulunamadı veya desteklenmiyor."
 
 
-def parse_operand_for_equ(operand_str, symbol_table, line_num): # RMB için de kullanılacak, mesajı güncelleyelim
+def parse_operand_for_equ(operand_str, symbol_table, location, location_counter=None): # RMB için de kullanılacak, mesajı güncelleyelim
+    # location: mesajların başındaki satır konumu (LineRecord.location, örn. "Satır 7" veya "e.inc:3")
     if operand_str is None:
-        return None, f"Satır {line_num}: EQU/ORG/RMB için operand eksik."
-    operand_str = operand_str.strip()
-    if HEX_REGEX.match(operand_str): return int(operand_str[1:], 16), None
-    elif BIN_REGEX.match(operand_str): return int(operand_str[1:], 2), None
-    elif DEC_REGEX.match(operand_str): return int(operand_str), None
-    elif is_label_like(operand_str):
-        if symbol_table:
-            value = symbol_table.get_symbol_value(operand_str.upper())
-            if value is not None: return value, None
-            else: return None, f"Satır {line_num}: EQU/ORG/RMB için tanımsız etiket referansı: {operand_str}"
-        else: return None, f"Satır {line_num}: EQU/ORG/RMB etiketi için sembol tablosu eksik: {operand_str}"
-    else: return None, f"Satır {line_num}: EQU/ORG/RMB için geçersiz değer: {operand_str}"
+        return None, f"{location}: EQU/ORG/RMB için operand eksik."
+    try:
+        return compile_expression(operand_str).evaluate(symbol_table, location_counter), None
+    except UndefinedSymbolError as e:
+        return None, f"{location}: EQU/ORG/RMB için tanımsız etiket referansı: {e.name}"
+    except ExpressionError:
+        return None, f"{location}: EQU/ORG/RMB için geçersiz değer: {operand_str.strip()}"
 
 # --- Birinci Geçiş (Pass 1) ---
-def pass_one(source_lines):
-    symbol_table = SymbolTable()
-    processed_lines_data = []
-    errors = []
-    location_counter = 0
-
-    for i, line_text in enumerate(source_lines):
-        parsed_line_info = parse_line(i + 1, line_text)
-
-        current_line_data = {
-            **parsed_line_info,
-            "address": location_counter,
-            "size": 0,
-            "addressing_mode": None,
-        }
-
-        if parsed_line_info.get("error"): # Lexer'dan hata geldiyse
-            # Hata mesajını errors listesine ekle
-            formatted_lexer_error = f"Satır {current_line_data['line_num']} (Lexer): {parsed_line_info['error']}"
-            if formatted_lexer_error not in errors:
-                errors.append(formatted_lexer_error)
-            # current_line_data['error'] zaten parsed_line_info'dan kopyalandı.
-            processed_lines_data.append(current_line_data)
-            continue # Bu satır için başka işlem yapma
-
-        if not current_line_data["label"] and not current_line_data["mnemonic"]: # Boş veya sadece yorum
-            processed_lines_data.append(current_line_data)
-            continue
-
-        # Etiket Tanımlama (EQU ve RMB hariç)
-        if current_line_data["label"]:
-            label_name_upper = current_line_data["label"].upper()
-            is_equ_or_rmb = current_line_data["mnemonic"] and current_line_data["mnemonic"].upper() in ["EQU", "RMB"]
-            if not is_equ_or_rmb:
-                try:
-                    symbol_table.add_symbol(label_name_upper, location_counter, current_line_data["line_num"])
-                except ValueError as e:
-                    err_msg = str(e)
-                    errors.append(err_msg)
-                    current_line_data["error"] = err_msg
-                    # print(f"DEBUG P1 (Normal Etiket): Tekrarlayan etiket: {err_msg}")
-
-        # Mnemonic İşleme (Eğer hata yoksa)
-        if current_line_data["mnemonic"] and not current_line_data.get("error"):
-            mnemonic_upper = current_line_data["mnemonic"].upper()
-
-            if mnemonic_upper == "ORG":
-                if current_line_data["operand_str"]:
-                    try:
-                        val, err = parse_operand_for_equ(current_line_data["operand_str"], symbol_table, current_line_data["line_num"])
-                        if err: raise ValueError(err)
-                        location_counter = val
-                        current_line_data["address"] = location_counter
-                    except ValueError as e:
-                        err_msg = f"Satır {current_line_data['line_num']}: ORG - {e}"
-                        errors.append(err_msg); current_line_data["error"] = err_msg
+def _pass1_error(errors, record, code, message, *args, column=None):
+    """Pass 1 hatasını hem hata listesine hem satır kaydına aynı Diagnostic olarak yazar."""
+    diagnostic = Diagnostic(message, code, record.line_num, PHASE_PASS1, column=column, args=args)
+    errors.append(diagnostic)
+    record.error = diagnostic
+    return diagnostic
+
+
+def _incbin_data(record, symbol_table, location_counter):
+    """
+    INCBIN satırının byte'ları: dosyanın mmap'i üzerinde [başlangıç, başlangıç+uzunluk) dilimi.
+    Başlangıç ve uzunluk RMB gibi önceden tanımlı sembollerle yazılmalıdır.
+
+    Returns:
+        tuple: (memoryview, None) veya (None, (hata_kodu, mesaj, argüman))
+    """
+    location = record.location
+    try:
+        name, arguments = split_incbin_operand(record.operand_str)
+    except ValueError as e:
+        return None, ("INVALID_STRING", f"{location}: INCBIN - {e}", record.operand_str)
+    values = []
+    for argument in arguments:
+        value, err = parse_operand_for_equ(argument, symbol_table, location, location_counter)
+        if err:
+            return None, ("INVALID_VALUE", err, argument)
+        if not isinstance(value, int) or value < 0:
+            return None, ("INVALID_VALUE", f"{location}: INCBIN için geçersiz başlangıç/uzunluk: {argument}", argument)
+        values.append(value)
+    try:
+        data = default_binary_cache.data(record.file_path or os.path.abspath(name))
+    except OSError as e:
+        return None, ("INCBIN", f"{location}: INCBIN - '{name}' açılamadı: {e.strerror or e}", name)
+    start = values[0] if values else 0
+    length = values[1] if len(values) > 1 else max(len(data) - start, 0)
+    if start + length > len(data):
+        return None, ("INCBIN", f"{location}: INCBIN - '{name}' ({len(data)} byte) için aralık dışı: "
+                                f"başlangıç {start}, uzunluk {length}.", name)
+    return data[start:start + length], None
+
+
+def process_line_pass1(line_num, line_text, symbol_table, location_counter, errors, parsed_line_info=None):
+    """
+    Tek bir kaynak satırını Pass 1 kurallarıyla işler: lexer, etiket tanımı,
+    pseudo-op'lar ve adresleme modu/boyut belirleme.
+
+    Args:
+        line_num (int): Satır numarası (1'den başlar).
+        line_text (str): Ham kaynak satırı.
+        symbol_table (SymbolTable): Etiketlerin ekleneceği sembol tablosu.
+        location_counter (int): Satırın başındaki adres sayacı.
+        errors (DiagnosticStore | list): Pass 1 hatalarının (Diagnostic) ekleneceği koleksiyon.
+        parsed_line_info (LineRecord, optional): Satırın önceden lexer'dan geçirilmiş hali.
+            Verilirse lexer tekrar çağrılmaz (artımlı assemble için). Kayıt yerinde
+            güncellenir; önbellekteki bir kayıt verilecekse kopyası (replace()) verilmelidir.
+
+    Returns:
+        tuple: (satır_kaydı (LineRecord), yeni_adres_sayacı, end_mi)
+    """
+    if parsed_line_info is None:
+        parsed_line_info = parse_line_fast(line_num, line_text)
+
+    # Lexer'ın ürettiği kayıt kopyalanmadan Pass 1 alanlarıyla doldurulur.
+    current_line_data = parsed_line_info
+    current_line_data.address = location_counter
+    current_line_data.size = 0
+    current_line_data.addressing_mode = None
+
+    if isinstance(parsed_line_info.error, Diagnostic): # INCLUDE dosyası eklenemedi (bkz. include.py)
+        errors.append(parsed_line_info.error)
+        return current_line_data, location_counter, False
+
+    if parsed_line_info.error: # Lexer'dan hata geldiyse
+        # Hata mesajını errors listesine ekle (listeleme girdisi lexer'ın mesajını olduğu gibi gösterir)
+        line_num = current_line_data.line_num
+        lexer_error = parsed_line_info.error
+        errors.append(Diagnostic(f"{current_line_data.location} (Lexer): {lexer_error}", "LEXER", line_num, PHASE_LEXER,
+                                 args=(lexer_error,)))
+        current_line_data.error = Diagnostic(lexer_error, "LEXER", line_num, PHASE_LEXER, args=(lexer_error,))
+        return current_line_data, location_counter, False # Bu satır için başka işlem yapma
+
+    if not current_line_data.label and not current_line_data.mnemonic: # Boş veya sadece yorum
+        return current_line_data, location_counter, False
+
+    # Etiket Tanımlama (EQU ve RMB hariç)
+    if current_line_data.label:
+        label_name_upper = current_line_data.label.upper()
+        is_equ_or_rmb = current_line_data.mnemonic and current_line_data.mnemonic.upper() in ["EQU", "RMB"]
+        if not is_equ_or_rmb:
+            try:
+                symbol_table.add_symbol(label_name_upper, location_counter, current_line_data.line_num, current_line_data.source)
+            except ValueError as e:
+                _pass1_error(errors, current_line_data, "DUPLICATE_LABEL", str(e), label_name_upper,
+                             column=label_column(current_line_data))
+                # print(f"DEBUG P1 (Normal Etiket): Tekrarlayan etiket: {err_msg}")
+
+    # Mnemonic İşleme (Eğer hata yoksa)
+    if current_line_data.mnemonic and not current_line_data.error:
+        mnemonic_upper = current_line_data.mnemonic.upper()
+
+        if mnemonic_upper == "ORG":
+            if current_line_data.operand_str:
+                val, err = parse_operand_for_equ(current_line_data.operand_str, symbol_table, current_line_data.location, location_counter)
+                if err:
+                    _pass1_error(errors, current_line_data, "INVALID_VALUE", f"{current_line_data.location}: ORG - {err}",
+                                 current_line_data.operand_str, column=operand_column(current_line_data))
                 else:
-                    err_msg = f"Satır {current_line_data['line_num']}: ORG için operand eksik."
-                    errors.append(err_msg); current_line_data["error"] = err_msg
-                current_line_data["size"] = 0
-
-            elif mnemonic_upper == "EQU":
-                if not current_line_data["label"]:
-                    err_msg = f"Satır {current_line_data['line_num']}: EQU için etiket eksik."
-                    errors.append(err_msg); current_line_data["error"] = err_msg
-                elif not current_line_data["operand_str"]:
-                    err_msg = f"Satır {current_line_data['line_num']}: EQU için değer eksik."
-                    errors.append(err_msg); current_line_data["error"] = err_msg
+                    location_counter = val
+                    current_line_data.address = location_counter
+            else:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: ORG için operand eksik.", "ORG")
+            current_line_data.size = 0
+
+        elif mnemonic_upper == "EQU":
+            if not current_line_data.label:
+                _pass1_error(errors, current_line_data, "MISSING_LABEL",
+                             f"{current_line_data.location}: EQU için etiket eksik.", "EQU")
+            elif not current_line_data.operand_str:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: EQU için değer eksik.", "EQU")
+            else:
+                value, err_equ = parse_operand_for_equ(current_line_data.operand_str, symbol_table, current_line_data.location, location_counter)
+                if err_equ:
+                    _pass1_error(errors, current_line_data, "INVALID_VALUE", err_equ, current_line_data.operand_str,
+                                 column=operand_column(current_line_data))
                 else:
                     try:
-                        value, err_equ = parse_operand_for_equ(current_line_data["operand_str"], symbol_table, current_line_data["line_num"])
-                        if err_equ: raise ValueError(err_equ)
-                        symbol_table.add_symbol(current_line_data["label"].upper(), value, current_line_data["line_num"])
-                        current_line_data["address"] = None
+                        symbol_table.add_symbol(current_line_data.label.upper(), value, current_line_data.line_num, current_line_data.source)
+                        current_line_data.address = None
                     except ValueError as e:
-                        err_msg = str(e)
-                        errors.append(err_msg); current_line_data["error"] = err_msg
-                current_line_data["size"] = 0
+                        _pass1_error(errors, current_line_data, "DUPLICATE_LABEL", str(e), current_line_data.label.upper(),
+                                     column=label_column(current_line_data))
+            current_line_data.size = 0
 
-            elif mnemonic_upper == "RMB":
-                if current_line_data["label"]:
-                    try:
-                        symbol_table.add_symbol(current_line_data["label"].upper(), location_counter, current_line_data["line_num"])
-                    except ValueError as e:
-                        err_msg = str(e)
-                        errors.append(err_msg); current_line_data["error"] = err_msg
-                
-                if not current_line_data.get("error"): # Etiket hatası yoksa devam et
-                    if current_line_data["operand_str"]:
-                        try:
-                            num_bytes, err_rmb = parse_operand_for_equ(current_line_data["operand_str"], symbol_table, current_line_data["line_num"])
-                            if err_rmb: raise ValueError(err_rmb)
-                            if not isinstance(num_bytes, int) or num_bytes < 0:
-                                raise ValueError(f"RMB için geçersiz byte sayısı: {current_line_data['operand_str']}")
-                            current_line_data["size"] = num_bytes
-                        except ValueError as e:
-                            err_msg = f"Satır {current_line_data['line_num']}: RMB - {e}"
-                            errors.append(err_msg); current_line_data["error"] = err_msg
-                            current_line_data["size"] = 0
-                    else:
-                        err_msg = f"Satır {current_line_data['line_num']}: RMB için operand eksik."
-                        errors.append(err_msg); current_line_data["error"] = err_msg
-                        current_line_data["size"] = 0
-
-            elif mnemonic_upper == "FCB":
-                if current_line_data["operand_str"]:
-                    try:
-                        vals = [s.strip() for s in current_line_data["operand_str"].split(',')]
-                        current_line_data["size"] = len(vals)
-                        for v_str in vals:
-                            _, err = parse_operand_for_equ(v_str, symbol_table, current_line_data["line_num"])
-                            if err and not is_label_like(v_str): raise ValueError(f"geçersiz byte değeri: '{v_str}' ({err})")
-                    except ValueError as e:
-                        err_msg = f"Satır {current_line_data['line_num']}: FCB - {e}"
-                        errors.append(err_msg); current_line_data["error"] = err_msg
-                        current_line_data["size"] = 0
-                else:
-                    err_msg = f"Satır {current_line_data['line_num']}: FCB için operand eksik."
-                    errors.append(err_msg); current_line_data["error"] = err_msg
+        elif mnemonic_upper == "RMB":
+            if current_line_data.label:
+                try:
+                    symbol_table.add_symbol(current_line_data.label.upper(), location_counter, current_line_data.line_num, current_line_data.source)
+                except ValueError as e:
+                    _pass1_error(errors, current_line_data, "DUPLICATE_LABEL", str(e), current_line_data.label.upper(),
+                                 column=label_column(current_line_data))
 
-            elif mnemonic_upper == "FDB": # FDB BLOĞU EKLENDİ/GÜNCELLENDİ
-                if current_line_data["operand_str"]:
+            if not current_line_data.error: # Etiket hatası yoksa devam et
+                if current_line_data.operand_str:
                     try:
-                        vals = [s.strip() for s in current_line_data["operand_str"].split(',')]
-                        current_line_data["size"] = len(vals) * 2
-                        for v_str in vals:
-                            _, err = parse_operand_for_equ(v_str, symbol_table, current_line_data["line_num"])
-                            if err and not is_label_like(v_str): raise ValueError(f"geçersiz word değeri: '{v_str}' ({err})")
+                        num_bytes, err_rmb = parse_operand_for_equ(current_line_data.operand_str, symbol_table, current_line_data.location, location_counter)
+                        if err_rmb: raise ValueError(err_rmb)
+                        if not isinstance(num_bytes, int) or num_bytes < 0:
+                            raise ValueError(f"RMB için geçersiz byte sayısı: {current_line_data.operand_str}")
+                        current_line_data.size = num_bytes
                     except ValueError as e:
-                        err_msg = f"Satır {current_line_data['line_num']}: FDB - {e}"
-                        errors.append(err_msg); current_line_data["error"] = err_msg
-                        current_line_data["size"] = 0
+                        _pass1_error(errors, current_line_data, "INVALID_VALUE", f"{current_line_data.location}: RMB - {e}",
+                                     current_line_data.operand_str, column=operand_column(current_line_data))
+                        current_line_data.size = 0
                 else:
-                    err_msg = f"Satır {current_line_data['line_num']}: FDB için operand eksik."
-                    errors.append(err_msg); current_line_data["error"] = err_msg
-
-            elif mnemonic_upper == "FCC": # FCC BLOĞU EKLENDİ/GÜNCELLENDİ
-                op_str = current_line_data["operand_str"]
-                if op_str:
-                    if len(op_str) >= 2 and \
-                       ((op_str.startswith('"') and op_str.endswith('"')) or \
-                        (op_str.startswith("'") and op_str.endswith("'"))):
-                        current_line_data["size"] = len(op_str) - 2
-                    else:
-                        err_msg = f"Satır {current_line_data['line_num']}: FCC için geçersiz string formatı: {op_str}"
-                        errors.append(err_msg); current_line_data["error"] = err_msg
-                        current_line_data["size"] = 0
+                    _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                                 f"{current_line_data.location}: RMB için operand eksik.", "RMB")
+                    current_line_data.size = 0
+
+        elif mnemonic_upper == "FCB":
+            if current_line_data.operand_str:
+                try:
+                    vals = [s.strip() for s in current_line_data.operand_str.split(',')]
+                    current_line_data.size = len(vals)
+                    for v_str in vals:
+                        # Sadece sözdizimi kontrol edilir; ileri referanslı değerler Pass 2'de çözülür.
+                        try: compile_expression(v_str)
+                        except ExpressionError as err: raise ValueError(f"geçersiz byte değeri: '{v_str}' ({err})")
+                except ValueError as e:
+                    _pass1_error(errors, current_line_data, "INVALID_VALUE", f"{current_line_data.location}: FCB - {e}",
+                                 v_str, column=operand_column(current_line_data))
+                    current_line_data.size = 0
+            else:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: FCB için operand eksik.", "FCB")
+
+        elif mnemonic_upper == "FDB": # FDB BLOĞU EKLENDİ/GÜNCELLENDİ
+            if current_line_data.operand_str:
+                try:
+                    vals = [s.strip() for s in current_line_data.operand_str.split(',')]
+                    current_line_data.size = len(vals) * 2
+                    for v_str in vals:
+                        # Sadece sözdizimi kontrol edilir; ileri referanslı değerler Pass 2'de çözülür.
+                        try: compile_expression(v_str)
+                        except ExpressionError as err: raise ValueError(f"geçersiz word değeri: '{v_str}' ({err})")
+                except ValueError as e:
+                    _pass1_error(errors, current_line_data, "INVALID_VALUE", f"{current_line_data.location}: FDB - {e}",
+                                 v_str, column=operand_column(current_line_data))
+                    current_line_data.size = 0
+            else:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: FDB için operand eksik.", "FDB")
+
+        elif mnemonic_upper == "FCC": # FCC BLOĞU EKLENDİ/GÜNCELLENDİ
+            op_str = current_line_data.operand_str
+            if op_str:
+                if len(op_str) >= 2 and \
+                   ((op_str.startswith('"') and op_str.endswith('"')) or \
+                    (op_str.startswith("'") and op_str.endswith("'"))):
+                    current_line_data.size = len(op_str) - 2
                 else:
-                    err_msg = f"Satır {current_line_data['line_num']}: FCC için operand eksik."
-                    errors.append(err_msg); current_line_data["error"] = err_msg
-            
-            elif mnemonic_upper == "END":
-                current_line_data["size"] = 0
-                processed_lines_data.append(current_line_data)
-                break
-
-            else: # Normal M6800 Komutları
-                mode, size, err_addr = determine_addressing_mode_and_size(
-                    mnemonic_upper, current_line_data["operand_str"], symbol_table, location_counter
-                )
-                if err_addr:
-                    err_msg = f"Satır {current_line_data['line_num']}: {err_addr}"
-                    errors.append(err_msg); current_line_data["error"] = err_addr
+                    _pass1_error(errors, current_line_data, "INVALID_STRING",
+                                 f"{current_line_data.location}: FCC için geçersiz string formatı: {op_str}", op_str,
+                                 column=operand_column(current_line_data))
+                    current_line_data.size = 0
+            else:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: FCC için operand eksik.", "FCC")
+
+        elif mnemonic_upper == "INCLUDE":
+            # Dosyanın satırları IncludeExpander tarafından bu satırın hemen ardından akışa eklenir.
+            op_str = current_line_data.operand_str
+            if not op_str:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: INCLUDE için dosya adı eksik.", "INCLUDE")
+            elif include_file_name(op_str) is None:
+                _pass1_error(errors, current_line_data, "INVALID_STRING",
+                             f"{current_line_data.location}: INCLUDE için geçersiz dosya adı: {op_str}", op_str,
+                             column=operand_column(current_line_data))
+            current_line_data.size = 0
+
+        elif mnemonic_upper == "INCBIN":
+            # Boyut sadece dosya uzunluğundan belirlenir; byte'lar Pass 2'de dosyanın eşlemesinden alınır.
+            if current_line_data.operand_str:
+                data, err = _incbin_data(current_line_data, symbol_table, location_counter)
+                if err:
+                    _pass1_error(errors, current_line_data, *err, column=operand_column(current_line_data))
                 else:
-                    current_line_data["size"] = size
-                    current_line_data["addressing_mode"] = mode
-        
-        elif current_line_data["label"] and not current_line_data["mnemonic"]: # Sadece etiket
-            if not current_line_data.get("error"): # Etiket tanımında hata yoksa
-                current_line_data["size"] = 0
-
-        # Location Counter Güncellemesi
-        if not current_line_data.get("error"):
-            mne_lc = current_line_data["mnemonic"].upper() if current_line_data["mnemonic"] else ""
-            if mne_lc not in ["EQU", "ORG", "END"]:
-                 location_counter += current_line_data["size"]
-        
+                    current_line_data.size = len(data)
+            else:
+                _pass1_error(errors, current_line_data, "MISSING_OPERAND",
+                             f"{current_line_data.location}: INCBIN için dosya adı eksik.", "INCBIN")
+
+        elif mnemonic_upper == "END":
+            current_line_data.size = 0
+            return current_line_data, location_counter, True
+
+        else: # Normal M6800 Komutları
+            mode, size, err_addr = determine_addressing_mode_and_size(
+                mnemonic_upper, current_line_data.operand_str, symbol_table, location_counter
+            )
+            if err_addr:
+                # Listeleme girdisi mesajı "Satır N: " öneki olmadan gösterir
+                code = "UNKNOWN_MNEMONIC" if mnemonic_upper not in MODE_INDEX else "ADDRESSING_MODE"
+                column = operand_column(current_line_data) if code == "ADDRESSING_MODE" else None
+                args = (mnemonic_upper, current_line_data.operand_str)
+                errors.append(Diagnostic(f"{current_line_data.location}: {err_addr}", code,
+                                         current_line_data.line_num, PHASE_PASS1, column=column, args=args))
+                current_line_data.error = Diagnostic(err_addr, code, current_line_data.line_num, PHASE_PASS1,
+                                                     column=column, args=args)
+            else:
+                current_line_data.size = size
+                current_line_data.addressing_mode = mode
+
+    elif current_line_data.label and not current_line_data.mnemonic: # Sadece etiket
+        if not current_line_data.error: # Etiket tanımında hata yoksa
+            current_line_data.size = 0
+
+    # Location Counter Güncellemesi
+    if not current_line_data.error:
+        mne_lc = current_line_data.mnemonic.upper() if current_line_data.mnemonic else ""
+        if mne_lc not in ["EQU", "ORG", "END"]:
+             location_counter += current_line_data.size
+
+    return current_line_data, location_counter, False
+
+def pass_one(source_lines, symbols=None, origin=0, includes=None):
+    # symbols: önceden yüklenmiş semboller (SymbolTable, bkz. symbol_map.load_symbol_files);
+    # kopyalanarak kullanılır, aynı tablo birden çok assemble'a verilebilir.
+    # origin: ilk ORG'dan önceki satırların başlangıç adresi (nesne dosyası üretimi için).
+    # includes: INCLUDE'ları çözen IncludeExpander (None: çalışma dizinine göre çözülür).
+    symbol_table = symbols.copy() if symbols is not None else SymbolTable()
+    processed_lines_data = []
+    errors = DiagnosticStore()
+    location_counter = origin
+    if includes is None:
+        includes = IncludeExpander()
+
+    for record in includes.records(source_lines):
+        current_line_data, location_counter, is_end = process_line_pass1(
+            record.line_num, record.original_line, symbol_table, location_counter, errors, parsed_line_info=record
+        )
         processed_lines_data.append(current_line_data)
+        if is_end:
+            break
 
-    return symbol_table, processed_lines_data, list(set(errors))
+    return symbol_table, processed_lines_data, list(errors)
 
 # --- İkinci Geçiş (Pass 2) için Yardımcı Fonksiyon ---
-def parse_operand_value_for_pass2(operand_str, symbol_table, line_num, current_address_plus_size_for_relative=0):
-    # Bu fonksiyon bir önceki versiyonunuzdaki gibi (ETİKET+SAYI desteğiyle) kalabilir.
-    # ... (fonksiyon içeriği öncekiyle aynı) ...
+def parse_operand_value_for_pass2(operand_str, symbol_table, record):
+    # Operand Pass 1'de derlenip önbelleğe alındığından burada sadece değerlendirilir ('*' satırın adresidir).
+    # Dönüş: (değer, None) veya (None, Diagnostic)
     if operand_str is None: return 0, None
-    operand_str = operand_str.strip()
-    match_plus = re.fullmatch(r"([a-zA-Z_][a-zA-Z0-9_]*)\s*\+\s*([0-9]+|\$[0-9A-Fa-f]+|%[01]+)", operand_str, re.IGNORECASE)
-    match_minus = re.fullmatch(r"([a-zA-Z_][a-zA-Z0-9_]*)\s*-\s*([0-9]+|\$[0-9A-Fa-f]+|%[01]+)", operand_str, re.IGNORECASE)
-    if match_plus:
-        label_name, offset_str = match_plus.groups()
-        label_value = symbol_table.get_symbol_value(label_name.upper())
-        if label_value is None: return None, f"Satır {line_num}: İfadede tanımsız etiket: {label_name}"
-        offset_value, err_offset = parse_operand_value_for_pass2(offset_str, symbol_table, line_num)
-        if err_offset: return None, f"Satır {line_num}: İfadede geçersiz offset: {offset_str} ({err_offset})"
-        return label_value + offset_value, None
-    elif match_minus:
-        label_name, offset_str = match_minus.groups()
-        label_value = symbol_table.get_symbol_value(label_name.upper())
-        if label_value is None: return None, f"Satır {line_num}: İfadede tanımsız etiket: {label_name}"
-        offset_value, err_offset = parse_operand_value_for_pass2(offset_str, symbol_table, line_num)
-        if err_offset: return None, f"Satır {line_num}: İfadede geçersiz offset: {offset_str} ({err_offset})"
-        return label_value - offset_value, None
-    if IMM_REGEX.match(operand_str): return parse_operand_value_for_pass2(operand_str[1:], symbol_table, line_num)
-    indexed_match = IND_REGEX.match(operand_str)
-    if indexed_match:
-        offset_str = indexed_match.group(1).strip()
-        return (0, None) if not offset_str else parse_operand_value_for_pass2(offset_str, symbol_table, line_num)
-    if HEX_REGEX.match(operand_str):
-        try: return int(operand_str[1:], 16), None
-        except ValueError: return None, f"Satır {line_num}: Geçersiz hex değer: {operand_str}"
-    if BIN_REGEX.match(operand_str):
-        try: return int(operand_str[1:], 2), None
-        except ValueError: return None, f"Satır {line_num}: Geçersiz binary değer: {operand_str}"
-    if is_label_like(operand_str):
-        value = symbol_table.get_symbol_value(operand_str.upper())
-        return (value, None) if value is not None else (None, f"Satır {line_num}: Tanımsız etiket: {operand_str}")
-    if DEC_REGEX.match(operand_str):
-        try: return int(operand_str), None
-        except ValueError: return None, f"Satır {line_num}: Geçersiz decimal değer: {operand_str}"
-    return None, f"Satır {line_num}: Operand ayrıştırılamadı: {operand_str}"
+    try:
+        expression = compile_operand(operand_str)
+        if expression is None: return 0, None # ",X" (offset'siz indexed)
+        return expression.evaluate(symbol_table, record.address), None
+    except UndefinedSymbolError as e:
+        return None, Diagnostic(f"{record.location}: Tanımsız etiket: {e.name}", "UNDEFINED_SYMBOL", record.line_num,
+                                PHASE_PASS2, args=(e.name,))
+    except ExpressionError as e:
+        return None, Diagnostic(f"{record.location}: {e}", "INVALID_EXPRESSION", record.line_num, PHASE_PASS2,
+                                args=(operand_str,))
+
+
+def _pass2_error(errors_pass2, entry, code, message, *args):
+    """Pass 2 hatasını listeleme girdisine ve hata listesine aynı Diagnostic olarak yazar."""
+    record = entry.record
+    diagnostic = Diagnostic(message, code, record.line_num, PHASE_PASS2, column=operand_column(record), args=args)
+    entry.error = diagnostic
+    errors_pass2.append(diagnostic)
+    return diagnostic
+
+
+def _pass2_operand_error(errors_pass2, entry, diagnostic):
+    """parse_operand_value_for_pass2'nin döndürdüğü hatayı sütun bilgisiyle kaydeder."""
+    diagnostic.column = operand_column(entry.record)
+    entry.error = diagnostic
+    errors_pass2.append(diagnostic)
 
 
 # --- İkinci Geçiş (Pass 2) ---
-def pass_two(processed_lines_pass1, symbol_table):
-    # Bu fonksiyon bir önceki versiyonunuzdaki gibi kalabilir.
-    # (RMB'yi pas geçme ve diğer Pass 2 hata kontrolleri zaten vardı)
-    # ... (fonksiyon içeriği öncekiyle aynı) ...
+def encode_line_pass2(line_data_p1, symbol_table, errors_pass2):
+    """
+    Pass 1'de işlenmiş tek bir satır için listeleme girdisini ve makine kodunu üretir.
+
+    Args:
+        line_data_p1 (LineRecord): process_line_pass1'in ürettiği satır kaydı.
+        symbol_table (SymbolTable): Operandların çözüleceği sembol tablosu.
+        errors_pass2 (DiagnosticStore | list): Pass 2'de oluşan hataların (Diagnostic) ekleneceği koleksiyon.
+
+    Returns:
+        tuple: (listeleme_girdisi (ListingEntry), byte_listesi). Satır Pass 1'den hatalı geldiyse
+               byte_listesi None olur (segment mantığı bu satırı atlar). INCBIN satırlarında
+               byte_listesi, eşlenmiş dosya üzerinde bir memoryview'dır.
+    """
+    # Listeleme girdisi satır kaydını kopyalamaz, sadece makine kodu ve hatayı tutar.
+    current_listing_entry = ListingEntry(line_data_p1, error=line_data_p1.error) # Pass 1'den gelen hatayı al
+    if current_listing_entry.error: # Pass 1'den hata geldiyse, Pass 2'de daha fazla işlem yapma
+        return current_listing_entry, None
+    # ... (pass_two'nun geri kalanı, Pass 2'ye özgü hataları errors_pass2'ye ekler
+    #      ve current_listing_entry.error alanını günceller)
+    generated_bytes_for_line = []
+    if line_data_p1.mnemonic:
+        mnemonic_upper = line_data_p1.mnemonic.upper()
+        operand_str_p1 = line_data_p1.operand_str
+        addressing_mode_p1 = line_data_p1.addressing_mode
+        if mnemonic_upper in ["ORG", "EQU", "END", "RMB", "INCLUDE"]: pass
+        elif mnemonic_upper == "FCB":
+            # ... (FCB işleme ve Pass 2 hata kontrolü) ...
+            if operand_str_p1:
+                byte_strs = [s.strip() for s in operand_str_p1.split(',')]
+                for b_str in byte_strs:
+                    val, err = parse_operand_value_for_pass2(b_str, symbol_table, line_data_p1)
+                    if err: _pass2_operand_error(errors_pass2, current_listing_entry, err); break
+                    if not (0 <= val <= 255): _pass2_error(errors_pass2, current_listing_entry, "VALUE_RANGE", f"{line_data_p1.location}: FCB değeri (${val:02X}) 8-bit aralığı dışında.", val, 8); break
+                    generated_bytes_for_line.append(val & 0xFF)
+                if current_listing_entry.error: generated_bytes_for_line.clear()
+            else: _pass2_error(errors_pass2, current_listing_entry, "MISSING_OPERAND", f"{line_data_p1.location}: FCB için operand eksik (P2).", "FCB") # Bu P1 hatası olmalıydı
+        elif mnemonic_upper == "FDB":
+            # ... (FDB işleme ve Pass 2 hata kontrolü) ...
+            if operand_str_p1:
+                word_strs = [s.strip() for s in operand_str_p1.split(',')]
+                for w_str in word_strs:
+                    val, err = parse_operand_value_for_pass2(w_str, symbol_table, line_data_p1)
+                    if err: _pass2_operand_error(errors_pass2, current_listing_entry, err); break
+                    if not (0 <= val <= 65535): _pass2_error(errors_pass2, current_listing_entry, "VALUE_RANGE", f"{line_data_p1.location}: FDB değeri (${val:04X}) 16-bit aralığı dışında.", val, 16); break
+                    generated_bytes_for_line.extend([(val >> 8) & 0xFF, val & 0xFF])
+                if current_listing_entry.error: generated_bytes_for_line.clear()
+            else: _pass2_error(errors_pass2, current_listing_entry, "MISSING_OPERAND", f"{line_data_p1.location}: FDB için operand eksik (P2).", "FDB") # Bu P1 hatası olmalıydı
+        elif mnemonic_upper == "INCBIN":
+            # Byte'lar listeye açılmaz: eşlenmiş dosyanın dilimi olduğu gibi imaja yazılır.
+            data, err = _incbin_data(line_data_p1, symbol_table, line_data_p1.address)
+            if err: _pass2_error(errors_pass2, current_listing_entry, *err)
+            elif len(data) != line_data_p1.size: _pass2_error(errors_pass2, current_listing_entry, "INCBIN", f"{line_data_p1.location}: INCBIN dosyası Pass 1'den sonra değişti.", line_data_p1.operand_str)
+            else:
+                current_listing_entry.code = data
+                return current_listing_entry, data
+        elif mnemonic_upper == "FCC":
+            # ... (FCC işleme ve Pass 2 hata kontrolü) ...
+            if operand_str_p1: # Format P1'de kontrol edildi
+                text_content = operand_str_p1[1:-1]
+                for char_code in [ord(c) for c in text_content]:
+                    if not (0 <= char_code <= 255): _pass2_error(errors_pass2, current_listing_entry, "INVALID_CHAR", f"{line_data_p1.location}: FCC için geçersiz karakter kodu: {char_code}", char_code); break
+                    generated_bytes_for_line.append(char_code)
+                if current_listing_entry.error: generated_bytes_for_line.clear()
+            # else: P1 hatası olmalıydı
+        else: # Opcode'lar
+            # ... (Opcode işleme ve Pass 2 hata kontrolü) ...
+            opcode, num_bytes, _ = ENCODING_INDEX[(mnemonic_upper, addressing_mode_p1)]
+            generated_bytes_for_line.append(opcode)
+            operand_value = 0
+            err = code = None
+            if num_bytes > 1:
+                val, err_op = parse_operand_value_for_pass2(operand_str_p1, symbol_table, line_data_p1)
+                if err_op: _pass2_operand_error(errors_pass2, current_listing_entry, err_op)
+                else: operand_value = val
+
+            if not current_listing_entry.error: # Operand parse hatası yoksa devam et
+                if addressing_mode_p1 == ADDR_MODE_IMMEDIATE:
+                    if num_bytes == 2 and not (0 <= operand_value <= 255): code, err, bits = "VALUE_RANGE", f"{line_data_p1.location}: Immediate değer ({operand_value}) 8-bit aralığı dışında.", 8
+                    elif num_bytes == 3 and not (0 <= operand_value <= 65535): code, err, bits = "VALUE_RANGE", f"{line_data_p1.location}: Immediate değer ({operand_value}) 16-bit aralığı dışında.", 16
+                    else: generated_bytes_for_line.extend([(operand_value >> 8) & 0xFF, operand_value & 0xFF] if num_bytes == 3 else [operand_value & 0xFF])
+                elif addressing_mode_p1 == ADDR_MODE_DIRECT and not (0 <= operand_value <= 255): code, err, bits = "VALUE_RANGE", f"{line_data_p1.location}: Direct adres ({operand_value}) 8-bit aralığı dışında.", 8
+                elif addressing_mode_p1 == ADDR_MODE_INDEXED and not (0 <= operand_value <= 255): code, err, bits = "VALUE_RANGE", f"{line_data_p1.location}: Indexed offset ({operand_value}) 8-bit aralığı dışında.", 8
+                elif addressing_mode_p1 == ADDR_MODE_EXTENDED and not (0 <= operand_value <= 65535): code, err, bits = "VALUE_RANGE", f"{line_data_p1.location}: Extended adres ({operand_value}) 16-bit aralığı dışında.", 16
+                elif addressing_mode_p1 == ADDR_MODE_RELATIVE:
+                    target_address = operand_value
+                    offset = target_address - (line_data_p1.address + num_bytes)
+                    if not (-128 <= offset <= 127): code, err, bits = "BRANCH_RANGE", f"{line_data_p1.location}: Relative offset ({offset}) menzil dışı.", 8
+                    else: generated_bytes_for_line.append(offset & 0xFF)
+
+                if err: # Eğer yukarıdaki kontrollerde bir err tanımlandıysa
+                    _pass2_error(errors_pass2, current_listing_entry, code, err, offset if code == "BRANCH_RANGE" else operand_value, bits)
+                elif addressing_mode_p1 not in [ADDR_MODE_IMMEDIATE, ADDR_MODE_RELATIVE, ADDR_MODE_INHERENT]:
+                    if num_bytes == 2: generated_bytes_for_line.append(operand_value & 0xFF)
+                    elif num_bytes == 3: generated_bytes_for_line.extend([(operand_value >> 8) & 0xFF, operand_value & 0xFF])
+            if current_listing_entry.error: generated_bytes_for_line.clear()
+
+    current_listing_entry.code = generated_bytes_for_line # machine_code_hex okunduğunda türetilir
+    return current_listing_entry, generated_bytes_for_line
+
+
+def pass_two(processed_lines_pass1, symbol_table, workers=1):
+    # Byte'lar 64 KiB'lık tek bir imaja yazılır; segmentler imaj üzerinde (adres, memoryview) dilimleridir.
+    # workers: 1 (varsayılan) sıralı, >1 o kadar işçi süreçle paralel kodlar (bkz. parallel_pass2.py).
+    # None ise PARALLEL_MIN_LINES satıra ulaşan kaynaklar CPU sayısı kadar işçide kodlanır; her çağrı
+    # yeni bir süreç havuzu açtığından bunu sadece kısa ömürlü, __main__ korumalı çağıranlar seçmeli (CLI).
+    if workers != 1:
+        from . import parallel_pass2
+        if workers is None and len(processed_lines_pass1) >= parallel_pass2.PARALLEL_MIN_LINES:
+            workers = parallel_pass2.default_workers()
+        if workers is not None and workers > 1:
+            return parallel_pass2.pass_two_parallel(processed_lines_pass1, symbol_table, workers)
     listing_output = []
-    machine_code_segments = []
-    current_segment_address = -1
-    current_segment_bytes = []
-    errors_pass2 = [] # Sadece Pass 2'de YENİ oluşan hatalar için
+    segment_builder = SegmentBuilder()
+    errors_pass2 = DiagnosticStore() # Sadece Pass 2'de YENİ oluşan hatalar için
     for line_data_p1 in processed_lines_pass1:
-        current_listing_entry = {
-            "line_num": line_data_p1["line_num"],
-            "address_hex": f"${line_data_p1['address']:04X}" if line_data_p1['address'] is not None else "----",
-            "machine_code_hex": "", "label": line_data_p1["label"], "mnemonic": line_data_p1["mnemonic"],
-            "operand_str": line_data_p1["operand_str"], "original_line": line_data_p1["original_line"],
-            "comment": line_data_p1["comment"], "error": line_data_p1.get("error") # Pass 1'den gelen hatayı al
-        }
-        if current_listing_entry["error"]: # Pass 1'den hata geldiyse, Pass 2'de daha fazla işlem yapma
-            listing_output.append(current_listing_entry)
-            continue
-        # ... (pass_two'nun geri kalanı, Pass 2'ye özgü hataları errors_pass2'ye ekler
-        #      ve current_listing_entry["error"] alanını günceller)
-        if current_segment_address != -1 and line_data_p1["address"] != current_segment_address:
-            if current_segment_bytes: machine_code_segments.append((current_segment_address, current_segment_bytes))
-            current_segment_bytes = []
-        current_segment_address = line_data_p1["address"]
-        generated_bytes_for_line = []
-        if line_data_p1["mnemonic"]:
-            mnemonic_upper = line_data_p1["mnemonic"].upper()
-            operand_str_p1 = line_data_p1["operand_str"]
-            addressing_mode_p1 = line_data_p1.get("addressing_mode")
-            if mnemonic_upper in ["ORG", "EQU", "END", "RMB"]: pass
-            elif mnemonic_upper == "FCB":
-                # ... (FCB işleme ve Pass 2 hata kontrolü) ...
-                if operand_str_p1:
-                    byte_strs = [s.strip() for s in operand_str_p1.split(',')]
-                    for b_str in byte_strs:
-                        val, err = parse_operand_value_for_pass2(b_str, symbol_table, line_data_p1["line_num"])
-                        if err: current_listing_entry["error"] = err; errors_pass2.append(err); generated_bytes_for_line.clear(); break
-                        if not (0 <= val <= 255): err = f"Satır {line_data_p1['line_num']}: FCB değeri (${val:02X}) 8-bit aralığı dışında."; current_listing_entry["error"] = err; errors_pass2.append(err); generated_bytes_for_line.clear(); break
-                        generated_bytes_for_line.append(val & 0xFF)
-                    if current_listing_entry["error"]: generated_bytes_for_line.clear()
-                else: err = f"Satır {line_data_p1['line_num']}: FCB için operand eksik (P2)."; current_listing_entry["error"] = err; errors_pass2.append(err) # Bu P1 hatası olmalıydı
-            elif mnemonic_upper == "FDB":
-                # ... (FDB işleme ve Pass 2 hata kontrolü) ...
-                if operand_str_p1:
-                    word_strs = [s.strip() for s in operand_str_p1.split(',')]
-                    for w_str in word_strs:
-                        val, err = parse_operand_value_for_pass2(w_str, symbol_table, line_data_p1["line_num"])
-                        if err: current_listing_entry["error"] = err; errors_pass2.append(err); generated_bytes_for_line.clear(); break
-                        if not (0 <= val <= 65535): err = f"Satır {line_data_p1['line_num']}: FDB değeri (${val:04X}) 16-bit aralığı dışında."; current_listing_entry["error"] = err; errors_pass2.append(err); generated_bytes_for_line.clear(); break
-                        generated_bytes_for_line.extend([(val >> 8) & 0xFF, val & 0xFF])
-                    if current_listing_entry["error"]: generated_bytes_for_line.clear()
-                else: err = f"Satır {line_data_p1['line_num']}: FDB için operand eksik (P2)."; current_listing_entry["error"] = err; errors_pass2.append(err) # Bu P1 hatası olmalıydı
-            elif mnemonic_upper == "FCC":
-                # ... (FCC işleme ve Pass 2 hata kontrolü) ...
-                if operand_str_p1: # Format P1'de kontrol edildi
-                    text_content = operand_str_p1[1:-1]
-                    for char_code in [ord(c) for c in text_content]:
-                        if not (0 <= char_code <= 255): err = f"Satır {line_data_p1['line_num']}: FCC için geçersiz karakter kodu: {char_code}"; current_listing_entry["error"] = err; errors_pass2.append(err); generated_bytes_for_line.clear(); break
-                        generated_bytes_for_line.append(char_code)
-                    if current_listing_entry["error"]: generated_bytes_for_line.clear()
-                # else: P1 hatası olmalıydı
-            else: # Opcode'lar
-                # ... (Opcode işleme ve Pass 2 hata kontrolü) ...
-                op_hex, num_bytes_str, _ = OPCODE_TABLE[mnemonic_upper][addressing_mode_p1]
-                num_bytes = int(num_bytes_str)
-                generated_bytes_for_line.append(int(op_hex, 16))
-                operand_value = 0
-                if num_bytes > 1:
-                    val, err_op = parse_operand_value_for_pass2(operand_str_p1, symbol_table, line_data_p1["line_num"])
-                    if err_op: current_listing_entry["error"] = err_op; errors_pass2.append(err_op)
-                    else: operand_value = val
-
-                if not current_listing_entry.get("error"): # Operand parse hatası yoksa devam et
-                    if addressing_mode_p1 == ADDR_MODE_IMMEDIATE:
-                        if num_bytes == 2 and not (0 <= operand_value <= 255): err = f"Satır {line_data_p1['line_num']}: Immediate değer ({operand_value}) 8-bit aralığı dışında."
-                        elif num_bytes == 3 and not (0 <= operand_value <= 65535): err = f"Satır {line_data_p1['line_num']}: Immediate değer ({operand_value}) 16-bit aralığı dışında."
-                        else: generated_bytes_for_line.extend([(operand_value >> 8) & 0xFF, operand_value & 0xFF] if num_bytes == 3 else [operand_value & 0xFF])
-                    elif addressing_mode_p1 == ADDR_MODE_DIRECT and not (0 <= operand_value <= 255): err = f"Satır {line_data_p1['line_num']}: Direct adres ({operand_value}) 8-bit aralığı dışında."
-                    elif addressing_mode_p1 == ADDR_MODE_INDEXED and not (0 <= operand_value <= 255): err = f"Satır {line_data_p1['line_num']}: Indexed offset ({operand_value}) 8-bit aralığı dışında."
-                    elif addressing_mode_p1 == ADDR_MODE_EXTENDED and not (0 <= operand_value <= 65535): err = f"Satır {line_data_p1['line_num']}: Extended adres ({operand_value}) 16-bit aralığı dışında."
-                    elif addressing_mode_p1 == ADDR_MODE_RELATIVE:
-                        target_address = operand_value
-                        offset = target_address - (line_data_p1["address"] + num_bytes)
-                        if not (-128 <= offset <= 127): err = f"Satır {line_data_p1['line_num']}: Relative offset ({offset}) menzil dışı."
-                        else: generated_bytes_for_line.append(offset & 0xFF)
-                    
-                    if 'err' in locals() and err: # Eğer yukarıdaki kontrollerde bir err tanımlandıysa
-                        current_listing_entry["error"] = err; errors_pass2.append(err)
-                    elif addressing_mode_p1 not in [ADDR_MODE_IMMEDIATE, ADDR_MODE_RELATIVE, ADDR_MODE_INHERENT]:
-                        if num_bytes == 2: generated_bytes_for_line.append(operand_value & 0xFF)
-                        elif num_bytes == 3: generated_bytes_for_line.extend([(operand_value >> 8) & 0xFF, operand_value & 0xFF])
-                if current_listing_entry.get("error"): generated_bytes_for_line.clear()
-
-        if not current_listing_entry.get("error") and generated_bytes_for_line:
-            current_listing_entry["machine_code_hex"] = "".join([f"{b:02X}" for b in generated_bytes_for_line])
-            current_segment_bytes.extend(generated_bytes_for_line)
+        current_listing_entry, generated_bytes_for_line = encode_line_pass2(line_data_p1, symbol_table, errors_pass2)
         listing_output.append(current_listing_entry)
-    if current_segment_bytes and current_segment_address != -1 : machine_code_segments.append((current_segment_address, current_segment_bytes))
-    return listing_output, machine_code_segments, list(set(errors_pass2))
+        if generated_bytes_for_line is None: # Pass 1 hatalı satır
+            continue
+        segment_builder.add(line_data_p1.address, () if current_listing_entry.error else generated_bytes_for_line)
+    segment_builder.finish()
+    return listing_output, segment_builder.segments, list(errors_pass2)
 
 
 # --- Ana Test Bloğu ---
@@ -0,0 +1,177 @@
+# assembler_core/batch.py
+# Çok dosyalı (toplu) assemble.
+#
+# Dosya ve glob desenleri genişletilir, her dosya ayrı bir işçi süreçte
+# (ProcessPoolExecutor) assemble edilip .lst/.hex çıktıları yazılır. Sonuçlar
+# tamamlanma sırasına göre değil, giriş sırasına göre toplanır; böylece özet
+# çıktısı ve çıkış kodu zamanlamadan bağımsızdır.
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .listing import get_renderer
+from .server import handle_request
+
+# Çıkış kodları: hepsi başarılı / en az bir dosyada assemble hatası / en az bir dosya işlenemedi.
+EXIT_OK = 0
+EXIT_ASSEMBLY_ERRORS = 1
+EXIT_FAILED = 2
+
+_GLOB_CHARS = set("*?[")
+
+
+def is_batch_pattern(pattern):
+    """Argüman tek bir dosya yerine birden çok dosyayı ifade edebilir mi (glob veya dizin)?"""
+    return bool(_GLOB_CHARS & set(pattern)) or os.path.isdir(pattern)
+
+
+def expand_inputs(patterns):
+    """
+    Dosya yollarını, glob desenlerini ('**' dahil) ve dizinleri (altındaki tüm .asm
+    dosyaları) genişletir. Her desenin eşleşmeleri sıralanır, desenler verildiği
+    sırada işlenir ve tekrar eden dosyalar atlanır.
+
+    Args:
+        patterns (list[str]): Komut satırı argümanları.
+
+    Returns:
+        list[str]: Dosya yolları. Hiçbir şeyle eşleşmeyen düz yollar olduğu gibi bırakılır
+                   (hata olarak raporlanmaları için).
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "**", "*.asm"), recursive=True))
+        elif _GLOB_CHARS & set(pattern):
+            matches = sorted(m for m in glob.glob(pattern, recursive=True) if os.path.isfile(m))
+        else:
+            matches = [pattern]
+        for path in matches:
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def output_bases(input_paths, out_dir):
+    """
+    Her giriş dosyası için çıktı yollarının uzantısız tabanını belirler. Çıktılar out_dir altında,
+    girişlerin ortak üst dizinine göre aynı alt dizin yapısıyla yer alır; böylece farklı
+    dizinlerdeki aynı adlı dosyalar birbirinin çıktısının üzerine yazmaz.
+    """
+    if not input_paths:
+        return []
+    directories = [os.path.dirname(os.path.abspath(p)) for p in input_paths]
+    common_root = os.path.commonpath(directories)
+    result = []
+    for path in input_paths:
+        relative = os.path.relpath(os.path.abspath(path), common_root)
+        result.append(os.path.join(out_dir, os.path.splitext(relative)[0]))
+    return result
+
+
+def _assemble_one(request):
+    """İşçi süreçte tek bir dosyayı assemble eder (ProcessPoolExecutor için modül seviyesinde)."""
+    response = handle_request(request)
+    # Sembol tablosu ve segmentler özet için gerekmez; süreçler arası aktarım küçük tutulur.
+    response.pop("symbols", None)
+    response.pop("segments", None)
+    response["path"] = request["path"]
+    return response
+
+
+# İsteğe bağlı makine kodu ve sembol çıktıları: sunucu isteğindeki alan adı -> dosya uzantısı.
+IMAGE_OUTPUTS = {"output_s19": ".s19", "output_ihex": ".ihx", "output_bin": ".bin", "output_sym": ".sym"}
+
+
+def assemble_batch(input_paths, out_dir=".", jobs=None, single_pass=False, cache_dir=None, image_outputs=(),
+                   listing_format="text", **options):
+    """
+    Dosyaları paralel assemble eder.
+
+    Args:
+        input_paths (list[str]): expand_inputs ile genişletilmiş dosya yolları.
+        out_dir (str): Çıktıların yazılacağı kök dizin.
+        jobs (int, optional): İşçi süreç sayısı (None: CPU sayısı, 1: süreç açmadan sırayla).
+        single_pass (bool): Tek geçişli motoru kullan.
+        cache_dir (str, optional): Derleme önbelleği dizini (None: önbellek kullanılmaz).
+        image_outputs (iterable[str]): Ayrıca yazılacak çıktıların IMAGE_OUTPUTS anahtarları
+                                       (örn. ["output_s19"]).
+        listing_format (str, optional): Listeleme biçimi (bkz. listing.py); None ise listeleme yazılmaz.
+        **options: Her isteğe olduğu gibi eklenen seçenekler (örn. s19_record_length).
+
+    Returns:
+        list[dict]: Giriş sırasıyla dosya başına sonuçlar (handle_request yanıtı + "path").
+    """
+    list_extension = get_renderer(listing_format).extension if listing_format is not None else None
+    work = []
+    for path, base in zip(input_paths, output_bases(input_paths, out_dir)):
+        os.makedirs(os.path.dirname(base) or ".", exist_ok=True)
+        request = {"op": "assemble", "path": path, "name": path,
+                   "output_list": base + list_extension if list_extension else None, "listing_format": listing_format,
+                   "output_hex": base + ".hex", "listing": False, "single_pass": single_pass,
+                   "cache_dir": cache_dir, **options}
+        for field in image_outputs:
+            request[field] = base + IMAGE_OUTPUTS[field]
+        work.append(request)
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(work)) or 1
+    if jobs == 1:
+        return [_assemble_one(job) for job in work]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # map() sonuçları giriş sırasıyla döndürür, hangi işçinin önce bittiğinden bağımsız.
+        return list(executor.map(_assemble_one, work, chunksize=max(1, len(work) // (jobs * 4))))
+
+
+def print_summary(results, wall_seconds, jobs):
+    """
+    Dosya başına bir satır ve toplam özet yazdırır.
+
+    Returns:
+        int: Çıkış kodu (EXIT_OK, EXIT_ASSEMBLY_ERRORS veya EXIT_FAILED).
+    """
+    failed = with_errors = total_errors = cache_hits = cache_misses = 0
+    busy_ms = 0.0
+    for result in results:
+        if not result.get("ok"):
+            failed += 1
+            print(f"BAŞARISIZ {result['path']}: {result.get('error')}")
+            continue
+        busy_ms += result["elapsed_ms"]
+        cache_hits += result.get("cache") == "hit"
+        cache_misses += result.get("cache") == "miss"
+        error_count = len(set(result["errors_p1"] + result["errors_p2"]))
+        if error_count:
+            with_errors += 1
+            total_errors += error_count
+            print(f"HATALI    {result['path']}: {error_count} hata ({result['elapsed_ms']:.1f} ms)")
+        else:
+            print(f"TAMAM     {result['path']} ({result['elapsed_ms']:.1f} ms)")
+
+    ok_count = len(results) - failed - with_errors
+    print("-" * 80)
+    print(f"{len(results)} dosya: {ok_count} başarılı, {with_errors} hatalı ({total_errors} hata), "
+          f"{failed} işlenemedi")
+    print(f"Süre: {wall_seconds:.2f} s (dosyalarda toplam {busy_ms / 1000:.2f} s, {jobs} işçi)")
+    if cache_hits or cache_misses:
+        print(f"Önbellek: {cache_hits} isabet, {cache_misses} ıska")
+    if failed:
+        return EXIT_FAILED
+    if with_errors:
+        return EXIT_ASSEMBLY_ERRORS
+    return EXIT_OK
+
+
+def run_batch(patterns, out_dir=".", jobs=None, single_pass=False, cache_dir=None, image_outputs=(), **options):
+    """Desenleri genişletir, dosyaları assemble eder, özeti yazdırır ve çıkış kodunu döndürür."""
+    input_paths = expand_inputs(patterns)
+    if not input_paths:
+        print("HATA: Desenlerle eşleşen .asm dosyası bulunamadı.")
+        return EXIT_FAILED
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = assemble_batch(input_paths, out_dir, jobs, single_pass, cache_dir, image_outputs, **options)
+    return print_summary(results, time.perf_counter() - start, min(jobs, len(input_paths)))
@@ -0,0 +1,372 @@
+# assembler_core/build_cache.py
+# İçerik adresli derleme önbelleği.
+#
+# Anahtar; kaynak dosyanın byte'ları, assembler kaynak kodunun parmak izi (sürüm
+# yerine geçer: assembler_core içindeki herhangi bir .py dosyası değişirse tüm
+# kayıtlar geçersizleşir), opcode tablosu ve çıktıyı etkileyen seçeneklerin
+# SHA-256 özetidir. Değer; listeleme girdileri, makine kodu segmentleri, sembol
+# tablosu ve hatalardır. İsabette kaynak hiç lex edilmez, .lst/.hex dosyaları
+# saklanan girdilerden aynı yazıcılarla yeniden yazılır.
+#
+# INCLUDE edilen ve INCBIN ile okunan dosyalar anahtarda yoktur (hangilerinin ekleneceği
+# ancak assemble sırasında belli olur); kayıtta yolları ve içerik özetleriyle saklanır
+# ve get() bunlardan biri değişmişse kaydı ıska sayar.
+#
+# Her kayıt önbellek dizininde <anahtar>.jsonl dosyasıdır. Iskada akış tüketilirken her
+# listeleme girdisi ve segment bir JSON satırı olarak geçici dosyaya hemen yazılır (segment
+# byte'ları hex string'dir); bellekte kopyası tutulmaz. put() sona sembol tablosu, hatalar ve
+# INCLUDE özetlerini içeren bir satır ile bu satırın dosyadaki konumunu (sabit genişlikli
+# son satır) ekleyip dosyayı yerine taşır. get() sadece bu son satırları okur; isabette
+# girdiler dosyadan satır satır okunarak yeniden üretilir. Kayıt max_bytes'ı aşacaksa
+# yazmaktan vazgeçilir. Okunan kaydın mtime'ı güncellenir; toplam boyut sınırı aşılınca en
+# eski mtime'lı kayıtlar silinir (LRU).
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from .diagnostics import from_json, to_json
+from .line_table import ListingEntry
+from .m6800_opcodes import OPCODE_TABLE, PSEUDO_OPS
+from .symbol_table import SymbolTable
+
+# Önbellek kayıt biçimi değişirse artırılır.
+CACHE_FORMAT = 7
+
+# Listeleme girdileri JSON'da bu sırada alan listesi (satır başına bir dizi) olarak saklanır.
+_LISTING_KEYS = ListingEntry._KEYS
+_ERROR_INDEX = _LISTING_KEYS.index("error")
+
+_ENTRY_SUFFIX = ".jsonl"
+_TRAILER_WIDTH = 20 # Son satır: özet satırının byte konumu, sıfırla doldurulmuş
+_WRITE_BATCH = 1024 # Geçici dosyaya bu kadar satırda bir yazılır
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_READ_CHUNK = 1 << 20 # Dosyalar özetlenirken bu boyutta parçalarla okunur
+_INCLUDE_RE = re.compile(rb"include|incbin", re.IGNORECASE)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_dir():
+    """M6800_CACHE_DIR ortam değişkeni, yoksa ~/.cache/m6800_assembler."""
+    return os.environ.get("M6800_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "m6800_assembler")
+
+
+_toolchain_digest = None
+
+
+def _toolchain_fingerprint():
+    """Assembler kaynak kodu ve opcode tablosunun özeti (süreç başına bir kez hesaplanır)."""
+    global _toolchain_digest
+    if _toolchain_digest is None:
+        digest = hashlib.sha256(f"format={CACHE_FORMAT}\n".encode())
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for path in sorted(glob.glob(os.path.join(package_dir, "*.py"))):
+            digest.update(os.path.basename(path).encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        digest.update(repr(sorted(OPCODE_TABLE.items())).encode())
+        digest.update(repr(sorted(PSEUDO_OPS)).encode())
+        _toolchain_digest = digest.hexdigest()
+    return _toolchain_digest
+
+
+class _Recorder:
+    """
+    Bir (tür, veri) akışını değiştirmeden geçirirken her öğeyi önbellek dizinindeki geçici
+    dosyaya bir JSON satırı olarak yazar: ["line", alanlar...] veya ["segment", adres, "hex"].
+    Dosya açılamazsa, yazma hatası olursa veya boyut max_bytes'ı aşarsa kayıttan vazgeçilir
+    (path None olur) ve akış kayıtsız geçirilir. Akış sonuna kadar tüketilmezse geçici dosya silinir.
+    """
+
+    def __init__(self, results, directory, max_bytes):
+        self._results = results
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self.file = self.path = None
+        self.size = 0
+
+    def __iter__(self):
+        self._open()
+        pending = []
+        complete = False
+        try:
+            for kind, payload in self._results:
+                if self.path is not None:
+                    if kind == "line":
+                        row = [payload[key] for key in _LISTING_KEYS]
+                        row[_ERROR_INDEX] = to_json(row[_ERROR_INDEX])
+                        pending.append(_encode(["line", *row]))
+                    else:
+                        pending.append(_encode(["segment", payload[0], bytes(payload[1]).hex()]))
+                    if len(pending) >= _WRITE_BATCH:
+                        self._write(pending)
+                        pending = []
+                yield kind, payload
+            if self.path is not None and pending:
+                self._write(pending)
+            complete = True
+        finally:
+            if not complete:
+                self.discard()
+
+    def _open(self):
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            fd, self.path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            self.file = os.fdopen(fd, 'w', encoding='utf-8')
+        except OSError:
+            self.discard()
+
+    def _write(self, rows):
+        text = "\n".join(rows) + "\n"
+        self.size += len(text) # Yaklaşık (karakter sayısı); sınır kontrolü için yeterli
+        if self.size > self._max_bytes:
+            self.discard()
+            return
+        try:
+            self.file.write(text)
+        except OSError:
+            self.discard()
+
+    def discard(self):
+        """Kaydı bırakır ve geçici dosyayı siler (akış etkilenmez)."""
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        self.file = self.path = None
+
+
+class BuildCache:
+    """
+    Dizin tabanlı, boyut sınırlı (LRU) assemble önbelleği.
+
+    Kullanım:
+        cache = BuildCache()
+        key = cache.key(kaynak_byte_lari, single_pass=False)
+        artifacts = cache.get(key)
+        if artifacts is None:
+            results = cache.record(results)   # akış tüketilirken geçici dosyaya yazılır
+            ...
+            cache.put(key, results, symbol_table, errors_p1, errors_p2)
+        else:
+            results = iter_cached(artifacts)
+
+    hits / misses sayaçları bu nesne üzerinden yapılan get() çağrılarını sayar.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source_bytes, **options):
+        """
+        Kaynak içeriği, assembler parmak izi ve seçeneklerden önbellek anahtarı üretir.
+
+        Args:
+            source_bytes (bytes | Iterable[bytes]): Kaynak dosyanın içeriği veya parçaları
+                (örn. file_chunks(yol); büyük kaynak belleğe alınmadan özetlenir).
+            **options: Çıktıyı etkileyen seçenekler (örn. single_pass=True).
+
+        Returns:
+            str: Hex SHA-256 özeti.
+        """
+        digest = hashlib.sha256(_toolchain_fingerprint().encode())
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        digest.update(b"\0")
+        for chunk in _chunks(source_bytes):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def get(self, key):
+        """
+        Kayıt varsa saklanan çıktıları (dict; girdiler iter_cached ile dosyadan okunur),
+        yoksa None döndürür.
+        """
+        path = self._path(key)
+        try:
+            f = open(path, 'rb')
+        except OSError: # Yok: ıska sayılır
+            self.misses += 1
+            return None
+        try:
+            f.seek(-(_TRAILER_WIDTH + 1), os.SEEK_END)
+            summary_offset = int(f.read(_TRAILER_WIDTH))
+            f.seek(summary_offset)
+            artifacts = json.loads(f.readline())
+        except (OSError, ValueError): # Bozuk kayıt
+            f.close()
+            self.misses += 1
+            return None
+        if not _includes_unchanged(artifacts["includes"]): # Dahil edilen bir dosya değişmiş
+            f.close()
+            self.misses += 1
+            return None
+        try:
+            os.utime(path) # LRU: son kullanım zamanı
+        except OSError:
+            pass
+        f.seek(0)
+        artifacts["file"] = f # Açık tutulur: kayıt bu arada silinse de iter_cached okuyabilir
+        artifacts["rows_end"] = summary_offset
+        self.hits += 1
+        return artifacts
+
+    def record(self, results):
+        """Akışı, tüketilirken önbellek dizinindeki geçici bir dosyaya yazan bir iterable'a sarar."""
+        return _Recorder(results, self.directory, self.max_bytes)
+
+    def put(self, key, recorder, symbol_table, errors_p1, errors_p2, includes=()):
+        """
+        Tüketilmiş bir record() akışının kaydını tamamlar ve gerekirse eski kayıtları siler.
+        Yazma hataları yok sayılır; önbellek sadece bir hızlandırmadır. includes, kaynağın
+        INCLUDE ettiği dosyalardır (bkz. IncludeExpander.files); biri okunamazsa kayıt yazılmaz.
+        """
+        if recorder.path is None: # Kayıttan vazgeçilmiş (yazma hatası veya boyut sınırı)
+            return
+        try:
+            include_digests = [[path, _file_digest(path)] for path in includes]
+        except OSError:
+            recorder.discard()
+            return
+        artifacts = {
+            "includes": include_digests,
+            "symbols": symbol_table.table,
+            "definitions": symbol_table.definitions,
+            "sources": symbol_table.sources, # INCLUDE'lardan sonra tanımlananların (dosya, satır) konumu
+            "external": symbol_table.external, # Sembol dosyalarından yüklenenler (etiket -> dosya adı)
+            "errors_p1": [to_json(err) for err in errors_p1], # Diagnostic'ler alanlarıyla, sırası korunarak
+            "errors_p2": [to_json(err) for err in errors_p2],
+        }
+        try:
+            f = recorder.file
+            f.flush()
+            summary_offset = f.buffer.tell()
+            f.write(_encode(artifacts) + "\n")
+            f.write(f"{summary_offset:0{_TRAILER_WIDTH}d}\n")
+            f.close()
+            # Aynı anda çalışan süreçler (toplu mod) yarım yazılmış dosya görmesin diye atomik taşınır.
+            os.replace(recorder.path, self._path(key))
+            recorder.file = recorder.path = None
+            self._evict()
+        except OSError:
+            recorder.discard()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for path in glob.glob(os.path.join(self.directory, "*" + _ENTRY_SUFFIX)):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def summary(self):
+        return f"Önbellek: {self.hits} isabet, {self.misses} ıska"
+
+
+def cached_symbol_table(artifacts):
+    """Saklanan sembollerden bir SymbolTable oluşturur."""
+    symbol_table = SymbolTable()
+    symbol_table.table.update(artifacts["symbols"])
+    symbol_table.definitions.update(artifacts["definitions"])
+    symbol_table.sources.update((name, tuple(source)) for name, source in artifacts["sources"].items())
+    symbol_table.external.update(artifacts["external"])
+    return symbol_table
+
+
+def file_chunks(path):
+    """Dosyayı _READ_CHUNK boyutunda bytes parçaları olarak okur (key() ve include_dir_option() için)."""
+    with open(path, 'rb') as f:
+        while chunk := f.read(_READ_CHUNK):
+            yield chunk
+
+
+def _chunks(source_bytes):
+    return (source_bytes,) if isinstance(source_bytes, (bytes, bytearray, memoryview)) else source_bytes
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    for chunk in file_chunks(path):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _includes_unchanged(include_digests):
+    try:
+        return all(_file_digest(path) == digest for path, digest in include_digests)
+    except OSError:
+        return False
+
+
+def files_fingerprint(paths):
+    """
+    Ek girdi dosyalarının (örn. önceden yüklenen sembol dosyaları) key() seçeneği olarak
+    kullanılacak özeti: sırasıyla (dosya adı, içerik SHA-256'sı) çiftleri.
+
+    Raises:
+        OSError: Dosyalardan biri okunamazsa.
+    """
+    return [[os.path.basename(path), _file_digest(path)] for path in paths]
+
+
+def include_dir_option(source_bytes, base_dir):
+    """
+    Kaynak INCLUDE/INCBIN içerebiliyorsa key() seçeneği olarak eklenecek mutlak dizin, değilse
+    None. Göreli yollar bu dizine göre çözüldüğünden aynı içerikli iki kaynak farklı
+    dizinlerde farklı dosyaları ekleyebilir. source_bytes key()'deki gibi parçalar da olabilir.
+    """
+    tail = b""
+    for chunk in _chunks(source_bytes):
+        if _INCLUDE_RE.search(tail + chunk[:6]) or _INCLUDE_RE.search(chunk): # tail: parça sınırındaki kelime
+            return os.path.abspath(base_dir or ".")
+        tail = bytes(chunk[-6:])
+    return None
+
+
+def cached_errors(artifacts):
+    """Saklanan Pass 1 ve Pass 2 hataları (Diagnostic listeleri)."""
+    return [from_json(err) for err in artifacts["errors_p1"]], [from_json(err) for err in artifacts["errors_p2"]]
+
+
+def iter_cached(artifacts):
+    """Saklanan çıktıları kayıt dosyasından satır satır okuyarak AssemblyStream ile aynı (tür, veri) akışına çevirir."""
+    with artifacts["file"] as f:
+        remaining = artifacts["rows_end"]
+        for line in f:
+            remaining -= len(line)
+            if remaining < 0: # Özet satırına gelindi
+                break
+            row = json.loads(line)
+            if row[0] == "line":
+                entry = dict(zip(_LISTING_KEYS, row[1:]))
+                entry["error"] = from_json(entry["error"])
+                yield "line", entry
+            else:
+                yield "segment", (row[1], bytes.fromhex(row[2]))
@@ -0,0 +1,90 @@
+# assembler_core/client.py
+# Sunucu moduna (main.py --serve --socket YOL) istek ileten ince istemci.
+# assembler'ın kendisini import etmez; sadece isteği sokete yazar ve yanıtı okur.
+#
+# Kullanım:
+#   python -m assembler_core.client --socket /tmp/m6800.sock program.asm [-o_lst X.lst] [-o_hex X.hex]
+#   python -m assembler_core.client --socket /tmp/m6800.sock --shutdown
+import argparse
+import json
+import os
+import socket
+import sys
+
+
+class AssemblerClient:
+    """Tek bir sunucu bağlantısı üzerinden art arda istek gönderir."""
+
+    def __init__(self, socket_path):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(socket_path)
+        self._rfile = self._sock.makefile('r', encoding='utf-8')
+        self._next_id = 1
+
+    def request(self, **fields):
+        """İsteği gönderir ve yanıtı (dict) döndürür."""
+        fields.setdefault("id", self._next_id)
+        self._next_id += 1
+        self._sock.sendall((json.dumps(fields, ensure_ascii=False) + "\n").encode('utf-8'))
+        line = self._rfile.readline()
+        if not line:
+            raise ConnectionError("Sunucu bağlantıyı kapattı.")
+        return json.loads(line)
+
+    def assemble_file(self, input_filepath, output_list_filepath=None, output_hex_filepath=None, **options):
+        """
+        Dosyayı sunucuda assemble ettirir. Çıktı yolları main.py ile aynı varsayılanları
+        kullanır (geçerli dizinde <ad>.lst / <ad>.hex) ve sunucuya mutlak yol olarak gönderilir.
+        """
+        base_filename = os.path.splitext(os.path.basename(input_filepath))[0]
+        return self.request(
+            op="assemble",
+            path=os.path.abspath(input_filepath),
+            name=input_filepath,
+            output_list=os.path.abspath(output_list_filepath or base_filename + ".lst"),
+            output_hex=os.path.abspath(output_hex_filepath or base_filename + ".hex"),
+            **options,
+        )
+
+    def close(self):
+        self._rfile.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="M6800 assembler sunucusu için ince istemci")
+    parser.add_argument("input_file", nargs="?", help="Assemble edilecek .asm kaynak dosyası")
+    parser.add_argument("--socket", required=True, help="Sunucunun Unix soket yolu")
+    parser.add_argument("-o_lst", "--output_list", default=None, help="Listeleme dosyasının adı")
+    parser.add_argument("-o_hex", "--output_hex", default=None, help="Makine kodu döküm dosyasının adı")
+    parser.add_argument("--single-pass", action="store_true", help="Tek geçişli motoru kullan")
+    parser.add_argument("--shutdown", action="store_true", help="Sunucuyu durdur")
+    args = parser.parse_args(argv)
+
+    with AssemblerClient(args.socket) as client:
+        if args.shutdown:
+            client.request(op="shutdown")
+            return 0
+        if not args.input_file:
+            parser.error("input_file gerekli (veya --shutdown)")
+        response = client.assemble_file(args.input_file, args.output_list, args.output_hex,
+                                        single_pass=args.single_pass, listing=False)
+    if not response.get("ok"):
+        print(f"HATA: {response.get('error')}", file=sys.stderr)
+        return 2
+    reported = set(response["errors_p1"])
+    for err in response["errors_p1"] + [e for e in response["errors_p2"] if e not in reported]:
+        print(f"  {err}")
+    if response["errors_p1"] or response["errors_p2"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# assembler_core/diagnostics.py
+# Yapılandırılmış hata/uyarı kayıtları (diagnostic).
+#
+# Hatalar eskiden sadece "Satır N: ..." biçiminde string'lerdi; tekrarlar list(set(...))
+# ile atılıyor (sıra kayboluyordu) ve GUI Pass 2 hatalarını Pass 1 hatalarıyla iç içe
+# alt-string aramasıyla eşleştiriyordu. Diagnostic, mesaj metnini değiştirmeden
+# (str alt sınıfı olduğundan hata listeleri, karşılaştırmalar ve JSON çıktısı aynı
+# kalır) kodunu, önem derecesini, satır/sütununu, aşamasını ve mesaj argümanlarını
+# taşır. DiagnosticStore tekrarları mesaj metnine değil yapılandırılmış anahtara
+# (kod, satır, aşama, argümanlar) bakarak, ilk görülme sırasını koruyarak atar ve
+# satır numarasına göre O(1) erişim sağlar; CLI ve GUI Pass 2'de yeni olan hataları
+# bu satır indeksiyle ayıklar.
+
+ERROR = "error"
+WARNING = "warning"
+
+PHASE_LEXER = "lexer"
+PHASE_PASS1 = "pass1"
+PHASE_PASS2 = "pass2"
+PHASE_LINK = "link"
+
+# Hata kodları ve kısa açıklamaları
+CODES = {
+    "LEXER": "Satır ayrıştırılamadı",
+    "UNKNOWN_MNEMONIC": "Bilinmeyen komut",
+    "ADDRESSING_MODE": "Komut bu adresleme modunu desteklemiyor",
+    "DUPLICATE_LABEL": "Etiket daha önce tanımlanmış",
+    "MISSING_LABEL": "Pseudo-op için etiket eksik",
+    "MISSING_OPERAND": "Operand eksik",
+    "INVALID_VALUE": "Geçersiz değer veya ifade",
+    "INVALID_STRING": "Geçersiz string",
+    "INVALID_CHAR": "8-bit olmayan karakter",
+    "UNDEFINED_SYMBOL": "Tanımsız etiket",
+    "INVALID_EXPRESSION": "İfade değerlendirilemedi",
+    "VALUE_RANGE": "Değer aralık dışında",
+    "BRANCH_RANGE": "Dallanma hedefi menzil dışında",
+    "INCLUDE": "INCLUDE dosyası eklenemedi",
+    "INCBIN": "INCBIN dosyası okunamadı veya aralık dosyanın dışında",
+    "RELOCATION": "Değer yer değiştirme kaydıyla ifade edilemiyor",
+    "LINK_UNDEFINED": "Hiçbir modülde tanımlanmamış sembol",
+    "LINK_AMBIGUOUS": "Sembol birden çok modülde farklı değerlerle tanımlı",
+    "LINK_OVERLAP": "Bölümler üst üste biniyor veya adres alanına sığmıyor",
+    "LINK_RANGE": "Bağlama sonrası değer aralık dışında",
+}
+
+
+class Diagnostic(str):
+    """
+    Bir hata veya uyarı. String değeri kullanıcıya gösterilen mesajdır ("Satır N: ...");
+    str olarak eşitlik ve hash bu metne bakar, tekrar kontrolü ise key'e (DiagnosticStore).
+
+    Attributes:
+        code (str): CODES'taki hata kodu.
+        line (int or None): Kaynak satır numarası (1'den başlar).
+        phase (str): PHASE_LEXER, PHASE_PASS1, PHASE_PASS2 veya PHASE_LINK.
+        severity (str): ERROR veya WARNING.
+        column (int or None): Hatalı kısmın satırdaki sütunu (1'den başlar), biliniyorsa.
+        args (tuple): Mesajın değişken kısımları (örn. tanımsız etiketin adı).
+    """
+
+    def __new__(cls, message, code, line=None, phase=PHASE_PASS1, severity=ERROR, column=None, args=()):
+        self = super().__new__(cls, message)
+        self.code = code
+        self.line = line
+        self.phase = phase
+        self.severity = severity
+        self.column = column
+        self.args = tuple(args)
+        return self
+
+    def __getnewargs__(self):
+        # pickle (toplu moddaki işçi süreçleri) ve copy için
+        return (str(self), self.code, self.line, self.phase, self.severity, self.column, self.args)
+
+    def __repr__(self):
+        return f"Diagnostic({str(self)!r}, code={self.code!r}, line={self.line!r}, phase={self.phase!r})"
+
+    @property
+    def key(self):
+        """Tekrar kontrolünde kullanılan yapılandırılmış anahtar: (code, line, phase, args)."""
+        return self.code, self.line, self.phase, self.args
+
+    def to_dict(self):
+        """JSON'a yazılabilir biçim (sunucu yanıtı ve derleme önbelleği için)."""
+        return {"message": str(self), "code": self.code, "line": self.line, "phase": self.phase,
+                "severity": self.severity, "column": self.column, "args": list(self.args)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["message"], data["code"], data["line"], data["phase"], data["severity"],
+                   data["column"], data["args"])
+
+
+def to_json(value):
+    """Diagnostic'i sözlüğe çevirir; düz string'leri (veya None'u) olduğu gibi bırakır."""
+    return value.to_dict() if isinstance(value, Diagnostic) else value
+
+
+def from_json(value):
+    """to_json'un tersi."""
+    return Diagnostic.from_dict(value) if isinstance(value, dict) else value
+
+
+def operand_column(record):
+    """Satır kaydındaki operandın sütunu (1'den başlar); bulunamazsa None."""
+    if not record.operand_str:
+        return None
+    index = record.original_line.find(record.operand_str)
+    return index + 1 if index >= 0 else None
+
+
+def label_column(record):
+    """Satır kaydındaki etiketin sütunu (1'den başlar); bulunamazsa None."""
+    if not record.label:
+        return None
+    index = record.original_line.find(record.label)
+    return index + 1 if index >= 0 else None
+
+
+class DiagnosticStore:
+    """
+    Diagnostic'lerin sıralı ve tekrarsız koleksiyonu. Liste gibi append() ile doldurulur
+    (process_line_pass1/encode_line_pass2'nin errors parametresi olarak verilebilir);
+    tekrarlar mesaj metnine değil Diagnostic.key'e göre atılır. `in` kontrolü ve satıra
+    göre arama O(1)'dir.
+    """
+    __slots__ = ("_items", "_by_line")
+
+    def __init__(self, diagnostics=()):
+        self._items = {} # anahtar -> Diagnostic (ekleme sırasıyla)
+        self._by_line = {} # satır -> [Diagnostic, ...]
+        for diagnostic in diagnostics:
+            self.append(diagnostic)
+
+    def append(self, diagnostic):
+        """Ekler; aynı anahtarla daha önce eklendiyse bir şey yapmaz. Eklendiyse True döner."""
+        key = _key(diagnostic)
+        if key in self._items:
+            return False
+        self._items[key] = diagnostic
+        self._by_line.setdefault(getattr(diagnostic, "line", None), []).append(diagnostic)
+        return True
+
+    def append_new(self, diagnostic):
+        """
+        Aynı satırda aynı kod ve argümanlarla (aşamasından bağımsız) bir diagnostic yoksa
+        ekler ve True döner. Pass 2 hatalarından Pass 1'de zaten raporlanmış olanları
+        ayıklamak için (CLI, GUI); sadece o satırın diagnostic'lerine bakar.
+        """
+        if isinstance(diagnostic, Diagnostic):
+            for reported in self.for_line(diagnostic.line):
+                if getattr(reported, "code", None) == diagnostic.code and getattr(reported, "args", None) == diagnostic.args:
+                    return False
+        return self.append(diagnostic)
+
+    def extend(self, diagnostics):
+        for diagnostic in diagnostics:
+            self.append(diagnostic)
+
+    def for_line(self, line):
+        """Bir satırın diagnostic'leri (ekleme sırasıyla); yoksa boş liste."""
+        return self._by_line.get(line, [])
+
+    def lines(self):
+        """Diagnostic'i olan satır numaraları (ilk görülme sırasıyla)."""
+        return [line for line in self._by_line if line is not None]
+
+    def __contains__(self, diagnostic):
+        return _key(diagnostic) in self._items
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __repr__(self):
+        return f"DiagnosticStore({len(self)} diagnostic)"
+
+
+def _key(diagnostic):
+    """Diagnostic'in anahtarı; düz string'ler (eski hata listeleri) metinleriyle karşılaştırılır."""
+    return diagnostic.key if isinstance(diagnostic, Diagnostic) else diagnostic
+
+
+def unique(diagnostics):
+    """Tekrarları (Diagnostic.key'e göre) ilk görülme sırasını koruyarak atar (eski list(set(...)) yerine)."""
+    return list(DiagnosticStore(diagnostics))
+
+
+if __name__ == '__main__':
+    store = DiagnosticStore()
+    store.append(Diagnostic("Satır 3: Tanımsız etiket: FOO", "UNDEFINED_SYMBOL", 3, PHASE_PASS2, column=17, args=("FOO",)))
+    store.append(Diagnostic("Satır 1: ORG için operand eksik.", "MISSING_OPERAND", 1, args=("ORG",)))
+    store.append(Diagnostic("Satır 3: Tanımsız etiket: FOO", "UNDEFINED_SYMBOL", 3, PHASE_PASS2, args=("FOO",))) # Tekrar: atlanır
+    print(list(store), store.lines())
+    print([d.to_dict() for d in store.for_line(3)])
+    # Pass 1'de aynı satırda aynı kod ve argümanla raporlanmış hata Pass 2'de yeni sayılmaz
+    p2 = Diagnostic("Satır 1: ORG için operand eksik.", "MISSING_OPERAND", 1, PHASE_PASS2, args=("ORG",))
+    print(store.append_new(p2), len(store))
@@ -0,0 +1,296 @@
+# assembler_core/expressions.py
+# Operand ifadelerinin derleyicisi.
+#
+# Bir operand ifadesi (örn. "START_ADDR+1", "(TABLE+2)*4", "<BUFFER", "*-2") bir
+# kez ayrıştırılıp iç içe closure'lardan oluşan bir Expression nesnesine derlenir.
+# Derlenmiş nesneler ifade metnine göre önbelleklenir; dosyada aynı operand metni
+# kaç kez geçerse geçsin tek bir nesne paylaşılır. Pass 2 sadece evaluate() çağırır.
+# Önbellekler en son kullanılan CACHE_SIZE metinle sınırlıdır (lru_cache): sunucu ve
+# artımlı oturumlar gibi uzun yaşayan süreçlerde bellek, görülen metin sayısıyla büyümez.
+#
+# Desteklenen sözdizimi (öncelik sırası yüksekten düşüğe):
+#   Terimler : $1F (hex), %1010 (binary), 42 (decimal), ETIKET, * (konum sayacı), ( ... )
+#   Tekli    : -x  +x  ~x  <x (düşük byte)  >x (yüksek byte)
+#   Çarpımsal: *  /  %
+#   Toplamsal: +  -
+#   Kaydırma : <<  >>
+#   Bit      : &  sonra  ^  sonra  |
+import functools
+import re
+
+
+class ExpressionError(ValueError):
+    """İfade ayrıştırılamadığında veya değerlendirilemediğinde fırlatılır."""
+
+
+class UndefinedSymbolError(ExpressionError):
+    """İfadede sembol tablosunda bulunmayan bir etiket kullanıldığında fırlatılır."""
+
+    def __init__(self, name):
+        super().__init__(f"Tanımsız etiket: {name}")
+        self.name = name
+
+
+_TOKEN_REGEX = re.compile(
+    r"\s*(?:(?P<hex>\$[0-9A-Fa-f]+)|(?P<bin>%[01]+)|(?P<dec>[0-9]+)|"
+    r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<op><<|>>|[-+*/%&|^~<>()]))"
+)
+
+# İkili operatörler: öncelik ve işlem. Büyük sayı daha sıkı bağlar.
+_BINARY_OPS = {
+    "|": (1, lambda a, b: a | b),
+    "^": (2, lambda a, b: a ^ b),
+    "&": (3, lambda a, b: a & b),
+    "<<": (4, lambda a, b: a << b),
+    ">>": (4, lambda a, b: a >> b),
+    "+": (5, lambda a, b: a + b),
+    "-": (5, lambda a, b: a - b),
+    "*": (6, lambda a, b: a * b),
+    "/": (6, None), # Sıfıra bölme kontrolü için ayrı ele alınır
+    "%": (6, None),
+}
+
+_UNARY_OPS = {
+    "-": lambda a: -a,
+    "+": lambda a: a,
+    "~": lambda a: ~a,
+    "<": lambda a: a & 0xFF,
+    ">": lambda a: (a >> 8) & 0xFF,
+}
+
+
+class Expression:
+    """
+    Derlenmiş bir operand ifadesi.
+
+    text:          İfadenin kaynak metni.
+    symbols:       İfadede geçen etiket adları (büyük harf).
+    uses_location: İfade '*' (satırın kendi adresi) içeriyor mu?
+    byte_sized:    En dıştaki işlem '<' veya '>' mi (sonuç her zaman 8-bit)?
+    constant:      Etiket ve '*' içermeyen ifadelerin önceden hesaplanmış değeri, yoksa None.
+    is_symbol:     İfade tek bir etiketten mi ibaret?
+    """
+    __slots__ = ("text", "symbols", "uses_location", "byte_sized", "constant", "is_symbol", "_evaluate")
+
+    def __init__(self, text, evaluate, symbols, uses_location, byte_sized, is_symbol):
+        self.text = text
+        self.symbols = symbols
+        self.uses_location = uses_location
+        self.byte_sized = byte_sized
+        self.is_symbol = is_symbol
+        self.constant = None
+        if not symbols and not uses_location:
+            self.constant = evaluate(None, None)
+            constant = self.constant
+            evaluate = lambda symbol_table, location_counter: constant
+        self._evaluate = evaluate
+
+    def evaluate(self, symbol_table, location_counter=None):
+        """
+        İfadenin değerini hesaplar.
+
+        Args:
+            symbol_table (SymbolTable): Etiketlerin çözüleceği tablo.
+            location_counter (int, optional): '*' için satırın adresi.
+
+        Returns:
+            int: İfadenin değeri (aralık kontrolü çağırana aittir).
+
+        Raises:
+            UndefinedSymbolError: Tanımsız bir etiket kullanıldıysa.
+            ExpressionError: Sıfıra bölme veya adres bilinmeden '*' kullanımı.
+        """
+        return self._evaluate(symbol_table, location_counter)
+
+    def __repr__(self):
+        return f"Expression({self.text!r})"
+
+
+class _Parser:
+    """Öncelik tırmanma (precedence climbing) ile ifadeyi closure ağacına çevirir."""
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+        self.symbols = set()
+        self.uses_location = False
+
+    def _tokenize(self, text):
+        tokens = []
+        pos = 0
+        end = len(text.rstrip())
+        expect_operand = True # '*', '%', '<', '>' anlamı konuma göre değişir
+        while pos < end:
+            match = _TOKEN_REGEX.match(text, pos)
+            if not match or match.end() == pos:
+                raise ExpressionError(f"Operand ayrıştırılamadı: {text}")
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "bin" and not expect_operand:
+                # "A%10": burada '%' mod operatörüdür, ardından gelen sayı ayrı okunur.
+                tokens.append(("op", "%"))
+                pos = match.start(kind) + 1
+                expect_operand = True
+                continue
+            tokens.append((kind, value))
+            pos = match.end()
+            expect_operand = kind == "op" and value != ")"
+        return tokens
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _error(self):
+        return ExpressionError(f"Operand ayrıştırılamadı: {self.text}")
+
+    def parse(self):
+        if not self.tokens:
+            raise self._error()
+        node = self._parse_binary(1)
+        if self.pos != len(self.tokens):
+            raise self._error()
+        return node
+
+    def _parse_binary(self, min_precedence):
+        left = self._parse_unary()
+        while True:
+            kind, value = self._peek()
+            if kind != "op" or value not in _BINARY_OPS:
+                return left
+            precedence, operation = _BINARY_OPS[value]
+            if precedence < min_precedence:
+                return left
+            self.pos += 1
+            right = self._parse_binary(precedence + 1)
+            left = self._combine(value, operation, left, right)
+
+    def _combine(self, op, operation, left, right):
+        if op == "/" or op == "%":
+            text = self.text
+            def evaluate(st, lc):
+                divisor = right(st, lc)
+                if divisor == 0:
+                    raise ExpressionError(f"Sıfıra bölme: {text}")
+                dividend = left(st, lc)
+                return dividend // divisor if op == "/" else dividend % divisor
+            return evaluate
+        return lambda st, lc: operation(left(st, lc), right(st, lc))
+
+    def _parse_unary(self):
+        kind, value = self._peek()
+        if kind == "op" and value in _UNARY_OPS:
+            self.pos += 1
+            operand = self._parse_unary()
+            operation = _UNARY_OPS[value]
+            evaluate = lambda st, lc: operation(operand(st, lc))
+            evaluate.byte_sized = value in ("<", ">") # Sonuç her zaman 8-bit
+            return evaluate
+        return self._parse_term()
+
+    def _parse_term(self):
+        kind, value = self._peek()
+        self.pos += 1
+        if kind == "hex":
+            number = int(value[1:], 16)
+            return lambda st, lc: number
+        if kind == "bin":
+            number = int(value[1:], 2)
+            return lambda st, lc: number
+        if kind == "dec":
+            number = int(value)
+            return lambda st, lc: number
+        if kind == "name":
+            name = value.upper()
+            self.symbols.add(name)
+            def lookup(st, lc):
+                symbol_value = st.get_symbol_value(name) if st is not None else None
+                if symbol_value is None:
+                    raise UndefinedSymbolError(value)
+                return symbol_value
+            return lookup
+        if kind == "op" and value == "*":
+            self.uses_location = True
+            text = self.text
+            def location(st, lc):
+                if lc is None:
+                    raise ExpressionError(f"Konum sayacı ('*') bu ifadede kullanılamaz: {text}")
+                return lc
+            return location
+        if kind == "op" and value == "(":
+            node = self._parse_binary(1)
+            if self._peek() != ("op", ")"):
+                raise self._error()
+            self.pos += 1
+            return node
+        raise self._error()
+
+
+# Önbellek başına en fazla bu kadar metin (ifade başına ~1 KB; ~100K satırlık bir kaynağın operandları sığar)
+CACHE_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text):
+    """
+    Bir ifade metnini derler; aynı metin için önbellekteki nesneyi döndürür.
+
+    Args:
+        text (str): İfade (başındaki/sonundaki boşluklar önemsizdir).
+
+    Returns:
+        Expression: Derlenmiş ifade.
+
+    Raises:
+        ExpressionError: İfade sözdizimi geçersizse.
+    """
+    parser = _Parser(text.strip())
+    evaluate = parser.parse()
+    byte_sized = getattr(evaluate, "byte_sized", False)
+    is_symbol = len(parser.tokens) == 1 and parser.tokens[0][0] == "name"
+    return Expression(text.strip(), evaluate, frozenset(parser.symbols), parser.uses_location, byte_sized, is_symbol)
+
+
+_INDEXED_OPERAND_REGEX = re.compile(r"^(.*?),\s*[Xx]$")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def compile_operand(operand_str):
+    """
+    Bir komut operandının değer kısmını derler: immediate için '#' ve indexed için
+    ',X' ayrılır. "  ,X" gibi boş offset'li indexed operandlar için None döner (değer 0).
+    Sonuç operand metnine göre önbelleklenir.
+
+    Raises:
+        ExpressionError: Değer kısmı geçerli bir ifade değilse.
+    """
+    text = operand_str.strip()
+    if text.startswith("#"):
+        text = text[1:]
+    else:
+        indexed_match = _INDEXED_OPERAND_REGEX.match(text)
+        if indexed_match:
+            text = indexed_match.group(1).strip()
+            if not text:
+                return None
+    return compile_expression(text)
+
+
+if __name__ == '__main__':
+    from .symbol_table import SymbolTable
+
+    st = SymbolTable()
+    st.add_symbol("START", 0x1000, 1)
+    st.add_symbol("COUNT", 10, 2)
+    examples = ["$10", "%1010", "START+1", "START-$10", "(START+2)*2", "COUNT*2+1", "COUNT*(2+1)",
+                "<START+$34", ">START", "*+3", "* - 2", "-1", "~0&$FF", "1<<4|1", "COUNT%3", "START/0",
+                "UNDEFINED", "$00,Y", "(1+2"]
+    for text in examples:
+        try:
+            compiled = compile_expression(text)
+            value = compiled.evaluate(st, 0x2000)
+            print(f"{text:<14} = ${value & 0xFFFF:04X} ({value})  semboller={sorted(compiled.symbols)} "
+                  f"byte={compiled.byte_sized}")
+        except ExpressionError as e:
+            print(f"{text:<14} HATA: {e}")
+    print("Aynı metin aynı nesne:", compile_expression("START+1") is compile_expression("START+1"))
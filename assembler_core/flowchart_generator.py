@@ -13,7 +13,7 @@ RETURN_INSTRUCTIONS = ["RTS", "RTI"]
 ALL_CONTROL_FLOW_INSTRUCTIONS = BRANCH_INSTRUCTIONS + RETURN_INSTRUCTIONS
 
 # Direktifler (bunlar genellikle flowchart'ta özel olarak ele alınmaz veya atlanır)
-ASSEMBLER_DIRECTIVES = ["ORG", "EQU", "FCB", "FCC", "FDB", "RMB", "END", "OPT"] # END ve OPT eklendi
+ASSEMBLER_DIRECTIVES = ["ORG", "EQU", "FCB", "FCC", "FDB", "RMB", "END", "OPT", "INCLUDE", "INCBIN"] # END ve OPT eklendi
 
 def parse_m6800(asm_file_path):
     print(f"DEBUG: parse_m6800 fonksiyonu çağrıldı, dosya: {asm_file_path}")
@@ -0,0 +1,88 @@
+# assembler_core/image_only.py
+# Listelemesiz (sadece imaj) assemble.
+#
+# Sadece makine kodu isteyen çağıranlar (CI derlemeleri, main.py --image-only) için
+# pass_one'dan sonra satırlar listeleme girdileri toplanmadan kodlanır: listeleme
+# listesi tutulmaz, hex string'leri üretilmez, listeleme yazıcısı çalışmaz ve akış
+# modundaki gibi Pass 2'de kaynak yeniden lex edilmez. Sonuç; bellek imajı, pass_two
+# ile aynı segmentler, sembol tablosu ve hatalardır. Listeleme gerekirse
+# ImageResult.listing() ile sonradan türetilir.
+from .assembler import pass_one, encode_line_pass2
+from .diagnostics import DiagnosticStore
+from .memory_image import SegmentBuilder
+
+
+class ImageResult:
+    """
+    assemble_image() sonucu.
+
+    image:        Makine kodu (MemoryImage).
+    segments:     pass_two'nun machine_code_segments'iyle aynı (adres, byte'lar) dizisi; yazıcılara verilebilir.
+    symbol_table: Sembol tablosu.
+    errors_p1:    Pass 1 hataları (Diagnostic listesi).
+    errors_p2:    Pass 2 hataları (Diagnostic listesi).
+    end_operand:  END satırının operandı (S19 başlangıç adresi için) veya None.
+    lines:        Pass 1 kayıtları (LineRecord listesi; listing() ve wcet.py için).
+    """
+    __slots__ = ("image", "segments", "symbol_table", "errors_p1", "errors_p2", "end_operand", "lines")
+
+    def __init__(self, image, segments, symbol_table, errors_p1, errors_p2, end_operand, lines):
+        self.image = image
+        self.segments = segments
+        self.symbol_table = symbol_table
+        self.errors_p1 = errors_p1
+        self.errors_p2 = errors_p2
+        self.end_operand = end_operand
+        self.lines = lines
+
+    def listing(self):
+        """pass_two'nun listing_output'uyla aynı listeleme girdileri (istendiğinde yeniden kodlanır)."""
+        scratch_errors = []
+        return [encode_line_pass2(line_data, self.symbol_table, scratch_errors)[0] for line_data in self.lines]
+
+
+def assemble_image(source_lines, symbols=None, includes=None):
+    """
+    Kaynağı listeleme üretmeden assemble eder.
+
+    Args:
+        source_lines (iterable[str]): Kaynak satırları.
+        symbols (SymbolTable): Önceden yüklenmiş semboller (bkz. pass_one); None ise boş tablo.
+        includes (IncludeExpander): INCLUDE'ları çözen genişletici; None ise çalışma dizinine göre çözülür.
+
+    Returns:
+        ImageResult: İmaj, segmentler, sembol tablosu ve hatalar.
+    """
+    symbol_table, lines_p1, errors_p1 = pass_one(source_lines, symbols, includes=includes)
+    segment_builder = SegmentBuilder()
+    errors_p2 = DiagnosticStore()
+    end_operand = None
+    for line_data in lines_p1:
+        entry, generated_bytes = encode_line_pass2(line_data, symbol_table, errors_p2)
+        if generated_bytes is None: # Pass 1 hatalı satır
+            continue
+        segment_builder.add(line_data.address, () if entry.error else generated_bytes)
+        if line_data.mnemonic == "END":
+            end_operand = line_data.operand_str
+    segment_builder.finish()
+    return ImageResult(segment_builder.image, segment_builder.segments, symbol_table, errors_p1, list(errors_p2),
+                       end_operand, lines_p1)
+
+
+if __name__ == '__main__':
+    import glob
+    import os
+    from .assembler import pass_two
+
+    tests_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+    for path in sorted(glob.glob(os.path.join(tests_dir, "*.asm"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().strip().split('\n')
+        st, p1, e1 = pass_one(lines)
+        listing_2p, segments_2p, e2 = pass_two(p1, st)
+        result = assemble_image(lines)
+        same = ([(a, bytes(b)) for a, b in result.segments] == [(a, bytes(b)) for a, b in segments_2p]
+                and result.symbol_table.table == st.table
+                and result.errors_p1 == e1 and result.errors_p2 == e2
+                and result.listing() == listing_2p)
+        print(f"{os.path.basename(path):<28} {'AYNI' if same else 'FARKLI'}")
@@ -0,0 +1,123 @@
+# assembler_core/incbin.py
+# INCBIN "dosya"[,başlangıç[,uzunluk]] direktifi: ikili dosyaların (font, arama tablosu)
+# byte'larının olduğu gibi koda eklenmesi.
+#
+# Aynı tablo binlerce değerlik FCB satırları olarak yazıldığında her değer Pass 1'de
+# derlenir, Pass 2'de yeniden değerlendirilir ve byte byte bir listeye eklenir. INCBIN
+# satırının boyutu Pass 1'de sadece dosya uzunluğundan belirlenir; Pass 2 byte'ları
+# dosyanın mmap'i üzerinde bir memoryview dilimi olarak verir ve SegmentBuilder bunu
+# MemoryImage'a tek bir dilim atamasıyla kopyalar.
+#
+# Eşlenen dosyalar BinaryCache'te (mutlak yol -> (mtime_ns, boyut, memoryview)) tutulur;
+# aynı dosyanın Pass 2'deki (ve sonraki assemble'lardaki) kullanımı dosyayı yeniden
+# açmaz. Dosyanın mtime'ı veya boyutu değişince yeniden eşlenir.
+#
+# Göreli yollar INCLUDE'daki gibi satırı içeren dosyanın dizinine göre çözülür;
+# çözülen yol IncludeExpander tarafından kaydın file_path alanına yazılır.
+import mmap
+import os
+
+INCBIN_MNEMONIC = "INCBIN"
+
+
+def split_incbin_operand(operand_str):
+    """
+    INCBIN operandını dosya adı ve isteğe bağlı başlangıç/uzunluk ifadelerine ayırır.
+
+    Args:
+        operand_str (str): Örn. '"font.bin"', '"tablo.bin",$100' veya '"tablo.bin",OFS,256'.
+
+    Returns:
+        tuple: (dosya_adı, ifade_listesi) - ifade_listesi 0, 1 (başlangıç) veya 2 (başlangıç,
+               uzunluk) elemanlıdır.
+
+    Raises:
+        ValueError: Dosya adı tırnak içinde değilse veya ifade listesi geçersizse.
+    """
+    if not operand_str or operand_str[0] not in "\"'":
+        raise ValueError(f"dosya adı tırnak içinde olmalı: {operand_str}")
+    end = operand_str.find(operand_str[0], 1)
+    if end <= 1:
+        raise ValueError(f"geçersiz dosya adı: {operand_str}")
+    name = operand_str[1:end]
+    rest = operand_str[end + 1:].strip()
+    if not rest:
+        return name, []
+    if rest[0] != ',':
+        raise ValueError(f"dosya adından sonra ',' bekleniyordu: {rest}")
+    arguments = [item.strip() for item in rest[1:].split(',')]
+    if len(arguments) > 2 or not all(arguments):
+        raise ValueError(f"en fazla başlangıç ve uzunluk verilebilir: {rest[1:].strip()}")
+    return name, arguments
+
+
+def incbin_file_name(operand_str):
+    """INCBIN operandındaki dosya adı; operand geçersizse None."""
+    try:
+        return split_incbin_operand(operand_str)[0]
+    except ValueError:
+        return None
+
+
+class BinaryCache:
+    """
+    Salt okunur eşlenmiş (mmap) ikili dosyalar.
+
+    hits / misses sayaçları data() çağrılarını sayar.
+    """
+
+    def __init__(self):
+        self._files = {} # mutlak yol -> (mtime_ns, boyut, memoryview)
+        self.hits = 0
+        self.misses = 0
+
+    def data(self, path):
+        """
+        Dosyanın tüm içeriği (kopyasız memoryview; boş dosya için boş görünüm).
+
+        Raises:
+            OSError: Dosya açılamazsa.
+        """
+        stat = os.stat(path)
+        cached = self._files.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self.hits += 1
+            return cached[2]
+        if stat.st_size:
+            with open(path, 'rb') as f:
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            view = memoryview(b"") # Boş dosya eşlenemez
+        # Eski eşleme kapatılmaz; dağıtılmış dilimleri son referansla birlikte serbest kalır.
+        self._files[path] = (stat.st_mtime_ns, stat.st_size, view)
+        self.misses += 1
+        return view
+
+    def clear(self):
+        self._files.clear()
+
+    def summary(self):
+        return f"INCBIN önbelleği: {len(self._files)} dosya, {self.hits} isabet, {self.misses} ıska"
+
+
+# Süreç boyunca paylaşılan önbellek (sunucu modunda tüm isteklerde geçerli).
+default_binary_cache = BinaryCache()
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    for operand in ['"font.bin"', "'tablo.bin',$10", '"tablo.bin", OFS , 256', 'font.bin', '"a.bin" 3', '"a.bin",1,2,3']:
+        try:
+            print(f"{operand:<26} -> {split_incbin_operand(operand)}")
+        except ValueError as e:
+            print(f"{operand:<26} -> HATA: {e}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tablo.bin")
+        with open(path, 'wb') as f:
+            f.write(bytes(range(256)))
+        cache = BinaryCache()
+        view = cache.data(path)
+        print(len(view), bytes(view[16:20]).hex(), cache.data(path) is view, cache.summary())
+        del view
+        cache.clear()
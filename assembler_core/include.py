@@ -0,0 +1,232 @@
+# assembler_core/include.py
+# INCLUDE "dosya" direktifi: ortak başlık dosyalarının (EQU tanımları, makrolar yerine
+# kullanılan ortak rutinler) kaynağa eklenmesi.
+#
+# Dahil edilen her dosya süreç başına bir kez lexer'dan geçirilir ve IncludeCache'te
+# (mutlak yol -> (mtime_ns, boyut, satırların lexer alanları)) saklanır. Aynı dosyanın
+# sonraki INCLUDE'ları (aynı kaynakta, toplu modda aynı işçideki diğer dosyalarda veya
+# sunucu modunda sonraki isteklerde) dosyayı yeniden okumaz; saklanan alanlardan yeni
+# LineRecord'lar kurulup akışa eklenir. Dosyanın mtime'ı veya boyutu değişince
+# kayıtlar yeniden oluşturulur.
+#
+# Genişletilmiş akışta satır numaraları (line_num) sıralıdır; Diagnostic.line ve satırlar
+# arası başvurular bu numarayı kullanır. Numarası ana kaynaktaki satırıyla aynı olmayan
+# kayıtlarda source = (dosya_adı, dosyadaki_satır) tutulur (bkz. LineRecord.source); hata
+# mesajları bu kayıtları "dosya:satır" ile, listeleme de dosyadaki satır numarasıyla gösterir.
+#
+# INCBIN satırlarının dosya adları da burada, satırı içeren dosyanın dizinine göre
+# çözülür (kaydın file_path alanı); dosyanın kendisi Pass 1'de okunur (bkz. incbin.py).
+import os
+
+from .diagnostics import Diagnostic, PHASE_PASS1
+from .incbin import INCBIN_MNEMONIC, incbin_file_name
+from .lexer import parse_line_fast
+from .line_table import LineRecord
+
+INCLUDE_MNEMONIC = "INCLUDE"
+MAX_INCLUDE_DEPTH = 16
+
+
+def include_file_name(operand_str):
+    """INCLUDE operandındaki dosya adı ("..." veya '...' arasında); geçersizse None."""
+    if operand_str and len(operand_str) > 2 and operand_str[0] in "\"'" and operand_str[-1] == operand_str[0]:
+        return operand_str[1:-1]
+    return None
+
+
+def _lexed_fields(record):
+    return (record.original_line, record.label, record.mnemonic, record.operand_str, record.comment, record.error)
+
+
+class IncludeCache:
+    """
+    Dahil edilen dosyaların lexer sonuçları. Satır başına LineRecord'un lexer alanları
+    (original_line, label, mnemonic, operand_str, comment, error) bir tuple olarak
+    saklanır; IncludeExpander her eklemede bunlardan yeni kayıt kurar (kayıt kopyalamak
+    replace() ile alan alan yapılacağından daha yavaştır).
+
+    hits / misses sayaçları records() çağrılarını sayar.
+    """
+
+    def __init__(self):
+        self._files = {} # mutlak yol -> (mtime_ns, boyut, satır alanları)
+        self.hits = 0
+        self.misses = 0
+
+    def records(self, path):
+        """
+        Dosyanın satırlarının lexer alanları (dosyadaki satır sırasıyla).
+
+        Raises:
+            OSError: Dosya okunamazsa.
+            UnicodeDecodeError: Dosya UTF-8 değilse.
+        """
+        stat = os.stat(path)
+        cached = self._files.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self.hits += 1
+            return cached[2]
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        records = tuple(_lexed_fields(parse_line_fast(i, text)) for i, text in enumerate(lines, 1))
+        self._files[path] = (stat.st_mtime_ns, stat.st_size, records)
+        self.misses += 1
+        return records
+
+    def clear(self):
+        self._files.clear()
+
+    def summary(self):
+        return f"INCLUDE önbelleği: {len(self._files)} dosya, {self.hits} isabet, {self.misses} ıska"
+
+
+# Süreç boyunca paylaşılan önbellek (sunucu modunda tüm isteklerde geçerli).
+default_include_cache = IncludeCache()
+
+
+class IncludeExpander:
+    """
+    Kaynak satırlarını, INCLUDE'ları yerine eklenmiş LineRecord akışına çevirir.
+
+    Kullanım:
+        includes = IncludeExpander(os.path.dirname(path), os.path.basename(path))
+        for record in includes.records(source_lines):
+            process_line_pass1(record.line_num, record.original_line, ..., parsed_line_info=record)
+        includes.files   # dahil edilen dosyalar ve INCBIN dosyaları (önbellek geçerliliği için)
+
+    INCLUDE satırının kendisi akışta kalır (byte üretmez); dosyanın satırları hemen
+    ardından gelir. Dosya bulunamazsa, döngü oluşursa veya iç içe derinlik
+    MAX_INCLUDE_DEPTH'i aşarsa INCLUDE satırının error alanına bir Diagnostic
+    (kod INCLUDE) yazılır ve dosya eklenmez.
+    """
+
+    def __init__(self, base_dir=None, source_name="<kaynak>", cache=None, max_depth=MAX_INCLUDE_DEPTH):
+        """
+        Args:
+            base_dir (str): Ana kaynaktaki INCLUDE yollarının göreli olduğu dizin (None: çalışma dizini).
+                            İç içe INCLUDE'lar, onları içeren dosyanın dizinine göre çözülür.
+            source_name (str): Ana kaynağın adı (source alanında kullanılır).
+            cache (IncludeCache): None ise süreç boyunca paylaşılan default_include_cache.
+            max_depth (int): İzin verilen en fazla iç içe INCLUDE derinliği.
+        """
+        self.base_dir = base_dir or ""
+        self.source_name = source_name
+        self.cache = cache if cache is not None else default_include_cache
+        self.max_depth = max_depth
+        self.files = [] # Dahil edilen ve INCBIN ile okunan dosyaların mutlak yolları (ilk görülme sırasıyla)
+        self._line_num = 0
+
+    def records(self, source_lines):
+        """
+        Genişletilmiş akışın kayıtlarını üretir; her kayıt yeni bir nesnedir (yerinde
+        doldurulabilir). Her çağrıda files baştan toplanır.
+
+        Args:
+            source_lines (iterable[str]): Ana kaynağın satırları.
+
+        Yields:
+            LineRecord: line_num'ı akıştaki sırası olan kayıtlar.
+        """
+        self.files = []
+        self._line_num = 0
+        stack = [os.path.abspath(os.path.join(self.base_dir, self.source_name))]
+        shifted = False # Bir INCLUDE'dan sonra ana kaynağın satır numaraları kayar
+        for file_line, text in enumerate(source_lines, 1):
+            self._line_num += 1
+            record = parse_line_fast(self._line_num, text)
+            if shifted:
+                record.source = (self.source_name, file_line)
+            if record.mnemonic == INCLUDE_MNEMONIC:
+                included = self._resolve(record, self.base_dir, stack)
+                yield record
+                if included is not None:
+                    yield from self._splice(included, stack)
+                    shifted = True
+            else:
+                if record.mnemonic == INCBIN_MNEMONIC:
+                    self._resolve_binary(record, self.base_dir)
+                yield record
+
+    def _resolve(self, record, directory, stack):
+        """INCLUDE kaydının dosyasını çözer; hata varsa kayda yazar ve None döndürür."""
+        name = include_file_name(record.operand_str)
+        if name is None or record.error:
+            return None # Operand hatası Pass 1'de raporlanır
+        path = record.file_path = os.path.abspath(os.path.join(directory, name))
+        if path in stack:
+            return self._error(record, f"'{name}' zaten dahil ediliyor (döngüsel INCLUDE).", name)
+        if len(stack) > self.max_depth:
+            return self._error(record, f"iç içe INCLUDE derinliği {self.max_depth}'i aşıyor ('{name}').", name)
+        try:
+            records = self.cache.records(path)
+        except OSError as e:
+            return self._error(record, f"'{name}' açılamadı: {e.strerror or e}", name)
+        except UnicodeDecodeError:
+            return self._error(record, f"'{name}' UTF-8 metin dosyası değil.", name)
+        if path not in self.files:
+            self.files.append(path)
+        return path, records
+
+    def _resolve_binary(self, record, directory):
+        """INCBIN kaydının dosya yolunu çözer (dosya Pass 1'de okunur, hatalar orada raporlanır)."""
+        name = incbin_file_name(record.operand_str)
+        if name is None or record.error:
+            return
+        path = record.file_path = os.path.abspath(os.path.join(directory, name))
+        if path not in self.files:
+            self.files.append(path)
+
+    def _splice(self, included, stack):
+        path, records = included
+        name = os.path.basename(path)
+        directory = os.path.dirname(path)
+        stack.append(path)
+        try:
+            for file_line, fields in enumerate(records, 1):
+                self._line_num += 1
+                record = LineRecord(self._line_num, *fields, source=(name, file_line))
+                if record.mnemonic == INCLUDE_MNEMONIC:
+                    nested = self._resolve(record, directory, stack)
+                    yield record
+                    if nested is not None:
+                        yield from self._splice(nested, stack)
+                else:
+                    if record.mnemonic == INCBIN_MNEMONIC:
+                        self._resolve_binary(record, directory)
+                    yield record
+        finally:
+            stack.pop()
+
+    def _error(self, record, message, name):
+        record.error = Diagnostic(f"{record.location}: INCLUDE - {message}", "INCLUDE", record.line_num,
+                                  PHASE_PASS1, args=(name,))
+        return None
+
+
+def expand_includes(source_lines, base_dir=None, source_name="<kaynak>"):
+    """IncludeExpander(...).records(...) için kısayol (dahil edilen dosyaların listesi gerekmiyorsa)."""
+    return IncludeExpander(base_dir, source_name).records(source_lines)
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "io.inc"), 'w', encoding='utf-8') as f:
+            f.write("ACIA    EQU     $8000\n        INCLUDE \"regs.inc\"\n")
+        with open(os.path.join(tmp, "regs.inc"), 'w', encoding='utf-8') as f:
+            f.write("STATUS  EQU     ACIA\nDATA    EQU     ACIA+1\n")
+        with open(os.path.join(tmp, "loop.inc"), 'w', encoding='utf-8') as f:
+            f.write("        INCLUDE \"loop.inc\"\n")
+        source = [
+            "        INCLUDE \"io.inc\"",
+            "START   LDAA    STATUS",
+            "        INCLUDE \"yok.inc\"",
+            "        INCLUDE \"loop.inc\"",
+            "        END",
+        ]
+        for _ in range(2):
+            includes = IncludeExpander(tmp, "main.asm")
+            for record in includes.records(source):
+                print(f"{record.line_num:>3} {str(record.source):<20} {record.original_line:<28} {record.error or ''}")
+            print([os.path.basename(path) for path in includes.files], includes.cache.summary())
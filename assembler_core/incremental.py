@@ -0,0 +1,285 @@
+# assembler_core/incremental.py
+# Artımlı (incremental) yeniden assemble oturumu.
+#
+# GUI'de her F5'te tüm dosya baştan lexer'dan geçirilip kodlanıyordu. Bu oturum
+# bir önceki çalıştırmanın satır bazlı sonuçlarını saklar:
+#   - Lexer sonuçları satır metnine göre önbelleklenir; sadece yeni/düzenlenmiş
+#     satırlar lexer'dan geçer.
+#   - Düzenlemeden önceki ortak önek (prefix) satırların Pass 1 verisi ve
+#     adresleri aynen kullanılır; adresler sadece ilk değişen satırdan itibaren
+#     yeniden hesaplanır.
+#   - Pass 2'de bir satır, adresi değişmediyse ve operandında geçen sembollerin
+#     hiçbirinin değeri değişmediyse yeniden kodlanmaz.
+# Sonuçlar pass_one + pass_two ile aynıdır.
+#
+# INCLUDE içeren kaynaklarda satır numaraları dahil edilen dosyalara göre kaydığından
+# oturum tam assemble'a döner (dahil edilen dosyalar yine süreç önbelleğinden gelir).
+# INCBIN içeren kaynaklar da öyle: satırın metni değişmese de dosyası değişmiş olabilir.
+import re
+
+from .assembler import process_line_pass1, encode_line_pass2, pass_one, pass_two
+from .diagnostics import unique
+from .incbin import INCBIN_MNEMONIC
+from .include import INCLUDE_MNEMONIC, IncludeExpander
+from .lexer import parse_line_fast
+from .m6800_opcodes import ADDR_MODE_RELATIVE
+from .memory_image import SegmentBuilder
+from .symbol_table import SymbolTable
+
+_IDENTIFIER_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Boyutu sembol değerlerine bağlı olan veya akışı değiştiren pseudo-op'lar hızlı yoldan geçmez.
+# Dosyalara başvuran direktifler (INCLUDE, INCBIN) varsa oturum tam assemble'a döner.
+_FILE_OPS = {INCLUDE_MNEMONIC, INCBIN_MNEMONIC}
+_SYMBOL_DEPENDENT_OPS = {"ORG", "EQU", "RMB", "END"}
+
+
+class _LineState:
+    """Bir kaynak satırının son çalıştırmadaki durumu."""
+    __slots__ = ("text", "line_data", "lc_after", "p1_errors", "entry", "code", "p2_errors", "refs")
+
+    def __init__(self, text, line_data, lc_after, p1_errors):
+        self.text = text
+        self.line_data = line_data
+        self.lc_after = lc_after # Satırdan sonraki adres sayacı
+        self.p1_errors = p1_errors
+        self.entry = None
+        self.code = None
+        self.p2_errors = ()
+        self.refs = frozenset()
+
+
+class IncrementalAssembler:
+    """
+    Aynı kaynağın art arda düzenlenip assemble edildiği durumlar (GUI, sunucu modu)
+    için durum tutan assembler oturumu.
+
+    Kullanım:
+        session = IncrementalAssembler()
+        symbol_table, listing, segments, errors_p1, errors_p2 = session.assemble(lines)
+    """
+
+    def __init__(self, includes=None):
+        self.includes = includes if includes is not None else IncludeExpander() # INCLUDE'ları çözer
+        self._lex_cache = {}     # satır metni -> lexer kaydı (line_num hariç anlamlı)
+        self._size_cache = {}    # satır metni -> (boyut, adresleme_modu) (sembolden bağımsız satırlar)
+        self._refs_cache = {}    # operand metni -> operandda geçen isimler
+        self._lines = []         # önceki çalıştırmanın _LineState listesi
+        self._symbol_table = None
+        self.stats = {"lexed": 0, "pass1": 0, "encoded": 0}
+
+    def reset(self):
+        """Tüm önbellekleri ve önceki çalıştırma durumunu siler (örn. yeni dosya açıldığında)."""
+        self.__init__(self.includes)
+
+    # --- Yardımcılar ---
+    def _lex(self, line_num, text):
+        """Önbellekteki lexer kaydı; paylaşıldığı için yerinde değiştirilmemelidir."""
+        cached = self._lex_cache.get(text)
+        if cached is None:
+            cached = parse_line_fast(line_num, text)
+            self._lex_cache[text] = cached
+            self.stats["lexed"] += 1
+        return cached
+
+    def _operand_refs(self, operand_str):
+        if not operand_str:
+            return frozenset()
+        refs = self._refs_cache.get(operand_str)
+        if refs is None:
+            refs = frozenset(name.upper() for name in _IDENTIFIER_REGEX.findall(operand_str))
+            self._refs_cache[operand_str] = refs
+        return refs
+
+    def _pass1_line(self, line_num, text, symbol_table, location_counter):
+        """Tek satır için Pass 1; sembolden bağımsız satırlarda önbellekteki boyutu kullanır."""
+        lexed = self._lex(line_num, text)
+        sized = self._size_cache.get(text)
+        if sized is not None:
+            size, mode = sized
+            label = lexed["label"]
+            try:
+                if label:
+                    symbol_table.add_symbol(label.upper(), location_counter, line_num)
+            except ValueError:
+                pass # Tekrarlayan etiket: hata mesajını tam yol üretsin
+            else:
+                line_data = lexed.replace(line_num=line_num, address=location_counter, size=size,
+                                          addressing_mode=mode)
+                return line_data, location_counter + size, False, ()
+
+        errors = []
+        self.stats["pass1"] += 1
+        line_data, new_lc, is_end = process_line_pass1(
+            line_num, text, symbol_table, location_counter, errors, parsed_line_info=lexed.replace(line_num=line_num)
+        )
+        mnemonic = line_data["mnemonic"]
+        if not line_data.get("error") and mnemonic not in _SYMBOL_DEPENDENT_OPS:
+            self._size_cache[text] = (line_data["size"], line_data["addressing_mode"])
+        return line_data, new_lc, is_end, tuple(errors)
+
+    def _splice_suffix(self, new_lines, symbol_table, location_counter, old_lines, old_table, prefix, old_start, shift):
+        """
+        Düzenleme bölgesinden sonraki değişmemiş satırların Pass 1 sonuçlarını aynen devralır.
+
+        Sonek satırlarına girerken adres sayacı ve düzenleme bölgesinde tanımlanan semboller
+        önceki çalıştırmayla aynıysa, sonekteki her satırın Pass 1 sonucu da aynıdır.
+        Bu durumda satırlar tek tek işlenmez. Devralma yapılamıyorsa False döner.
+        """
+        old_lc_before = old_lines[old_start - 1].lc_after if old_start > 0 else 0
+        if location_counter != old_lc_before:
+            return False
+        suffix_states = old_lines[old_start:]
+        if any(state.p1_errors for state in suffix_states):
+            if shift:
+                return False # Hata mesajlarındaki satır numaraları değişirdi
+            middle_key = lambda table, name: (table.table[name], table.definitions[name])
+        else:
+            middle_key = lambda table, name: table.table[name]
+        old_middle = {name: middle_key(old_table, name) for name, line in old_table.definitions.items()
+                      if prefix < line <= old_start}
+        new_middle = {name: middle_key(symbol_table, name) for name, line in symbol_table.definitions.items()
+                      if line > prefix}
+        if old_middle != new_middle:
+            return False
+
+        for name, line in old_table.definitions.items():
+            if line > old_start:
+                symbol_table.table[name] = old_table.table[name]
+                symbol_table.definitions[name] = line + shift
+        if shift:
+            for state in suffix_states:
+                line_data = state.line_data.replace(line_num=state.line_data.line_num + shift)
+                new_lines.append(_LineState(state.text, line_data, state.lc_after, ()))
+        else:
+            new_lines.extend(suffix_states)
+        return True
+
+    # --- Ana giriş noktası ---
+    def assemble(self, source_lines):
+        """
+        Kaynağı, önceki çalıştırmadan değişmeyen kısımları yeniden kullanarak assemble eder.
+
+        Args:
+            source_lines (list[str]): Kaynak satırları.
+
+        Returns:
+            tuple: (symbol_table, listing_output, machine_code_segments, errors_p1, errors_p2)
+        """
+        if not isinstance(source_lines, list):
+            source_lines = list(source_lines)
+        self.stats = {"lexed": 0, "pass1": 0, "encoded": 0} # Son çalıştırmanın sayaçları
+        if any(self._lex(i + 1, text).mnemonic in _FILE_OPS for i, text in enumerate(source_lines)):
+            self._lines = []
+            self._symbol_table = None
+            symbol_table, lines_p1, errors_p1 = pass_one(source_lines, includes=self.includes)
+            listing_output, machine_code_segments, errors_p2 = pass_two(lines_p1, symbol_table)
+            return symbol_table, listing_output, machine_code_segments, unique(errors_p1), unique(errors_p2)
+        old_lines = self._lines
+        old_table = self._symbol_table
+
+        # Değişmeyen ortak önek ve sonek (editördeki tek bir düzenleme bölgesi varsayımı).
+        limit = min(len(old_lines), len(source_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix].text == source_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and \
+              old_lines[len(old_lines) - 1 - suffix].text == source_lines[len(source_lines) - 1 - suffix]:
+            suffix += 1
+        shift = len(source_lines) - len(old_lines) # Sonek satırlarının numara kayması
+
+        # --- Pass 1 ---
+        symbol_table = SymbolTable()
+        new_lines = []
+        location_counter = 0
+
+        # Önek satırları aynen geçerli: Pass 1 verisi ve tanımladıkları semboller kopyalanır.
+        # (END önekte kaldıysa önceki çalıştırmadaki satır listesi zaten orada bitiyordur.)
+        for state in old_lines[:prefix]:
+            new_lines.append(state)
+        if prefix:
+            for name, def_line in old_table.definitions.items():
+                if def_line <= prefix:
+                    symbol_table.table[name] = old_table.table[name]
+                    symbol_table.definitions[name] = def_line
+            location_counter = old_lines[prefix - 1].lc_after
+
+        ended = prefix and _is_end_line(old_lines[prefix - 1].line_data)
+        if not ended:
+            suffix_start = len(source_lines) - suffix
+            for i in range(prefix, len(source_lines)):
+                if i == suffix_start and self._splice_suffix(
+                        new_lines, symbol_table, location_counter, old_lines, old_table, prefix, i - shift, shift):
+                    break
+                text = source_lines[i]
+                line_data, location_counter, is_end, p1_errors = self._pass1_line(
+                    i + 1, text, symbol_table, location_counter
+                )
+                new_lines.append(_LineState(text, line_data, location_counter, p1_errors))
+                if is_end:
+                    break
+
+        # --- Değişen semboller ---
+        if old_table is None:
+            changed_symbols = None # İlk çalıştırma: her şey kodlanır
+        else:
+            old_values, new_values = old_table.table, symbol_table.table
+            changed_symbols = {name for name in old_values.keys() | new_values.keys()
+                               if old_values.get(name) != new_values.get(name)}
+
+        # --- Pass 2 ---
+        listing_output = []
+        segment_builder = SegmentBuilder()
+        errors_p1 = []
+        errors_p2 = []
+        old_count = len(old_lines)
+        for i, state in enumerate(new_lines):
+            line_data = state.line_data
+            errors_p1.extend(state.p1_errors)
+
+            if state.entry is None or i >= prefix:
+                # Eski karşılık: önekte aynı indeks, sonekte kaydırılmış indeks.
+                old_index = i - shift if i >= len(source_lines) - suffix else -1
+                old = old_lines[old_index] if 0 <= old_index < old_count else None
+                refs = self._operand_refs(line_data["operand_str"])
+                if old is not None and changed_symbols is not None and old.entry is not None and \
+                   not old.entry.get("error") and not line_data.get("error") and \
+                   refs.isdisjoint(changed_symbols) and \
+                   (old.line_data["address"] == line_data["address"] or
+                    (line_data["addressing_mode"] != ADDR_MODE_RELATIVE and "*" not in (line_data["operand_str"] or ""))):
+                    # Relative ve '*' (konum sayacı) içermeyen kodlamalar satırın kendi adresine
+                    # bağlı değildir; adres kaydıysa sadece listeleme alanları güncellenir.
+                    entry = old.entry
+                    if entry.record is not line_data:
+                        entry = entry.with_record(line_data)
+                    state.entry, state.code, state.p2_errors = entry, old.code, ()
+                else:
+                    line_errors = []
+                    self.stats["encoded"] += 1
+                    state.entry, state.code = encode_line_pass2(line_data, symbol_table, line_errors)
+                    state.p2_errors = tuple(line_errors)
+                state.refs = refs
+            elif changed_symbols and not state.refs.isdisjoint(changed_symbols):
+                # Önekteki satır değişmedi ama kullandığı bir sembolün değeri değişti.
+                line_errors = []
+                self.stats["encoded"] += 1
+                state.entry, state.code = encode_line_pass2(line_data, symbol_table, line_errors)
+                state.p2_errors = tuple(line_errors)
+            errors_p2.extend(state.p2_errors)
+
+            listing_output.append(state.entry)
+            if state.code is None: # Pass 1 hatalı satır
+                continue
+            segment_builder.add(line_data["address"], () if state.entry.get("error") else state.code)
+        segment_builder.finish()
+        machine_code_segments = segment_builder.segments
+
+        self._lines = new_lines
+        self._symbol_table = symbol_table
+        return symbol_table, listing_output, machine_code_segments, unique(errors_p1), unique(errors_p2)
+
+
+def _is_end_line(line_data):
+    return line_data["mnemonic"] == "END" and not line_data.get("error")
+
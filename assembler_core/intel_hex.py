@@ -0,0 +1,153 @@
+# assembler_core/intel_hex.py
+# Intel HEX yazıcı ve yükleyici.
+#
+# M6800'ün adres alanı 16-bit olduğundan sadece iki kayıt türü gerekir:
+#   00: veri (":" + byte sayısı + adres + "00" + veri + checksum)
+#   01: dosya sonu (":00000001FF")
+# Checksum; byte sayısı, adres, tür ve veri byte'larının toplamının ikiye tümleyeninin
+# düşük byte'ıdır (kaydın tüm byte'larının toplamı 0 olur).
+#
+# Yazıcı S19 yazıcısıyla aynı şekilde çalışır: segmentler birleştirilip kayıtlara
+# çevrilir, kayıtlar tek bir tamponda toplanır. Yükleyici dosyayı 64 KiB'lık bir
+# bellek imajına (bytearray) okur.
+from .output_files import HEX_BYTE, RecordFileWriter, coalesce_segments
+
+DEFAULT_RECORD_LENGTH = 16
+MAX_RECORD_LENGTH = 255
+
+MEMORY_SIZE = 0x10000
+
+EOF_RECORD = ":00000001FF\n"
+
+
+def _data_records(address, byte_codes, record_length):
+    data = bytes(byte_codes)
+    records = []
+    offset = 0
+    while offset < len(data):
+        record_address = (address + offset) & 0xFFFF
+        # Kayıt $FFFF'i aşamaz: adres alanının sonunda kesilir, kalanı $0000'dan yeni kayıtla sürer.
+        chunk = data[offset:offset + min(record_length, MEMORY_SIZE - record_address)]
+        offset += len(chunk)
+        high, low = record_address >> 8, record_address & 0xFF
+        count = len(chunk)
+        checksum = -(count + high + low + sum(chunk)) & 0xFF
+        records.append(f":{HEX_BYTE[count]}{HEX_BYTE[high]}{HEX_BYTE[low]}00{chunk.hex().upper()}{HEX_BYTE[checksum]}\n")
+    return records
+
+
+def _check_record_length(record_length):
+    if not 1 <= record_length <= MAX_RECORD_LENGTH:
+        raise ValueError(f"Intel HEX kayıt uzunluğu 1-{MAX_RECORD_LENGTH} aralığında olmalı: {record_length}")
+
+
+def format_intel_hex(segments, record_length=DEFAULT_RECORD_LENGTH):
+    """
+    Makine kodu segmentlerini Intel HEX metnine çevirir.
+
+    Args:
+        segments (list): (adres, byte_listesi) çiftleri (pass_two'nun machine_code_segments'i).
+        record_length (int): Veri kaydı başına en fazla byte.
+
+    Returns:
+        str: Intel HEX dosyasının içeriği (01 kaydıyla biter).
+    """
+    _check_record_length(record_length)
+    records = []
+    for address, data in coalesce_segments(segments):
+        records.extend(_data_records(address, data, record_length))
+    records.append(EOF_RECORD)
+    return "".join(records)
+
+
+class IntelHexWriter(RecordFileWriter):
+    """Intel HEX dosyasını segmentler geldikçe oluşturur (bkz. RecordFileWriter)."""
+
+    def __init__(self, output_filepath, record_length=DEFAULT_RECORD_LENGTH):
+        _check_record_length(record_length)
+        super().__init__(output_filepath, record_length)
+
+    def data_records(self, address, data):
+        return _data_records(address, data, self.record_length)
+
+    def trailer_records(self):
+        return [EOF_RECORD]
+
+
+def read_intel_hex(source, image=None):
+    """
+    Bir Intel HEX dosyasını bellek imajına yükler ve checksum'ları doğrular.
+
+    Args:
+        source (str | iterable): Dosya yolu veya satırlar.
+        image (bytearray, optional): Yüklenecek 64 KiB imaj; verilmezse sıfırlarla yeni bir imaj oluşturulur.
+
+    Returns:
+        tuple: (image, loaded_ranges)
+               image: 64 KiB bytearray,
+               loaded_ranges: yazılan (başlangıç, bitiş_hariç) adres aralıkları, dosyadaki sırayla
+               (ardışık kayıtlar birleştirilir).
+
+    Raises:
+        ValueError: Biçim veya checksum hatasında ("Satır N: ..." mesajıyla).
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='ascii') as f:
+            return read_intel_hex(f.read().splitlines(), image)
+
+    if image is None:
+        image = bytearray(MEMORY_SIZE)
+    loaded_ranges = []
+    range_start = range_end = None
+    for line_num, line in enumerate(source, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] != ":" or len(line) < 11 or len(line) % 2 == 0:
+            raise ValueError(f"Satır {line_num}: Geçersiz Intel HEX kaydı: {line}")
+        try:
+            raw = bytes.fromhex(line[1:])
+        except ValueError:
+            raise ValueError(f"Satır {line_num}: Intel HEX kaydı geçersiz hex içeriyor: {line}")
+        count = raw[0]
+        if count != len(raw) - 5:
+            raise ValueError(f"Satır {line_num}: Intel HEX byte sayısı uyuşmuyor: {line}")
+        if sum(raw) & 0xFF:
+            raise ValueError(f"Satır {line_num}: Intel HEX checksum hatası: {line}")
+        record_type = raw[3]
+        if record_type == 0x00:
+            address = (raw[1] << 8) | raw[2]
+            end = address + count
+            if end > MEMORY_SIZE:
+                raise ValueError(f"Satır {line_num}: Intel HEX kaydı 64 KiB adres alanını aşıyor: {line}")
+            image[address:end] = raw[4:4 + count]
+            if address == range_end:
+                range_end = end
+            else:
+                if range_start is not None:
+                    loaded_ranges.append((range_start, range_end))
+                range_start, range_end = address, end
+        elif record_type == 0x01:
+            break
+        else:
+            raise ValueError(f"Satır {line_num}: Desteklenmeyen Intel HEX kayıt türü: {record_type:02X}")
+    if range_start is not None:
+        loaded_ranges.append((range_start, range_end))
+    return image, loaded_ranges
+
+
+if __name__ == '__main__':
+    segments = [(0x1000, [0x86, 0x10, 0xC6, 0x20, 0x3F] * 5), (0x2000, [0x01, 0x02])]
+    text = format_intel_hex(segments)
+    print(text, end="")
+    image, ranges = read_intel_hex(text.splitlines())
+    print("Yüklenen aralıklar:", [(f"${s:04X}", f"${e:04X}") for s, e in ranges])
+    print("Aynı:", all(image[a:a + len(d)] == bytes(d) for a, d in segments))
+
+    # $FFFF'i aşan segment: $FFFE-$FFFF ve $0000-$0002 iki ayrı kayda bölünür
+    wrapped = [(0xFFFE, [0x01, 0x02, 0x03, 0x04, 0x05])]
+    text = format_intel_hex(wrapped)
+    print(text, end="")
+    image, ranges = read_intel_hex(text.splitlines())
+    print("Yüklenen aralıklar:", [(f"${s:04X}", f"${e:04X}") for s, e in ranges])
+    print("Aynı:", bytes(image[0xFFFE:]) + bytes(image[:3]) == bytes(wrapped[0][1]))
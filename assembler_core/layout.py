@@ -0,0 +1,325 @@
+# assembler_core/layout.py
+# DIRECT adreslemeye küçülten optimize yerleşim (layout) modu.
+#
+# determine_addressing_mode_and_size, operandı etiket olan komutları (etiket henüz
+# tanımlanmamış olabileceğinden) her zaman EXTENDED (3 byte) boyutlandırır. Sıfır
+# sayfadaki ($00-$FF) değişkenlere yapılan başvurular bu yüzden bir byte ve bir
+# çevrim fazla tutar. Bu mod Pass 1'i yineleyerek, değeri son yerleşimde 8 bit'e
+# sığan bu tür satırları DIRECT'e (2 byte) küçültür.
+#
+# Küçültme satırdan sonraki adresleri kaydırır; bu da başka satırların küçülebilmesini
+# sağlayabilir veya (örn. "$200-ETIKET" gibi ifadelerde) küçültülmüş bir satırın
+# değerini 8 bit'in dışına itebilir. Sonlanma kuralı: her satır sadece tek yönde,
+#   aday -> DIRECT -> EXTENDED'a sabitlenmiş
+# durumlarından geçer; sabitlenen satır bir daha küçültülmez. Değişiklik olan her
+# yineleme en az bir satırı bir adım ilerlettiğinden yineleme sayısı en fazla
+# 2 * satır_sayısı + 1'dir. Değişiklik olmayan son yinelemede tüm DIRECT satırların
+# değerleri 8 bit'e sığar (sabit nokta).
+#
+# Etiketli başvurular yeni adresleri izler, ama '*' içeren ("BRA *+5") veya sadece sayıdan
+# oluşan ("JMP $1004") operandlar izlemez: küçültülen satır başvuranla hedefin arasındaysa
+# hedef komutun ortasına düşebilir. Böyle bir başvurunun aştığı satırlar küçültülmez
+# (bkz. FixedReferences); rapordaki referenced_lines bunları listeler.
+from bisect import bisect_right
+
+from .assembler import process_line_pass1, pass_two
+from .diagnostics import DiagnosticStore
+from .expressions import compile_operand
+from .include import IncludeExpander
+from .m6800_opcodes import ADDR_MODE_DIRECT, ADDR_MODE_EXTENDED, ADDR_MODE_IMMEDIATE, ADDR_MODE_INDEXED, \
+                           MODE_INDEX
+from .symbol_table import SymbolTable
+
+
+class LayoutReport:
+    """
+    optimize_layout() sonucunun özeti.
+
+    iterations:   Pass 1'in kaç kez çalıştığı.
+    direct_lines: DIRECT'e küçültülen satırların numaraları (artan sırada).
+    pinned_lines: Küçültüldükten sonra değeri 8 bit'i aştığı için EXTENDED'a sabitlenen satırlar.
+    referenced_lines: '*' içeren veya sayısal bir başvurunun aştığı için küçültülmeyen satırlar:
+                  [(satır, başvuran_satır), ...].
+    bytes_saved:  Kazanılan program byte'ı.
+    cycles_saved: Küçültülen komutların her biri bir kez çalıştığında kazanılan toplam çevrim.
+    """
+    __slots__ = ("iterations", "direct_lines", "pinned_lines", "referenced_lines", "bytes_saved", "cycles_saved")
+
+    def __init__(self, iterations, direct_lines, pinned_lines, bytes_saved, cycles_saved, referenced_lines=()):
+        self.iterations = iterations
+        self.direct_lines = direct_lines
+        self.pinned_lines = pinned_lines
+        self.referenced_lines = list(referenced_lines)
+        self.bytes_saved = bytes_saved
+        self.cycles_saved = cycles_saved
+
+    def summary(self):
+        text = (f"DIRECT'e küçültülen {len(self.direct_lines)} komut: {self.bytes_saved} byte, "
+                f"{self.cycles_saved} çevrim kazanç ({self.iterations} yineleme)")
+        if self.pinned_lines:
+            text += f"; EXTENDED'a sabitlenen {len(self.pinned_lines)} satır"
+        if self.referenced_lines:
+            text += f"; sabit adres/'*' başvurusu nedeniyle küçültülmeyen {len(self.referenced_lines)} satır"
+        return text
+
+    def __repr__(self):
+        return f"LayoutReport({self.summary()})"
+
+
+def _operand_value(record, symbol_table):
+    """Operandın son sembol tablosuyla değeri; çözülemiyorsa None."""
+    try:
+        return compile_operand(record.operand_str).evaluate(symbol_table, record.address)
+    except (ValueError, AttributeError): # ExpressionError dahil; AttributeError: operandsız (None) ifade
+        return None
+
+
+class FixedReferences:
+    """
+    Yerleşim değişince hedefini izlemeyen başvurular: operandında '*' olan veya sadece
+    sayılardan oluşan komutlar (8-bit immediate ve indexed offset hariç), FDB değerleri ve
+    '*' içeren EQU'lar. Her başvuru, boyutu değişirse (veya silinirse) başvuruyu bozacak
+    satır adreslerinin kapalı bir aralığını verir:
+
+      '*' içeren: başvuranın adresiyle hedef arası (ikisi dahil)
+      sayısal   : hedefi içeren bitişik bölümün (ORG'lar arası, RMB dahil) başından hedefe kadar
+
+    Args:
+        lines (list[LineRecord]): Pass 1 kayıtları.
+        symbol_table (SymbolTable): Pass 1 sonrası sembol tablosu.
+    """
+
+    def __init__(self, lines, symbol_table):
+        sections = [] # [başlangıç, bitiş) bitişik bölümler
+        references = [] # (başvuranın_adresi, hedef, '*' içeriyor mu, satır)
+        location = start = 0
+        for record in lines:
+            if record.error:
+                continue
+            if record.address is not None and record.address != location:
+                if location != start:
+                    sections.append((start, location))
+                start = record.address
+            if record.address is not None:
+                location = record.address + record.size
+            for expression in _reference_expressions(record):
+                if expression.uses_location or not expression.symbols:
+                    try:
+                        target = expression.evaluate(symbol_table, location if record.address is None
+                                                     else record.address)
+                    except ValueError: # ExpressionError
+                        continue
+                    references.append((location if record.address is None else record.address, target,
+                                       expression.uses_location, record.line_num))
+        if location != start:
+            sections.append((start, location))
+
+        spans = []
+        for address, target, relative, line_num in references:
+            if relative:
+                spans.append((min(address, target), max(address, target), line_num))
+            else:
+                spans.extend((low, target, line_num) for low, high in sections if low < target <= high)
+        spans.sort()
+        self._spans = spans
+        self._lows = [low for low, _, _ in spans]
+        self._reach = [] # Ön ek boyunca en uzak üst sınır ve onun satırı
+        best = (-1, None)
+        for _, high, line_num in spans:
+            if high > best[0]:
+                best = (high, line_num)
+            self._reach.append(best)
+
+    def crossing(self, address, ignore=()):
+        """
+        address'teki satırın boyutu değişirse bozulan bir başvurunun satırı; yoksa None.
+
+        Args:
+            ignore (container): Sayılmayacak başvuran satırlar (örn. kendisi yeniden yazılanlar).
+        """
+        count = bisect_right(self._lows, address)
+        if not count:
+            return None
+        high, line_num = self._reach[count - 1]
+        if high < address:
+            return None
+        if line_num not in ignore:
+            return line_num
+        return next((line_num for _, high, line_num in self._spans[:count]
+                     if high >= address and line_num not in ignore), None)
+
+
+def _reference_expressions(record):
+    """Satırın adres olabilecek operand ifadeleri."""
+    if not record.operand_str or not record.mnemonic:
+        return ()
+    mnemonic = record.mnemonic.upper()
+    try:
+        if mnemonic == "FDB":
+            return [compile_operand(item) for item in record.operand_str.split(",")]
+        if mnemonic == "EQU":
+            expression = compile_operand(record.operand_str)
+            return (expression,) if expression.uses_location else ()
+        mode = record.addressing_mode
+        if mode is None or mode == ADDR_MODE_INDEXED or (mode == ADDR_MODE_IMMEDIATE and record.size == 2):
+            return ()
+        return (compile_operand(record.operand_str),)
+    except ValueError: # ExpressionError
+        return ()
+
+
+def _is_candidate(record):
+    """EXTENDED boyutlandırılmış ve DIRECT biçimi de olan komut satırı mı?"""
+    if record.error or record.addressing_mode != ADDR_MODE_EXTENDED:
+        return False
+    return ADDR_MODE_DIRECT in MODE_INDEX[record.mnemonic.upper()]
+
+
+def _pass_one(source_lines, direct_lines, symbols, includes):
+    """pass_one; direct_lines'taki EXTENDED satırlar DIRECT boyutuyla yerleştirilir."""
+    symbol_table = symbols.copy() if symbols is not None else SymbolTable()
+    processed_lines = []
+    errors = DiagnosticStore()
+    location_counter = 0
+    for record in includes.records(source_lines):
+        line_data, location_counter, is_end = process_line_pass1(
+            record.line_num, record.original_line, symbol_table, location_counter, errors, parsed_line_info=record
+        )
+        if line_data.line_num in direct_lines and line_data.addressing_mode == ADDR_MODE_EXTENDED:
+            direct_size = MODE_INDEX[line_data.mnemonic.upper()][ADDR_MODE_DIRECT][1]
+            location_counter -= line_data.size - direct_size
+            line_data.addressing_mode = ADDR_MODE_DIRECT
+            line_data.size = direct_size
+        processed_lines.append(line_data)
+        if is_end:
+            break
+    return symbol_table, processed_lines, list(errors)
+
+
+def _savings(mnemonic):
+    """Bir komutun DIRECT'e küçültülmesinin (byte, çevrim) kazancı."""
+    modes = MODE_INDEX[mnemonic]
+    _, extended_size, extended_cycles = modes[ADDR_MODE_EXTENDED]
+    _, direct_size, direct_cycles = modes[ADDR_MODE_DIRECT]
+    return extended_size - direct_size, extended_cycles - direct_cycles
+
+
+def optimize_layout(source_lines, symbols=None, includes=None):
+    """
+    Pass 1'i, DIRECT'e sığan EXTENDED komutları küçülterek sabit noktaya kadar yineler.
+    Kaynakta Pass 1 hatası varsa küçültme yapılmaz (ilk yinelemenin sonucu döner).
+
+    Args:
+        source_lines (iterable[str]): Kaynak satırları (birden çok kez okunur).
+        symbols (SymbolTable): Önceden yüklenmiş semboller (bkz. pass_one); None ise boş tablo.
+        includes (IncludeExpander): INCLUDE'ları çözen genişletici; None ise çalışma dizinine göre çözülür.
+
+    Returns:
+        tuple: (symbol_table, processed_lines, errors_p1, report (LayoutReport)) - ilk üçü pass_one ile aynı biçimde.
+    """
+    if not isinstance(source_lines, (list, tuple)):
+        source_lines = list(source_lines)
+    if includes is None:
+        includes = IncludeExpander()
+    direct_lines = set()
+    pinned_lines = set()
+    referenced = {} # Sabit başvuru nedeniyle küçültülmeyen satır -> başvuran satır
+    iterations = 0
+    while True:
+        iterations += 1
+        symbol_table, lines, errors_p1 = _pass_one(source_lines, direct_lines, symbols, includes)
+        if errors_p1:
+            break
+        references = FixedReferences(lines, symbol_table)
+        changed = False
+        for record in lines:
+            line_num = record.line_num
+            if line_num in pinned_lines or line_num in referenced:
+                continue
+            if line_num in direct_lines:
+                value = _operand_value(record, symbol_table)
+                crossing = references.crossing(record.address)
+                if crossing is not None:
+                    direct_lines.discard(line_num)
+                    referenced[line_num] = crossing
+                    changed = True
+                elif value is None or not 0 <= value <= 0xFF: # Kayma değeri 8 bit'in dışına itti
+                    direct_lines.discard(line_num)
+                    pinned_lines.add(line_num)
+                    changed = True
+            elif _is_candidate(record):
+                value = _operand_value(record, symbol_table)
+                if value is not None and 0 <= value <= 0xFF:
+                    crossing = references.crossing(record.address)
+                    if crossing is not None:
+                        referenced[line_num] = crossing
+                    else:
+                        direct_lines.add(line_num)
+                    changed = True
+        if not changed:
+            break
+
+    bytes_saved = cycles_saved = 0
+    shrunk = []
+    for record in lines:
+        if record.line_num in direct_lines and record.addressing_mode == ADDR_MODE_DIRECT:
+            saved_bytes, saved_cycles = _savings(record.mnemonic.upper())
+            bytes_saved += saved_bytes
+            cycles_saved += saved_cycles
+            shrunk.append(record.line_num)
+    report = LayoutReport(iterations, shrunk, sorted(pinned_lines), bytes_saved, cycles_saved, sorted(referenced.items()))
+    return symbol_table, lines, errors_p1, report
+
+
+def assemble_optimized(source_lines, symbols=None, includes=None, workers=1):
+    """
+    optimize_layout + pass_two (workers pass_two'ya iletilir).
+
+    Returns:
+        tuple: (symbol_table, listing_output, machine_code_segments, errors_p1, errors_p2, report)
+    """
+    symbol_table, lines, errors_p1, report = optimize_layout(source_lines, symbols, includes)
+    listing_output, machine_code_segments, errors_p2 = pass_two(lines, symbol_table, workers)
+    return symbol_table, listing_output, machine_code_segments, errors_p1, errors_p2, report
+
+
+if __name__ == '__main__':
+    import glob
+    import os
+    from .assembler import pass_one
+
+    source = [
+        "        ORG     $1000",
+        "START   LDAA    COUNT       ; ileri referans, sıfır sayfada",
+        "        STAA    FLAGS",
+        "        LDX     PTR",
+        "        LDAB    $110B-TAIL  ; küçültülürse TAIL kayar, değer 8 bit'in dışına çıkar",
+        "        JMP     START       ; JMP'nin DIRECT biçimi yok",
+        "TAIL    RTS",
+        "        BRA     *+5         ; '*' başvurusu aradaki LDAA'nın küçültülmesini engeller",
+        "        LDAA    FLAGS",
+        "        ADDA    #1",
+        "        RTS",
+        "        ORG     $0080",
+        "COUNT   RMB     1",
+        "FLAGS   RMB     1",
+        "PTR     RMB     2",
+        "        END",
+    ]
+    for line in source:
+        print(line)
+    symbol_table, listing, segments, errors_p1, errors_p2, report = assemble_optimized(source)
+    print(report.summary(), "| DIRECT:", report.direct_lines, "| sabitlenen:", report.pinned_lines,
+          "| başvuru nedeniyle:", report.referenced_lines)
+    for entry in listing:
+        print(f"  {entry['line_num']:>3} {entry['address_hex']:<6} {entry['machine_code_hex']:<8} {entry['original_line']}")
+    print("Hatalar:", errors_p1 + errors_p2)
+
+    tests_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+    for path in sorted(glob.glob(os.path.join(tests_dir, "*.asm"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().strip().split('\n')
+        _, _, e1 = pass_one(lines)
+        _, _, _, o1, o2, report = assemble_optimized(lines)
+        status = "hatalı kaynak" if e1 else ("hatasız" if not o1 and not o2 else f"YENİ HATA {o1 + o2}")
+        print(f"{os.path.basename(path):<28} {status:<14} {report.summary()}")
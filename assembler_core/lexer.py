@@ -1,5 +1,6 @@
 # assembler_core/lexer.py
 import re
+import sys
 # OPCODE_TABLE'ı import etmemiz gerekecek, bu yüzden bir üst dizindeki
 # m6800_opcodes.py dosyasından alacağız.
 # Proje yapınıza göre bu import yolu değişebilir.
@@ -7,6 +8,7 @@ import re
 # from .m6800_opcodes import OPCODE_TABLE
 # Eğer assembler_core bir paketse ve ana dizinden çalıştırıyorsanız:
 from .m6800_opcodes import OPCODE_TABLE, PSEUDO_OPS # Bu satırı ana script'ten çalıştırırken kullanın
+from .line_table import LineRecord
 
 
 # Etiketler için geçerli karakterler (basit bir regex)
@@ -15,25 +17,30 @@ from .m6800_opcodes import OPCODE_TABLE, PSEUDO_OPS # Bu satırı ana script'ten
 # Şimdilik uzunluk kontrolü eklemeyelim.
 LABEL_REGEX = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# Mnemonic'lerin tek (intern edilmiş) kopyaları: her satırda .upper() ile üretilen
+# string yerine bu nesneler saklanır.
+_CANONICAL_MNEMONICS = {name: name for name in list(OPCODE_TABLE) + list(PSEUDO_OPS)}
+
+# parse_line_fast için önceden hesaplanmış büyük/küçük harf varyantları (LDAA, ldaa, Ldaa).
+# Diğer karışık yazımlar .upper() ile _CANONICAL_MNEMONICS'ten bulunur.
+_MNEMONIC_LOOKUP = {}
+for _name in _CANONICAL_MNEMONICS:
+    for _variant in (_name, _name.lower(), _name.capitalize()):
+        _MNEMONIC_LOOKUP[_variant] = _name
+del _name, _variant
+
 def parse_line(line_number, text_line):
     """
     Bir assembly satırını etiket, mnemonic, operand ve yorum olarak ayırır.
     OPCODE_TABLE ve PSEUDO_OPS kullanarak etiket ve mnemonic ayrımını yapar.
-    Dönüş: {"line_num": int, "original_line": str, "label": str|None,
-            "mnemonic": str|None, "operand_str": str|None, "comment": str|None, "error": str|None}
+    Dönüş: LineRecord (sözlük gibi de okunabilir): line_num, original_line, label,
+           mnemonic, operand_str, comment, error alanları doldurulur; address/size/
+           addressing_mode alanlarını Pass 1 aynı kayıt üzerinde doldurur.
     """
     original_line = text_line
     processed_line = text_line.strip() # Başta ve sonda olabilecek tüm boşlukları kaldır
 
-    result = {
-        "line_num": line_number,
-        "original_line": original_line.rstrip('\n'),
-        "label": None,
-        "mnemonic": None,
-        "operand_str": None,
-        "comment": None,
-        "error": None
-    }
+    result = LineRecord(line_number, original_line.rstrip('\n'))
 
     if not processed_line: # Boş satır
         return result
@@ -41,7 +48,7 @@ def parse_line(line_number, text_line):
     # 1. Yorumu ayır
     if ';' in processed_line:
         code_part, comment_part = processed_line.split(';', 1)
-        result["comment"] = comment_part.strip()
+        result.comment = comment_part.strip()
         processed_line = code_part.strip() # Yorumsuz kısmı tekrar işle
     
     if not processed_line: # Sadece yorum içeren satır
@@ -82,20 +89,21 @@ def parse_line(line_number, text_line):
        first_word not in OPCODE_TABLE and \
        first_word not in PSEUDO_OPS and \
        LABEL_REGEX.match(parts[0]): # parts[0] orijinal haliyle (büyük/küçük harf) etiket formatına uyuyor mu?
-        result["label"] = parts[0] # Etiketi orijinal haliyle sakla, ama karşılaştırmalarda .upper() kullan
+        result.label = sys.intern(parts[0]) # Etiketi orijinal haliyle sakla, ama karşılaştırmalarda .upper() kullan
         if len(parts) > 1: # Etiketten sonra komut var
-            result["mnemonic"] = parts[1].upper()
+            mnemonic = parts[1].upper()
+            result.mnemonic = _CANONICAL_MNEMONICS.get(mnemonic, mnemonic)
             if len(parts) > 2: # Komuttan sonra operand var
-                result["operand_str"] = parts[2].strip() # Operandın başındaki/sonundaki boşlukları al
+                result.operand_str = parts[2].strip() # Operandın başındaki/sonundaki boşlukları al
         # else: Sadece etiket var, mnemonic ve operand None kalacak (EQU için özel durum olabilir)
 
     elif first_word in OPCODE_TABLE or first_word in PSEUDO_OPS:
         # İlk kelime bir komut veya pseudo-op. Etiket yok.
-        result["mnemonic"] = first_word # Zaten upper() yapılmıştı
+        result.mnemonic = _CANONICAL_MNEMONICS[first_word] # Zaten upper() yapılmıştı
         if len(parts) > 1: # Komuttan sonra operand var
-            result["operand_str"] = parts[1].strip()
+            result.operand_str = parts[1].strip()
             if len(parts) > 2: # Operand birden fazla kelime olabilir (örn: FCC "HELLO WORLD")
-                result["operand_str"] += " " + parts[2].strip() # Geri kalanını birleştir
+                result.operand_str += " " + parts[2].strip() # Geri kalanını birleştir
         # else: Komut var ama operand yok (örn: NOP, INCA)
     
     else:
@@ -105,19 +113,19 @@ def parse_line(line_number, text_line):
         # Bu durumu daha sonraki aşamalarda (Pass 1) daha iyi ele alabiliriz.
         # Şimdilik, eğer LABEL_REGEX ile eşleşiyorsa sadece etiket olarak alalım.
         if LABEL_REGEX.match(parts[0]) and len(parts) == 1:
-            result["label"] = parts[0]
+            result.label = sys.intern(parts[0])
         elif parts: # parts boş değilse ama tanımsızsa
-            result["error"] = f"Tanımsız ifade veya geçersiz komut: '{parts[0]}'"
+            result.error = f"Tanımsız ifade veya geçersiz komut: '{parts[0]}'"
 
 
     # Mnemonic'in geçerliliğini (eğer varsa) kontrol et.
     # Bu zaten yukarıdaki mantıkla büyük ölçüde yapıldı.
     # Ama yine de bir son kontrol:
-    if result["mnemonic"] and \
-       result["mnemonic"] not in OPCODE_TABLE and \
-       result["mnemonic"] not in PSEUDO_OPS:
-        result["error"] = f"Bilinmeyen komut veya pseudo-op: {result['mnemonic']}"
-        result["mnemonic"] = None # Hatalıysa mnemonic'i temizle
+    if result.mnemonic and \
+       result.mnemonic not in OPCODE_TABLE and \
+       result.mnemonic not in PSEUDO_OPS:
+        result.error = f"Bilinmeyen komut veya pseudo-op: {result.mnemonic}"
+        result.mnemonic = None # Hatalıysa mnemonic'i temizle
 
     # Operand gerektiren komutlar için operand var mı kontrolü Pass1/Pass2'de daha detaylı yapılmalı.
     # Örneğin, LDAA komutu operand bekler. NOP beklemez.
@@ -125,6 +133,47 @@ def parse_line(line_number, text_line):
 
     return result
 
+def parse_line_fast(line_number, text_line):
+    """
+    parse_line ile aynı sonucu üreten hızlı yol. Satır bir kez ';' ile bölünür ve
+    kod kısmı tek bir split ile en fazla üç parçaya ayrılır (strip/tekrar strip yok);
+    mnemonic'ler önceden hesaplanmış sözlükten bulunur. parse_line referans
+    uygulama olarak kalır (farksal kontrol: benchmarks/bench_lexer.py).
+    """
+    code, has_comment, comment = text_line.partition(';')
+    comment = comment.strip() if has_comment else None
+    parts = code.split(None, 2)
+    label = mnemonic = operand_str = error = None
+
+    if parts:
+        first = parts[0]
+        mnemonic = _MNEMONIC_LOOKUP.get(first)
+        if mnemonic is None:
+            mnemonic = _CANONICAL_MNEMONICS.get(first.upper())
+        # isascii() + isidentifier() == LABEL_REGEX ([a-zA-Z_][a-zA-Z0-9_]*)
+        if mnemonic is None and not text_line.startswith(" ") and first.isascii() and first.isidentifier():
+            label = sys.intern(first)
+            if len(parts) > 1:
+                second = parts[1]
+                mnemonic = _MNEMONIC_LOOKUP.get(second)
+                if mnemonic is None:
+                    mnemonic = _CANONICAL_MNEMONICS.get(second.upper())
+                    if mnemonic is None:
+                        error = f"Bilinmeyen komut veya pseudo-op: {second.upper()}"
+                if len(parts) > 2:
+                    operand_str = parts[2].rstrip()
+        elif mnemonic is not None:
+            if len(parts) > 2:
+                operand_str = f"{parts[1]} {parts[2].rstrip()}"
+            elif len(parts) > 1:
+                operand_str = parts[1]
+        elif len(parts) == 1 and first.isascii() and first.isidentifier():
+            label = sys.intern(first)
+        else:
+            error = f"Tanımsız ifade veya geçersiz komut: '{first}'"
+
+    return LineRecord(line_number, text_line.rstrip('\n'), label, mnemonic, operand_str, comment, error)
+
 if __name__ == '__main__':
     # Test için OPCODE_TABLE ve PSEUDO_OPS'ın bu scope'ta olması lazım
     # Ana script'ten çalıştırırken bu importlar zaten yukarıda olacak.
@@ -177,4 +226,7 @@ if __name__ == '__main__':
         print(f"  Operand: {parsed['operand_str']}")
         print(f"  Yorum  : {parsed['comment']}")
         if parsed['error']:
-            print(f"  HATA   : {parsed['error']}")
\ No newline at end of file
+            print(f"  HATA   : {parsed['error']}")
+    # Hızlı yol referans uygulamayla aynı sonucu vermeli.
+    differences = [line for i, line in enumerate(test_lines) if parse_line(i + 1, line) != parse_line_fast(i + 1, line)]
+    print(f"\nparse_line_fast farkları: {len(differences)}")
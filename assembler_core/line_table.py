@@ -0,0 +1,164 @@
+# assembler_core/line_table.py
+# Satır tablosu kayıtları.
+#
+# Lexer, Pass 1 ve Pass 2 her satır için ayrı bir sözlük üretiyordu (parse_line
+# sonucu, Pass 1'in {**...} kopyası ve Pass 2'nin listeleme girdisi). Artık her
+# kaynak satırı için tek bir __slots__'lu LineRecord vardır: lexer onu oluşturur,
+# Pass 1 adres/boyut alanlarını aynı kayıt üzerinde doldurur, Pass 2 ise sadece
+# makine kodu ve hata alanlarını tutan küçük bir ListingEntry görünümü üretir.
+# Etiket ve mnemonic string'leri lexer'da intern edilir. Her iki sınıf da eski
+# sözlük erişimini (kayit["label"], kayit.get("error"), dict(kayit)) destekler.
+#
+# source: satır INCLUDE ile eklenmiş bir dosyadan geliyorsa (veya bir INCLUDE'dan sonra
+# ana kaynağın numarası kaydıysa) (dosya_adı, dosyadaki_satır); aksi halde None, yani
+# line_num satırın ana kaynaktaki numarasıdır (bkz. include.py). Hata mesajları satırı
+# location ile anar: "Satır N" veya source varsa "dosya:satır".
+#
+# file_path: INCLUDE/INCBIN satırlarında direktifin başvurduğu dosyanın mutlak yolu
+# (IncludeExpander, satırı içeren dosyanın dizinine göre çözer); diğer satırlarda None.
+from .m6800_opcodes import ENCODING_INDEX
+
+
+class LineRecord:
+    """Bir kaynak satırının lexer ve Pass 1 verisi."""
+    __slots__ = ("line_num", "original_line", "label", "mnemonic", "operand_str", "comment", "error",
+                 "address", "size", "addressing_mode", "source", "file_path")
+
+    _KEYS = __slots__
+
+    def __init__(self, line_num, original_line, label=None, mnemonic=None, operand_str=None,
+                 comment=None, error=None, address=None, size=0, addressing_mode=None, source=None,
+                 file_path=None):
+        self.line_num = line_num
+        self.original_line = original_line
+        self.label = label
+        self.mnemonic = mnemonic
+        self.operand_str = operand_str
+        self.comment = comment
+        self.error = error
+        self.address = address
+        self.size = size
+        self.addressing_mode = addressing_mode
+        self.source = source
+        self.file_path = file_path
+
+    @property
+    def location(self):
+        """Hata mesajlarındaki konum: "Satır N"; INCLUDE akışında numarası kaymışsa "dosya:satır"."""
+        source = self.source
+        return f"{source[0]}:{source[1]}" if source else f"Satır {self.line_num}"
+
+    def replace(self, **changes):
+        """Belirtilen alanları değiştirilmiş bir kopya döndürür (önbellekteki kaydı korumak için)."""
+        record = LineRecord.__new__(LineRecord)
+        for key in self._KEYS:
+            setattr(record, key, changes.get(key, getattr(self, key)))
+        return record
+
+    # --- Sözlük uyumluluğu ---
+    # kayit["alan"] erişimi doğrudan slot erişimidir (Python seviyesinde ek çağrı yok).
+    __getitem__ = object.__getattribute__
+    __setitem__ = object.__setattr__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return self._KEYS
+
+    def __eq__(self, other):
+        if not isinstance(other, LineRecord):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self._KEYS)
+
+    def __repr__(self):
+        return f"LineRecord({', '.join(f'{key}={getattr(self, key)!r}' for key in self._KEYS)})"
+
+
+class ListingEntry:
+    """
+    Pass 2'nin listeleme girdisi. Satırın metin alanları kopyalanmaz; kayda
+    (LineRecord) bakılarak okunur. Sadece Pass 2'ye özgü alanlar burada tutulur:
+    üretilen byte'lar (code) ve hata. machine_code_hex, code'dan okunduğunda türetilir;
+    listelemesi hiç okunmayan bir assemble (örn. sadece imaj) hex string'leri üretmez.
+    cycles, komut satırlarında OPCODE_TABLE'daki çevrim sayısıdır (bkz. timing.py).
+    """
+    __slots__ = ("record", "code", "error")
+
+    _KEYS = ("line_num", "address_hex", "machine_code_hex", "label", "mnemonic",
+             "operand_str", "original_line", "comment", "error", "source", "cycles")
+
+    def __init__(self, record, code=None, error=None):
+        self.record = record
+        # Satırın byte'ları (liste; INCBIN'de memoryview, paralel Pass 2'de bytes, tek geçişte
+        # yamalanan satırda bytearray); yoksa None
+        self.code = code
+        self.error = error
+
+    @property
+    def machine_code_hex(self):
+        code = self.code
+        return bytes(code).hex().upper() if code and not self.error else ""
+
+    @property
+    def cycles(self):
+        record = self.record
+        if record.addressing_mode is None or self.error: # Direktif veya hatalı satır
+            return None
+        return ENCODING_INDEX[(record.mnemonic.upper(), record.addressing_mode)][2]
+
+    @property
+    def line_num(self):
+        return self.record.line_num
+
+    @property
+    def address_hex(self):
+        address = self.record.address
+        return f"${address:04X}" if address is not None else "----"
+
+    @property
+    def label(self):
+        return self.record.label
+
+    @property
+    def mnemonic(self):
+        return self.record.mnemonic
+
+    @property
+    def operand_str(self):
+        return self.record.operand_str
+
+    @property
+    def original_line(self):
+        return self.record.original_line
+
+    @property
+    def comment(self):
+        return self.record.comment
+
+    @property
+    def source(self):
+        return self.record.source
+
+    def with_record(self, record):
+        """Aynı kodlama sonucunu başka bir kayda (örn. satır numarası kaymış) bağlar."""
+        return ListingEntry(record, self.code, self.error)
+
+    # --- Sözlük uyumluluğu ---
+    # Sadece code ve error yazılabilir; diğer alanlar salt okunur property'lerdir.
+    __getitem__ = object.__getattribute__
+    __setitem__ = object.__setattr__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return self._KEYS
+
+    def __eq__(self, other):
+        if not isinstance(other, ListingEntry):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self._KEYS)
+
+    def __repr__(self):
+        return f"ListingEntry({', '.join(f'{key}={getattr(self, key)!r}' for key in self._KEYS)})"
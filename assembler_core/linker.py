@@ -0,0 +1,209 @@
+# assembler_core/linker.py
+# Nesne modüllerinin (bkz. object_file.py) bağlanması.
+#
+# link() modülleri yeniden assemble etmeden tek bir doğrusal taramayla bağlar:
+#   1. text bölümleri taban adresten başlayarak modül sırasıyla art arda yerleştirilir,
+#   2. dışa aktarılan semboller global tabloya eklenir,
+#   3. bölümlerin byte'ları 64 KiB'lık MemoryImage'a yazılır (üst üste binme hatadır),
+#   4. yer değiştirme kayıtları imaj üzerinde yerinde yamalanır.
+#
+# Aynı ad birden çok modülde farklı değerlerle tanımlanabilir (örn. her modülün kendi
+# LOOP etiketi); böyle bir ad ancak bir modül onu import ederse hata olur.
+import os
+
+from .diagnostics import Diagnostic, DiagnosticStore, PHASE_LINK
+from .include import IncludeExpander
+from .memory_image import MEMORY_SIZE, MemoryImage
+from .object_file import OBJECT_EXTENSION, REL_WORD, SECTION_TARGET, assemble_object, read_object, write_object
+
+
+class LinkResult:
+    """
+    link() sonucu.
+
+    image:     Bağlanmış program (MemoryImage).
+    segments:  [(adres, memoryview), ...]; imajın dolu aralıkları, yazıcılara (.hex, S19, ...) verilebilir.
+    symbols:   {ad: değer}; bağlama sonrası mutlak değerler (belirsiz adlar hariç).
+    placement: {modül_adı: text bölümünün adresi}
+    errors:    Bağlama hataları (Diagnostic listesi).
+    """
+    __slots__ = ("image", "segments", "symbols", "placement", "errors")
+
+    def __init__(self, image, segments, symbols, placement, errors):
+        self.image = image
+        self.segments = segments
+        self.symbols = symbols
+        self.placement = placement
+        self.errors = errors
+
+
+def _link_error(errors, module, code, message, line=None, *args):
+    where = f"{module.name}: Satır {line}: " if line is not None else f"{module.name}: "
+    errors.append(Diagnostic(where + message, code, line, PHASE_LINK, args=(module.name,) + args))
+
+
+def link(modules, base=0):
+    """
+    Nesne modüllerini bağlar.
+
+    Args:
+        modules (list[ObjectModule]): Bağlanacak modüller (text bölümleri bu sırayla yerleştirilir).
+        base (int): İlk text bölümünün adresi.
+
+    Returns:
+        LinkResult: errors boş değilse imaj eksik veya hatalı yamalanmış olabilir.
+    """
+    errors = DiagnosticStore()
+
+    # 1. Yerleştirme
+    text_addresses = []
+    address = base
+    for module in modules:
+        text_addresses.append(address)
+        address += module.text.size
+    if address > MEMORY_SIZE:
+        errors.append(Diagnostic(f"text bölümleri adres alanına sığmıyor (${base:04X} + {address - base} byte).",
+                                 "LINK_OVERLAP", None, PHASE_LINK, args=(base, address - base)))
+
+    # 2. Global semboller
+    symbols = {}
+    owners = {}
+    ambiguous = set()
+    for module, text_address in zip(modules, text_addresses):
+        for name, (target, value) in module.symbols.items():
+            if target == SECTION_TARGET:
+                value += text_address
+            previous = symbols.get(name)
+            if previous is None:
+                symbols[name] = value
+                owners[name] = module.name
+            elif previous != value:
+                ambiguous.add(name)
+
+    # 3. Bölüm byte'ları
+    image = MemoryImage()
+    for module, text_address in zip(modules, text_addresses):
+        for section in module.sections:
+            start = text_address if section.relocatable else section.address
+            for offset, data in section.chunks:
+                if image.is_free(start + offset, len(data)):
+                    image.write(start + offset, data)
+                else:
+                    _link_error(errors, module, "LINK_OVERLAP",
+                                f"{section.name} bölümü (${start + offset:04X}-${start + offset + len(data) - 1:04X}) "
+                                f"başka bir bölümle üst üste biniyor veya adres alanına sığmıyor.")
+
+    # 4. Yer değiştirmeler
+    data = image.data
+    for module, text_address in zip(modules, text_addresses):
+        section_addresses = [text_address if section.relocatable else section.address for section in module.sections]
+        for section_index, offset, kind, target, addend, line in module.relocations:
+            if target == SECTION_TARGET:
+                value = text_address
+            elif target is None:
+                value = 0
+            elif target in ambiguous:
+                _link_error(errors, module, "LINK_AMBIGUOUS",
+                            f"'{target}' sembolü birden çok modülde farklı değerlerle tanımlı "
+                            f"(ilki: {owners[target]}).", line, target)
+                continue
+            else:
+                value = symbols.get(target)
+                if value is None:
+                    _link_error(errors, module, "LINK_UNDEFINED", f"Tanımsız sembol: {target}", line, target)
+                    continue
+            value += addend
+            place = section_addresses[section_index] + offset
+            if kind == REL_WORD:
+                if not 0 <= value <= 0xFFFF:
+                    _link_error(errors, module, "LINK_RANGE", f"Değer (${value:X}) 16-bit aralığı dışında.", line, value)
+                    continue
+                data[place] = value >> 8
+                data[place + 1] = value & 0xFF
+            else: # REL_BRANCH
+                branch = value - (place + 1)
+                if not -128 <= branch <= 127:
+                    _link_error(errors, module, "LINK_RANGE", f"Relative offset ({branch}) menzil dışı.", line, branch)
+                    continue
+                data[place] = branch & 0xFF
+
+    for name in ambiguous:
+        del symbols[name]
+    segments = [(start, image.view(start, end - start)) for start, end in image.ranges()]
+    placement = {module.name: text_address for module, text_address in zip(modules, text_addresses)}
+    return LinkResult(image, segments, symbols, placement, list(errors))
+
+
+def load_module(path, obj_path, symbols=None, dependencies=()):
+    """
+    Bağlanacak bir girdiyi modüle çevirir: .obj dosyaları okunur. Kaynak dosyaları için
+    obj_path kaynaktan, dependencies'teki ve kaynağın INCLUDE ettiği dosyalardan yeniyse o
+    okunur; değilse kaynak assemble edilip obj_path'e yazılır. Böylece değişmeyen modüller
+    tekrar assemble edilmez.
+
+    Args:
+        path (str): .obj veya kaynak (.asm) dosyası.
+        obj_path (str): Kaynağın nesne dosyasının yolu.
+        symbols (SymbolTable): Kaynak assemble edilirken önceden yüklenecek semboller.
+        dependencies (iterable[str]): Nesneyi eskiten diğer dosyalar (örn. sembol dosyaları).
+
+    Returns:
+        tuple: (ObjectModule veya None, hatalar, yeniden_kullanıldı_mı)
+
+    Raises:
+        OSError, ValueError: Dosya okunamıyorsa veya geçerli bir nesne dosyası değilse.
+    """
+    if path.lower().endswith(OBJECT_EXTENSION):
+        return read_object(path), [], True
+    try:
+        obj_mtime = os.path.getmtime(obj_path)
+        if all(os.path.getmtime(source) <= obj_mtime for source in (path, *dependencies)):
+            module = read_object(obj_path)
+            if all(os.path.getmtime(source) <= obj_mtime for source in module.includes):
+                return module, [], True
+    except (OSError, ValueError): # .obj yok, eski biçimde veya bozuk: yeniden assemble edilir
+        pass
+    with open(path, 'r', encoding='utf-8') as f:
+        source_lines = f.read().strip().split('\n')
+    name = os.path.basename(path)
+    module, errors_p1, errors_p2 = assemble_object(source_lines, name, symbols,
+                                                   IncludeExpander(os.path.dirname(path), name))
+    if errors_p1 or errors_p2:
+        return None, errors_p1 + errors_p2, False
+    os.makedirs(os.path.dirname(obj_path) or ".", exist_ok=True)
+    write_object(obj_path, module)
+    return module, [], False
+
+
+if __name__ == '__main__':
+    main_source = [
+        "START   LDS     #$00FF",
+        "        LDX     #GREETING",
+        "        JSR     PUTS",
+        "        BRA     START",
+        "        ORG     $FFFE",
+        "        FDB     START",
+        "        END",
+    ]
+    puts_source = [
+        "PUTS    LDAA    0,X",
+        "        BEQ     DONE",
+        "        STAA    $8001",
+        "        INX",
+        "        BRA     PUTS",
+        "DONE    RTS",
+        "GREETING FCC    'HI'",
+        "        FCB     0",
+        "        END",
+    ]
+    modules = []
+    for name, source in (("main.asm", main_source), ("puts.asm", puts_source)):
+        module, errors_p1, errors_p2 = assemble_object(source, name)
+        print(module, errors_p1 + errors_p2)
+        modules.append(module)
+    result = link(modules, base=0xE000)
+    print("Yerleşim:", {name: f"${address:04X}" for name, address in result.placement.items()})
+    print("Semboller:", {name: f"${value:04X}" for name, value in sorted(result.symbols.items())})
+    print("Hatalar:", result.errors)
+    for address, data in result.segments:
+        print(f"${address:04X}: {bytes(data).hex(' ').upper()}")
@@ -0,0 +1,297 @@
+# assembler_core/listing.py
+# Listeleme biçimleri (renderer'lar).
+#
+# Pass 2'nin listeleme girdileri (ListingEntry veya aynı anahtarlara sahip sözlükler)
+# burada metne çevrilir. Her biçim üç parçadan oluşur: başlık, girdi başına satır(lar)
+# ve sonuç (hata özeti). Girdiler geldikçe tek tek çevrildiğinden listeleme akış
+# halinde üretilebilir; tamamının bellekte tutulması gerekmez.
+#
+#   text    : klasik .lst (80 sütun, komut satırının varsayılanı)
+#   compact : GUI'deki kısa listeleme ("L:7   Adr:$0C00  Kod:8E01FF ...")
+#   jsonl   : girdi başına bir JSON nesnesi ({"type": "line", ...}), sonda {"type": "summary", ...}
+#   csv     : başlık satırı + girdi başına bir satır
+#
+# jsonl ve csv'de adres ayrıca sayı olarak ("address", yoksa boş), satırın ürettiği
+# byte sayısı ("size") ve hatanın kodu ("error_code", bkz. diagnostics.py) verilir;
+# ROM boyutu gibi ölçümler metin ayrıştırmadan yapılabilir.
+#
+# INCLUDE ile eklenen satırlar: text ve compact biçimlerinde satırın geldiği dosya
+# değiştikçe "Dosya: ..." satırı yazılır ve satır sütunu o dosyadaki satır numarasıdır;
+# jsonl ve csv'de line_num genişletilmiş akıştaki sıradır, her satırın dosyası ve o
+# dosyadaki satır numarası "source_file" / "source_line" sütunlarındadır.
+#
+# Çevrim sütunları (bkz. timing.py): her komut satırının çevrim sayısı ve etiketli bloğun
+# başından itibaren birikimli çevrim; geriye dallanan satırlarda döngünün tur başına
+# tahmini maliyeti. text ve compact biçimlerinde döngü ayrı bir "Döngü" satırıdır; jsonl
+# ve csv'de "cycles", "block_cycles", "loop_target" ve "loop_cycles" sütunlarıdır.
+import csv
+import io
+import json
+import os
+
+from .diagnostics import to_json, unique
+from .timing import CycleCounter
+
+# Makine tarafından okunacak biçimlerin sütunları
+DATA_FIELDS = ("line_num", "address", "address_hex", "size", "machine_code_hex", "label",
+               "mnemonic", "operand_str", "comment", "error", "error_code", "source_file", "source_line",
+               "cycles", "block_cycles", "loop_target", "loop_cycles")
+
+
+def _loop_line(loop, address_hex):
+    """Geriye dallanan satırın döngü açıklaması."""
+    return f"Döngü: ${loop[0]:04X}-{address_hex} tur başına {loop[1]} çevrim"
+
+
+def _source_of(entry, source_name):
+    """Girdinin (dosya_adı, dosyadaki_satır) bilgisi; source alanı yoksa ana kaynaktaki satırdır."""
+    source = entry.get('source')
+    if source:
+        return source[0], source[1]
+    return source_name, entry['line_num']
+
+
+def _line_column(entry):
+    """text/compact satır sütunu: satırın kendi dosyasındaki numarası (dosyası "Dosya:" satırında)."""
+    source = entry.get('source')
+    return source[1] if source else entry['line_num']
+
+
+def _data_values(entry, counter, source_name=""):
+    """Bir girdinin DATA_FIELDS sırasıyla değerleri (çevrim sütunları counter'dan, bkz. CycleCounter)."""
+    address_hex = entry['address_hex']
+    machine_code_hex = entry['machine_code_hex'] or ""
+    address = int(address_hex[1:], 16) if address_hex and address_hex != "----" else None
+    error = entry['error']
+    label = entry['label']
+    mnemonic = entry['mnemonic']
+    cycles, block_cycles, loop = counter.next(entry['cycles'], label, mnemonic, address_hex, machine_code_hex)
+    return (entry['line_num'], address, address_hex, len(machine_code_hex) // 2, machine_code_hex,
+            label, mnemonic, entry['operand_str'], entry['comment'],
+            str(error) if error else error, getattr(error, "code", None), *_source_of(entry, source_name),
+            cycles, block_cycles, loop[0] if loop else None, loop[1] if loop else None)
+
+
+class _FileMarker:
+    """Girdinin geldiği dosya değiştiğinde bir kez metin üretir (text ve compact için)."""
+
+    def __init__(self):
+        self._source_name = self._current = ""
+
+    def start(self, source_name):
+        self._source_name = self._current = os.path.basename(source_name)
+
+    def changed(self, entry):
+        """Dosya bir önceki girdiden farklıysa yeni dosyanın adı, değilse None."""
+        source = entry.get('source')
+        file_name = source[0] if source else self._source_name
+        if file_name == self._current:
+            return None
+        self._current = file_name
+        return file_name
+
+
+class TextRenderer:
+    """Klasik .lst biçimi."""
+    extension = ".lst"
+
+    def __init__(self):
+        self._files = _FileMarker()
+        self._cycles = CycleCounter()
+
+    def header(self, source_name):
+        self._files.start(source_name)
+        return (f"Kaynak Dosya: {os.path.basename(source_name)}\n"
+                "Assembler Listeleme Çıktısı\n"
+                + "=" * 80 + "\n"
+                f"{'Satır':<5} {'Adres':<7} {'Mak.Kodu':<12} {'Çvr':>3} {'Blok':>5} {'Etiket':<10} {'Komut':<7} {'Operand':<20} {'Yorum'}\n"
+                + "-" * 80 + "\n")
+
+    def entry(self, entry):
+        # Her alan bir kez okunur (ListingEntry'de alanlar property'dir)
+        addr_hex = entry['address_hex']
+        if addr_hex == "----":
+            addr_hex = "      "
+        mc_hex = entry['machine_code_hex'] or ""
+        label = entry['label'] or ""
+        mnemonic = entry['mnemonic'] or ""
+        operand = entry['operand_str'] or ""
+        comment = entry['comment'] or ""
+        error = entry['error']
+        cycles, block_cycles, loop = self._cycles.next(entry['cycles'], label, mnemonic, entry['address_hex'], mc_hex)
+        if cycles is None:
+            cycles = block_cycles = ""
+
+        line = (f"{_line_column(entry):<5} {addr_hex:<7} {mc_hex:<12} {cycles:>3} {block_cycles:>5} "
+                f"{label:<10} {mnemonic:<7} {operand:<20} {comment}\n")
+        file_name = self._files.changed(entry)
+        if file_name is not None:
+            line = f"***** Dosya: {file_name}\n" + line
+        if loop:
+            line += f"***** {_loop_line(loop, addr_hex)}\n"
+        if error:
+            line += f"***** HATA: {error}\n"
+        return line
+
+    def footer(self, errors_p1, errors_p2):
+        text = "=" * 80 + "\n"
+        if errors_p1 or errors_p2:
+            text += "\nToplam Hatalar:\n"
+            for err in unique(errors_p1 + errors_p2): # Tekrarları önle (ilk görülme sırasıyla)
+                text += f"- {err}\n"
+        return text + "Listeleme Sonu.\n"
+
+
+class CompactRenderer:
+    """GUI'nin Listeleme sekmesindeki kısa biçim (başlık ve hata özeti yok)."""
+    extension = ".lst"
+
+    def __init__(self):
+        self._files = _FileMarker()
+        self._cycles = CycleCounter()
+
+    def header(self, source_name):
+        self._files.start(source_name)
+        return ""
+
+    def entry(self, entry):
+        file_name = self._files.changed(entry)
+        line = f"    Dosya: {file_name}\n" if file_name is not None else ""
+        address_hex = entry['address_hex']
+        machine_code_hex = entry['machine_code_hex']
+        label = entry['label']
+        mnemonic = entry['mnemonic']
+        line += f"L:{_line_column(entry):<3} Adr:{address_hex:<6} Kod:{machine_code_hex:<10} "
+        cycles, block_cycles, loop = self._cycles.next(entry['cycles'], label, mnemonic, address_hex, machine_code_hex)
+        line += f"Çvr:{cycles}/{block_cycles:<4} " if cycles is not None else " " * 13
+        line += f"{label or '':<8} {mnemonic or '':<6} {entry['operand_str'] or '':<15}"
+        if entry['comment']:
+            line += f"; {entry['comment']}"
+        line += "\n"
+        if loop:
+            line += f"    {_loop_line(loop, address_hex)}\n"
+        if entry['error']:
+            line += f"    HATA: {entry['error']}\n"
+        return line
+
+    def footer(self, errors_p1, errors_p2):
+        return ""
+
+
+class JsonLinesRenderer:
+    """Girdi başına bir JSON nesnesi; son satır hata özeti."""
+    extension = ".jsonl"
+
+    def __init__(self):
+        self._encode = json.JSONEncoder(ensure_ascii=False).encode
+        self._source_name = ""
+        self._cycles = CycleCounter()
+
+    def header(self, source_name):
+        self._source_name = os.path.basename(source_name)
+        return ""
+
+    def entry(self, entry):
+        return self._encode({"type": "line", **dict(zip(DATA_FIELDS, _data_values(entry, self._cycles, self._source_name)))}) + "\n"
+
+    def footer(self, errors_p1, errors_p2):
+        return self._encode({"type": "summary", "source": self._source_name,
+                             "errors_p1": unique(errors_p1), "errors_p2": unique(errors_p2),
+                             "diagnostics": [to_json(err) for err in unique(errors_p1 + errors_p2)]}) + "\n"
+
+
+class CsvRenderer:
+    """Başlık satırı ve girdi başına bir CSV satırı (RFC 4180 tırnaklama)."""
+    extension = ".csv"
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._source_name = ""
+        self._cycles = CycleCounter()
+
+    def _row(self, values):
+        self._writer.writerow(values)
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+    def header(self, source_name):
+        self._source_name = os.path.basename(source_name)
+        return self._row(DATA_FIELDS)
+
+    def entry(self, entry):
+        return self._row(_data_values(entry, self._cycles, self._source_name))
+
+    def footer(self, errors_p1, errors_p2):
+        return ""
+
+
+RENDERERS = {
+    "text": TextRenderer,
+    "compact": CompactRenderer,
+    "jsonl": JsonLinesRenderer,
+    "csv": CsvRenderer,
+}
+
+LISTING_FORMATS = tuple(RENDERERS)
+
+
+def get_renderer(listing_format="text"):
+    """
+    Biçim adına karşılık gelen yeni bir renderer.
+
+    Raises:
+        ValueError: Bilinmeyen biçim adında.
+    """
+    try:
+        return RENDERERS[listing_format]()
+    except KeyError:
+        raise ValueError(f"Bilinmeyen listeleme biçimi: {listing_format} "
+                         f"(geçerli: {', '.join(LISTING_FORMATS)})") from None
+
+
+def render_listing(entries, listing_format="text", source_name="", errors_p1=(), errors_p2=()):
+    """
+    Listelemeyi tembel olarak metne çevirir: başlık, her girdi ve sonuç ayrı parçalar
+    halinde üretilir (boş parçalar atlanır).
+
+    Args:
+        entries (iterable): Listeleme girdileri (ListingEntry veya sözlük).
+        listing_format (str): LISTING_FORMATS'tan biri.
+        source_name (str): Kaynak dosyanın adı (başlıkta kullanılır).
+        errors_p1 (list): Pass 1 hataları (sonuç kısmı için).
+        errors_p2 (list): Pass 2 hataları (sonuç kısmı için).
+
+    Yields:
+        str: Satır sonları dahil metin parçaları.
+    """
+    renderer = get_renderer(listing_format)
+    text = renderer.header(source_name)
+    if text:
+        yield text
+    for entry in entries:
+        yield renderer.entry(entry)
+    text = renderer.footer(list(errors_p1), list(errors_p2))
+    if text:
+        yield text
+
+
+if __name__ == '__main__':
+    sample = [
+        {"line_num": 1, "address_hex": "$1000", "machine_code_hex": "8610", "label": "START", "mnemonic": "LDAA",
+         "operand_str": "#$10", "original_line": "START LDAA #$10 ; A=16", "comment": "A=16", "error": None,
+         "cycles": 2},
+        {"line_num": 2, "address_hex": "----", "machine_code_hex": "", "label": None, "mnemonic": "FOO",
+         "operand_str": "1,2", "original_line": "      FOO 1,2", "comment": None, "error": "Bilinmeyen komut: FOO",
+         "cycles": None},
+        {"line_num": 3, "address_hex": "$1002", "machine_code_hex": "20FC", "label": None, "mnemonic": "BRA",
+         "operand_str": "START", "original_line": "        BRA START", "comment": None, "error": None, "cycles": 4},
+        {"line_num": 4, "address_hex": "$1004", "machine_code_hex": "39", "label": None, "mnemonic": "RTS",
+         "operand_str": None, "original_line": "        RTS", "comment": None, "error": None, "source": ("ortak.inc", 1),
+         "cycles": 5},
+    ]
+    for listing_format in LISTING_FORMATS:
+        print(f"--- {listing_format} ---")
+        print("".join(render_listing(sample, listing_format, "demo.asm", ["Satır 2: Bilinmeyen komut: FOO"])), end="")
@@ -0,0 +1,256 @@
+# assembler_core/memory_image.py
+# 64 KiB'lık makine kodu imajı.
+#
+# pass_two eskiden her segmentin byte'larını ayrı bir Python int listesinde
+# biriktiriyordu (byte başına 8 byte'lık işaretçi + liste ve tuple yükü). Artık
+# üretilen byte'lar önceden ayrılmış tek bir bytearray(65536) içine, satırın
+# adresine yazılır; segment listesi sadece (adres, uzunluk) çiftlerini tutar ve
+# segmentleri imaj üzerinde memoryview dilimleri olarak verir. Yazıcılar (.hex,
+# S19, Intel HEX, .bin) bu dilimleri kopyalamadan okur.
+#
+# Hangi adreslerin yazıldığı 8 KiB'lık bir bit haritasında tutulur (adres başına
+# bir bit; adres a, a >> 3. byte'ın a & 7. biti). Bir aralığın işaretlenmesi ve
+# sorgulanması uçlardaki iki byte için maske, aradaki tam byte'lar için dilim
+# işlemleriyle yapılır. Dolu aralıklar, harita tek bir tamsayıya çevrilip ikili
+# gösterimi regex ile taranarak bulunur.
+import re
+from array import array
+
+MEMORY_SIZE = 0x10000
+
+_FULL = memoryview(b"\xff" * (MEMORY_SIZE >> 3))
+_USED_RUN = re.compile(r"1+")
+
+
+class MemoryImage:
+    """64 KiB bellek imajı ve yazılmış adreslerin bit haritası."""
+    __slots__ = ("data", "used", "_view")
+
+    def __init__(self):
+        self.data = bytearray(MEMORY_SIZE)
+        self.used = bytearray(MEMORY_SIZE >> 3) # Bit başına bir adres: 0 boş, 1 yazılmış
+        self._view = memoryview(self.data)
+
+    def is_empty(self):
+        """Hiçbir adres yazılmamış mı?"""
+        return self.used.count(0) == len(self.used)
+
+    def is_free(self, address, length):
+        """[address, address+length) aralığı adres alanı içinde ve hiç yazılmamış mı?"""
+        end = address + length
+        if address < 0 or end > MEMORY_SIZE:
+            return False
+        if not length:
+            return True
+        used = self.used
+        first, last = address >> 3, (end - 1) >> 3
+        if first == last:
+            return not used[first] & (((1 << length) - 1) << (address & 7))
+        return (not used[first] & (0xFF << (address & 7)) & 0xFF
+                and not used[last] & (0xFF >> (7 - ((end - 1) & 7)))
+                and used.count(0, first + 1, last) == last - first - 1)
+
+    def _mark(self, address, end):
+        used = self.used
+        first, last = address >> 3, (end - 1) >> 3
+        if first == last:
+            used[first] |= ((1 << (end - address)) - 1) << (address & 7)
+            return
+        used[first] |= (0xFF << (address & 7)) & 0xFF
+        used[first + 1:last] = _FULL[:last - first - 1]
+        used[last] |= 0xFF >> (7 - ((end - 1) & 7))
+
+    def write(self, address, byte_codes):
+        """Byte'ları verilen adrese yazar; $FFFF'i aşan kısım $0000'dan devam eder."""
+        end = address + len(byte_codes)
+        if address == end:
+            return
+        if 0 <= address and end <= MEMORY_SIZE:
+            self.data[address:end] = byte_codes
+            self._mark(address, end)
+            return
+        for offset, value in enumerate(byte_codes):
+            wrapped = (address + offset) & 0xFFFF
+            self.data[wrapped] = value
+            self.used[wrapped >> 3] |= 1 << (wrapped & 7)
+
+    def view(self, address, length):
+        """İmajın bir bölümüne kopyasız erişim (memoryview)."""
+        return self._view[address:address + length]
+
+    def ranges(self):
+        """Yazılmış adreslerin (başlangıç, bitiş_hariç) aralıkları, artan sırada."""
+        bits = int.from_bytes(self.used, 'little')
+        if not bits:
+            return []
+        # format() en yüksek biti başa yazar; ters çevrilince i. karakter i. adrestir
+        return [match.span() for match in _USED_RUN.finditer(format(bits, 'b')[::-1])]
+
+    def bin_bytes(self, fill=0xFF):
+        """
+        En düşük ve en yüksek yazılmış adres arasındaki ham imaj. Aradaki yazılmamış
+        byte'lar fill ile doldurulur.
+
+        Returns:
+            tuple: (başlangıç_adresi, bytes-benzeri) veya imaj boşsa (None, b"").
+        """
+        ranges = self.ranges()
+        if not ranges:
+            return None, b""
+        low, high = ranges[0][0], ranges[-1][1]
+        if len(ranges) == 1:
+            return low, self.view(low, high - low) # Boşluk yok: kopyasız
+        result = bytearray([fill]) * (high - low)
+        for start, end in ranges:
+            result[start - low:end - low] = self._view[start:end]
+        return low, result
+
+    def save_bin(self, path, fill=0xFF):
+        """bin_bytes() sonucunu dosyaya yazar; başlangıç adresini döndürür (imaj boşsa None)."""
+        low, data = self.bin_bytes(fill)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return low
+
+
+class BinWriter:
+    """
+    Ham .bin çıktısı: segmentler geldikçe bir MemoryImage'a yazılır, close(keep=True) ile en
+    düşük ve en yüksek dolu adres arası dosyaya yazılır (boşluklar fill ile doldurulur).
+    Diğer yazıcılar gibi hata varsa veya hiç segment yoksa dosya oluşmaz.
+    """
+
+    def __init__(self, output_filepath, fill=0xFF):
+        self.path = output_filepath
+        self.fill = fill
+        self.image = MemoryImage()
+        self.start_address = None
+
+    def write_segment(self, address, byte_codes):
+        self.image.write(address, byte_codes)
+
+    def close(self, keep):
+        """Dosya oluştuysa True döner; başlangıç adresi start_address'te kalır."""
+        if not keep or self.image.is_empty():
+            return False
+        self.start_address = self.image.save_bin(self.path, self.fill)
+        return True
+
+
+class ImageSegments:
+    """
+    pass_two'nun machine_code_segments listesi: (adres, memoryview) çiftleri. Sadece
+    adresler ve uzunluklar (segment başına 6 byte) saklanır; byte'lar MemoryImage içindedir. Liste gibi
+    gezilebilir, indekslenebilir ve len() ile uzunluğu alınabilir.
+    """
+    __slots__ = ("image", "_addresses", "_lengths")
+
+    def __init__(self, image):
+        self.image = image
+        self._addresses = array('H')
+        self._lengths = array('I') # Tek segment 64 KiB'ın tamamı olabilir
+
+    def append(self, address, length):
+        self._addresses.append(address)
+        self._lengths.append(length)
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        address = self._addresses[index]
+        return address, self.image.view(address, self._lengths[index])
+
+    def __iter__(self):
+        view = self.image.view
+        for address, length in zip(self._addresses, self._lengths):
+            yield address, view(address, length)
+
+    def __repr__(self):
+        return f"ImageSegments({len(self)} segment)"
+
+
+class SegmentBuilder:
+    """
+    pass_two'nun segment kuralıyla (satırın adresi bir öncekinden farklıysa yeni segment)
+    byte'ları MemoryImage'a yazar.
+
+    Daha önce yazılmış bir adrese tekrar yazan (üst üste binen ORG'lar) veya $FFFF'i aşan
+    bir satır görülürse, o ana kadarki segmentler bytes olarak kopyalanır ve sonraki
+    segmentler de ayrı bytes nesneleri olarak tutulur; böylece her segment kendi
+    byte'larını korur, imaj ise en son yazılanı gösterir.
+
+    keep=False ise segmentler saklanmaz, sadece add()/finish() ile döndürülür (akış modu).
+    Döndürülen memoryview'lar imajın kendisidir; daha sonra üst üste binen bir yazma
+    onları değiştirebileceğinden, saklamak isteyen tüketici kopyalamalıdır.
+    """
+
+    def __init__(self, image=None, keep=True):
+        self.image = image if image is not None else MemoryImage()
+        self.segments = ImageSegments(self.image) if keep else None
+        self.overlapping = False
+        self._address = -1
+        self._length = 0
+        self._copy = None # Kopya modunda açık segmentin byte'ları
+
+    def add(self, address, byte_codes):
+        """
+        Bir satırın byte'larını ekler (hatalı satırlar için boş bir dizi verilir).
+
+        Returns:
+            tuple or None: Bu satırla kapanan önceki segment (adres, byte'lar), yoksa None.
+        """
+        finished = None
+        if self._address != -1 and address != self._address:
+            finished = self._close()
+        self._address = address
+        if byte_codes:
+            start = address + self._length
+            if not self.overlapping and not self.image.is_free(start, len(byte_codes)):
+                self._enter_copy_mode()
+            self.image.write(start, byte_codes)
+            if self._copy is not None:
+                self._copy.extend(byte_codes)
+            self._length += len(byte_codes)
+        return finished
+
+    def finish(self):
+        """Açık segmenti kapatır ve döndürür (yoksa None)."""
+        return self._close() if self._address != -1 else None
+
+    def _close(self):
+        if not self._length:
+            return None
+        if self._copy is not None:
+            segment = (self._address, bytes(self._copy))
+            self._copy = bytearray()
+            if self.segments is not None:
+                self.segments.append(segment)
+        else:
+            segment = (self._address, self.image.view(self._address, self._length))
+            if self.segments is not None:
+                self.segments.append(self._address, self._length)
+        self._length = 0
+        return segment
+
+    def _enter_copy_mode(self):
+        self.overlapping = True
+        if self.segments is not None:
+            self.segments = [(address, bytes(data)) for address, data in self.segments]
+        self._copy = bytearray(self.image.view(self._address, self._length)) if self._length else bytearray()
+
+
+if __name__ == '__main__':
+    builder = SegmentBuilder()
+    for address, code in [(0x1000, [0x86, 0x10]), (0x1002, [0x3F]), (0x1002, []), (0x2000, [0x01, 0x02, 0x03])]:
+        builder.add(address, code)
+    builder.finish()
+    print(builder.segments, [(f"${a:04X}", bytes(d).hex()) for a, d in builder.segments])
+    print("Dolu aralıklar:", [(f"${s:04X}", f"${e:04X}") for s, e in builder.image.ranges()])
+    low, data = builder.image.bin_bytes()
+    print(f".bin: ${low:04X}'dan {len(data)} byte")
+    builder.add(0x1001, [0xAA]) # Üst üste binme: önceki segmentler kopyalanır
+    builder.finish()
+    print("Üst üste binme sonrası:", [(f"${a:04X}", bytes(d).hex()) for a, d in builder.segments])
@@ -0,0 +1,376 @@
+# assembler_core/object_file.py
+# Yer değiştirilebilir nesne dosyaları (.obj).
+#
+# pass_two sadece mutlak segmentler ürettiğinden her derlemede bütün kaynaklar
+# baştan assemble ediliyordu. assemble_object() bir kaynağı nesne modülüne çevirir;
+# değişmeyen modüllerin .obj dosyaları saklanır ve sadece yeniden bağlanır
+# (bkz. linker.py).
+#
+# Bölümler: ilk ORG'dan önceki kod yer değiştirilebilir "text" bölümüdür (adresini
+# bağlayıcı belirler); her ORG sabit adresli mutlak bir bölüm açar (örn. $FFF8'deki
+# vektörler). Modülde tanımlanan semboller dışa aktarılır; kullanılıp tanımlanmayan
+# semboller diğer modüllerden beklenir (import). Değeri text bölümünün adresine veya
+# bir import'a bağlı alanlar için yer değiştirme kaydı tutulur:
+#
+#   W16 : 16 bit'lik alan (FDB, extended, 16 bit immediate) = hedef + ek
+#   R8  : dallanma ofseti = hedef + ek - (alanın adresi + 1)
+#
+# Hedef SECTION_TARGET (".") modülün kendi text bölümü, None mutlak adres 0, diğer
+# değerler sembol adıdır.
+#
+# Bir değerin bölüm adresine bağlı olup olmadığı, ifade sembol değerleri yerine
+# (hedef, ek) çiftleriyle (_Relocatable) değerlendirilerek bulunur: toplama ve aynı
+# hedefli iki değerin çıkarılması dışında bir işlem görürse değer yer değiştirilemez.
+# text bölümü Pass 1'de PROBE_ORIGIN adresine yerleştirilmiş gibi assemble edilir;
+# böylece bölüm içi dallanmalar ve '*' doğru kodlanır, yer değiştirilen alanları
+# bağlayıcı yeniden yazar.
+import json
+
+from .assembler import encode_line_pass2, pass_one
+from .diagnostics import Diagnostic, DiagnosticStore, PHASE_PASS1, PHASE_PASS2, operand_column
+from .expressions import ExpressionError, compile_expression, compile_operand
+from .include import IncludeExpander
+from .m6800_opcodes import ADDR_MODE_RELATIVE, ENCODING_INDEX
+
+OBJECT_FORMAT = "m6800-obj"
+OBJECT_VERSION = 1
+OBJECT_EXTENSION = ".obj"
+
+TEXT_SECTION = "text"
+SECTION_TARGET = "."
+REL_WORD = "W16"
+REL_BRANCH = "R8"
+
+# text bölümünün assemble sırasında varsayılan adresi (16 bit alanlarda negatif ekler için pay bırakır)
+PROBE_ORIGIN = 0x8000
+
+_NO_CODE_OPS = {"ORG", "EQU", "RMB", "END", "INCLUDE"}
+
+
+class _Relocatable:
+    """Değeri bağlamada belli olacak bir adres: hedef + ek."""
+    __slots__ = ("target", "addend")
+
+    def __init__(self, target, addend):
+        self.target = target
+        self.addend = addend
+
+    def __add__(self, other):
+        if type(other) is int:
+            return _Relocatable(self.target, self.addend + other)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is int:
+            return _Relocatable(self.target, self.addend - other)
+        if isinstance(other, _Relocatable) and other.target == self.target:
+            return self.addend - other.addend # Aynı bölümdeki iki adresin farkı sabittir
+        return NotImplemented
+
+    def __pos__(self):
+        return self
+
+
+class _LinkTimeSymbols:
+    """
+    Expression.evaluate için sembol tablosu: değerler int veya _Relocatable. Tanımlı
+    olmayan her ad import olarak kaydedilir ve değeri import'un kendisi olur.
+    """
+
+    def __init__(self, values, probe_values):
+        self.values = values
+        self.probe_values = probe_values # Pass 2'de kullanılan int tablo; import'lar buraya PROBE_ORIGIN olarak eklenir
+        self.imports = {} # Ad -> None (ilk kullanım sırasıyla)
+
+    def get_symbol_value(self, name):
+        value = self.values.get(name)
+        if value is None:
+            self.imports[name] = None
+            self.probe_values[name] = PROBE_ORIGIN
+            value = self.values[name] = _Relocatable(name, 0)
+        return value
+
+
+class Section:
+    """
+    Nesne modülünün bir bölümü.
+
+    name:        Bölüm adı (TEXT_SECTION veya "ORG $XXXX").
+    relocatable: Adresi bağlayıcı mı belirler?
+    address:     Mutlak bölümün adresi (text bölümü için 0).
+    size:        Bölümün kapladığı byte sayısı (RMB boşlukları dahil).
+    chunks:      [(bölüm_içi_ofset, bytes), ...]; RMB ile ayrılan alanlar yazılmaz.
+    """
+    __slots__ = ("name", "relocatable", "address", "size", "chunks")
+
+    def __init__(self, name, relocatable, address, size=0, chunks=None):
+        self.name = name
+        self.relocatable = relocatable
+        self.address = address
+        self.size = size
+        self.chunks = chunks if chunks is not None else []
+
+    def add(self, offset, data):
+        """Byte'ları ekler; önceki parçanın hemen arkasındaysa ona eklenir."""
+        chunks = self.chunks
+        if chunks and chunks[-1][0] + len(chunks[-1][1]) == offset:
+            chunks[-1][1].extend(data)
+        else:
+            chunks.append((offset, bytearray(data)))
+
+    def __repr__(self):
+        return f"Section({self.name!r}, {self.size} byte, {len(self.chunks)} parça)"
+
+
+class ObjectModule:
+    """
+    Bir kaynağın nesne modülü.
+
+    name:        Kaynak dosyanın adı (hata mesajları için).
+    sections:    [Section, ...]; ilki her zaman text bölümüdür (boş olabilir).
+    symbols:     {ad: (hedef, değer)}; hedef SECTION_TARGET ise değer text bölümü içi ofsettir, None ise mutlak.
+    imports:     Modülün kullandığı ama tanımlamadığı semboller.
+    relocations: [(bölüm_indeksi, bölüm_içi_ofset, tür, hedef, ek, satır_no), ...]
+    includes:    Kaynağın INCLUDE ile eklediği ve INCBIN ile okuduğu dosyalar (mutlak yollar; nesnenin güncelliği için).
+    """
+
+    def __init__(self, name, sections, symbols, imports, relocations, includes=()):
+        self.name = name
+        self.sections = sections
+        self.symbols = symbols
+        self.imports = imports
+        self.relocations = relocations
+        self.includes = list(includes)
+
+    def to_dict(self):
+        """JSON'a yazılabilir biçim (byte'lar hex string olarak)."""
+        return {
+            "format": OBJECT_FORMAT,
+            "version": OBJECT_VERSION,
+            "name": self.name,
+            "sections": [{"name": section.name, "relocatable": section.relocatable, "address": section.address,
+                          "size": section.size, "chunks": [[offset, bytes(data).hex()] for offset, data in section.chunks]}
+                         for section in self.sections],
+            "symbols": {name: list(value) for name, value in self.symbols.items()},
+            "imports": self.imports,
+            "relocations": [list(relocation) for relocation in self.relocations],
+            "includes": self.includes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Raises:
+            ValueError: Biçim veya sürüm tanınmıyorsa.
+        """
+        if data.get("format") != OBJECT_FORMAT or data.get("version") != OBJECT_VERSION:
+            raise ValueError(f"Tanınmayan nesne dosyası biçimi: {data.get('format')} sürüm {data.get('version')}")
+        sections = [Section(section["name"], section["relocatable"], section["address"], section["size"],
+                            [(offset, bytes.fromhex(text)) for offset, text in section["chunks"]])
+                    for section in data["sections"]]
+        symbols = {name: tuple(value) for name, value in data["symbols"].items()}
+        return cls(data["name"], sections, symbols, data["imports"], [tuple(entry) for entry in data["relocations"]],
+                   data.get("includes", ()))
+
+    @property
+    def text(self):
+        return self.sections[0]
+
+    def __repr__(self):
+        return (f"ObjectModule({self.name!r}, {len(self.sections)} bölüm, {len(self.symbols)} sembol, "
+                f"{len(self.imports)} import, {len(self.relocations)} yer değiştirme)")
+
+
+def write_object(path, module):
+    """Nesne modülünü JSON olarak yazar."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(module.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+
+
+def read_object(path):
+    """
+    Bir .obj dosyasını okur.
+
+    Raises:
+        OSError: Dosya okunamazsa.
+        ValueError: Dosya geçerli bir nesne dosyası değilse.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return ObjectModule.from_dict(json.load(f))
+
+
+def _relocation_error(errors, record, message, code_phase=PHASE_PASS2):
+    errors.append(Diagnostic(f"{record.location}: {message}", "RELOCATION", record.line_num, code_phase,
+                             column=operand_column(record), args=(record.operand_str,)))
+
+
+def _line_fields(record, mnemonic, symbols, location_counter):
+    """
+    Satırın bölüm adresine veya import'lara bağlı alanları.
+
+    Returns:
+        list: [(satır_içi_ofset, tür, hedef, ek), ...]
+
+    Raises:
+        TypeError: Değer yer değiştirilebilir bir biçimde ifade edilemiyorsa.
+        ValueError: Yer değiştirilebilir değer 8 bit'lik bir alana yazılıyorsa.
+    """
+    fields = []
+    if mnemonic == "FCB":
+        for item in record.operand_str.split(','):
+            if isinstance(compile_expression(item.strip()).evaluate(symbols, location_counter), _Relocatable):
+                raise ValueError("8 bit'lik FCB alanına yer değiştirilebilir adres yazılamaz.")
+    elif mnemonic == "FDB":
+        for index, item in enumerate(record.operand_str.split(',')):
+            value = compile_expression(item.strip()).evaluate(symbols, location_counter)
+            if isinstance(value, _Relocatable):
+                fields.append((2 * index, REL_WORD, value.target, value.addend))
+    elif mnemonic not in ("FCC", "INCBIN"):
+        mode = record.addressing_mode
+        num_bytes = ENCODING_INDEX[(mnemonic, mode)][1]
+        if num_bytes == 1:
+            return fields
+        expression = compile_operand(record.operand_str)
+        value = expression.evaluate(symbols, location_counter) if expression is not None else 0
+        if mode == ADDR_MODE_RELATIVE:
+            # Hedef satırla aynı bölümdeyse (ikisi de text ya da ikisi de mutlak) ofset sabittir.
+            target = value.target if isinstance(value, _Relocatable) else None
+            here = location_counter.target if isinstance(location_counter, _Relocatable) else None
+            if target != here:
+                fields.append((1, REL_BRANCH, target, value.addend if target is not None else value))
+        elif isinstance(value, _Relocatable):
+            if num_bytes != 3:
+                raise ValueError(f"8 bit'lik operand alanına yer değiştirilebilir adres yazılamaz: {record.operand_str}")
+            fields.append((1, REL_WORD, value.target, value.addend))
+    return fields
+
+
+def assemble_object(source_lines, name="", symbols=None, includes=None):
+    """
+    Kaynağı yer değiştirilebilir bir nesne modülüne çevirir.
+
+    Args:
+        source_lines (iterable): Kaynak satırları.
+        name (str): Modülün (kaynak dosyanın) adı.
+        symbols (SymbolTable): Önceden yüklenmiş mutlak semboller (bkz. symbol_map); None ise yok.
+        includes (IncludeExpander): INCLUDE'ları çözen genişletici; None ise çalışma dizinine göre çözülür.
+
+    Returns:
+        tuple: (ObjectModule veya None, errors_p1, errors_p2). Pass 1 hatası varsa modül None'dır;
+               errors_p2 Pass 2 ve yer değiştirme hatalarını içerir (varsa modül yazılmamalıdır).
+    """
+    if includes is None:
+        includes = IncludeExpander(source_name=name or "<kaynak>")
+    symbol_table, lines, errors_p1 = pass_one(source_lines, symbols, origin=PROBE_ORIGIN, includes=includes)
+    if errors_p1:
+        return None, errors_p1, []
+    errors_p1 = DiagnosticStore()
+    errors_p2 = DiagnosticStore()
+
+    # 1. tarama: bölümler ve sembollerin yer değiştirilebilir değerleri. EQU/ORG/RMB
+    # operandları Pass 1'deki gibi sadece önceden tanımlanmış sembollere başvurabilir.
+    probe = symbol_table.copy()
+    values = dict(symbol_table.table)
+    local = _LinkTimeSymbols(values, probe.table)
+    text = Section(TEXT_SECTION, True, 0)
+    sections = [text]
+    section = text
+    line_sections = [] # Satır başına bölüm indeksi
+    location = PROBE_ORIGIN
+    for record in lines:
+        mnemonic = (record.mnemonic or "").upper()
+        here = _Relocatable(SECTION_TARGET, location - PROBE_ORIGIN) if section is text else location
+        if record.label and mnemonic != "EQU" and section is text:
+            label = record.label.upper()
+            values[label] = _Relocatable(SECTION_TARGET, values[label] - PROBE_ORIGIN)
+        if mnemonic in ("ORG", "EQU", "RMB"):
+            try:
+                value = compile_expression(record.operand_str).evaluate(local, here)
+            except (TypeError, ExpressionError):
+                value = None
+            if not isinstance(value, int):
+                _relocation_error(errors_p1, record, f"{mnemonic} değeri yer değiştirilebilir bir adrese bağlı olamaz: "
+                                                     f"{record.operand_str}", PHASE_PASS1)
+                value = 0
+            if mnemonic == "EQU":
+                values[record.label.upper()] = value
+            elif mnemonic == "ORG":
+                section = Section(f"ORG ${record.address:04X}", False, record.address)
+                sections.append(section)
+                location = record.address
+        line_sections.append(len(sections) - 1)
+        if mnemonic not in ("ORG", "EQU", "END"):
+            location = record.address + record.size
+            if section is text:
+                section.size = location - PROBE_ORIGIN
+            else:
+                section.size = location - section.address
+    if errors_p1:
+        return None, list(errors_p1), []
+
+    # 2. tarama: kodlama. Import'lar Pass 2'de PROBE_ORIGIN değeriyle çözülür; yer değiştirilen
+    # alanları bağlayıcı yeniden yazar.
+    relocations = []
+    for record, section_index in zip(lines, line_sections):
+        section = sections[section_index]
+        mnemonic = (record.mnemonic or "").upper()
+        if not record.size or mnemonic in _NO_CODE_OPS:
+            continue
+        offset = record.address - (PROBE_ORIGIN if section is text else section.address)
+        here = _Relocatable(SECTION_TARGET, offset) if section is text else record.address
+        try:
+            fields = _line_fields(record, mnemonic, local, here)
+        except TypeError:
+            _relocation_error(errors_p2, record, f"İfade yer değiştirilebilir değil (adresler sadece sabitle "
+                                                 f"toplanıp çıkarılabilir): {record.operand_str}")
+            continue
+        except ValueError as e: # ExpressionError dahil: aşağıda encode_line_pass2 de raporlar
+            if not isinstance(e, ExpressionError):
+                _relocation_error(errors_p2, record, str(e))
+                continue
+            fields = []
+        if any(kind == REL_BRANCH for _, kind, _, _ in fields):
+            # Hedefi bağlamada belli olacak dallanma: ofset byte'ı bağlayıcı yazar.
+            code = [ENCODING_INDEX[(mnemonic, record.addressing_mode)][0], 0]
+        else:
+            entry, code = encode_line_pass2(record, probe, errors_p2)
+            if entry.error or not code:
+                continue
+        section.add(offset, code)
+        for field_offset, kind, target, addend in fields:
+            relocations.append((section_index, offset + field_offset, kind, target, addend, record.line_num))
+
+    exported = {}
+    for symbol_name in symbol_table.table:
+        if symbol_name in symbol_table.external:
+            continue
+        value = values[symbol_name]
+        exported[symbol_name] = (value.target, value.addend) if isinstance(value, _Relocatable) else (None, value)
+    module = ObjectModule(name, sections, exported, list(local.imports), relocations, includes.files)
+    return module, [], list(errors_p2)
+
+
+if __name__ == '__main__':
+    source = [
+        "PUTS    LDX     #MSG",
+        "LOOP    LDAA    0,X",
+        "        BEQ     DONE",
+        "        JSR     PUTCHAR",
+        "        INX",
+        "        BRA     LOOP",
+        "DONE    RTS",
+        "MSG     FCC     'HI'",
+        "        FCB     0",
+        "        ORG     $FFFE",
+        "        FDB     PUTS",
+        "        END",
+    ]
+    module, errors_p1, errors_p2 = assemble_object(source, "puts.asm")
+    print(module, errors_p1, errors_p2)
+    print("Dışa aktarılan:", module.symbols)
+    print("Import:", module.imports)
+    for relocation in module.relocations:
+        print("Yer değiştirme:", relocation)
+    print(assemble_object(["        LDAA    #PUTS", "PUTS    RTS"], "bad.asm")[2])
@@ -0,0 +1,162 @@
+# assembler_core/output_files.py
+# Listeleme ve basit .hex dökümü yazıcıları ile kayıt tabanlı makine kodu dosyaları (S19,
+# Intel HEX) için ortak temel sınıf. Komut satırı (main.py), toplu mod ve sunucu modu
+# aynı yazıcıları kullanır; hepsi girdileri geldikçe yazar.
+import os
+
+from .listing import get_renderer
+
+# Kayıtların sayı/adres/checksum alanları için önceden hesaplanmış hex tablosu.
+# Veri byte'ları bytes.hex() ile (C'de) çevrilir; byte başına tablo aramasından hızlıdır.
+HEX_BYTE = [f"{i:02X}" for i in range(256)]
+
+
+class ListingWriter:
+    """
+    Listeleme dosyasını girdiler geldikçe seçilen biçimde (bkz. listing.py) yazar.
+    Çevrilen satırlar bir listede toplanır ve FLUSH_ENTRIES girdide bir tek write() ile yazılır.
+    """
+    FLUSH_ENTRIES = 4096
+
+    def __init__(self, output_list_filepath, input_filepath, listing_format="text"):
+        self.path = output_list_filepath
+        self.renderer = get_renderer(listing_format)
+        self.file = open(output_list_filepath, 'w', encoding='utf-8')
+        self._buffer = [self.renderer.header(input_filepath)]
+
+    def write_entry(self, entry):
+        self._buffer.append(self.renderer.entry(entry))
+        if len(self._buffer) >= self.FLUSH_ENTRIES:
+            self.file.write("".join(self._buffer))
+            self._buffer = []
+
+    def close(self, errors_p1, errors_p2):
+        self._buffer.append(self.renderer.footer(errors_p1, errors_p2))
+        self.file.write("".join(self._buffer))
+        self._buffer = []
+        self.file.close()
+
+
+class HexDumpWriter:
+    """
+    Basit hex dökümünü ($ADDR: XX XX ...) segmentler geldikçe geçici bir dosyaya yazar.
+    Pass 2 hataları ancak akış bitince bilindiğinden dosya, sonunda hata yoksa
+    asıl adına taşınır, varsa silinir.
+    """
+
+    def __init__(self, output_hex_filepath, input_filepath):
+        self.path = output_hex_filepath
+        self.tmp_path = output_hex_filepath + ".tmp"
+        self.file = open(self.tmp_path, 'w', encoding='utf-8')
+        self.file.write(f"; {os.path.basename(input_filepath)} için makine kodu dökümü\n")
+        self.segment_count = 0
+
+    def write_segment(self, address, byte_codes):
+        hex_string = " ".join([f"{b:02X}" for b in byte_codes])
+        self.file.write(f"${address:04X}: {hex_string}\n")
+        self.segment_count += 1
+
+    def close(self, keep):
+        """keep=True ve en az bir segment yazıldıysa dosyayı kalıcı hale getirir. Oluştuysa True döner."""
+        self.file.close()
+        if keep and self.segment_count:
+            os.replace(self.tmp_path, self.path)
+            return True
+        os.remove(self.tmp_path)
+        return False
+
+
+def coalesce_segments(segments):
+    """
+    Adresleri art arda gelen segmentleri tek bir (adres, bytearray) parçasında birleştirir.
+    pass_two her satır için ayrı segment ürettiğinden kayıt tabanlı biçimler bunu kullanır.
+    """
+    pending_address = None
+    pending = bytearray()
+    for address, byte_codes in segments:
+        if pending_address is not None and address == pending_address + len(pending):
+            pending.extend(byte_codes)
+            continue
+        if pending:
+            yield pending_address, pending
+        pending_address = address
+        pending = bytearray(byte_codes)
+    if pending:
+        yield pending_address, pending
+
+
+class RecordFileWriter:
+    """
+    Kayıt tabanlı makine kodu dosyaları için ortak yazıcı. Ardışık segmentler birleştirilip
+    kayıtlara çevrilir, kayıtlar bellekte toplanır ve büyük parçalar halinde geçici dosyaya
+    yazılır (tipik bir imaj tek yazmada biter). close(keep=True) ile dosya asıl adına taşınır;
+    HexDumpWriter'daki gibi hata varsa veya hiç segment yoksa dosya oluşmaz.
+
+    Alt sınıflar data_records(address, data) ve trailer_records() metodlarını tanımlar.
+    """
+    FLUSH_THRESHOLD = 1 << 20
+
+    def __init__(self, output_filepath, record_length, header_records=()):
+        self.path = output_filepath
+        self.tmp_path = output_filepath + ".tmp"
+        self.record_length = record_length
+        self.segment_count = 0
+        self._pending_address = None # Henüz kayda çevrilmemiş ardışık byte'lar
+        self._pending = bytearray()
+        self._buffer = list(header_records)
+        self._buffered = 0
+        self.file = open(self.tmp_path, 'w', encoding='ascii')
+
+    def data_records(self, address, data):
+        """Ardışık bir byte bloğunun kayıtları (satır sonları dahil string listesi)."""
+        raise NotImplementedError
+
+    def trailer_records(self):
+        """Dosya sonuna eklenecek kayıtlar."""
+        return []
+
+    def write_segment(self, address, byte_codes):
+        self.segment_count += 1
+        if self._pending_address is not None and address == self._pending_address + len(self._pending):
+            self._pending.extend(byte_codes) # memoryview dilimleri ara kopya olmadan eklenir
+        else:
+            self._emit_pending()
+            self._pending_address = address
+            self._pending = bytearray(byte_codes)
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self._emit_pending()
+
+    def _emit_pending(self):
+        if self._pending:
+            self._buffer.extend(self.data_records(self._pending_address, self._pending))
+            self._buffered += len(self._pending)
+            self._pending_address = None
+            self._pending = bytearray()
+            if self._buffered >= self.FLUSH_THRESHOLD:
+                self._flush()
+
+    def _flush(self):
+        self.file.write("".join(self._buffer))
+        self._buffer = []
+        self._buffered = 0
+
+    def close(self, keep):
+        """keep=True ve en az bir segment yazıldıysa dosyayı kalıcı hale getirir. Oluştuysa True döner."""
+        if keep and self.segment_count:
+            self._emit_pending()
+            self._buffer.extend(self.trailer_records())
+            self._flush()
+            self.file.close()
+            os.replace(self.tmp_path, self.path)
+            return True
+        self.file.close()
+        os.remove(self.tmp_path)
+        return False
+
+
+def iter_assembled(final_listing, machine_code_segments):
+    """Önceden hesaplanmış sonuçları AssemblyStream ile aynı (tür, veri) akışına çevirir."""
+    for entry in final_listing:
+        yield "line", entry
+    for segment in machine_code_segments:
+        yield "segment", segment
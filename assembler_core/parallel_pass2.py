@@ -0,0 +1,161 @@
+# assembler_core/parallel_pass2.py
+# Pass 2'nin işçi süreçlerde paralel kodlanması.
+#
+# Pass 1 bittikten sonra sembol tablosu ve her satırın adresi/boyutu/adresleme modu
+# sabittir; encode_line_pass2 bir satırı sadece kendi kaydına ve sembol tablosuna bakarak
+# kodlar. Bu yüzden satırlar parçalara bölünüp işçi süreçlere gönderilebilir:
+#
+#   - Sembol tablosunun anlık görüntüsü (sadece etiket -> değer sözlüğü) her işçiye bir kez,
+#     havuz kurulurken gönderilir; parçalar satır kayıtlarının sadece kodlamada kullanılan
+#     alanlarını tuple olarak taşır (LineRecord pickle etmek birkaç kat pahalıdır).
+#   - İşçi parçanın byte'larını tek bir bytes olarak, satır uzunlukları ve hatalarıyla döndürür;
+#     ListingEntry'ler (code: satırın bytes dilimi) ve segmentler ana süreçte, satır sırasıyla
+#     kurulur. Hatalar da aynı sırayla DiagnosticStore'a eklenir, yani
+#     sonuç sıralı pass_two ile byte byte aynıdır.
+#   - Pass 1'den hatalı gelen satırlar ve INCBIN satırları gönderilmez: ilki kodlanmaz, ikincisi
+#     eşlenmiş dosya üzerinde bir memoryview döndürür (süreçler arası taşınamaz); ikisi de ana
+#     süreçte encode_line_pass2 ile işlenir.
+#
+# Süreç açmak ve kayıtları pickle etmek satır başına kodlamadan pahalı olduğundan paralel
+# kodlama sadece büyük kaynaklarda ve birden çok CPU'da kazandırabilir. Kütüphanede pass_two
+# varsayılan olarak sıralıdır (workers=1); her çağrı yeni bir süreç havuzu açtığı ve spawn ile
+# başlatan platformlarda işçiler çağıran betiği yeniden import ettiği için paralel kodlama
+# açıkça istenir: pass_two(workers=N) veya CLI'da --pass2-jobs. workers=None (CLI'da
+# --pass2-jobs 0) satır sayısı PARALLEL_MIN_LINES'a (M6800_PASS2_PARALLEL_LINES ortam
+# değişkeniyle değiştirilebilir) ulaşınca CPU sayısı kadar işçi kullanır; bu eşik tahminidir,
+# makinede benchmarks/bench_parallel_pass2.py ile ölçülmelidir.
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .assembler import encode_line_pass2
+from .diagnostics import DiagnosticStore, operand_column
+from .line_table import LineRecord, ListingEntry
+from .memory_image import SegmentBuilder
+from .symbol_table import SymbolTable
+
+PARALLEL_MIN_LINES = int(os.environ.get("M6800_PASS2_PARALLEL_LINES", 200_000))
+
+# İşçi başına parça sayısı: işçiler arasındaki yük dengesizliğini küçük tutar.
+_CHUNKS_PER_WORKER = 4
+
+_worker_symbols = None # İşçi süreçteki sembol tablosu (_init_worker kurar)
+
+
+def _init_worker(symbols):
+    """İşçi süreç başlangıcı: sembol anlık görüntüsünden salt okunur kullanılacak tabloyu kurar."""
+    global _worker_symbols
+    _worker_symbols = SymbolTable()
+    _worker_symbols.table = symbols
+
+
+def _encode_chunk(rows):
+    """
+    İşçi süreçte bir parça satırı kodlar (ProcessPoolExecutor için modül seviyesinde).
+
+    Args:
+        rows (list[tuple]): Satır başına (line_num, mnemonic, operand_str, addressing_mode, address, size, source).
+
+    Returns:
+        tuple: (byte'lar (tüm satırlarınki art arda), satır başına byte sayıları (array),
+                {parçadaki_sıra: Diagnostic} - sadece hatalı satırlar).
+    """
+    errors = []
+    code = bytearray()
+    lengths = array("I")
+    failed = {}
+    for index, (line_num, mnemonic, operand_str, addressing_mode, address, size, source) in enumerate(rows):
+        record = LineRecord(line_num, "", mnemonic=mnemonic, operand_str=operand_str, address=address, size=size,
+                            addressing_mode=addressing_mode, source=source) # source: hata mesajındaki konum
+        entry, generated = encode_line_pass2(record, _worker_symbols, errors)
+        if entry.error is not None:
+            failed[index] = entry.error
+        code += bytes(generated)
+        lengths.append(len(generated))
+    return bytes(code), lengths, failed
+
+
+def _local(record):
+    """Satır ana süreçte mi kodlanmalı? (Pass 1 hatası veya INCBIN)"""
+    return record.error is not None or (record.mnemonic is not None and record.mnemonic.upper() == "INCBIN")
+
+
+def _iter_encoded(chunk_results):
+    """İşçi sonuçlarını satır başına (byte'lar (bytes), hata) olarak açar."""
+    for code, lengths, failed in chunk_results:
+        position = 0
+        for index, length in enumerate(lengths):
+            yield code[position:position + length], failed.get(index)
+            position += length
+
+
+def default_workers():
+    """Kullanılacak işçi sayısı (CPU sayısı)."""
+    return os.cpu_count() or 1
+
+
+def pass_two_parallel(processed_lines_pass1, symbol_table, workers=None):
+    """
+    pass_two ile aynı sonucu satırları işçi süreçlerde kodlayarak üretir.
+
+    Args:
+        processed_lines_pass1 (list[LineRecord]): Pass 1 kayıtları.
+        symbol_table (SymbolTable): Pass 1 sonrası sembol tablosu.
+        workers (int, optional): İşçi süreç sayısı (None: CPU sayısı).
+
+    Returns:
+        tuple: (listeleme_girdileri, segmentler, pass2_hataları) - pass_two ile aynı.
+    """
+    workers = workers or default_workers()
+    remote = [(record.line_num, record.mnemonic, record.operand_str, record.addressing_mode, record.address, record.size,
+               record.source)
+              for record in processed_lines_pass1 if not _local(record)]
+    chunk_size = max(1, -(-len(remote) // (workers * _CHUNKS_PER_WORKER)))
+    chunks = [remote[start:start + chunk_size] for start in range(0, len(remote), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(dict(symbol_table.table),)) as executor:
+        # map() sonuçları parça sırasıyla döndürür, hangi işçinin önce bittiğinden bağımsız.
+        encoded = _iter_encoded(executor.map(_encode_chunk, chunks))
+
+        listing_output = []
+        segment_builder = SegmentBuilder()
+        errors_pass2 = DiagnosticStore()
+        for record in processed_lines_pass1:
+            if _local(record):
+                entry, code = encode_line_pass2(record, symbol_table, errors_pass2)
+                listing_output.append(entry)
+                if code is None: # Pass 1 hatalı satır
+                    continue
+            else:
+                code, error = next(encoded)
+                entry = ListingEntry(record, code, error)
+                listing_output.append(entry)
+                if error is not None:
+                    error.column = operand_column(record) # İşçideki kayıtta satır metni yoktu
+                    errors_pass2.append(error)
+            segment_builder.add(record.address, () if entry.error else code)
+    segment_builder.finish()
+    return listing_output, segment_builder.segments, list(errors_pass2)
+
+
+if __name__ == '__main__':
+    import time
+
+    from .assembler import pass_one, pass_two
+
+    source = ["        ORG     $0100"]
+    for n in range(5_000):
+        source += [f"L{n}      LDAA    #{n % 256}", f"        STAA    $20", f"        BNE     L{n}",
+                   f"        FDB     L{n}, *+2"]
+    source += ["        LDAA    #300", "        END"] # Pass 2 hatası
+    symbol_table, lines, errors_p1 = pass_one(source)
+    start = time.perf_counter()
+    expected = pass_two(lines, symbol_table, workers=1)
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    result = pass_two_parallel(lines, symbol_table, workers=2)
+    parallel = time.perf_counter() - start
+    same = [dict(e) for e in result[0]] == [dict(e) for e in expected[0]] and result[2] == expected[2] and \
+        [(a, bytes(d)) for a, d in result[1]] == [(a, bytes(d)) for a, d in expected[1]]
+    print(f"{len(source)} satır: sıralı {sequential * 1000:.1f} ms, 2 işçi {parallel * 1000:.1f} ms, "
+          f"{'AYNI' if same else 'FARKLI'}; hatalar: {result[2]}")
@@ -0,0 +1,565 @@
+# assembler_core/peephole.py
+# Pass 1 ile Pass 2 arasında çalışan, kural tablosuyla yönetilen peephole iyileştiricisi.
+#
+# Her kural Pass 1'den çıkan satır akışında (son adres ve sembollerle) kısa bir kalıp
+# arar ve eşleşirse bir veya birkaç satırı yeniden yazar (komut/operand değişir ya da
+# satır silinir; etiketler ve yorumlar korunur, yorumun başına kuralın adı eklenir).
+# Yeniden yazılan satırlar boyut değiştirdiğinden, layout.py'deki gibi Pass 1 düzenlemeler
+# uygulanarak yeniden çalıştırılır ve yeni yerleşimde yeni eşleşmeler aranır.
+#
+# Koşul kodları: her kural, yeniden yazılmış kodun orijinalinden farklı bırakabileceği
+# CCR bayraklarını (clobbers) bildirir. Kural sadece bu bayraklar, düzenlenen son satırdan
+# sonraki düz akışta okunmadan önce yeniden yazılıyorsa uygulanır. Akışta dallanma, alt
+# program çağrısı/dönüşü, veri direktifi veya hatalı satır görülürse bayraklar canlı
+# sayılır (kural uygulanmaz). Her yinelemede uygulanmış düzenlemeler yeni yerleşimde
+# yeniden doğrulanır (bayraklar hala ölü mü, yeni dallanmalar menzilde mi); geçersiz
+# kalan düzenleme geri alınır ve o satırlar sabitlenir. Her yineleme ya yeni bir satır
+# düzenler ya da bir satırı sabitlediğinden yineleme sayısı satır sayısıyla sınırlıdır.
+#
+# Adresler: etiketli başvurular yeni yerleşimi izler, '*' içeren veya sayısal olanlar
+# ("BRA *+4", "JMP $1004") izlemez. Düzenlenen bir satırı böyle bir başvuru aşıyorsa
+# (bkz. layout.FixedReferences) kural uygulanmaz; raporda referenced olarak listelenir.
+#
+# Kurallar:
+#   clr_zero         : LDAA/LDAB #0 -> CLRA/CLRB (1 byte kısa; C'yi sıfırlar)
+#   jump_next        : hedefi bir sonraki adres olan JMP/BRA silinir
+#   branch_over_jump : "Bcc L1 / BRA|JMP L2 / L1" -> "B(ters cc) L2"
+#   redundant_load   : aynı adrese yazıp hemen geri okuma veya aynı yüklemenin tekrarı silinir.
+#                      Bellek eşlemeli G/Ç adreslerinde okunan değer yazılandan farklı
+#                      olabileceğinden varsayılan olarak kapalıdır.
+from .assembler import process_line_pass1, pass_two
+from .diagnostics import DiagnosticStore
+from .expressions import compile_operand
+from .include import IncludeExpander
+from .layout import FixedReferences
+from .m6800_opcodes import ADDR_MODE_EXTENDED, ADDR_MODE_IMMEDIATE, ADDR_MODE_INDEXED, ADDR_MODE_RELATIVE, \
+                           ENCODING_INDEX, MODE_INDEX
+from .symbol_table import SymbolTable
+
+# Bayrak canlılığı için ileriye en fazla bu kadar satır taranır.
+_LIVENESS_WINDOW = 32
+
+
+def _flag_effects():
+    """Komut -> (okuduğu bayraklar, her durumda yeniden yazdığı bayraklar). CCR: H I N Z V C."""
+    effects = {}
+
+    def accumulators(base, reads, writes):
+        effects[base + "A"] = effects[base + "B"] = (frozenset(reads), frozenset(writes))
+
+    accumulators("ADD", "", "HNZVC")
+    accumulators("ADC", "C", "HNZVC")
+    for base in ("SUB", "CMP"):
+        accumulators(base, "", "NZVC")
+    accumulators("SBC", "C", "NZVC")
+    for base in ("AND", "BIT", "EOR", "ORA", "LDA", "STA"):
+        accumulators(base, "", "NZV")
+    for base in ("CLR", "COM", "NEG", "ASL", "ASR", "LSR", "TST"):
+        accumulators(base, "", "NZVC")
+        effects[base] = (frozenset(), frozenset("NZVC"))
+    for base in ("ROL", "ROR"):
+        accumulators(base, "C", "NZVC")
+        effects[base] = (frozenset("C"), frozenset("NZVC"))
+    for base in ("DEC", "INC"):
+        accumulators(base, "", "NZV")
+        effects[base] = (frozenset(), frozenset("NZV"))
+    for base in ("PSH", "PUL"):
+        accumulators(base, "", "")
+    for mnemonic, reads, writes in (
+            ("ABA", "", "HNZVC"), ("CBA", "", "NZVC"), ("SBA", "", "NZVC"), ("TAB", "", "NZV"), ("TBA", "", "NZV"),
+            ("DAA", "HC", "NZ"), # C eski değerle birleşir, V tanımsız
+            ("CPX", "", "NZV"), ("LDX", "", "NZV"), ("LDS", "", "NZV"), ("STX", "", "NZV"), ("STS", "", "NZV"),
+            ("INX", "", "Z"), ("DEX", "", "Z"), ("INS", "", ""), ("DES", "", ""), ("TXS", "", ""), ("TSX", "", ""),
+            ("CLC", "", "C"), ("SEC", "", "C"), ("CLV", "", "V"), ("SEV", "", "V"), ("CLI", "", "I"), ("SEI", "", "I"),
+            ("TAP", "", "HINZVC"), ("TPA", "HINZVC", ""), ("NOP", "", "")):
+        effects[mnemonic] = (frozenset(reads), frozenset(writes))
+    return effects
+
+
+FLAG_EFFECTS = _flag_effects()
+
+# Akışı değiştiren komutlar: bayrak taraması bunlarda durur (bayraklar canlı sayılır).
+_CONTROL_FLOW = frozenset(mnemonic for mnemonic, modes in MODE_INDEX.items() if ADDR_MODE_RELATIVE in modes) | \
+                {"JMP", "JSR", "RTS", "RTI", "SWI", "WAI"}
+
+_INVERTED_BRANCH = {"BEQ": "BNE", "BCC": "BCS", "BVC": "BVS", "BPL": "BMI", "BHI": "BLS", "BGE": "BLT", "BGT": "BLE"}
+_INVERTED_BRANCH.update({inverse: branch for branch, inverse in list(_INVERTED_BRANCH.items())})
+
+# Saklama/yükleme -> aynı yazmacın yükleme komutu
+_RELOAD = {"STAA": "LDAA", "STAB": "LDAB", "STX": "LDX", "STS": "LDS",
+           "LDAA": "LDAA", "LDAB": "LDAB", "LDX": "LDX", "LDS": "LDS"}
+
+
+def _operand_value(record, symbol_table):
+    """Operandın son sembol tablosuyla değeri; çözülemiyorsa None."""
+    try:
+        return compile_operand(record.operand_str).evaluate(symbol_table, record.address)
+    except (ValueError, AttributeError): # ExpressionError dahil; AttributeError: operandsız (None) ifade
+        return None
+
+
+def _is_instruction(record):
+    return record.addressing_mode is not None and not record.error
+
+
+def _next_instruction(lines, index):
+    """
+    index'ten sonraki ilk kodlu satır.
+
+    Returns:
+        tuple: (indeks, etiketli_mi) - araya sadece etiket satırı girdiyse de etiketli sayılır;
+               sonraki satır komut değilse None.
+    """
+    labeled = False
+    for next_index in range(index + 1, len(lines)):
+        record = lines[next_index]
+        if not record.mnemonic:
+            if record.label:
+                labeled = True
+            continue
+        if not _is_instruction(record):
+            return None
+        return next_index, labeled or bool(record.label)
+    return None
+
+
+def _match_clr_zero(lines, index, symbol_table):
+    record = lines[index]
+    mnemonic = record.mnemonic.upper()
+    if mnemonic not in ("LDAA", "LDAB") or record.addressing_mode != ADDR_MODE_IMMEDIATE:
+        return None
+    if _operand_value(record, symbol_table) != 0:
+        return None
+    return [(record.line_num, "CLR" + mnemonic[-1], None)], index
+
+
+def _match_jump_next(lines, index, symbol_table):
+    record = lines[index]
+    mnemonic = record.mnemonic.upper()
+    if not ((mnemonic == "JMP" and record.addressing_mode == ADDR_MODE_EXTENDED) or mnemonic == "BRA"):
+        return None
+    if _operand_value(record, symbol_table) != record.address + record.size:
+        return None
+    return [(record.line_num, None, None)], index # Etiket (varsa) aynı adresi gösterir
+
+
+def _match_branch_over_jump(lines, index, symbol_table):
+    record = lines[index]
+    inverse = _INVERTED_BRANCH.get(record.mnemonic.upper())
+    if inverse is None:
+        return None
+    found = _next_instruction(lines, index)
+    if found is None or found[1]: # Atlanan satıra başka yerden dallanılıyor olabilir
+        return None
+    jump = lines[found[0]]
+    jump_mnemonic = jump.mnemonic.upper()
+    if not ((jump_mnemonic == "JMP" and jump.addressing_mode == ADDR_MODE_EXTENDED) or jump_mnemonic == "BRA"):
+        return None
+    if "*" in jump.operand_str or jump.address != record.address + record.size: # Operand yeni adreste aynı kalmalı
+        return None
+    if _operand_value(record, symbol_table) != jump.address + jump.size:
+        return None
+    target = _operand_value(jump, symbol_table)
+    if target is None:
+        return None
+    if target > jump.address: # Silinen satırdan sonraki hedef kayar
+        target -= jump.size
+    if not -128 <= target - (record.address + 2) <= 127:
+        return None
+    return [(record.line_num, inverse, jump.operand_str), (jump.line_num, None, None)], found[0]
+
+
+def _match_redundant_load(lines, index, symbol_table):
+    record = lines[index]
+    load = _RELOAD.get(record.mnemonic.upper())
+    if load is None:
+        return None
+    mode = record.addressing_mode
+    if load == "LDX" and mode == ADDR_MODE_INDEXED: # LDX n,X adresi değiştirir
+        return None
+    found = _next_instruction(lines, index)
+    if found is None or found[1]:
+        return None
+    reload = lines[found[0]]
+    if reload.mnemonic.upper() != load or reload.addressing_mode != mode or \
+            reload.address != record.address + record.size:
+        return None
+    value = _operand_value(record, symbol_table)
+    if value is None or _operand_value(reload, symbol_table) != value:
+        return None
+    # Yükleme, önceki komutla aynı yazmaç değerinden aynı N, Z, V'yi üretir.
+    return [(reload.line_num, None, None)], found[0]
+
+
+class Rule:
+    """
+    Bir peephole kuralı.
+
+    name:        Kuralın adı (--peephole-rules ve raporda).
+    description: Kısa açıklama.
+    clobbers:    Yeniden yazılan kodun orijinalinden farklı bırakabileceği CCR bayrakları.
+    default:     Kural listesi verilmediğinde açık mı?
+    match:       match(lines, index, symbol_table) -> ([(line_num, mnemonic, operand_str), ...], son_indeks)
+                 veya None. mnemonic None ise satır silinir.
+    """
+    __slots__ = ("name", "description", "clobbers", "default", "match")
+
+    def __init__(self, name, description, clobbers, default, match):
+        self.name = name
+        self.description = description
+        self.clobbers = frozenset(clobbers)
+        self.default = default
+        self.match = match
+
+    def __repr__(self):
+        return f"Rule({self.name})"
+
+
+RULES = (
+    Rule("clr_zero", "LDAA/LDAB #0 -> CLRA/CLRB", "C", True, _match_clr_zero),
+    Rule("jump_next", "Bir sonraki adrese JMP/BRA silinir", "", True, _match_jump_next),
+    Rule("branch_over_jump", "Bcc L1 / BRA|JMP L2 / L1: -> B(ters cc) L2", "", True, _match_branch_over_jump),
+    Rule("redundant_load", "Aynı adrese yazıp geri okuma / tekrarlanan yükleme silinir (G/Ç adreslerinde güvensiz)",
+         "", False, _match_redundant_load),
+)
+
+RULE_NAMES = tuple(rule.name for rule in RULES)
+
+
+def resolve_rules(names=None):
+    """
+    Kural adlarını RULES sırasıyla Rule nesnelerine çevirir.
+
+    Args:
+        names (iterable[str]): Açılacak kurallar; None ise varsayılan olarak açık olanlar.
+
+    Raises:
+        ValueError: Bilinmeyen kural adında.
+    """
+    if names is None:
+        return tuple(rule for rule in RULES if rule.default)
+    names = set(names)
+    unknown = names.difference(RULE_NAMES)
+    if unknown:
+        raise ValueError(f"Bilinmeyen peephole kuralı: {', '.join(sorted(unknown))} "
+                         f"(geçerli: {', '.join(RULE_NAMES)})")
+    return tuple(rule for rule in RULES if rule.name in names)
+
+
+def _flags_dead(lines, index, flags):
+    """flags, lines[index]'ten başlayan düz akışta okunmadan önce yeniden yazılıyor mu?"""
+    live = set(flags)
+    if not live:
+        return True
+    for record in lines[index:index + _LIVENESS_WINDOW]:
+        mnemonic = record.mnemonic
+        if not mnemonic: # Boş, yorum veya sadece etiket
+            continue
+        mnemonic = mnemonic.upper()
+        if mnemonic == "EQU":
+            continue
+        if not _is_instruction(record) or mnemonic in _CONTROL_FLOW:
+            return False
+        reads, writes = FLAG_EFFECTS[mnemonic]
+        if live & reads:
+            return False
+        live -= writes
+        if not live:
+            return True
+    return False
+
+
+def _instruction_cost(record):
+    """Satırın (byte, çevrim) maliyeti; komut değilse (0, 0)."""
+    if not _is_instruction(record):
+        return 0, 0
+    return record.size, ENCODING_INDEX[(record.mnemonic.upper(), record.addressing_mode)][2]
+
+
+def _source_text(mnemonic, operand_str):
+    return f"{mnemonic} {operand_str}" if operand_str else mnemonic
+
+
+class Rewrite:
+    """
+    Uygulanmış bir yeniden yazma.
+
+    rule:         Kuralın adı.
+    line_num:     Düzenlenen ilk satır.
+    before:       Düzenlenen satırların orijinal komutları ("LDAA #0" veya "BEQ L1 / BRA L2").
+    after:        Yerlerine gelen komutlar (hepsi silindiyse boş).
+    bytes_saved:  Kazanılan program byte'ı.
+    cycles_saved: Düzenlenen satırlar birer kez çalıştığında kazanılan çevrim (komut çevrimleri toplamı farkı).
+    """
+    __slots__ = ("rule", "line_num", "before", "after", "bytes_saved", "cycles_saved")
+
+    def __init__(self, rule, line_num, before, after, bytes_saved, cycles_saved):
+        self.rule = rule
+        self.line_num = line_num
+        self.before = before
+        self.after = after
+        self.bytes_saved = bytes_saved
+        self.cycles_saved = cycles_saved
+
+    def __str__(self):
+        return (f"Satır {self.line_num}: {self.before} -> {self.after or '(silindi)'} "
+                f"[{self.rule}] {self.bytes_saved} byte, {self.cycles_saved} çevrim")
+
+    def __repr__(self):
+        return f"Rewrite({self})"
+
+
+class PeepholeReport:
+    """
+    optimize_peephole() sonucunun özeti.
+
+    iterations:   Pass 1'in kaç kez çalıştığı.
+    rewrites:     Uygulanan yeniden yazmalar (Rewrite, satır sırasıyla).
+    blocked:      Kalıbı eşleşen ama bayraklar canlı olduğu veya yeni yerleşimde geçersiz kaldığı
+                  için uygulanmayan (kural_adı, satır) çiftleri.
+    referenced:   '*' içeren veya sayısal bir başvuru düzenlenen satırları aştığı için uygulanmayan
+                  (kural_adı, satır, başvuran_satır) üçlüleri.
+    bytes_saved:  Toplam kazanılan byte.
+    cycles_saved: Toplam kazanılan çevrim (her düzenlenen satır bir kez çalıştığında).
+    """
+    __slots__ = ("iterations", "rewrites", "blocked", "referenced", "bytes_saved", "cycles_saved")
+
+    def __init__(self, iterations, rewrites, blocked, referenced=()):
+        self.iterations = iterations
+        self.rewrites = rewrites
+        self.blocked = blocked
+        self.referenced = list(referenced)
+        self.bytes_saved = sum(rewrite.bytes_saved for rewrite in rewrites)
+        self.cycles_saved = sum(rewrite.cycles_saved for rewrite in rewrites)
+
+    def summary(self):
+        text = (f"Peephole: {len(self.rewrites)} yeniden yazma, {self.bytes_saved} byte, "
+                f"{self.cycles_saved} çevrim kazanç ({self.iterations} yineleme)")
+        if self.blocked:
+            text += f"; bayrak/menzil nedeniyle uygulanmayan {len(self.blocked)} eşleşme"
+        if self.referenced:
+            text += f"; sabit adres/'*' başvurusu nedeniyle uygulanmayan {len(self.referenced)} eşleşme"
+        return text
+
+    def __repr__(self):
+        return f"PeepholeReport({self.summary()})"
+
+
+class _Applied:
+    """Uygulanmış bir eşleşme: kural, düzenlenen satırlar ve orijinal maliyetleri."""
+    __slots__ = ("rule", "line_nums", "before", "bytes", "cycles")
+
+    def __init__(self, rule, line_nums, before, size, cycles):
+        self.rule = rule
+        self.line_nums = line_nums
+        self.before = before
+        self.bytes = size
+        self.cycles = cycles
+
+
+def _pass_one(source_lines, edits, symbols, includes):
+    """pass_one; edits'teki satırlar (line_num -> (mnemonic, operand_str, not)) yeniden yazılarak yerleştirilir."""
+    symbol_table = symbols.copy() if symbols is not None else SymbolTable()
+    processed_lines = []
+    errors = DiagnosticStore()
+    location_counter = 0
+    for record in includes.records(source_lines):
+        edit = edits.get(record.line_num)
+        if edit is not None:
+            record.mnemonic, record.operand_str, note = edit
+            record.comment = f"{note}; {record.comment}" if record.comment else note
+        line_data, location_counter, is_end = process_line_pass1(
+            record.line_num, record.original_line, symbol_table, location_counter, errors, parsed_line_info=record
+        )
+        processed_lines.append(line_data)
+        if is_end:
+            break
+    return symbol_table, processed_lines, list(errors)
+
+
+def _crossing_reference(line_nums, lines, index_of, references):
+    """Düzenlenen satırlardan birini aşan '*' içeren/sayısal başvurunun satırı; yoksa None."""
+    for line_num in line_nums:
+        crossing = references.crossing(lines[index_of[line_num]].address, line_nums)
+        if crossing is not None:
+            return crossing
+    return None
+
+
+def _still_valid(applied, lines, index_of, symbol_table, references):
+    """
+    Uygulanmış eşleşme yeni yerleşimde hala geçerli mi (bayraklar ölü, dallanmalar menzilde,
+    düzenlenen satırları aşan sabit başvuru yok)?
+    """
+    if _crossing_reference(applied.line_nums, lines, index_of, references) is not None:
+        return False
+    for line_num in applied.line_nums:
+        record = lines[index_of[line_num]]
+        if record.addressing_mode == ADDR_MODE_RELATIVE:
+            target = _operand_value(record, symbol_table)
+            if target is None or not -128 <= target - (record.address + 2) <= 127:
+                return False
+    return _flags_dead(lines, index_of[applied.line_nums[-1]] + 1, applied.rule.clobbers)
+
+
+def optimize_peephole(source_lines, symbols=None, includes=None, rules=None):
+    """
+    Pass 1 sonucuna kuralları uygular ve Pass 1'i sabit noktaya kadar yineler.
+    Kaynakta Pass 1 hatası varsa yeniden yazma yapılmaz (ilk yinelemenin sonucu döner).
+
+    Args:
+        source_lines (iterable[str]): Kaynak satırları (birden çok kez okunur).
+        symbols (SymbolTable): Önceden yüklenmiş semboller (bkz. pass_one); None ise boş tablo.
+        includes (IncludeExpander): INCLUDE'ları çözen genişletici; None ise çalışma dizinine göre çözülür.
+        rules (iterable[str]): Açılacak kural adları (bkz. resolve_rules); None ise varsayılanlar.
+
+    Returns:
+        tuple: (symbol_table, processed_lines, errors_p1, report (PeepholeReport)) - ilk üçü pass_one ile aynı biçimde.
+
+    Raises:
+        ValueError: Bilinmeyen kural adında.
+    """
+    rules = resolve_rules(rules)
+    if not isinstance(source_lines, (list, tuple)):
+        source_lines = list(source_lines)
+    if includes is None:
+        includes = IncludeExpander()
+    edits = {}
+    applied = []
+    pinned = set()
+    blocked = set()
+    referenced = {} # (kural_adı, satır) -> başvuran satır
+    iterations = 0
+    while True:
+        iterations += 1
+        symbol_table, lines, errors_p1 = _pass_one(source_lines, edits, symbols, includes)
+        if errors_p1:
+            break
+        index_of = {record.line_num: index for index, record in enumerate(lines)}
+        references = FixedReferences(lines, symbol_table)
+        invalid = [item for item in applied if not _still_valid(item, lines, index_of, symbol_table, references)]
+        if invalid:
+            for item in invalid:
+                for line_num in item.line_nums:
+                    del edits[line_num]
+                pinned.update(item.line_nums)
+                blocked.add((item.rule.name, item.line_nums[0]))
+            applied = [item for item in applied if item not in invalid]
+            continue
+
+        changed = False
+        for index, record in enumerate(lines):
+            if not _is_instruction(record) or record.line_num in edits or record.line_num in pinned:
+                continue
+            for rule in rules:
+                found = rule.match(lines, index, symbol_table)
+                if found is None:
+                    continue
+                new_edits, last_index = found
+                line_nums = [line_num for line_num, _, _ in new_edits]
+                if any(line_num in edits or line_num in pinned for line_num in line_nums):
+                    continue
+                if not _flags_dead(lines, last_index + 1, rule.clobbers):
+                    blocked.add((rule.name, record.line_num))
+                    continue
+                crossing = _crossing_reference(line_nums, lines, index_of, references)
+                if crossing is not None:
+                    referenced[(rule.name, record.line_num)] = crossing
+                    continue
+                before = []
+                size = cycles = 0
+                for line_num, mnemonic, operand_str in new_edits:
+                    original = lines[index_of[line_num]]
+                    before.append(_source_text(original.mnemonic, original.operand_str))
+                    line_size, line_cycles = _instruction_cost(original)
+                    size += line_size
+                    cycles += line_cycles
+                    edits[line_num] = (mnemonic, operand_str, f"[{rule.name}] {before[-1]}")
+                applied.append(_Applied(rule, line_nums, " / ".join(before), size, cycles))
+                changed = True
+                break
+        if not changed:
+            break
+
+    rewrites = []
+    if not errors_p1:
+        for item in sorted(applied, key=lambda item: item.line_nums[0]):
+            after = []
+            size, cycles = item.bytes, item.cycles
+            for line_num in item.line_nums:
+                record = lines[index_of[line_num]]
+                if record.mnemonic:
+                    after.append(_source_text(record.mnemonic, record.operand_str))
+                line_size, line_cycles = _instruction_cost(record)
+                size -= line_size
+                cycles -= line_cycles
+            rewrites.append(Rewrite(item.rule.name, item.line_nums[0], item.before, " / ".join(after), size, cycles))
+    for rewrite in rewrites: # Sonradan uygulanabilenler
+        blocked.discard((rewrite.rule, rewrite.line_num))
+        referenced.pop((rewrite.rule, rewrite.line_num), None)
+    report = PeepholeReport(iterations, rewrites, sorted(blocked, key=lambda pair: pair[1]),
+                            sorted(((rule, line_num, crossing) for (rule, line_num), crossing in referenced.items()),
+                                   key=lambda item: item[1]))
+    return symbol_table, lines, errors_p1, report
+
+
+def assemble_peephole(source_lines, symbols=None, includes=None, rules=None, workers=1):
+    """
+    optimize_peephole + pass_two (workers pass_two'ya iletilir).
+
+    Returns:
+        tuple: (symbol_table, listing_output, machine_code_segments, errors_p1, errors_p2, report)
+    """
+    symbol_table, lines, errors_p1, report = optimize_peephole(source_lines, symbols, includes, rules)
+    listing_output, machine_code_segments, errors_p2 = pass_two(lines, symbol_table, workers)
+    return symbol_table, listing_output, machine_code_segments, errors_p1, errors_p2, report
+
+
+if __name__ == '__main__':
+    import glob
+    import os
+    from .assembler import pass_one
+
+    source = [
+        "        ORG     $1000",
+        "START   LDAA    #0          ; sonraki ADDA C'yi yeniden yazar",
+        "        ADDA    VALUE",
+        "        LDAB    #$00        ; sonraki ADCB C'yi okur: dokunulmaz",
+        "        ADCB    VALUE+1",
+        "        STAA    VALUE",
+        "        LDAA    VALUE       ; yeni yazılanı geri okuma (redundant_load)",
+        "        CMPA    #10",
+        "        BNE     SKIP",
+        "        BRA     DONE",
+        "SKIP    INCA",
+        "        JMP     DONE",
+        "DONE    RTS",
+        "        BRA     *+4         ; '*' başvurusu: aradaki LDAA #0 kısaltılmaz",
+        "        LDAA    #0",
+        "        ADDA    #1",
+        "        RTS",
+        "VALUE   RMB     2",
+        "        END",
+    ]
+    for line in source:
+        print(line)
+    for rules in (None, RULE_NAMES):
+        symbol_table, listing, segments, errors_p1, errors_p2, report = assemble_peephole(source, rules=rules)
+        print(f"\nKurallar: {', '.join(rule.name for rule in resolve_rules(rules))}")
+        print(report.summary(), "| uygulanmayan:", report.blocked, "| başvuru nedeniyle:", report.referenced)
+        for rewrite in report.rewrites:
+            print(f"  {rewrite}")
+        for entry in listing:
+            if entry['machine_code_hex']:
+                print(f"  {entry['address_hex']:<6} {entry['machine_code_hex']:<8} {entry['mnemonic']:<5} "
+                      f"{entry['operand_str'] or '':<8} ; {entry['comment'] or ''}")
+        print("Hatalar:", errors_p1 + errors_p2)
+
+    tests_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+    for path in sorted(glob.glob(os.path.join(tests_dir, "*.asm"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().strip().split('\n')
+        _, _, e1 = pass_one(lines)
+        _, _, _, o1, o2, report = assemble_peephole(lines, rules=RULE_NAMES)
+        status = "hatalı kaynak" if e1 else ("hatasız" if not o1 and not o2 else f"YENİ HATA {o1 + o2}")
+        print(f"{os.path.basename(path):<28} {status:<14} {report.summary()}")
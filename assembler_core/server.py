@@ -0,0 +1,327 @@
+# assembler_core/server.py
+# Sürekli çalışan (resident) assembler sunucusu.
+#
+# Derleme sistemleri main.py'yi dosya başına bir kez çağırdığında her çağrı
+# yorumlayıcı açılışını, assembler_core importunu ve OPCODE_TABLE'ın kurulmasını
+# yeniden öder. Sunucu modu bu maliyeti bir kez öder ve istekleri JSON-lines
+# protokolüyle (satır başına bir JSON nesnesi) stdin/stdout veya yerel bir Unix
+# soketi üzerinden karşılar. İnce istemci için bkz. assembler_core/client.py.
+#
+# İstek:  {"id": 1, "op": "assemble", "path": "prog.asm"}            (veya "source": "<metin>")
+#         isteğe bağlı: "name", "output_list", "output_hex", "listing" (varsayılan true),
+#                       "single_pass" (varsayılan false), "cache_dir" (derleme önbelleği, varsayılan yok),
+#                       "output_s19", "s19_record_length" (varsayılan 16),
+#                       "output_ihex", "ihex_record_length" (varsayılan 16),
+#                       "output_bin", "bin_fill" (varsayılan 255),
+#                       "listing_format" (output_list'in biçimi: text/compact/jsonl/csv, varsayılan text),
+#                       "symbol_files" (önceden yüklenecek .sym/.map dosyalarının listesi),
+#                       "output_sym" (sembollerin yazılacağı dosya; uzantı .map ise ikili, değilse metin),
+#                       "include_dir" (INCLUDE/INCBIN yollarının göreli olduğu dizin; varsayılan: path'in dizini),
+#                       "image_only" (listeleme hiç üretilmez; output_list ve listing yok sayılır, önbellek kullanılmaz),
+#                       "optimize" (DIRECT'e sığan EXTENDED komutları küçült, bkz. layout.py; varsayılan false),
+#                       "peephole" (true: varsayılan kurallar veya kural adları listesi, bkz. peephole.py; varsayılan yok)
+#         {"op": "ping"}  /  {"op": "shutdown"}
+# Yanıt:  {"id": 1, "ok": true, "errors_p1": [...], "errors_p2": [...], "symbols": {...},
+#          "segments": [[adres, "hex"], ...], "listing": [{...}, ...], "elapsed_ms": 1.2,
+#          "output_list": "...", "output_hex": "..." veya null, "output_s19" / "output_ihex" / "output_bin" / "output_sym": "..." veya null,
+#          "diagnostics": [{"message", "code", "line", "column", "phase", "severity", "args"}, ...],
+#          "cache": "hit" / "miss" / null,
+#          "layout": {"direct_lines", "pinned_lines", "referenced_lines", "bytes_saved", "cycles_saved", "iterations"} (sadece optimize'da; önbellek isabetinde null),
+#          "peephole": {"rewrites": [{"rule", "line_num", "before", "after", "bytes_saved", "cycles_saved"}, ...],
+#                       "blocked", "referenced", "bytes_saved", "cycles_saved", "iterations"} (sadece peephole'da; önbellek isabetinde null)}
+#         Hatalı isteklerde: {"id": 1, "ok": false, "error": "..."}
+import io
+import json
+import os
+import socketserver
+import sys
+import time
+
+from .diagnostics import to_json, unique
+from .build_cache import BuildCache, cached_errors, cached_symbol_table, files_fingerprint, include_dir_option, \
+                         iter_cached
+from .image_only import assemble_image
+from .include import IncludeExpander
+from .layout import assemble_optimized
+from .peephole import assemble_peephole, resolve_rules
+from .output_files import ListingWriter, HexDumpWriter, iter_assembled
+from .intel_hex import IntelHexWriter
+from .memory_image import BinWriter
+from .srecord import S19Writer, DEFAULT_RECORD_LENGTH, end_start_address
+from .single_pass import assemble_single_pass
+from .streaming import AssemblyStream
+from .symbol_map import load_symbol_files, write_symbol_file
+
+
+_caches = {} # önbellek dizini -> BuildCache (sunucu ömrü boyunca paylaşılır)
+
+
+def _get_cache(directory):
+    cache = _caches.get(directory)
+    if cache is None:
+        cache = _caches[directory] = BuildCache(directory)
+    return cache
+
+
+def _assemble(request):
+    source = request.get("source")
+    path = request.get("path")
+    if source is None and path is None:
+        raise ValueError("İstekte 'source' veya 'path' olmalı.")
+    if source is None and not os.path.exists(path):
+        raise ValueError(f"Giriş dosyası bulunamadı: {path}")
+    name = request.get("name") or path or "<kaynak>"
+    image_only = bool(request.get("image_only"))
+    peephole = request.get("peephole")
+    if peephole: # true -> varsayılan kurallar
+        peephole = [rule.name for rule in resolve_rules(None if peephole is True else peephole)]
+        if request.get("single_pass") or request.get("optimize") or image_only:
+            raise ValueError("'peephole', 'single_pass', 'optimize' ve 'image_only' ile birlikte kullanılamaz.")
+    else:
+        peephole = None
+    want_listing = request.get("listing", True) and not image_only
+
+    start = time.perf_counter()
+    symbol_files = request.get("symbol_files") or []
+    preloaded = load_symbol_files(symbol_files) if symbol_files else None
+    # Dahil edilen dosyalar süreç boyunca paylaşılan önbellekten gelir (istekler arasında yeniden lex edilmez).
+    include_dir = request.get("include_dir") or (os.path.dirname(path) if path else None)
+    includes = IncludeExpander(include_dir, os.path.basename(path) if path else name)
+    cache = _get_cache(request["cache_dir"]) if request.get("cache_dir") and not image_only else None
+    cached = stream = image = report = None
+    if cache is not None:
+        if source is not None:
+            source_bytes = source.encode('utf-8')
+        else:
+            with open(path, 'rb') as f:
+                source_bytes = f.read()
+        options = {"single_pass": bool(request.get("single_pass"))}
+        if request.get("optimize"):
+            options["optimize"] = True
+        if peephole is not None:
+            options["peephole"] = sorted(peephole)
+        if symbol_files:
+            options["symbol_files"] = files_fingerprint(symbol_files)
+        cache_include_dir = include_dir_option(source_bytes, include_dir)
+        if cache_include_dir:
+            options["include_dir"] = cache_include_dir
+        cache_key = cache.key(source_bytes, **options)
+        cached = cache.get(cache_key)
+
+    if cached is not None:
+        symbol_table = cached_symbol_table(cached)
+        errors_p1, errors_p2 = cached_errors(cached)
+        results = iter_cached(cached)
+    elif request.get("single_pass"):
+        if source is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        symbol_table, listing, segments, errors_p1, errors_p2 = \
+            assemble_single_pass(source.strip().split('\n'), preloaded, includes)
+        results = iter_assembled(listing, segments)
+    elif request.get("optimize"):
+        if source is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        symbol_table, listing, segments, errors_p1, errors_p2, report = \
+            assemble_optimized(source.splitlines(), preloaded, includes)
+        results = iter_assembled(listing, segments)
+    elif peephole is not None:
+        if source is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        symbol_table, listing, segments, errors_p1, errors_p2, report = \
+            assemble_peephole(source.splitlines(), preloaded, includes, peephole)
+        results = iter_assembled(listing, segments)
+    elif image_only:
+        if source is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        image = assemble_image(source.splitlines(), preloaded, includes)
+        symbol_table, errors_p1, errors_p2 = image.symbol_table, image.errors_p1, image.errors_p2
+        results = (("segment", segment) for segment in image.segments)
+    else:
+        results = stream = AssemblyStream(io.StringIO(source) if source is not None else path, preloaded, includes)
+        symbol_table = stream.run_pass_one()
+        errors_p1 = stream.errors_p1
+    if cache is not None and cached is None:
+        results = cache.record(results)
+
+    lst_writer = ListingWriter(request["output_list"], name, request.get("listing_format") or "text") \
+        if request.get("output_list") and not image_only else None
+    hex_writer = HexDumpWriter(request["output_hex"], name) \
+        if request.get("output_hex") and not errors_p1 else None
+    s19_writer = S19Writer(request["output_s19"], os.path.splitext(os.path.basename(name))[0],
+                           request.get("s19_record_length", DEFAULT_RECORD_LENGTH)) \
+        if request.get("output_s19") and not errors_p1 else None
+    ihex_writer = IntelHexWriter(request["output_ihex"], request.get("ihex_record_length", DEFAULT_RECORD_LENGTH)) \
+        if request.get("output_ihex") and not errors_p1 else None
+    bin_writer = BinWriter(request["output_bin"], request.get("bin_fill", 0xFF)) \
+        if request.get("output_bin") and not errors_p1 else None
+    end_operand = image.end_operand if image is not None else None
+    listing_out = []
+    segments_out = []
+    try:
+        for kind, payload in results:
+            if kind == "line":
+                if want_listing:
+                    listing_out.append(dict(payload))
+                if lst_writer is not None:
+                    lst_writer.write_entry(payload)
+                if s19_writer is not None and (payload["mnemonic"] or "").upper() == "END":
+                    end_operand = payload["operand_str"]
+            else:
+                address, byte_codes = payload
+                segments_out.append([address, bytes(byte_codes).hex().upper()])
+                if hex_writer is not None:
+                    hex_writer.write_segment(address, byte_codes)
+                if s19_writer is not None:
+                    s19_writer.write_segment(address, byte_codes)
+                if ihex_writer is not None:
+                    ihex_writer.write_segment(address, byte_codes)
+                if bin_writer is not None:
+                    bin_writer.write_segment(address, byte_codes)
+        if stream is not None:
+            errors_p2 = stream.errors_p2
+    except BaseException:
+        if hex_writer is not None:
+            hex_writer.close(keep=False)
+        if s19_writer is not None:
+            s19_writer.close(keep=False)
+        if ihex_writer is not None:
+            ihex_writer.close(keep=False)
+        if bin_writer is not None:
+            bin_writer.close(keep=False)
+        if cache is not None and cached is None:
+            results.discard()
+        raise
+    if lst_writer is not None:
+        lst_writer.close(errors_p1, errors_p2)
+    hex_written = hex_writer.close(keep=not errors_p2) if hex_writer is not None else False
+    s19_written = s19_writer.close(keep=not errors_p2, start_address=end_start_address(end_operand, symbol_table)) \
+        if s19_writer is not None else False
+    ihex_written = ihex_writer.close(keep=not errors_p2) if ihex_writer is not None else False
+    bin_written = bin_writer.close(keep=not errors_p2) if bin_writer is not None else False
+    if cache is not None and cached is None:
+        cache.put(cache_key, results, symbol_table, errors_p1, errors_p2, includes.files)
+    sym_written = False
+    if request.get("output_sym") and not errors_p1:
+        write_symbol_file(request["output_sym"], symbol_table.local_symbols(), name)
+        sym_written = True
+
+    response = {
+        "ok": True,
+        "errors_p1": sorted(errors_p1),
+        "errors_p2": sorted(errors_p2),
+        "diagnostics": [to_json(err) for err in unique(errors_p1 + errors_p2)],
+        "symbols": dict(symbol_table.table),
+        "segments": segments_out,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        "output_list": request.get("output_list") if lst_writer is not None else None,
+        "output_hex": request["output_hex"] if hex_written else None,
+        "output_s19": request["output_s19"] if s19_written else None,
+        "output_ihex": request["output_ihex"] if ihex_written else None,
+        "output_bin": request["output_bin"] if bin_written else None,
+        "output_sym": request["output_sym"] if sym_written else None,
+        "cache": None if cache is None else ("hit" if cached is not None else "miss"),
+    }
+    if request.get("optimize"):
+        response["layout"] = None if report is None else {key: getattr(report, key) for key in report.__slots__}
+    elif peephole is not None:
+        response["peephole"] = None if report is None else {
+            "rewrites": [{key: getattr(rewrite, key) for key in rewrite.__slots__} for rewrite in report.rewrites],
+            "blocked": report.blocked, "referenced": report.referenced, "bytes_saved": report.bytes_saved,
+            "cycles_saved": report.cycles_saved, "iterations": report.iterations}
+    if want_listing:
+        response["listing"] = listing_out
+    return response
+
+
+def handle_request(request):
+    """
+    Tek bir protokol isteğini işler.
+
+    Args:
+        request (dict): Çözülmüş JSON isteği.
+
+    Returns:
+        dict: JSON'a çevrilecek yanıt. İstekte "id" varsa yanıta aynen kopyalanır.
+    """
+    op = request.get("op", "assemble")
+    try:
+        if op == "assemble":
+            response = _assemble(request)
+        elif op in ("ping", "shutdown"):
+            response = {"ok": True, "pid": os.getpid()}
+        else:
+            response = {"ok": False, "error": f"Bilinmeyen işlem: {op}"}
+    except (OSError, ValueError) as e:
+        response = {"ok": False, "error": str(e)}
+    except Exception as e: # Sunucu tek bir hatalı istek yüzünden kapanmamalı
+        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    if "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+def _serve_lines(read_line, write_line):
+    """Satır satır istek okuyup yanıt yazar. 'shutdown' isteği alındıysa True döner."""
+    while True:
+        line = read_line()
+        if not line:
+            return False
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("İstek bir JSON nesnesi olmalı.")
+        except ValueError as e:
+            write_line(json.dumps({"ok": False, "error": f"Geçersiz istek: {e}"}, ensure_ascii=False))
+            continue
+        write_line(json.dumps(handle_request(request), ensure_ascii=False))
+        if request.get("op") == "shutdown":
+            return True
+
+
+def serve_stdio(stdin=None, stdout=None):
+    """stdin'den JSON-lines istekleri okur, yanıtları stdout'a yazar (EOF veya 'shutdown' ile biter)."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    def write_line(text):
+        stdout.write(text + "\n")
+        stdout.flush()
+
+    _serve_lines(stdin.readline, write_line)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        def read_line():
+            return self.rfile.readline().decode('utf-8')
+
+        def write_line(text):
+            self.wfile.write((text + "\n").encode('utf-8'))
+            self.wfile.flush()
+
+        if _serve_lines(read_line, write_line):
+            # ThreadingMixIn: bu handler serve_forever'dan ayrı bir thread'de çalışır,
+            # bu yüzden shutdown() burada güvenle çağrılabilir.
+            self.server.shutdown()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_unix_socket(socket_path):
+    """Unix soketinde bağlantı başına JSON-lines istekleri karşılar ('shutdown' ile biter)."""
+    if os.path.exists(socket_path):
+        os.remove(socket_path) # Önceki çalıştırmadan kalan soket dosyası
+    with _UnixServer(socket_path, _ConnectionHandler) as server:
+        try:
+            server.serve_forever(poll_interval=0.1)
+        finally:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
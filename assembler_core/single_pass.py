@@ -0,0 +1,204 @@
+# assembler_core/single_pass.py
+# Tek geçişli (one-pass) assembler motoru.
+#
+# Her satır okunur okunmaz Pass 1 kurallarıyla boyutlandırılır ve hemen kodlanır.
+# Operandı henüz tanımlanmamış bir etikete (ileri referans) dayanan satırlar için
+# çıktı görüntüsüne opcode byte'ı ve operand genişliği kadar yer tutucu byte yazılır
+# ve bir "fixup" kaydı tutulur. END'e (veya kaynağın sonuna) gelindiğinde tüm
+# fixup'lar tek bir taramada çözülür: operand ifadesi değerlendirilir ve sonucu
+# (relative ise dallanma offset'i) kaydedilen konuma width byte olarak yamalanır.
+# Adresleme modu ve boyut sembol değerlerine bağlı olmadığından (bkz.
+# determine_addressing_mode_and_size) sonuç iki geçişli yolla byte düzeyinde aynıdır.
+# Değeri aralık dışında kalan veya çözülemeyen satırlar (ve INCBIN gibi yamalanamayan
+# satırlar) hata mesajının iki geçişli yolla aynı olması için encode_line_pass2 ile
+# yeniden kodlanır.
+from .assembler import process_line_pass1, encode_line_pass2
+from .diagnostics import DiagnosticStore
+from .expressions import compile_operand, ExpressionError
+from .include import IncludeExpander
+from .m6800_opcodes import ADDR_MODE_RELATIVE, ENCODING_INDEX
+from .symbol_table import SymbolTable
+
+
+class Fixup:
+    """
+    END'de yamalanacak tek bir kod bölgesi.
+
+    segment:       Byte'ların yazıldığı segment (bytearray).
+    offset:        Satırın segment içindeki başlangıç konumu.
+    size:          Satırın toplam byte sayısı (Pass 1 boyutu).
+    width:         Yamalanacak her değerin genişliği (byte): komutlarda operand (size - 1),
+                   FCB'de 1, FDB'de 2; None ise satır yamalanamaz, yeniden kodlanır.
+    is_relative:   Relative (dallanma) operandı mı? (değer yerine 8-bit offset yamalanır)
+    listing_index: Satırın listeleme çıktısındaki sırası.
+    line_data:     Satırın Pass 1 verisi (operand metni ve adresi).
+    """
+    __slots__ = ("segment", "offset", "size", "width", "is_relative", "listing_index", "line_data")
+
+    def __init__(self, segment, offset, size, width, is_relative, listing_index, line_data):
+        self.segment = segment
+        self.offset = offset
+        self.size = size
+        self.width = width
+        self.is_relative = is_relative
+        self.listing_index = listing_index
+        self.line_data = line_data
+
+
+_DATA_WIDTHS = {"FCB": 1, "FDB": 2}
+
+
+def _place_fixup(segment, listing_index, line_data):
+    """Satır için fixup kaydı oluşturur ve segmente yer tutucusunu (komutlarda opcode + sıfırlar) yazar."""
+    size = line_data["size"]
+    mode = line_data.get("addressing_mode")
+    offset = len(segment)
+    if mode is None: # Direktif: FCB/FDB değerleri yamalanır, diğerleri yeniden kodlanır
+        width = _DATA_WIDTHS.get(line_data["mnemonic"].upper())
+        segment.extend(bytes(size))
+    else:
+        width = size - 1 # Opcode byte'ı zaten biliniyor
+        segment.append(ENCODING_INDEX[(line_data["mnemonic"].upper(), mode)][0])
+        segment.extend(bytes(width))
+    return Fixup(segment, offset, size, width, mode == ADDR_MODE_RELATIVE, listing_index, line_data)
+
+
+def _evaluate(operand_str, symbol_table, address):
+    """Operandın değeri (parse_operand_value_for_pass2 gibi; ",X" için 0). ExpressionError fırlatabilir."""
+    expression = compile_operand(operand_str)
+    return expression.evaluate(symbol_table, address) if expression is not None else 0
+
+
+def _patch(fixup, symbol_table):
+    """
+    Fixup'ın operand değer(ler)ini hesaplayıp segmente yamalar.
+
+    Returns:
+        bool: Yamalandıysa True. Değer çözülemiyor veya aralık dışındaysa (ya da satır
+              yamalanamıyorsa) False; segmente dokunulmaz, satır yeniden kodlanmalıdır.
+    """
+    width = fixup.width
+    if width is None:
+        return False
+    record = fixup.line_data
+    address = record.address
+    segment = fixup.segment
+    try:
+        if record.addressing_mode is not None: # Komut: opcode'dan sonraki tek operand
+            value = _evaluate(record.operand_str, symbol_table, address)
+            if fixup.is_relative:
+                value -= address + fixup.size # Dallanma hedefinden 8-bit offset
+                if not -128 <= value <= 127:
+                    return False
+                value &= 0xFF
+            elif not 0 <= value < 1 << (8 * width):
+                return False
+            segment[fixup.offset + 1:fixup.offset + 1 + width] = value.to_bytes(width, "big")
+            return True
+        values = [_evaluate(text.strip(), symbol_table, address) for text in (record.operand_str or "").split(',')]
+    except ExpressionError:
+        return False
+    limit = 1 << (8 * width)
+    if len(values) * width != fixup.size or not all(0 <= value < limit for value in values):
+        return False
+    segment[fixup.offset:fixup.offset + fixup.size] = b"".join(value.to_bytes(width, "big") for value in values)
+    return True
+
+
+def assemble_single_pass(source_lines, symbols=None, includes=None):
+    """
+    Kaynağı tek geçişte assemble eder.
+
+    Args:
+        source_lines (iterable): Kaynak satırları.
+        symbols (SymbolTable): Önceden yüklenmiş semboller (kopyalanarak kullanılır); None ise boş tablo.
+        includes (IncludeExpander): INCLUDE'ları çözen genişletici; None ise çalışma dizinine göre çözülür.
+
+    Returns:
+        tuple: (symbol_table, listing_output, machine_code_segments, errors_p1, errors_p2)
+               pass_one + pass_two çağrılarının döndürdüğü değerlerle aynı yapıdadır.
+    """
+    symbol_table = symbols.copy() if symbols is not None else SymbolTable()
+    errors_p1 = DiagnosticStore()
+    errors_p2 = DiagnosticStore()
+    location_counter = 0
+
+    listing_output = []
+    machine_code_segments = []
+    current_segment_address = -1
+    current_segment_bytes = bytearray()
+    fixups = []
+    if includes is None:
+        includes = IncludeExpander()
+
+    for record in includes.records(source_lines):
+        line_data, location_counter, is_end = process_line_pass1(
+            record.line_num, record.original_line, symbol_table, location_counter, errors_p1, parsed_line_info=record
+        )
+
+        # İlk deneme: tanımsız (ileri) bir etiket varsa kodlama hata döner,
+        # bu hata END'deki çözümlemeye kadar ertelenir.
+        attempt_errors = []
+        listing_entry, generated_bytes = encode_line_pass2(line_data, symbol_table, attempt_errors)
+        listing_output.append(listing_entry)
+
+        if generated_bytes is not None: # Pass 1 hatalı satırlar segmentlere katılmaz
+            if current_segment_address != -1 and line_data["address"] != current_segment_address:
+                if current_segment_bytes:
+                    machine_code_segments.append((current_segment_address, current_segment_bytes))
+                current_segment_bytes = bytearray()
+            current_segment_address = line_data["address"]
+
+            if attempt_errors:
+                fixups.append(_place_fixup(current_segment_bytes, len(listing_output) - 1, line_data))
+            elif generated_bytes:
+                current_segment_bytes.extend(generated_bytes)
+
+        if is_end:
+            break
+
+    if current_segment_bytes and current_segment_address != -1:
+        machine_code_segments.append((current_segment_address, current_segment_bytes))
+
+    # --- Fixup Taraması ---
+    # Artık tüm semboller tanımlı; her fixup'ın değeri kaydedilen konuma yamalanır. Sadece
+    # yamalanamayan satırlar tam sembol tablosuyla yeniden kodlanır (hata mesajı için).
+    failed = []
+    for fixup in fixups:
+        if _patch(fixup, symbol_table):
+            listing_entry = listing_output[fixup.listing_index]
+            listing_entry.error = None
+            listing_entry.code = fixup.segment[fixup.offset:fixup.offset + fixup.size]
+            continue
+        listing_entry, generated_bytes = encode_line_pass2(fixup.line_data, symbol_table, errors_p2)
+        listing_output[fixup.listing_index] = listing_entry
+        if listing_entry.get("error"):
+            failed.append(fixup)
+        else:
+            fixup.segment[fixup.offset:fixup.offset + fixup.size] = bytes(generated_bytes)
+
+    # Hatalı satırların yer tutucuları, iki geçişli yoldaki gibi çıktıdan çıkarılır.
+    # Aynı segmentteki konumların kaymaması için sondan başa doğru silinir.
+    for fixup in sorted(failed, key=lambda f: f.offset, reverse=True):
+        del fixup.segment[fixup.offset:fixup.offset + fixup.size]
+    if failed:
+        machine_code_segments = [(addr, seg) for addr, seg in machine_code_segments if seg]
+
+    return symbol_table, listing_output, machine_code_segments, list(errors_p1), list(errors_p2)
+
+
+if __name__ == '__main__':
+    import glob
+    import os
+    from .assembler import pass_one, pass_two
+
+    tests_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+    for path in sorted(glob.glob(os.path.join(tests_dir, "*.asm"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().strip().split('\n')
+        st, p1, e1 = pass_one(lines)
+        listing_2p, segments_2p, e2 = pass_two(p1, st)
+        _, listing_1p, segments_1p, e1_1p, e2_1p = assemble_single_pass(lines)
+        same = ([(a, list(b)) for a, b in segments_2p] == [(a, list(b)) for a, b in segments_1p]
+                and listing_2p == listing_1p and sorted(e1 + e2) == sorted(e1_1p + e2_1p))
+        print(f"{os.path.basename(path):<28} {'AYNI' if same else 'FARKLI'}")
@@ -0,0 +1,221 @@
+# assembler_core/srecord.py
+# Motorola S-record (S19) yazıcı ve okuyucu.
+#
+# S19 dosyası 16-bit adresli kayıtlardan oluşur:
+#   S0: başlık (adres 0000, veri: modül adı)
+#   S1: veri (adres + en fazla record_length byte)
+#   S9: bitiş (program başlangıç adresi)
+# Her kayıt: "S" + tür + byte sayısı + adres + veri + checksum (hex). Byte sayısı
+# adres, veri ve checksum byte'larını sayar; checksum bu byte'ların toplamının
+# düşük byte'ının birler tümleyenidir.
+#
+# Yazıcı pass_two'nun (veya AssemblyStream'in) makine kodu segmentlerini doğrudan
+# alır. pass_two her satır için ayrı segment ürettiğinden ardışık segmentler önce
+# birleştirilir, böylece S1 kayıtları record_length byte'a kadar dolar. Kayıtlar
+# bellekteki bir tamponda toplanır ve dosyaya tek seferde yazılır.
+from .expressions import ExpressionError, compile_expression
+from .output_files import HEX_BYTE, RecordFileWriter, coalesce_segments
+
+DEFAULT_RECORD_LENGTH = 16
+MAX_RECORD_LENGTH = 252 # Byte sayısı alanı 8-bit: 2 adres + 252 veri + 1 checksum = 255
+
+RESET_VECTOR = 0xFFFE
+
+MEMORY_SIZE = 0x10000
+
+
+def _record(record_type, address, data=b""):
+    """Tek bir S0/S1/S9 kaydı (satır sonu dahil)."""
+    count = len(data) + 3
+    high, low = address >> 8, address & 0xFF
+    checksum = ~(count + high + low + sum(data)) & 0xFF
+    return f"S{record_type}{HEX_BYTE[count]}{HEX_BYTE[high]}{HEX_BYTE[low]}{data.hex().upper()}{HEX_BYTE[checksum]}\n"
+
+
+def _data_records(address, byte_codes, record_length):
+    data = bytes(byte_codes)
+    records = []
+    offset = 0
+    while offset < len(data):
+        record_address = (address + offset) & 0xFFFF
+        # S1 kaydı $FFFF'i aşamaz: adres alanının sonunda kesilir, kalanı $0000'dan yeni kayıtla sürer.
+        chunk = data[offset:offset + min(record_length, MEMORY_SIZE - record_address)]
+        offset += len(chunk)
+        records.append(_record(1, record_address, chunk))
+    return records
+
+
+def _check_record_length(record_length):
+    if not 1 <= record_length <= MAX_RECORD_LENGTH:
+        raise ValueError(f"S-record uzunluğu 1-{MAX_RECORD_LENGTH} aralığında olmalı: {record_length}")
+
+
+def format_s19(segments, start_address=0, header="", record_length=DEFAULT_RECORD_LENGTH):
+    """
+    Makine kodu segmentlerini S19 metnine çevirir.
+
+    Args:
+        segments (list): (adres, byte_listesi) çiftleri (pass_two'nun machine_code_segments'i).
+        start_address (int): S9 kaydına yazılacak başlangıç adresi.
+        header (str): S0 kaydındaki modül adı.
+        record_length (int): S1 kaydı başına en fazla veri byte'ı.
+
+    Returns:
+        str: S19 dosyasının içeriği.
+    """
+    _check_record_length(record_length)
+    records = [_record(0, 0, header.encode('ascii', 'replace')[:MAX_RECORD_LENGTH])]
+    for address, data in coalesce_segments(segments):
+        records.extend(_data_records(address, data, record_length))
+    records.append(_record(9, start_address & 0xFFFF))
+    return "".join(records)
+
+
+class S19Writer(RecordFileWriter):
+    """
+    S19 dosyasını segmentler geldikçe oluşturur (tamponlama ve geçici dosya kuralları
+    için bkz. RecordFileWriter). S9 kaydı close() sırasında eklenir.
+    """
+
+    def __init__(self, output_filepath, header="", record_length=DEFAULT_RECORD_LENGTH):
+        _check_record_length(record_length)
+        super().__init__(output_filepath, record_length,
+                         [_record(0, 0, header.encode('ascii', 'replace')[:MAX_RECORD_LENGTH])])
+        self._vector_segments = [] # Reset vektörünü ($FFFE) içeren segmentler
+        self._start_address = 0
+
+    def write_segment(self, address, byte_codes):
+        if address + len(byte_codes) > RESET_VECTOR:
+            self._vector_segments.append((address, bytes(byte_codes))) # Akıştaki dilim kalıcı değil
+        super().write_segment(address, byte_codes)
+
+    def data_records(self, address, data):
+        return _data_records(address, data, self.record_length)
+
+    def trailer_records(self):
+        return [_record(9, self._start_address & 0xFFFF)]
+
+    def close(self, keep, start_address=None):
+        """
+        keep=True ve en az bir segment yazıldıysa S9 kaydını ekleyip dosyayı kalıcı hale getirir.
+        start_address None ise yazılan segmentlerdeki reset vektörü, o da yoksa 0 kullanılır.
+        Dosya oluştuysa True döner.
+        """
+        if start_address is None:
+            start_address = reset_vector(self._vector_segments) or 0
+        self._start_address = start_address
+        return super().close(keep)
+
+
+def end_start_address(end_operand, symbol_table):
+    """END'in operandının (örn. "END START") değeri; operand yoksa veya çözülemiyorsa None."""
+    if not end_operand or not end_operand.strip():
+        return None
+    try:
+        return compile_expression(end_operand).evaluate(symbol_table) & 0xFFFF
+    except ExpressionError:
+        return None
+
+
+def reset_vector(segments):
+    """Segmentlerde $FFFE-$FFFF tanımlıysa reset vektörünün gösterdiği adres, yoksa None."""
+    vector = {}
+    for address, byte_codes in segments:
+        end = address + len(byte_codes)
+        for vector_address in (RESET_VECTOR, RESET_VECTOR + 1):
+            if address <= vector_address < end:
+                vector[vector_address] = byte_codes[vector_address - address]
+    if len(vector) == 2:
+        return (vector[RESET_VECTOR] << 8) | vector[RESET_VECTOR + 1]
+    return None
+
+
+def resolve_start_address(end_operand, symbol_table, segments):
+    """
+    S9 kaydının başlangıç adresini belirler: END'in operandı, yoksa reset vektörü,
+    o da yoksa 0.
+    """
+    start_address = end_start_address(end_operand, symbol_table)
+    if start_address is None:
+        start_address = reset_vector(segments)
+    return start_address or 0
+
+
+def read_s19(source):
+    """
+    Bir S19 dosyasını okur ve checksum'ları doğrular.
+
+    Args:
+        source (str | iterable): Dosya yolu veya satırlar.
+
+    Returns:
+        tuple: (segments, start_address, header)
+               segments: ardışık S1 kayıtları birleştirilmiş (adres, bytes) listesi,
+               start_address: S9 kaydındaki adres (S9 yoksa None),
+               header: S0 kaydındaki metin.
+
+    Raises:
+        ValueError: Biçim veya checksum hatasında ("Satır N: ..." mesajıyla).
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='ascii') as f:
+            return read_s19(f.read().splitlines())
+
+    segments = []
+    current_address = None
+    current_data = bytearray()
+    start_address = None
+    header = ""
+    for line_num, line in enumerate(source, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) < 10 or line[0] not in "Ss" or len(line) % 2:
+            raise ValueError(f"Satır {line_num}: Geçersiz S-record: {line}")
+        try:
+            raw = bytes.fromhex(line[2:])
+        except ValueError:
+            raise ValueError(f"Satır {line_num}: S-record geçersiz hex içeriyor: {line}")
+        if raw[0] != len(raw) - 1:
+            raise ValueError(f"Satır {line_num}: S-record byte sayısı uyuşmuyor: {line}")
+        if (sum(raw) & 0xFF) != 0xFF:
+            raise ValueError(f"Satır {line_num}: S-record checksum hatası: {line}")
+        record_type = line[1]
+        address = (raw[1] << 8) | raw[2]
+        data = raw[3:-1]
+        if record_type == "0":
+            header = data.decode('ascii', 'replace')
+        elif record_type == "1":
+            if address + len(data) > MEMORY_SIZE:
+                raise ValueError(f"Satır {line_num}: S1 kaydı 64 KiB adres alanını aşıyor: {line}")
+            if current_address is not None and address == current_address + len(current_data):
+                current_data += data
+            else:
+                if current_data:
+                    segments.append((current_address, bytes(current_data)))
+                current_address = address
+                current_data = bytearray(data)
+        elif record_type == "9":
+            start_address = address
+        elif record_type != "5":
+            raise ValueError(f"Satır {line_num}: Desteklenmeyen S-record türü: S{record_type}")
+    if current_data:
+        segments.append((current_address, bytes(current_data)))
+    return segments, start_address, header
+
+
+if __name__ == '__main__':
+    segments = [(0x1000, [0x86, 0x10, 0xC6, 0x20, 0x3F] * 5), (0x2000, [0x01, 0x02])]
+    text = format_s19(segments, start_address=0x1000, header="demo")
+    print(text, end="")
+    loaded, start, name = read_s19(text.splitlines())
+    print("Geri okunan:", [(f"${a:04X}", len(d)) for a, d in loaded], f"başlangıç=${start:04X}", name)
+    print("Aynı:", [(a, list(d)) for a, d in loaded] == [(a, list(d)) for a, d in segments])
+
+    # $FFFF'i aşan segment: $FFFE-$FFFF ve $0000-$0002 iki ayrı S1 kaydına bölünür
+    wrapped = [(0xFFFE, [0x01, 0x02, 0x03, 0x04, 0x05])]
+    text = format_s19(wrapped, start_address=0xFFFE)
+    print(text, end="")
+    loaded, start, name = read_s19(text.splitlines())
+    print("Geri okunan:", [(f"${a:04X}", bytes(d).hex()) for a, d in loaded])
+    print("Aynı:", loaded == [(0xFFFE, bytes([0x01, 0x02])), (0x0000, bytes([0x03, 0x04, 0x05]))])
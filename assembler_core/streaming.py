@@ -0,0 +1,219 @@
+# assembler_core/streaming.py
+# Akış (streaming) tabanlı assemble API'si.
+#
+# pass_one/pass_two tüm satırların sözlüklerini listelerde tutar. Bu modül ise
+# kaynağı iki kez okur (Pass 1'de sadece sembol tablosunu ve istisnai satırları
+# saklar, Pass 2'de satırları yeniden işler) ve listeleme girdileriyle makine kodu
+# parçalarını bir generator olarak üretir. Böylece .lst/.hex yazıcıları listelemenin
+# tamamını bellekte tutmadan çıktı üretebilir; bellek kullanımı satır sayısıyla
+# değil, sadece sembol sayısıyla büyür.
+import os
+import tempfile
+
+from .assembler import process_line_pass1, encode_line_pass2
+from .diagnostics import DiagnosticStore
+from .include import IncludeExpander
+from .memory_image import SegmentBuilder
+from .symbol_table import SymbolTable
+
+# Pass 2'de Pass 1 sonucu yeniden üretilemeyen (sembol tablosunun o anki haline veya
+# INCBIN'de dosyanın çözülmüş yoluna bağlı) satırlar; bunların Pass 1 verisi saklanır.
+_STATEFUL_OPS = {"ORG", "EQU", "RMB", "END", "INCBIN"}
+
+
+class _ReplaySymbolTable:
+    """
+    Pass 2'de satırları Pass 1 kurallarıyla yeniden işlerken kullanılan boş tablo.
+    Etiket eklemeleri yok sayılır; hiçbir sembol tanımlı görünmez. Sembole bağlı
+    satırların Pass 1 verisi zaten saklandığından sonuç değişmez.
+    """
+    def add_symbol(self, name, value, line_num, source=None):
+        pass
+
+    def get_symbol_value(self, name):
+        return None
+
+    def is_defined(self, name):
+        return False
+
+
+class _LineSource:
+    """Kaynağı iki kez okunabilir hale getirir (dosya yolu, dosya nesnesi, liste veya generator)."""
+
+    def __init__(self, source):
+        self._source = source
+        self._spool = None
+
+    def first_pass(self):
+        source = self._source
+        if isinstance(source, str):
+            with open(source, 'r', encoding='utf-8') as f:
+                yield from f
+        elif isinstance(source, (list, tuple)):
+            yield from source
+        elif hasattr(source, "seek") and hasattr(source, "seekable") and source.seekable():
+            # "yield from" kullanılmaz: generator END'de erken kapanınca dosyayı da kapatırdı.
+            for line in source:
+                yield line
+        else:
+            # Tek seferlik iterable: Pass 2 için geçici dosyaya aktarılır (RAM'de tutulmaz).
+            self._spool = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+            for line in source:
+                if not line.endswith('\n'):
+                    line += '\n'
+                self._spool.write(line)
+                yield line
+
+    def second_pass(self):
+        source = self._source
+        if isinstance(source, str):
+            with open(source, 'r', encoding='utf-8') as f:
+                yield from f
+        elif isinstance(source, (list, tuple)):
+            yield from source
+        elif self._spool is None:
+            source.seek(0)
+            for line in source:
+                yield line
+        else:
+            self._spool.seek(0)
+            try:
+                yield from self._spool
+            finally:
+                self._spool.close()
+                self._spool = None
+
+
+class AssemblyStream:
+    """
+    Kaynağı akış halinde assemble eder.
+
+    Kullanım:
+        stream = AssemblyStream("program.asm")   # veya dosya nesnesi / satır iterable'ı
+        for kind, payload in stream:
+            if kind == "line":      # payload: listeleme girdisi (pass_two ile aynı sözlük)
+                ...
+            elif kind == "segment": # payload: (adres, byte_listesi)
+                ...
+        stream.symbol_table, stream.errors_p1, stream.errors_p2
+
+    Segmentler pass_two'nun machine_code_segments listesiyle aynı sırada ve aynı
+    sınırlarla, stream.image (MemoryImage) üzerinde memoryview dilimleri olarak üretilir;
+    segmenti saklamak isteyen tüketici kopyalamalıdır (üst üste binen ORG'lar imajı
+    değiştirebilir). errors_p2 iterasyon bittiğinde tamamlanır.
+
+    INCLUDE'lar her iki geçişte de includes (IncludeExpander) ile genişletilir; dosyalar
+    süreç boyunca paylaşılan önbellekten gelir (Pass 2'de yeniden lex edilmez). includes
+    verilmezse kaynak bir dosya yoluysa yollar onun dizinine göre çözülür. Dahil edilen
+    dosyalar Pass 1'den sonra stream.includes.files'tadır.
+    """
+
+    def __init__(self, source, symbols=None, includes=None):
+        self._lines = _LineSource(source)
+        self._preloaded = symbols # Sembol dosyalarından yüklenmiş SymbolTable (veya None)
+        if includes is None:
+            includes = IncludeExpander(os.path.dirname(source), os.path.basename(source)) \
+                if isinstance(source, str) else IncludeExpander()
+        self.includes = includes
+        self.symbol_table = None
+        self.errors_p1 = []
+        self.errors_p2 = []
+        self._stateful = None # satır_no -> Pass 1 verisi (sadece sembole bağlı/hatalı satırlar)
+        self.image = None
+        self._end_line = None
+
+    def run_pass_one(self):
+        """Pass 1'i çalıştırır: sembol tablosu ve istisnai satırların verisi tutulur."""
+        if self.symbol_table is not None:
+            return self.symbol_table
+        symbol_table = self._preloaded.copy() if self._preloaded is not None else SymbolTable()
+        stateful = {}
+        errors = DiagnosticStore()
+        location_counter = 0
+        for record in self.includes.records(self._lines.first_pass()):
+            line_data, location_counter, is_end = process_line_pass1(
+                record.line_num, record.original_line, symbol_table, location_counter, errors, parsed_line_info=record
+            )
+            if line_data.get("error") or (line_data["mnemonic"] or "").upper() in _STATEFUL_OPS:
+                stateful[record.line_num] = line_data
+            if is_end:
+                self._end_line = record.line_num
+                break
+        self.symbol_table = symbol_table
+        self._stateful = stateful
+        self.errors_p1 = list(errors)
+        return symbol_table
+
+    def __iter__(self):
+        symbol_table = self.run_pass_one()
+        stateful = self._stateful
+        replay_table = _ReplaySymbolTable()
+        scratch_errors = []
+        errors_p2 = DiagnosticStore()
+        location_counter = 0
+        segment_builder = SegmentBuilder(keep=False)
+        self.image = segment_builder.image
+
+        for record in self.includes.records(self._lines.second_pass()):
+            line_num = record.line_num
+            line_data = stateful.get(line_num)
+            if line_data is None:
+                # Sembolden bağımsız satır: Pass 1 sonucu metinden ve adres sayacından yeniden üretilir.
+                line_data, location_counter, _ = process_line_pass1(
+                    line_num, record.original_line, replay_table, location_counter, scratch_errors,
+                    parsed_line_info=record
+                )
+            else:
+                location_counter = _location_after(line_data, location_counter)
+
+            entry, generated_bytes = encode_line_pass2(line_data, symbol_table, errors_p2)
+            yield "line", entry
+
+            if generated_bytes is not None:
+                finished = segment_builder.add(line_data["address"], () if entry.error else generated_bytes)
+                if finished is not None:
+                    yield "segment", finished
+
+            if line_num == self._end_line:
+                break
+
+        finished = segment_builder.finish()
+        if finished is not None:
+            yield "segment", finished
+        self.errors_p2 = list(errors_p2)
+
+
+def _location_after(line_data, location_counter):
+    """Saklanan bir Pass 1 satırından sonraki adres sayacı (process_line_pass1 kurallarıyla)."""
+    if line_data.get("error"):
+        return location_counter
+    mnemonic = line_data["mnemonic"].upper()
+    if mnemonic == "ORG":
+        return line_data["address"]
+    if mnemonic in ("EQU", "END"):
+        return location_counter
+    return location_counter + line_data["size"]
+
+
+def assemble_stream(source, symbols=None, includes=None):
+    """AssemblyStream için kısayol; (tür, veri) çiftleri üreten bir AssemblyStream döndürür."""
+    return AssemblyStream(source, symbols, includes)
+
+
+if __name__ == '__main__':
+    import glob
+    import os
+    from .assembler import pass_one, pass_two
+
+    tests_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+    for path in sorted(glob.glob(os.path.join(tests_dir, "*.asm"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().strip().split('\n')
+        st, p1, e1 = pass_one(lines)
+        listing_2p, segments_2p, e2 = pass_two(p1, st)
+        stream = AssemblyStream(iter(lines)) # Tek seferlik iterable: geçici dosya yolu da denenir
+        items = list(stream)
+        same = ([payload for kind, payload in items if kind == "line"] == listing_2p
+                and [(p[0], bytes(p[1])) for k, p in items if k == "segment"] == [(a, bytes(b)) for a, b in segments_2p]
+                and sorted(e1 + e2) == sorted(stream.errors_p1 + stream.errors_p2))
+        print(f"{os.path.basename(path):<28} {'AYNI' if same else 'FARKLI'}")
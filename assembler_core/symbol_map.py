@@ -0,0 +1,172 @@
+# assembler_core/symbol_map.py
+# Sembol dosyaları: sembol tablosunun dışa aktarılması ve başka bir assemble'a
+# önceden yüklenmesi.
+#
+# Önceden assemble edilmiş bir programın (örn. ROM'daki monitör) sembolleri bir
+# dosyaya yazılır; başka bir kaynak (sabit vektörler, atlama tabloları) bu dosya
+# yüklenerek monitörün kaynağı yeniden assemble edilmeden derlenebilir.
+#
+#   .sym : metin, satır başına "ETIKET $DEGER" (';' ile başlayan satırlar yorum)
+#   .map : ikili; başlık + değer dizisi (little-endian; hepsi 16 bit'e sığıyorsa
+#          uint16, değilse int64) + "\n" ile ayrılmış ASCII ad bloğu. Dosya tek
+#          read() ile okunur, değerler array.frombytes ve adlar tek split ile
+#          çözülür (satır başına ayrıştırma yok).
+#
+# Okurken biçim dosyanın ilk byte'larından (sihirli değer) anlaşılır; uzantı sadece
+# yazarken biçimi seçer.
+import array
+import os
+import struct
+import sys
+
+from .symbol_table import SymbolTable
+
+SYMBOL_MAP_MAGIC = b"M68SYM\x00\x01"
+_HEADER = struct.Struct("<8s4sII") # sihirli değer, değer tipi (array typecode), sembol sayısı, ad bloğu uzunluğu
+_VALUE_TYPECODES = ('H', 'q') # uint16 (adresler) veya int64 (büyük/negatif EQU değerleri)
+
+BINARY_EXTENSION = ".map"
+TEXT_EXTENSION = ".sym"
+
+
+def _format_value(value):
+    return f"${value:04X}" if value >= 0 else str(value)
+
+
+def _parse_value(text):
+    return int(text[1:], 16) if text[0] == '$' else int(text)
+
+
+def write_symbol_file(path, symbols, source_name="", binary=None):
+    """
+    Sembolleri .sym (metin) veya .map (ikili) dosyasına yazar.
+
+    Args:
+        path (str): Çıktı dosyasının yolu.
+        symbols (dict): Etiket adı -> değer (örn. SymbolTable.local_symbols()).
+        source_name (str): Sembollerin geldiği kaynak dosyanın adı (metin başlığında).
+        binary (bool or None): None ise uzantı .map olduğunda ikili yazılır.
+
+    Raises:
+        ValueError: İkili biçimde bir değer 64 bit'e sığmıyorsa.
+    """
+    if binary is None:
+        binary = os.path.splitext(path)[1].lower() == BINARY_EXTENSION
+    names = sorted(symbols)
+    if binary:
+        values = [symbols[name] for name in names]
+        typecode = 'H' if not values or 0 <= min(values) and max(values) <= 0xFFFF else 'q'
+        try:
+            values = array.array(typecode, values)
+        except OverflowError:
+            raise ValueError("Sembol değeri 64 bit'e sığmıyor; metin (.sym) biçimini kullanın.") from None
+        if sys.byteorder == "big":
+            values.byteswap()
+        name_blob = "\n".join(names).encode('ascii')
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(SYMBOL_MAP_MAGIC, typecode.encode().ljust(4, b"\0"), len(names), len(name_blob)))
+            f.write(values.tobytes())
+            f.write(name_blob)
+    else:
+        lines = [f"; M6800 sembol dosyası: {os.path.basename(source_name)}\n" if source_name else "; M6800 sembol dosyası\n"]
+        lines.extend(f"{name:<15} {_format_value(symbols[name])}\n" for name in names)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("".join(lines))
+
+
+def _read_binary(data, path):
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path}: Sembol dosyası bozuk (başlık eksik).")
+    magic, typecode, count, blob_length = _HEADER.unpack_from(data)
+    typecode = typecode.rstrip(b"\0").decode('ascii', 'replace')
+    if typecode not in _VALUE_TYPECODES:
+        raise ValueError(f"{path}: Sembol dosyası bozuk (bilinmeyen değer tipi '{typecode}').")
+    values = array.array(typecode)
+    values_start = _HEADER.size
+    names_start = values_start + count * values.itemsize
+    if len(data) != names_start + blob_length:
+        raise ValueError(f"{path}: Sembol dosyası bozuk (beklenen {names_start + blob_length} byte, okunan {len(data)}).")
+    values.frombytes(memoryview(data)[values_start:names_start])
+    if sys.byteorder == "big":
+        values.byteswap()
+    names = data[names_start:].decode('ascii').upper().split("\n") if count else []
+    if len(names) != count:
+        raise ValueError(f"{path}: Sembol dosyası bozuk ({count} değer, {len(names)} ad).")
+    return dict(zip(names, values))
+
+
+def _read_text(text, path):
+    symbols = {}
+    for line_num, line in enumerate(text.splitlines(), 1):
+        fields = line.split()
+        if not fields or fields[0][0] == ';':
+            continue
+        try:
+            name, value = fields
+            symbols[name.upper()] = _parse_value(value)
+        except ValueError:
+            raise ValueError(f"{path}: Satır {line_num}: Geçersiz sembol satırı: {line.strip()}") from None
+    return symbols
+
+
+def read_symbol_file(path):
+    """
+    Bir .sym veya .map dosyasını okur (biçim içerikten anlaşılır).
+
+    Returns:
+        dict: Büyük harfli etiket adı -> değer.
+
+    Raises:
+        OSError: Dosya okunamazsa.
+        ValueError: Dosya bozuksa veya geçersiz satır içeriyorsa.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data.startswith(SYMBOL_MAP_MAGIC):
+        return _read_binary(data, path)
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        raise ValueError(f"{path}: Sembol dosyası tanınmadı (.sym metni veya .map değil).") from None
+    return _read_text(text, path)
+
+
+def load_symbol_files(paths, symbol_table=None):
+    """
+    Sembol dosyalarını bir SymbolTable'a önceden yüklenmiş (harici) semboller olarak ekler.
+
+    Args:
+        paths (list): .sym/.map dosyalarının yolları.
+        symbol_table (SymbolTable): Eklenecek tablo; None ise yenisi oluşturulur.
+
+    Returns:
+        SymbolTable: pass_one / AssemblyStream / assemble_single_pass'e symbols olarak verilebilir.
+
+    Raises:
+        OSError, ValueError: Okuma hatası, bozuk dosya veya dosyalar arası çakışan değer.
+    """
+    if symbol_table is None:
+        symbol_table = SymbolTable()
+    for path in paths:
+        symbol_table.preload(read_symbol_file(path), os.path.basename(path))
+    return symbol_table
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    st = SymbolTable()
+    st.add_symbol("RESET", 0xE000, 3)
+    st.add_symbol("PUTCHAR", 0xE1A0, 40)
+    st.add_symbol("ACIA", 0x8004, 2)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("monitor.sym", "monitor.map"):
+            path = os.path.join(tmp, name)
+            write_symbol_file(path, st.local_symbols(), "monitor.asm")
+            print(name, os.path.getsize(path), "byte:", read_symbol_file(path))
+        rom = load_symbol_files([os.path.join(tmp, "monitor.map")])
+        try:
+            rom.add_symbol("RESET", 0xF000, 7)
+        except ValueError as e:
+            print(f"HATA: {e}")
+        print(rom)
@@ -13,11 +13,19 @@ class SymbolTable:
                      {'ETIKET_ADI': adres_veya_deger}
         self.definitions: Etiketin hangi satırda tanımlandığını tutar, hata mesajları için.
                           {'ETIKET_ADI': satir_numarasi}
+        self.sources: INCLUDE akışında numarası kaymış satırlarda tanımlanan etiketlerin
+                      gerçek konumu. {'ETIKET_ADI': (dosya_adi, dosyadaki_satir)}
         """
         self.table = {}
         self.definitions = {} # Hangi etiketin hangi satırda tanımlandığını izlemek için
-
-    def add_symbol(self, name, value, line_num):
+        self.sources = {} # INCLUDE ile eklenen (veya INCLUDE'dan sonra kayan) tanımların dosya ve satırı
+        self.external = {} # Sembol dosyasından yüklenen etiketler: {'ETIKET_ADI': dosya_adi}
+        # __str__ çıktısı tablo değişene kadar saklanır (her yazdırmada yeniden sıralanmaz).
+        # table/definitions sözlüklerini doğrudan değiştiren kod yazdırmadan önce bunu yapmalıdır.
+        self._version = 0
+        self._str_cache = None
+
+    def add_symbol(self, name, value, line_num, source=None):
         """
         Sembol tablosuna yeni bir etiket ve değerini ekler.
 
@@ -25,6 +33,8 @@ class SymbolTable:
             name (str): Eklenecek etiketin adı.
             value (int): Etikete atanacak değer (adres veya sabit).
             line_num (int): Etiketin tanımlandığı kaynak koddaki satır numarası (hata raporlama için).
+            source (tuple, optional): Satırın (dosya_adı, dosyadaki_satır) konumu (LineRecord.source);
+                                      verilirse mesajlarda ve tabloda satır numarası yerine gösterilir.
 
         Raises:
             ValueError: Eğer etiket zaten tabloda tanımlıysa.
@@ -34,13 +44,59 @@ class SymbolTable:
         normalized_name = name.upper()
 
         if normalized_name in self.table:
-            original_definition_line = self.definitions.get(normalized_name, "bilinmiyor")
+            if normalized_name in self.external:
+                raise ValueError(
+                    f"{_location(line_num, source)}: '{name}' etiketi zaten {self.external[normalized_name]} sembol dosyasında tanımlanmış."
+                )
+            original_definition = _location(self.definitions.get(normalized_name, "bilinmiyor"),
+                                            self.sources.get(normalized_name))
             raise ValueError(
-                f"Satır {line_num}: '{name}' etiketi zaten Satır {original_definition_line}'da tanımlanmış."
+                f"{_location(line_num, source)}: '{name}' etiketi zaten {original_definition}'da tanımlanmış."
             )
         
         self.table[normalized_name] = value
         self.definitions[normalized_name] = line_num
+        if source is not None:
+            self.sources[normalized_name] = source
+        self._version += 1
+
+    def preload(self, symbols, source="harici"):
+        """
+        Başka bir programın sembollerini (örn. önceden assemble edilmiş bir monitörün
+        .sym/.map dosyası) tabloya toplu olarak ekler. Bu etiketler kaynakta yeniden
+        tanımlanamaz; definitions'a girmez, tanım yeri olarak dosya adı gösterilir.
+
+        Args:
+            symbols (dict): Büyük harfli etiket adlarını değerlerine eşleyen sözlük.
+            source (str): Sembollerin geldiği dosyanın adı (hata mesajları ve tablo çıktısı için).
+
+        Raises:
+            ValueError: Bir etiket tabloda farklı bir değerle zaten tanımlıysa.
+        """
+        table = self.table
+        for name in table.keys() & symbols.keys(): # Çakışma kontrolü (sadece ortak adlar)
+            if table[name] != symbols[name]:
+                where = self.external.get(name) or _location(self.definitions.get(name, 'bilinmiyor'), self.sources.get(name))
+                raise ValueError(f"'{name}' etiketi {source} ve {where} içinde farklı değerlerle tanımlanmış.")
+        table.update(symbols)
+        self.external.update(dict.fromkeys(symbols, source))
+        self._version += 1
+
+    def local_symbols(self):
+        """Kaynakta tanımlanan (sembol dosyasından yüklenmemiş) etiketler: {'ETIKET_ADI': deger}."""
+        if not self.external:
+            return dict(self.table)
+        external = self.external
+        return {name: value for name, value in self.table.items() if name not in external}
+
+    def copy(self):
+        """Tablonun bağımsız bir kopyası (önceden yüklenmiş tabloyu birden çok assemble'da kullanmak için)."""
+        other = SymbolTable()
+        other.table = self.table.copy()
+        other.definitions = self.definitions.copy()
+        other.sources = self.sources.copy()
+        other.external = self.external.copy()
+        return other
 
     def get_symbol_value(self, name):
         """
@@ -75,20 +131,32 @@ class SymbolTable:
         """
         if not self.table:
             return "Sembol Tablosu Boş."
-        
+
+        state = (self._version, len(self.table), len(self.definitions))
+        if self._str_cache is not None and self._str_cache[0] == state:
+            return self._str_cache[1]
+
         # Okunurluk için etiketleri sıralayabilir ve değerleri hex formatında gösterebiliriz
         sorted_symbols = sorted(self.table.items())
-        
-        output = "Sembol Tablosu:\n"
-        output += "--------------------\n"
-        output += "{:<15} | {:<10} | {:<10}\n".format("Etiket Adı", "Değer (Hex)", "Tanım Satırı")
-        output += "--------------------\n"
+        row = "{:<15} | {:<10} | {:<10}\n".format
+        definitions = self.definitions
+        sources = self.sources
+        external = self.external
+
+        parts = ["Sembol Tablosu:\n",
+                 "--------------------\n",
+                 row("Etiket Adı", "Değer (Hex)", "Tanım Satırı"),
+                 "--------------------\n"]
         for name, value in sorted_symbols:
             # Değerin tipine göre formatlama yapabiliriz, ama genellikle int olacak
             hex_value = f"${value:04X}" if isinstance(value, int) else str(value)
-            definition_line = self.definitions.get(name, '-') # Tanım satırı bilgisi
-            output += "{:<15} | {:<10} | {:<10}\n".format(name, hex_value, definition_line)
-        output += "--------------------\n"
+            # Tanım satırı ("dosya:satır" INCLUDE'lardan sonra) veya sembol dosyası
+            source = sources.get(name)
+            definition_line = f"{source[0]}:{source[1]}" if source else definitions.get(name) or external.get(name, '-')
+            parts.append(row(name, hex_value, definition_line))
+        parts.append("--------------------\n")
+        output = "".join(parts)
+        self._str_cache = (state, output)
         return output
 
     def clear(self):
@@ -98,6 +166,16 @@ class SymbolTable:
         """
         self.table.clear()
         self.definitions.clear()
+        self.sources.clear()
+        self.external.clear()
+        self._version += 1
+        self._str_cache = None
+
+
+def _location(line_num, source):
+    """Mesajdaki tanım yeri: "Satır N" veya source verilmişse "dosya:satır" (LineRecord.location gibi)."""
+    return f"{source[0]}:{source[1]}" if source else f"Satır {line_num}"
+
 
 # Sınıfın nasıl kullanılacağını göstermek için basit bir test bloğu
 if __name__ == '__main__':
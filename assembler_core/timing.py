@@ -0,0 +1,112 @@
+# assembler_core/timing.py
+# Listelemedeki çevrim sütunları.
+#
+#   çevrim : satırdaki komutun çevrim sayısı (ListingEntry.cycles, OPCODE_TABLE'ın üçüncü alanı)
+#   blok   : etiketli satırla başlayan bloğun başından o satıra kadar (satır dahil) toplam çevrim;
+#            bir sonraki etiketli satırda (EQU hariç) sıfırlanır
+#   döngü  : hedefi kendi adresinden geride olan dallanma (BSR hariç) veya JMP satırında,
+#            hedef komuttan dallanma satırına kadar (ikisi dahil) listeleme sırasındaki
+#            komutların toplam çevrimi, yani döngü gövdesinin bir turunun tahmini maliyeti
+#
+# Döngü tahmini gövdenin düz yolunu sayar: gövde içindeki ileri dallanmaların alındığı
+# turlar atlanan komutlar kadar daha kısadır. M6800'de koşullu dallanmalar alınsa da
+# alınmasa da 4 çevrim olduğundan döngüden çıkılan son tur da aynı maliyettedir.
+#
+# Girdiler geldikçe tek geçişte hesaplanır (listeleme akış halinde üretilebilir); sadece
+# görülen komut adreslerinin birikimli toplamları tutulur (en fazla 64K adres).
+from .m6800_opcodes import ADDR_MODE_RELATIVE, MODE_INDEX
+
+_BRANCHES = frozenset(mnemonic for mnemonic, modes in MODE_INDEX.items() if ADDR_MODE_RELATIVE in modes) - {"BSR"}
+_JUMPS = _BRANCHES | {"JMP"}
+
+
+def jump_target(mnemonic, address, machine_code_hex):
+    """
+    Dallanma (BSR hariç) veya JMP EXTENDED satırının hedef adresi.
+
+    Args:
+        mnemonic (str): Komut.
+        address (int): Satırın adresi.
+        machine_code_hex (str): Satırın makine kodu.
+
+    Returns:
+        int: Hedef adres; satır böyle bir komut değilse None.
+    """
+    mnemonic = mnemonic.upper()
+    if mnemonic in _BRANCHES and len(machine_code_hex) == 4:
+        offset = int(machine_code_hex[2:], 16)
+        if offset & 0x80:
+            offset -= 0x100
+        return (address + 2 + offset) & 0xFFFF
+    if mnemonic == "JMP" and len(machine_code_hex) == 6:
+        return int(machine_code_hex[2:], 16)
+    return None
+
+
+class CycleCounter:
+    """Listeleme girdilerini sırayla alıp çevrim sütunlarını hesaplar."""
+
+    def __init__(self):
+        self._total = 0 # Baştan bu yana toplam çevrim
+        self._block = 0
+        self._total_before = {} # Komut adresi -> o komuttan önceki toplam
+
+    def next(self, cycles, label, mnemonic, address_hex, machine_code_hex):
+        """
+        Bir sonraki girdinin çevrim sütunları. Değerler girdinin aynı adlı alanlarıdır;
+        renderer'lar zaten okudukları alanları verir (ListingEntry'de alanlar property'dir).
+
+        Returns:
+            tuple: (çevrim, blok, döngü) - komut olmayan satırlarda üçü de None; döngü geriye
+                   dallanan satırda (hedef_adres, tur_başına_çevrim), diğer satırlarda None.
+        """
+        if label and (mnemonic or "").upper() != "EQU":
+            self._block = 0
+        if cycles is None:
+            return None, None, None
+        address = int(address_hex[1:], 16)
+        self._total_before[address] = self._total
+        self._total += cycles
+        self._block += cycles
+        if mnemonic.upper() not in _JUMPS:
+            return cycles, self._block, None
+        target = jump_target(mnemonic, address, machine_code_hex)
+        start = self._total_before.get(target) if target is not None and target <= address else None
+        return cycles, self._block, (target, self._total - start) if start is not None else None
+
+    @property
+    def total(self):
+        """Şimdiye kadarki komutların toplam çevrimi (her biri bir kez çalışsaydı)."""
+        return self._total
+
+
+if __name__ == '__main__':
+    from .assembler import pass_one, pass_two
+
+    source = [
+        "        ORG     $1000",
+        "COPY    LDX     #$2000",
+        "        LDAB    #16",
+        "LOOP    LDAA    0,X         ; kaynak",
+        "        STAA    $40,X       ; hedef",
+        "        INX",
+        "        DECB",
+        "        BNE     LOOP",
+        "WAIT    TST     $8000       ; durum bekleme",
+        "        BPL     WAIT",
+        "        BSR     DONE",
+        "        JMP     COPY",
+        "DONE    RTS",
+        "        END",
+    ]
+    symbol_table, lines, errors_p1 = pass_one(source)
+    listing, _, errors_p2 = pass_two(lines, symbol_table)
+    counter = CycleCounter()
+    for entry in listing:
+        cycles, block, loop = counter.next(entry['cycles'], entry['label'], entry['mnemonic'],
+                                           entry['address_hex'], entry['machine_code_hex'])
+        text = f"{cycles if cycles is not None else '':>3} {block if block is not None else '':>4}  {entry['original_line']}"
+        if loop:
+            text += f"   <- döngü ${loop[0]:04X}: {loop[1]} çevrim/tur"
+        print(text)
+    print("Toplam:", counter.total, "| hatalar:", errors_p1 + errors_p2)
@@ -0,0 +1,526 @@
+# assembler_core/wcet.py
+# Kontrol akış grafiği (CFG) üzerinde statik en kötü durum çalışma süresi (WCET) analizi.
+#
+# flowchart_generator.parse_m6800 kaynağı sadece çizim için metin olarak bloklara ayırır.
+# Bu modül assemble edilmiş programın Pass 1 kayıtlarından (son adresler ve çözülmüş
+# dallanma hedefleriyle) gerçek bir CFG kurar: bir giriş adresinden erişilebilen komutlar
+# temel bloklara (tek girişli, sonu dallanma/atlama/dönüş olan diziler) ayrılır ve her blok
+# komutlarının çevrim sayılarıyla (OPCODE_TABLE) ağırlıklandırılır.
+#
+#   - Koşullu dallanmalar iki ardıllıdır (M6800'de alınsa da alınmasa da 4 çevrim).
+#   - JSR/BSR çağrılan alt programın WCET'ini (RTS dahil) bloğun maliyetine ekler; alt
+#     programlar bir kez analiz edilir. Özyinelemeli çağrı sınırsız sayılır.
+#   - RTS, RTI, SWI ve WAI akışı sonlandırır. Dolaylı JMP/JSR (n,X) ve kod dışına (veri,
+#     tanımsız adres) akış analiz edilemez; o giriş sınırsız raporlanır.
+#
+# Döngüler: CFG'deki geri kenarlardan (hedefi kaynağını baskılayan/dominate eden kenarlar)
+# doğal döngüler bulunur ve içten dışa tek bir düğüme indirgenir. Her döngü için bir sınır
+# gerekir; yorumda "@loop N" ile verilir: N, döngü başlığının girişte en fazla kaç kez
+# çalıştığıdır (tur sayısı). Açıklama başlık komutunun, başlıktan hemen önceki etiket/yorum
+# satırının veya geri dallanan komutun yorumunda olabilir:
+#
+#   LOOP    LDAA    0,X     ; @loop 16
+#           ...
+#           BNE     LOOP
+#
+# Döngünün maliyeti (N - 1) * (başlıktan geri kenara en uzun yol) + (başlıktan döngü çıkışına
+# en uzun yol) olarak alınır. Sınırı verilmemiş, çıkışı olmayan veya indirgenemez
+# (irreducible) döngüler sınırsız raporlanır.
+#
+# Girişler: etiket adları veya adresler; verilmezse programın tanımladığı kesme vektörleri
+# (IRQ $FFF8, SWI $FFFA, NMI $FFFC, RESET $FFFE) kullanılır. Her giriş için en kötü durum
+# çevrimi ve kritik yol (blokların etiketleri; döngüler "AD[N×tur]" biçiminde) raporlanır.
+# Kesmeye giriş (CPU'nun yazmaçları yığına atması) dahil değildir; sadece kodun çevrimleridir.
+import math
+import re
+
+from .expressions import compile_operand
+from .image_only import assemble_image
+from .m6800_opcodes import ADDR_MODE_EXTENDED, ADDR_MODE_RELATIVE, ENCODING_INDEX
+
+# M6800 kesme vektörleri (adres, yüksek byte önce)
+VECTORS = (("IRQ", 0xFFF8), ("SWI", 0xFFFA), ("NMI", 0xFFFC), ("RESET", 0xFFFE))
+
+LOOP_BOUND_REGEX = re.compile(r"@loop\s+(\d+)", re.IGNORECASE)
+
+_EXITS = frozenset({"RTS", "RTI", "SWI", "WAI"})
+
+
+def _loop_bound(comment):
+    if not comment:
+        return None
+    match = LOOP_BOUND_REGEX.search(comment)
+    return int(match.group(1)) if match else None
+
+
+class WcetResult:
+    """
+    Bir girişin analiz sonucu.
+
+    name:    Giriş adı (etiket veya vektör adı).
+    address: Giriş adresi.
+    cycles:  En kötü durum çevrimi; sınırsızsa None.
+    path:    Kritik yol (blok adları listesi).
+    reasons: Sınırsız olmasının nedenleri (sınırlıysa boş).
+    """
+    __slots__ = ("name", "address", "cycles", "path", "reasons")
+
+    def __init__(self, name, address, cycles, path, reasons):
+        self.name = name
+        self.address = address
+        self.cycles = cycles
+        self.path = path
+        self.reasons = reasons
+
+    def summary(self):
+        if self.cycles is None:
+            return f"{self.name} (${self.address:04X}): sınırsız - {'; '.join(self.reasons)}"
+        return f"{self.name} (${self.address:04X}): {self.cycles} çevrim | {' -> '.join(self.path)}"
+
+    def __repr__(self):
+        return f"WcetResult({self.summary()})"
+
+
+class _Block:
+    """CFG düğümü: temel blok."""
+    __slots__ = ("start", "cycles", "successors", "calls", "last")
+
+    def __init__(self, start):
+        self.start = start
+        self.cycles = 0         # Komutların çevrimleri ve çağrılan alt programların WCET'leri
+        self.successors = ()
+        self.calls = []         # Çağrılan alt program adresleri
+        self.last = start       # Son komutun adresi
+
+
+class _Analysis:
+    """Bir fonksiyonun (giriş adresinden dönüşe kadar) analiz sonucu."""
+    __slots__ = ("cycles", "path", "reasons")
+
+    def __init__(self, cycles, path, reasons):
+        self.cycles = cycles    # math.inf: sınırsız
+        self.path = path
+        self.reasons = reasons
+
+
+class ControlFlowGraph:
+    """
+    Assemble edilmiş bir programın komutları ve WCET analizi.
+
+    Args:
+        lines (list[LineRecord]): Hatasız Pass 1 kayıtları.
+        symbol_table (SymbolTable): Pass 1 sonrası sembol tablosu.
+    """
+
+    def __init__(self, lines, symbol_table):
+        self.symbol_table = symbol_table
+        self.instructions = {} # Adres -> LineRecord
+        self.bounds = {}       # Komut adresi -> @loop sınırı
+        self.names = {}        # Adres -> etiket
+        self._functions = {}   # Giriş adresi -> _Analysis (None: analiz sürüyor)
+        pending_bound = None
+        for record in lines:
+            mnemonic = record.mnemonic.upper() if record.mnemonic else None
+            if record.label and record.address is not None and (mnemonic is None or record.addressing_mode):
+                self.names.setdefault(record.address, record.label)
+            bound = _loop_bound(record.comment)
+            if mnemonic is None: # Etiket/yorum satırı: açıklama sonraki komuta aittir
+                pending_bound = bound or pending_bound
+                continue
+            if record.addressing_mode is not None and not record.error:
+                self.instructions[record.address] = record
+                bound = bound or pending_bound
+                if bound is not None:
+                    self.bounds[record.address] = bound
+            pending_bound = None
+
+    def name(self, address):
+        return self.names.get(address) or f"${address:04X}"
+
+    def _target(self, record):
+        return compile_operand(record.operand_str).evaluate(self.symbol_table, record.address) & 0xFFFF
+
+    def _flow(self, record):
+        """
+        Komutun akışı.
+
+        Returns:
+            tuple: (ardıl_adresler, çağrılan_adres veya None, sorun veya None)
+        """
+        mnemonic = record.mnemonic.upper()
+        next_address = record.address + record.size
+        if mnemonic in _EXITS:
+            return (), None, None
+        if record.addressing_mode == ADDR_MODE_RELATIVE:
+            target = self._target(record)
+            if mnemonic == "BRA":
+                return (target,), None, None
+            if mnemonic == "BSR":
+                return (next_address,), target, None
+            return (target, next_address), None, None
+        if mnemonic in ("JMP", "JSR"):
+            if record.addressing_mode != ADDR_MODE_EXTENDED:
+                return (), None, f"dolaylı {mnemonic} (${record.address:04X}) hedefi statik olarak bilinmiyor"
+            target = self._target(record)
+            if mnemonic == "JMP":
+                return (target,), None, None
+            return (next_address,), target, None
+        return (next_address,), None, None
+
+    def _blocks(self, entry, reasons):
+        """entry'den erişilebilen komutları temel bloklara ayırır: {başlangıç: _Block}."""
+        flows = {}
+        predecessors = {entry: 0}
+        leaders = {entry}
+        stack = [entry]
+        while stack:
+            address = stack.pop()
+            record = self.instructions.get(address)
+            if record is None:
+                reasons.append(f"kod dışına akış: ${address:04X}")
+                flows[address] = None
+                continue
+            successors, call, problem = self._flow(record)
+            if problem:
+                reasons.append(problem)
+            flows[address] = (successors, call, problem)
+            fall_through = record.address + record.size
+            for successor in successors:
+                if successor != fall_through or len(successors) > 1 or record.mnemonic.upper() in ("BRA", "JMP"):
+                    leaders.add(successor)
+                predecessors[successor] = predecessors.get(successor, 0) + 1
+                if successor not in flows and successor not in stack:
+                    stack.append(successor)
+        leaders.update(address for address, count in predecessors.items() if count > 1)
+
+        blocks = {}
+        for start in leaders:
+            block = blocks[start] = _Block(start)
+            address = start
+            while True:
+                flow = flows[address]
+                if flow is None: # Kod dışı: analiz edilemez
+                    block.cycles = math.inf
+                    break
+                successors, call, problem = flow
+                record = self.instructions[address]
+                block.last = address
+                block.cycles += ENCODING_INDEX[(record.mnemonic.upper(), record.addressing_mode)][2]
+                if problem:
+                    block.cycles = math.inf
+                if call is not None:
+                    block.calls.append(call)
+                    callee = self.analyze(call)
+                    block.cycles += callee.cycles
+                    if callee.cycles == math.inf:
+                        reasons.extend(f"{self.name(call)} çağrısı: {reason}" for reason in callee.reasons)
+                if len(successors) != 1 or successors[0] in leaders:
+                    block.successors = successors
+                    break
+                address = successors[0]
+        return blocks
+
+    def analyze(self, entry):
+        """
+        entry'den başlayan kodun (dönüşe kadar) en kötü durum çevrimi ve kritik yolu.
+
+        Returns:
+            _Analysis: cycles (sınırsızsa math.inf), path, reasons.
+        """
+        if entry in self._functions:
+            result = self._functions[entry]
+            if result is None:
+                return _Analysis(math.inf, [], [f"özyinelemeli çağrı: {self.name(entry)}"])
+            return result
+        self._functions[entry] = None
+        reasons = []
+        blocks = self._blocks(entry, reasons)
+        result = self._longest_path(entry, blocks, reasons)
+        self._functions[entry] = result
+        return result
+
+    def _longest_path(self, entry, blocks, reasons):
+        successors = {start: set(block.successors) for start, block in blocks.items()}
+        cost = {start: block.cycles for start, block in blocks.items()}
+        loops_info = {}
+
+        # Derinlik öncelikli arama: ters son sıra (dominator hesabı için) ve geri dönen kenarlar
+        order = []
+        retreating = []
+        on_stack = {entry}
+        visited = {entry}
+        stack = [(entry, iter(sorted(successors[entry])))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child in on_stack:
+                    retreating.append((node, child))
+                elif child not in visited:
+                    visited.add(child)
+                    on_stack.add(child)
+                    stack.append((child, iter(sorted(successors[child]))))
+                    break
+            else:
+                stack.pop()
+                on_stack.discard(node)
+                order.append(node)
+        order.reverse()
+
+        predecessors = {node: [] for node in order}
+        for node in order:
+            for child in successors[node]:
+                predecessors[child].append(node)
+        idom = _dominators(entry, order, predecessors)
+
+        loops = {}
+        for source, header in retreating:
+            if not _dominates(idom, header, source):
+                reasons.append(f"indirgenemez döngü: {self.name(source)} -> {self.name(header)}")
+                return _Analysis(math.inf, [], reasons)
+            loops.setdefault(header, []).append(source)
+        bodies = []
+        for header, sources in loops.items():
+            body = {header}
+            work = list(sources)
+            while work:
+                node = work.pop()
+                if node not in body:
+                    body.add(node)
+                    work.extend(predecessors[node])
+            bodies.append((len(body), header, sources, body))
+
+        representative = {}
+
+        def find(node):
+            while node in representative:
+                node = representative[node]
+            return node
+
+        for _, header, sources, body in sorted(bodies, key=lambda item: item[0]): # İçteki döngüler önce
+            members = {find(node) for node in body}
+            distance, _ = _dag_longest(header, members, successors, cost, find)
+            back_sources = [node for node in members if node in distance and header in map(find, successors[node])]
+            exits = {(node, find(child)) for node in members if node in distance
+                     for child in successors[node] if find(child) not in members}
+            bound = self.bounds.get(header)
+            if bound is None:
+                bound = next((self.bounds[blocks[node].last] for node in sources if blocks[node].last in self.bounds),
+                             None)
+            if not exits:
+                reasons.append(f"çıkışsız döngü: {self.name(header)}")
+                total = math.inf
+            elif bound is None or bound < 1:
+                reasons.append(f"sınırı bilinmeyen döngü: {self.name(header)} (@loop N ekleyin)")
+                total = math.inf
+            else:
+                iteration = max(distance[node] for node in back_sources)
+                total = (bound - 1) * iteration + max(distance[node] for node, _ in exits)
+                loops_info[header] = (bound, iteration)
+            for node in members:
+                if node != header:
+                    representative[node] = header
+                    del successors[node], cost[node]
+            successors[header] = {child for _, child in exits}
+            cost[header] = total
+
+        distance, previous = _dag_longest(entry, set(successors), successors, cost, find)
+        terminals = [node for node in distance if not {find(child) for child in successors[node]} - {node}]
+        if not terminals:
+            reasons.append(f"{self.name(entry)}: dönüşü olmayan akış")
+            return _Analysis(math.inf, [], reasons)
+        worst = max(terminals, key=lambda node: distance[node])
+        path = []
+        node = worst
+        while node is not None:
+            path.append(self._step(node, blocks[node], loops_info.get(node)))
+            node = previous.get(node)
+        path.reverse()
+        return _Analysis(distance[worst], path, reasons)
+
+    def _step(self, node, block, loop):
+        text = self.name(node)
+        if loop is not None:
+            text += f"[{loop[0]}×{loop[1]}]"
+        elif block.calls:
+            text += f"({', '.join(self.name(call) for call in block.calls)})"
+        return text
+
+    def entry_result(self, name, address):
+        """Bir giriş için WcetResult."""
+        result = self.analyze(address)
+        if result.cycles == math.inf:
+            return WcetResult(name, address, None, result.path, unique_reasons(result.reasons))
+        return WcetResult(name, address, result.cycles, result.path, [])
+
+
+def unique_reasons(reasons):
+    """Nedenler, ilk görülme sırasıyla tekrarsız."""
+    return list(dict.fromkeys(reasons))
+
+
+def _dominators(entry, order, predecessors):
+    """Ters son sıradaki düğümler için anlık baskılayıcılar (Cooper-Harvey-Kennedy)."""
+    index = {node: position for position, node in enumerate(order)}
+    idom = {entry: entry}
+
+    def intersect(a, b):
+        while a != b:
+            while index[a] > index[b]:
+                a = idom[a]
+            while index[b] > index[a]:
+                b = idom[b]
+        return a
+
+    changed = True
+    while changed:
+        changed = False
+        for node in order[1:]:
+            new_idom = None
+            for predecessor in predecessors[node]:
+                if predecessor in idom:
+                    new_idom = predecessor if new_idom is None else intersect(predecessor, new_idom)
+            if idom.get(node) != new_idom:
+                idom[node] = new_idom
+                changed = True
+    return idom
+
+
+def _dominates(idom, header, node):
+    while True:
+        if node == header:
+            return True
+        parent = idom[node]
+        if parent == node:
+            return False
+        node = parent
+
+
+def _dag_longest(start, members, successors, cost, find):
+    """
+    start'tan members içinde (start'a dönen kenarlar hariç) her düğüme en uzun yol.
+
+    Returns:
+        tuple: (uzaklık {düğüm: start ve düğüm dahil toplam çevrim}, önceki {düğüm: önceki düğüm})
+    """
+    reachable = []
+    seen = {start}
+    work = [start]
+    while work:
+        node = work.pop()
+        reachable.append(node)
+        for child in map(find, successors[node]):
+            if child in members and child != start and child not in seen:
+                seen.add(child)
+                work.append(child)
+    indegree = dict.fromkeys(reachable, 0)
+    for node in reachable:
+        for child in set(map(find, successors[node])):
+            if child in indegree and child != start and child != node:
+                indegree[child] += 1
+    distance = {start: cost[start]}
+    previous = {start: None}
+    ready = [start]
+    while ready:
+        node = ready.pop()
+        for child in set(map(find, successors[node])):
+            if child not in indegree or child == start or child == node:
+                continue
+            candidate = distance[node] + cost[child]
+            if candidate > distance.get(child, -1):
+                distance[child] = candidate
+                previous[child] = node
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+    return distance, previous
+
+
+def vector_entries(image):
+    """İmajda tanımlı kesme vektörleri: [(ad, adres), ...]."""
+    entries = []
+    for name, vector in VECTORS:
+        if not image.is_free(vector, 2):
+            entries.append((name, (image.data[vector] << 8) | image.data[vector + 1]))
+    return entries
+
+
+def analyze_wcet(source_lines, entries=None, symbols=None, includes=None):
+    """
+    Kaynağı assemble eder ve girişlerin WCET'ini hesaplar.
+
+    Args:
+        source_lines (iterable[str]): Kaynak satırları.
+        entries (iterable[str]): Giriş etiketleri veya adresleri ("$F000", "0xF000"); None ise kesme vektörleri.
+        symbols (SymbolTable): Önceden yüklenmiş semboller (bkz. pass_one).
+        includes (IncludeExpander): INCLUDE'ları çözen genişletici.
+
+    Returns:
+        tuple: (sonuçlar (WcetResult listesi), assemble hataları) - hata varsa sonuç listesi boştur.
+
+    Raises:
+        ValueError: Giriş etiketi tanımsızsa veya giriş verilmemiş ve program vektör tanımlamıyorsa.
+    """
+    result = assemble_image(source_lines, symbols, includes)
+    errors = result.errors_p1 + result.errors_p2
+    if errors:
+        return [], errors
+    graph = ControlFlowGraph(result.lines, result.symbol_table)
+    if entries is None:
+        resolved = vector_entries(result.image)
+        if not resolved:
+            raise ValueError("Program kesme vektörü ($FFF8-$FFFF) tanımlamıyor; giriş etiketi verin.")
+    else:
+        resolved = []
+        for entry in entries:
+            if entry.startswith("$"):
+                address = int(entry[1:], 16)
+            elif entry[:1].isdigit():
+                address = int(entry, 0)
+            else:
+                address = result.symbol_table.get_symbol_value(entry)
+                if address is None:
+                    raise ValueError(f"Tanımsız giriş etiketi: {entry}")
+            resolved.append((entry, address))
+    return [graph.entry_result(name, address) for name, address in resolved], []
+
+
+if __name__ == '__main__':
+    source = [
+        "        ORG     $F000",
+        "RESET   LDS     #$01FF",
+        "        CLI",
+        "MAIN    JSR     POLL",
+        "        BRA     MAIN        ; ana döngü: sınırsız",
+        "POLL    LDAA    $8000",
+        "        BPL     POLL_DONE",
+        "        JSR     COPY",
+        "POLL_DONE RTS",
+        "COPY    LDX     #$2000",
+        "        LDAB    #16",
+        "COPY_LOOP LDAA  0,X         ; @loop 16",
+        "        STAA    $40,X",
+        "        INX",
+        "        DECB",
+        "        BNE     COPY_LOOP",
+        "        RTS",
+        "IRQ     LDAA    $8001",
+        "        BEQ     IRQ_DONE",
+        "        JSR     COPY",
+        "        INC     $0010",
+        "IRQ_DONE RTI",
+        "NMI     LDAA    $8002",
+        "WAIT    DECA",
+        "        BNE     WAIT        ; sınır açıklaması yok",
+        "        RTI",
+        "        ORG     $FFF8",
+        "        FDB     IRQ, RESET, NMI, RESET",
+        "        END",
+    ]
+    for line in source:
+        print(line)
+    results, errors = analyze_wcet(source)
+    for result in results:
+        print(result.summary())
+    results, errors = analyze_wcet(source, ["COPY", "POLL"])
+    for result in results:
+        print(result.summary())
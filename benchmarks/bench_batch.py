@@ -0,0 +1,41 @@
+# benchmarks/bench_batch.py
+# Toplu mod: aynı dosya kümesinin tek işçiyle (sırayla) ve birden çok işçi süreçle
+# assemble süresi. Her dosya generate_source ile üretilmiş ayrı bir kaynaktır.
+import os
+import tempfile
+import time
+
+from corpus import generate_source
+
+from assembler_core.batch import assemble_batch
+
+NUM_FILES = 48
+LINES_PER_FILE = 5_000
+
+
+def _run(paths, out_dir, jobs):
+    start = time.perf_counter()
+    results = assemble_batch(paths, out_dir, jobs)
+    elapsed = time.perf_counter() - start
+    assert all(r["ok"] and not r["errors_p1"] and not r["errors_p2"] for r in results)
+    return elapsed, results
+
+
+if __name__ == "__main__":
+    source = "\n".join(generate_source(LINES_PER_FILE)) + "\n"
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(NUM_FILES):
+            path = os.path.join(tmp, "src", f"prog_{i:03d}.asm")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(source)
+            paths.append(path)
+
+        print(f"\n{NUM_FILES} dosya x {LINES_PER_FILE} satır, {os.cpu_count()} CPU")
+        baseline, baseline_results = _run(paths, os.path.join(tmp, "out1"), 1)
+        print(f"{'1 işçi':<10} {baseline:7.2f} s")
+        for jobs in sorted({2, 4, os.cpu_count() or 1} - {1}):
+            elapsed, results = _run(paths, os.path.join(tmp, f"out{jobs}"), jobs)
+            assert [r["path"] for r in results] == [r["path"] for r in baseline_results] # Giriş sırası korunur
+            print(f"{f'{jobs} işçi':<10} {elapsed:7.2f} s  ({baseline / elapsed:.1f}x)")
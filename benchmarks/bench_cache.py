@@ -0,0 +1,43 @@
+# benchmarks/bench_cache.py
+# Derleme önbelleği: aynı kaynağın ilk (ıska) ve ikinci (isabet) assemble süresi.
+# İsabette kaynak lex edilmez; .lst/.hex saklanan girdilerden yeniden yazılır.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import generate_source
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+    from assembler_core.build_cache import BuildCache
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def _timed_assemble(source_path, out_dir, cache):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        main.assemble_file(source_path, os.path.join(out_dir, "o.lst"), os.path.join(out_dir, "o.hex"), cache=cache)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print()
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            source_path = os.path.join(tmp, f"src_{size}.asm")
+            with open(source_path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(generate_source(size)) + "\n")
+            cache = BuildCache(os.path.join(tmp, f"cache_{size}"))
+            t_none = _timed_assemble(source_path, tmp, None)
+            t_miss = _timed_assemble(source_path, tmp, cache)
+            with open(os.path.join(tmp, "o.lst"), encoding='utf-8') as f:
+                listing_miss = f.read()
+            t_hit = _timed_assemble(source_path, tmp, cache)
+            with open(os.path.join(tmp, "o.lst"), encoding='utf-8') as f:
+                assert f.read() == listing_miss
+            assert (cache.hits, cache.misses) == (1, 1)
+            print(f"{size:>8} satır | önbelleksiz: {t_none * 1000:8.1f} ms | ıska: {t_miss * 1000:8.1f} ms | "
+                  f"isabet: {t_hit * 1000:8.1f} ms ({t_none / t_hit:.1f}x)")
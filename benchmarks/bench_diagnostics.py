@@ -0,0 +1,55 @@
+# benchmarks/bench_diagnostics.py
+# Çok hatalı bir kaynakta Pass 2 hatalarının Pass 1 hatalarından ayıklanması: GUI'nin
+# eski iç içe alt-string eşleştirmesi (hata sayısında karesel) ile DiagnosticStore
+# (hata başına O(1)) karşılaştırılır. Kaynağın yarısı Pass 1'de (tekrarlanan etiket),
+# yarısı Pass 2'de (tanımsız etiket) hata verir.
+import contextlib
+import io
+import time
+
+from corpus import project_root # noqa: F401 (proje kökünü sys.path'e ekler)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.diagnostics import DiagnosticStore
+
+SIZES = [1_000, 4_000]
+
+
+def _error_source(num_errors):
+    lines = ["        ORG     $1000", "DUP     NOP"]
+    for n in range(num_errors // 2):
+        lines.append("DUP     NOP")                     # Pass 1: tekrarlanan etiket
+        lines.append(f"        LDAA    MISSING{n}")     # Pass 2: tanımsız etiket
+    lines.append("        END")
+    return lines
+
+
+def _nested_substring(errs_p1, errs_p2):
+    unique_pass2_errors = []
+    for p2_err in errs_p2:
+        if not any(p2_err in p1_err or p1_err in p2_err for p1_err in errs_p1):
+            unique_pass2_errors.append(p2_err)
+    return unique_pass2_errors
+
+
+def _store(errs_p1, errs_p2):
+    diagnostics = DiagnosticStore(errs_p1)
+    return [err for err in errs_p2 if diagnostics.append_new(err)]
+
+
+if __name__ == "__main__":
+    print()
+    for size in SIZES:
+        with contextlib.redirect_stdout(io.StringIO()):
+            symbol_table, lines_p1, errs_p1 = pass_one(_error_source(size))
+            _, _, errs_p2 = pass_two(lines_p1, symbol_table)
+        start = time.perf_counter()
+        old = _nested_substring(errs_p1, errs_p2)
+        t_old = time.perf_counter() - start
+        start = time.perf_counter()
+        new = _store(errs_p1, errs_p2)
+        t_new = time.perf_counter() - start
+        assert old == new
+        print(f"{len(errs_p1):>5} P1 + {len(errs_p2):>5} P2 hata: alt-string eşleştirme {t_old * 1000:8.1f} ms | "
+              f"DiagnosticStore {t_new * 1000:6.2f} ms")
@@ -0,0 +1,58 @@
+# benchmarks/bench_encoding.py
+# Satır başına opcode kodlama maliyeti: eski string tabanlı OPCODE_TABLE erişimi
+# ile derlenmiş ENCODING_INDEX karşılaştırması (100k satırlık kaynak üzerinde).
+import time
+
+from corpus import generate_source
+
+from assembler_core.assembler import pass_one, pass_two
+from assembler_core.m6800_opcodes import OPCODE_TABLE, ENCODING_INDEX
+
+NUM_LINES = 100_000
+REPEATS = 5
+
+
+def _legacy_encode(keys):
+    # Derlenmiş indeksten önceki yol: determine_addressing_mode_and_size içinde int(size),
+    # pass_two içinde tekrar int(size) ve int(op_hex, 16).
+    for mnemonic, mode in keys:
+        int(OPCODE_TABLE[mnemonic][mode][1])
+        op_hex, num_bytes_str, _ = OPCODE_TABLE[mnemonic][mode]
+        int(num_bytes_str)
+        int(op_hex, 16)
+
+
+def _indexed_encode(keys):
+    for key in keys:
+        ENCODING_INDEX[key][1]
+        opcode, num_bytes, _ = ENCODING_INDEX[key]
+
+
+def _best_of(func, keys):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(keys)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    source = generate_source(NUM_LINES)
+    start = time.perf_counter()
+    symbol_table, lines_p1, errors_p1 = pass_one(source)
+    t_pass1 = time.perf_counter() - start
+    start = time.perf_counter()
+    _, _, errors_p2 = pass_two(lines_p1, symbol_table)
+    t_pass2 = time.perf_counter() - start
+    assert not errors_p1 and not errors_p2, (errors_p1[:3], errors_p2[:3])
+
+    keys = [(l["mnemonic"], l["addressing_mode"]) for l in lines_p1 if l["addressing_mode"]]
+    t_legacy = _best_of(_legacy_encode, keys)
+    t_indexed = _best_of(_indexed_encode, keys)
+
+    print(f"\nKaynak: {len(source)} satır, {len(keys)} komut satırı")
+    print(f"Pass 1: {t_pass1 * 1000:.1f} ms, Pass 2: {t_pass2 * 1000:.1f} ms")
+    print(f"Kodlama (önce, string tablo): {t_legacy * 1e9 / len(keys):7.1f} ns/satır")
+    print(f"Kodlama (sonra, ENCODING_INDEX): {t_indexed * 1e9 / len(keys):7.1f} ns/satır")
+    print(f"Hızlanma: {t_legacy / t_indexed:.2f}x")
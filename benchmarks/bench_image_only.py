@@ -0,0 +1,53 @@
+# benchmarks/bench_image_only.py
+# Sadece makine kodu isteyen bir derlemede: main.assemble_file'ın varsayılan yolu
+# (akış + .lst), --no-listing (akış, listeleme yazılmaz) ve --image-only
+# (assemble_image: listeleme üretilmez, kaynak bir kez lex edilir). Üç yolun .hex
+# çıktıları karşılaştırılır.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import iter_flat_source
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+
+SIZE = 100_000
+REPEATS = 3
+
+MODES = {
+    "akış + .lst (varsayılan)": {},
+    "akış, --no-listing": {"listing_format": None},
+    "--image-only": {"image_only": True},
+}
+
+
+def _run(source_path, hex_path, options):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            main.assemble_file(source_path, os.path.join(os.path.dirname(hex_path), "o.lst"), hex_path, **options)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    with open(hex_path, 'rb') as f:
+        return best, f.read()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "src.asm")
+        with open(source_path, 'w', encoding='utf-8') as f:
+            for line in iter_flat_source(SIZE):
+                f.write(line + "\n")
+        results = {name: _run(source_path, os.path.join(tmp, f"o{i}.hex"), options)
+                   for i, (name, options) in enumerate(MODES.items())}
+
+    outputs = {output for _, output in results.values()}
+    assert len(outputs) == 1
+    print(f"\n{SIZE} satır, main.assemble_file ({REPEATS} tekrarın en iyisi):")
+    for name, (elapsed, _) in results.items():
+        print(f"  {name:<26}: {elapsed * 1000:7.1f} ms")
+    print("  (.hex çıktıları aynı)")
@@ -0,0 +1,70 @@
+# benchmarks/bench_incbin.py
+# 48 KiB'lık font/arama tablosu: satır başına 16 değerlik FCB satırları olarak yazılması
+# ile INCBIN "tablo.bin" (boyut Pass 1'de dosya uzunluğundan, byte'lar Pass 2'de mmap
+# diliminden). İki yoldan çıkan bellek imajları karşılaştırılır (FCB'de her satır ayrı
+# bir segmenttir, INCBIN'de tablo tek segmenttir).
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import corpus  # proje kökünü sys.path'e ekler
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.include import IncludeExpander
+    from assembler_core.memory_image import MemoryImage
+
+TABLE_BYTES = 48 * 1024
+VALUES_PER_LINE = 16
+REPEATS = 5
+
+
+def _table():
+    return bytes((n * 7 + (n >> 8)) & 0xFF for n in range(TABLE_BYTES))
+
+
+def _fcb_source(table):
+    lines = ["        ORG     $2000", "TABLO   EQU     *"]
+    for start in range(0, len(table), VALUES_PER_LINE):
+        values = ",".join(f"${b:02X}" for b in table[start:start + VALUES_PER_LINE])
+        lines.append(f"        FCB     {values}")
+    lines.extend(["        LDX     #TABLO", "        END"])
+    return lines
+
+
+def _incbin_source():
+    return ["        ORG     $2000", "TABLO   INCBIN  \"tablo.bin\"", "        LDX     #TABLO", "        END"]
+
+
+def _assemble(lines, includes=None):
+    symbol_table, lines_p1, errors_p1 = pass_one(lines, includes=includes)
+    _, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    assert not errors_p1 and not errors_p2, (errors_p1[:3], errors_p2[:3])
+    image = MemoryImage()
+    for address, data in segments:
+        image.write(address, data)
+    return [(start, bytes(image.view(start, end - start))) for start, end in image.ranges()]
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func(*args)
+    return (time.perf_counter() - start) / REPEATS, result
+
+
+if __name__ == "__main__":
+    table = _table()
+    fcb_lines = _fcb_source(table)
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "tablo.bin"), 'wb') as f:
+            f.write(table)
+        t_fcb, fcb_image = _timed(_assemble, fcb_lines)
+        t_incbin, incbin_image = _timed(lambda: _assemble(_incbin_source(), IncludeExpander(tmp, "tablo.asm")))
+
+    assert fcb_image == incbin_image
+    print(f"\n{TABLE_BYTES} byte'lık tablo, pass_one + pass_two ({REPEATS} tekrar ortalaması):")
+    print(f"  {len(fcb_lines)} FCB satırı  : {t_fcb * 1000:7.2f} ms")
+    print(f"  tek INCBIN satırı: {t_incbin * 1000:7.2f} ms  (imaj aynı)")
@@ -0,0 +1,64 @@
+# benchmarks/bench_include.py
+# 30 modülün her biri 3000 EQU'luk ortak bir başlık dosyasını kullanıyor: başlığın
+# her modülün başına dışarıda eklenip (birleştirme) her seferinde yeniden lex
+# edilmesi ile INCLUDE "ortak.inc" (dosya süreç başına bir kez lex edilir, sonraki
+# modüllere önbellekteki kayıtların kopyaları eklenir). Sonuçlar karşılaştırılır.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import _BLOCK_TEMPLATE
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.include import IncludeCache, IncludeExpander
+
+NUM_MODULES = 30
+HEADER_EQUS = 3000
+BLOCKS_PER_MODULE = 50
+
+
+def _header():
+    return [f"REG{n:04d}  EQU     ${(n * 3) & 0xFFFF:04X}" for n in range(HEADER_EQUS)]
+
+
+def _module(k):
+    lines = ["        ORG     $1000"]
+    for j in range(BLOCKS_PER_MODULE):
+        lines.extend(t.format(n=k * 100 + j) for t in _BLOCK_TEMPLATE)
+        lines.append(f"        LDAA    REG{(k * 37 + j) % HEADER_EQUS:04d}")
+    lines.append("        END")
+    return lines
+
+
+def _assemble(lines, includes=None):
+    symbol_table, lines_p1, errors_p1 = pass_one(lines, includes=includes)
+    _, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    assert not errors_p1 and not errors_p2, (errors_p1[:3], errors_p2[:3])
+    return symbol_table.table, [(address, bytes(data)) for address, data in segments]
+
+
+if __name__ == "__main__":
+    header = _header()
+    modules = [_module(k) for k in range(NUM_MODULES)]
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "ortak.inc"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(header) + "\n")
+
+        start = time.perf_counter()
+        concatenated = [_assemble(header + module) for module in modules]
+        t_concat = time.perf_counter() - start
+
+        cache = IncludeCache()
+        start = time.perf_counter()
+        included = [_assemble(['        INCLUDE "ortak.inc"'] + module, IncludeExpander(tmp, f"m{k}.asm", cache))
+                    for k, module in enumerate(modules)]
+        t_include = time.perf_counter() - start
+
+    assert concatenated == included
+    lines = sum(len(module) for module in modules) + NUM_MODULES * HEADER_EQUS
+    print(f"\n{NUM_MODULES} modül x {HEADER_EQUS} satırlık başlık (toplam {lines} satır), pass_one + pass_two:")
+    print(f"  başlığı birleştirip lex etme : {t_concat * 1000:7.1f} ms")
+    print(f"  INCLUDE + lexer önbelleği    : {t_include * 1000:7.1f} ms  (sonuç aynı; {cache.summary()})")
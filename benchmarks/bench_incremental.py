@@ -0,0 +1,77 @@
+# benchmarks/bench_incremental.py
+# 20k satırlık bir kaynakta düzenle-assemble döngüsü: tam yeniden derleme ile
+# IncrementalAssembler oturumunun karşılaştırması. Her adımda sonuç pass_one +
+# pass_two ile de doğrulanır.
+import gc
+import time
+
+import corpus  # proje kökünü sys.path'e ekler
+
+from assembler_core.assembler import pass_one, pass_two
+from assembler_core.incremental import IncrementalAssembler
+
+NUM_LINES = 20_000
+
+
+def _rom_source():
+    lines = []
+    block = 0
+    while len(lines) < NUM_LINES:
+        if block % 200 == 0:
+            lines.append("        ORG     $1000")
+        lines.extend([
+            f"L{block}     LDAA    #$10",
+            f"        STAA    V{block % 50}",
+            f"        BNE     L{block}",
+            f"        LDX     #T{block}",
+            f"T{block}     FCB     $01,$02",
+        ])
+        block += 1
+    lines.extend(f"V{n}      EQU     ${n:02X}" for n in range(50))
+    lines.append("        END")
+    return lines
+
+
+def _full(lines):
+    symbol_table, lines_p1, errors_p1 = pass_one(lines)
+    listing, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    return symbol_table, listing, segments, errors_p1, errors_p2
+
+
+def _same(a, b):
+    return a[1] == b[1] and a[2] == b[2] and sorted(a[3]) == sorted(b[3]) and sorted(a[4]) == sorted(b[4])
+
+
+def _replace_store(lines):
+    # 5000. satır civarındaki ilk "STAA Vn" satırını aynı boyutlu başka bir store ile değiştir.
+    index = next(i for i in range(5000, len(lines)) if "STAA    V" in lines[i])
+    lines[index] = "        STAA    V7"
+
+
+EDITS = [
+    ("aynı boyutlu düzenleme", _replace_store),
+    ("yorum satırı ekleme",    lambda ls: ls.insert(7000, "        ; yeni yorum")),
+    ("boyut değiştiren ekleme", lambda ls: ls.insert(8000, "        NOP")),
+    ("satır silme",            lambda ls: ls.pop(8000)),
+    ("EQU değeri değiştirme",  lambda ls: ls.__setitem__(len(ls) - 10, "V40      EQU     $41")),
+]
+
+
+if __name__ == "__main__":
+    lines = _rom_source()
+    session = IncrementalAssembler()
+    start = time.perf_counter()
+    session.assemble(lines)
+    print(f"\nİlk assemble: {(time.perf_counter() - start) * 1000:.1f} ms ({len(lines)} satır)")
+
+    for name, edit in EDITS:
+        edit(lines)
+        gc.collect()
+        start = time.perf_counter()
+        result = session.assemble(lines)
+        t_incremental = time.perf_counter() - start
+        start = time.perf_counter()
+        reference = _full(lines)
+        t_full = time.perf_counter() - start
+        print(f"{name:<24} artımlı: {t_incremental * 1000:6.1f} ms | tam: {t_full * 1000:6.1f} ms | "
+              f"{session.stats} | {'aynı' if _same(result, reference) else 'FARKLI'}")
@@ -0,0 +1,57 @@
+# benchmarks/bench_intel_hex.py
+# Intel HEX: tam 64 KiB'lık bir imajın yazılıp geri okunma süresi (hedef: 100 ms'nin
+# epey altında). İmaj iki şekilde verilir: tek segment olarak ve pass_two'nun ürettiği
+# gibi satır başına 1-3 byte'lık segmentler olarak (yazıcı bunları birleştirir).
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from corpus import project_root # noqa: F401 (proje kökünü sys.path'e ekler)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.intel_hex import IntelHexWriter, MEMORY_SIZE, read_intel_hex
+
+REPEATS = 5
+
+
+def _line_sized_segments(image):
+    rng = random.Random(6800)
+    segments = []
+    address = 0
+    while address < MEMORY_SIZE:
+        size = min(rng.choice((1, 2, 3)), MEMORY_SIZE - address)
+        segments.append((address, list(image[address:address + size])))
+        address += size
+    return segments
+
+
+def _round_trip(path, segments):
+    start = time.perf_counter()
+    writer = IntelHexWriter(path)
+    for address, byte_codes in segments:
+        writer.write_segment(address, byte_codes)
+    writer.close(keep=True)
+    written = time.perf_counter()
+    image, ranges = read_intel_hex(path)
+    done = time.perf_counter()
+    return (written - start) * 1000, (done - written) * 1000, image, ranges
+
+
+if __name__ == "__main__":
+    original = bytes(random.Random(0).getrandbits(8) for _ in range(MEMORY_SIZE))
+    cases = [("tek segment", [(0, original)]), ("satır başına segment", _line_sized_segments(original))]
+    print()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "image.ihx")
+        for name, segments in cases:
+            best = None
+            for _ in range(REPEATS):
+                write_ms, read_ms, image, ranges = _round_trip(path, segments)
+                assert image == original and ranges == [(0, MEMORY_SIZE)]
+                if best is None or write_ms + read_ms < sum(best):
+                    best = (write_ms, read_ms)
+            print(f"{name:<22} ({len(segments):>5} segment): yazma {best[0]:6.1f} ms + okuma {best[1]:6.1f} ms "
+                  f"= {sum(best):6.1f} ms  ({os.path.getsize(path)} byte)")
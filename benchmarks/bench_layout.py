@@ -0,0 +1,54 @@
+# benchmarks/bench_layout.py
+# Sıfır sayfadaki değişkenlere ileri referans veren bir "firmware": değişkenler
+# programın sonunda ORG $0000 / RMB ile tanımlanır. Normal assemble (bu komutlar
+# EXTENDED) ile optimize yerleşim (DIRECT'e küçültme, sabit noktaya kadar yinelenen
+# Pass 1) karşılaştırılır: program boyutu, kazanılan byte/çevrim ve süre.
+import contextlib
+import io
+import time
+
+from corpus import _BLOCK_TEMPLATE
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.layout import assemble_optimized
+
+NUM_BLOCKS = 400
+NUM_VARIABLES = 200
+
+
+def _firmware():
+    lines = ["        ORG     $1000"]
+    for n in range(NUM_BLOCKS):
+        lines.extend(t.format(n=n) for t in _BLOCK_TEMPLATE)
+        lines.append(f"        LDAA    V{n % NUM_VARIABLES}")
+        lines.append(f"        STAA    V{(n * 7) % NUM_VARIABLES}")
+        lines.append(f"        LDX     P{n % 20}")
+    lines.append("        ORG     $0000")
+    lines.extend(f"V{k}      RMB     1" for k in range(NUM_VARIABLES))
+    lines.extend(f"P{k}      RMB     2" for k in range(20))
+    lines.append("        END")
+    return lines
+
+
+def _code_size(segments):
+    return sum(len(data) for address, data in segments if address >= 0x1000)
+
+
+if __name__ == "__main__":
+    source = _firmware()
+    start = time.perf_counter()
+    symbol_table, lines_p1, errors_p1 = pass_one(source)
+    _, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    t_plain = time.perf_counter() - start
+    assert not errors_p1 and not errors_p2
+
+    start = time.perf_counter()
+    _, _, opt_segments, opt_errors_p1, opt_errors_p2, report = assemble_optimized(source)
+    t_opt = time.perf_counter() - start
+    assert not opt_errors_p1 and not opt_errors_p2
+    assert _code_size(segments) - _code_size(opt_segments) == report.bytes_saved
+
+    print(f"\n{len(source)} satır, {NUM_VARIABLES} sıfır sayfa değişkeni (ileri referans):")
+    print(f"  normal           : {_code_size(segments):6d} byte kod, {t_plain * 1000:7.1f} ms")
+    print(f"  optimize yerleşim: {_code_size(opt_segments):6d} byte kod, {t_opt * 1000:7.1f} ms  ({report.summary()})")
@@ -0,0 +1,63 @@
+# benchmarks/bench_lexer.py
+# Lexer: referans parse_line ile tek taramalı parse_line_fast'in farksal (differential)
+# karşılaştırması ve tests/ derlemi 1M satıra çoğaltılarak ölçülen satır/saniye hızları.
+import random
+import time
+
+from corpus import generate_source, load_tests_corpus, replicate_tests_corpus
+
+from assembler_core.lexer import parse_line, parse_line_fast
+
+NUM_LINES = 1_000_000
+REPEATS = 3
+
+# Farksal kontrol için rastgele satırların yapı taşları: küçük/büyük harf mnemonic'ler,
+# ':' ile biten (geçersiz) etiketler, tırnak içinde ';', sekmeler, boş yorumlar vb.
+_FUZZ_TOKENS = ["LDAA", "ldaa", "Ldaa", "lDaA", "NOP", "nop", "FCB", "equ", "LABEL", "L1", "X:", "_",
+                "1ABC", "#$10", "$10,X", ",X", "'a;b'", '"HI THERE"', "VAL", "+", "1", ";", ";c",
+                "END", "BAD:SYNTAX", "ÇÖ", "é1"]
+_FUZZ_SEPARATORS = [" ", "  ", "\t", "", " \t"]
+
+
+def _fuzz_lines(count, seed=1):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        line = "".join(rng.choice(_FUZZ_TOKENS) + rng.choice(_FUZZ_SEPARATORS)
+                       for _ in range(rng.randint(0, 6)))
+        if rng.random() < 0.5:
+            line = rng.choice(_FUZZ_SEPARATORS) + line
+        if rng.random() < 0.2:
+            line += "\n"
+        lines.append(line)
+    return lines
+
+
+def differential_check(lines):
+    """İki lexer'ın tüm alanlarda aynı kaydı ürettiğini doğrular; farklı satırları döndürür."""
+    return [line for i, line in enumerate(lines) if parse_line(i + 1, line) != parse_line_fast(i + 1, line)]
+
+
+def _lines_per_second(func, lines):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for i, line in enumerate(lines):
+            func(i + 1, line)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+if __name__ == "__main__":
+    check_lines = load_tests_corpus() + generate_source(2_000) + _fuzz_lines(100_000)
+    mismatches = differential_check(check_lines)
+    print()
+    print(f"Farksal kontrol: {len(check_lines)} satır, {len(mismatches)} fark")
+    for line in mismatches[:10]:
+        print(f"  FARK: {line!r}")
+
+    lines = replicate_tests_corpus(NUM_LINES)
+    reference = _lines_per_second(parse_line, lines)
+    fast = _lines_per_second(parse_line_fast, lines)
+    print(f"parse_line      : {reference:12,.0f} satır/s")
+    print(f"parse_line_fast : {fast:12,.0f} satır/s  ({fast / reference:.2f}x)")
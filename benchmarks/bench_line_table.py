@@ -0,0 +1,48 @@
+# benchmarks/bench_line_table.py
+# pass_one + pass_two sonuçlarının (satır kayıtları + listeleme) 100k satırdaki
+# bellek kullanımı. Karşılaştırma için aynı verinin eski düzendeki karşılığı
+# (satır başına Pass 1 sözlüğü + listeleme sözlüğü) da oluşturulup ölçülür.
+import gc
+import tracemalloc
+
+from corpus import generate_source
+
+from assembler_core.assembler import pass_one, pass_two
+
+NUM_LINES = 100_000
+
+
+def _as_old_dicts(lines_p1, listing):
+    """Kayıtları eski sözlük düzenine çevirir (string nesneleri paylaşılır, kopyalanmaz)."""
+    return ([dict((key, record[key]) for key in record.keys()) for record in lines_p1],
+            [dict((key, entry[key]) for key in entry.keys()) for entry in listing])
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+if __name__ == "__main__":
+    source = generate_source(NUM_LINES)
+
+    def _assemble():
+        symbol_table, lines_p1, errors_p1 = pass_one(source)
+        listing, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+        return lines_p1, listing
+
+    (lines_p1, listing), current, peak = _measure(_assemble)
+    _, current_old, _ = _measure(lambda: _as_old_dicts(lines_p1, listing))
+
+    scale = 100_000 / len(source)
+    mib = 1024 * 1024
+    print()
+    print(f"{len(source)} satır")
+    print(f"LineRecord + ListingEntry (pass_one + pass_two, kalıcı): {current * scale / mib:7.1f} MiB "
+          f"(tepe: {peak * scale / mib:.1f} MiB)")
+    print(f"Eski düzen: satır başına 2 sözlük (sadece kaplar):      {current_old * scale / mib:7.1f} MiB")
+    print(f"100k satır başına kazanç (en az):                        {(current_old - current) * scale / mib:7.1f} MiB")
@@ -0,0 +1,91 @@
+# benchmarks/bench_linker.py
+# 30 modüllük bir programda tek modül değiştiğinde: tüm kaynağın tek parça yeniden
+# assemble edilmesi ile sadece değişen modülün nesneye çevrilip diğerlerinin .obj
+# dosyalarından okunarak bağlanması. Bağlanan imaj tek parça assemble ile karşılaştırılır.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import _BLOCK_TEMPLATE
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.linker import link
+    from assembler_core.memory_image import MemoryImage
+    from assembler_core.object_file import assemble_object, read_object, write_object
+
+NUM_MODULES = 30
+BLOCKS_PER_MODULE = 20
+BASE = 0x0400
+
+
+def _module_source(k):
+    # Her blok komşu modüllerin etiketlerine JSR / FDB / LDX ile başvurur.
+    lines = []
+    for j in range(BLOCKS_PER_MODULE):
+        n = k * 100 + j
+        lines.extend(t.format(n=n) for t in _BLOCK_TEMPLATE)
+        lines.append(f"        JSR     L{((k + 1) % NUM_MODULES) * 100 + j}")
+        lines.append(f"        FDB     T{((k + 7) % NUM_MODULES) * 100 + j}+2, L{n}-1")
+        lines.append(f"        LDX     #L{((k + 3) % NUM_MODULES) * 100}-$10")
+    return lines
+
+
+def _monolithic(sources):
+    lines = [f"        ORG     ${BASE:04X}"] + [line for source in sources for line in source] + ["        END"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbol_table, lines_p1, errors_p1 = pass_one(lines)
+        _, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    assert not errors_p1 and not errors_p2
+    image = MemoryImage()
+    for address, data in segments:
+        image.write(address, data)
+    return image
+
+
+def _relink(sources, obj_paths, changed):
+    modules = []
+    for k, path in enumerate(obj_paths):
+        if k == changed:
+            module, errors_p1, errors_p2 = assemble_object(sources[k] + ["        END"], f"m{k}.asm")
+            assert not errors_p1 and not errors_p2
+            write_object(path, module)
+        else:
+            module = read_object(path)
+        modules.append(module)
+    result = link(modules, BASE)
+    assert not result.errors
+    return result.image
+
+
+def _dump(image):
+    return [(start, bytes(image.view(start, end - start))) for start, end in image.ranges()]
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    sources = [_module_source(k) for k in range(NUM_MODULES)]
+    with tempfile.TemporaryDirectory() as tmp:
+        obj_paths = [os.path.join(tmp, f"m{k}.obj") for k in range(NUM_MODULES)]
+        t_objects = time.perf_counter()
+        for k, path in enumerate(obj_paths):
+            module, _, _ = assemble_object(sources[k] + ["        END"], f"m{k}.asm")
+            write_object(path, module)
+        t_objects = time.perf_counter() - t_objects
+
+        sources[NUM_MODULES // 2][3] = "        ADDA    2,X         ; düzenlendi"
+        t_mono, mono = _timed(_monolithic, sources)
+        t_link, linked = _timed(_relink, sources, obj_paths, NUM_MODULES // 2)
+        assert _dump(linked) == _dump(mono)
+
+    lines = sum(len(source) for source in sources)
+    print(f"\n{NUM_MODULES} modül, {lines} satır (ilk .obj üretimi {t_objects * 1000:.1f} ms), tek modül düzenlendi:")
+    print(f"  tek parça yeniden assemble : {t_mono * 1000:7.1f} ms")
+    print(f"  1 modül + .obj'ler + link  : {t_link * 1000:7.1f} ms  (imaj aynı)")
@@ -0,0 +1,55 @@
+# benchmarks/bench_listing.py
+# Listeleme yazma süresi: 100k satırlık bir programın listeleme girdileri her biçimde
+# (text, compact, jsonl, csv) ListingWriter ile yazılır. Karşılaştırma için eski
+# yazıcının yaptığı gibi girdi başına write() çağıran klasik metin yazımı da ölçülür.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import generate_source
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.listing import LISTING_FORMATS, TextRenderer
+    from assembler_core.output_files import ListingWriter
+
+NUM_LINES = 100_000
+
+
+def _unbuffered_text(path, listing):
+    renderer = TextRenderer()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(renderer.header("bench.asm"))
+        for entry in listing:
+            f.write(renderer.entry(entry))
+        f.write(renderer.footer([], []))
+
+
+def _writer(path, listing, listing_format):
+    writer = ListingWriter(path, "bench.asm", listing_format)
+    for entry in listing:
+        writer.write_entry(entry)
+    writer.close([], [])
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbol_table, lines_p1, _ = pass_one(generate_source(NUM_LINES))
+        listing, _, _ = pass_two(lines_p1, symbol_table)
+    print(f"\n{len(listing)} listeleme girdisi")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "base.lst")
+        t_base = _timed(_unbuffered_text, path, listing)
+        print(f"text (girdi başına write) : {t_base * 1000:7.1f} ms ({os.path.getsize(path) // 1024} KiB)")
+        for listing_format in LISTING_FORMATS:
+            path = os.path.join(tmp, f"o.{listing_format}")
+            elapsed = _timed(_writer, path, listing, listing_format)
+            print(f"{listing_format:<26}: {elapsed * 1000:7.1f} ms ({os.path.getsize(path) // 1024} KiB)")
@@ -0,0 +1,76 @@
+# benchmarks/bench_memory_image.py
+# Büyük bir veri tablosu (FCB satırları) için pass_two'nun makine kodu segmentlerinin
+# bellek kullanımı. Eski biçim (satır başına (adres, int listesi)) ile MemoryImage
+# tabanlı ImageSegments karşılaştırılır; ölçüm tracemalloc ile, segmentler
+# oluşturulduktan sonra ayakta kalan bellek üzerinden yapılır.
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from corpus import project_root # noqa: F401 (proje kökünü sys.path'e ekler)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.memory_image import BinWriter, SegmentBuilder
+
+BYTES_PER_LINE = 16
+NUM_LINES = 4000 # 4000 * 16 = 64000 byte, $0000-$FFFF adres alanına sığar
+
+
+def _data_table_source():
+    lines = ["        ORG     $0000"]
+    for n in range(NUM_LINES):
+        values = ",".join(f"${(n * BYTES_PER_LINE + i) & 0xFF:02X}" for i in range(BYTES_PER_LINE))
+        lines.append(f"        FCB     {values}")
+    lines.append("        END")
+    return lines
+
+
+def _build(segments):
+    builder = SegmentBuilder()
+    for address, data in segments:
+        builder.add(address, data)
+    builder.finish()
+    return builder
+
+
+def _retained(build):
+    """build() sonucunun ayakta tuttuğu bellek (byte) ve sonucun kendisi."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+if __name__ == "__main__":
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbol_table, lines_p1, _ = pass_one(_data_table_source())
+        start = time.perf_counter()
+        _, segments, errors = pass_two(lines_p1, symbol_table)
+        elapsed = time.perf_counter() - start
+    assert not errors
+    total_bytes = sum(len(data) for _, data in segments)
+
+    # Eski biçim: her segment ayrı bir Python int listesi
+    old_size, old_segments = _retained(lambda: [(address, list(data)) for address, data in segments])
+    # Yeni biçim: tek bytearray(65536) + kullanım haritası + (adres, uzunluk) dizileri
+    new_size, builder = _retained(lambda: _build(old_segments))
+    new_segments = builder.segments
+    assert [(a, bytes(d)) for a, d in new_segments] == [(a, bytes(d)) for a, d in old_segments]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = BinWriter(os.path.join(tmp, "table.bin"))
+        for address, data in new_segments:
+            writer.write_segment(address, data)
+        writer.close(keep=True)
+        bin_size = os.path.getsize(writer.path)
+
+    print(f"\n{NUM_LINES} FCB satırı, {len(segments)} segment, {total_bytes} byte (pass_two: {elapsed * 1000:.0f} ms)")
+    print(f"Eski segmentler (int listeleri) : {old_size / 1024:8.1f} KiB")
+    print(f"ImageSegments (imaj + harita)   : {new_size / 1024:8.1f} KiB ({old_size / new_size:.1f}x daha az)")
+    print(f".bin çıktısı                    : {bin_size} byte")
@@ -0,0 +1,42 @@
+# benchmarks/bench_parallel_pass2.py
+# Paralel Pass 2: aynı Pass 1 sonucunun sıralı pass_two ile ve 1, 2, 4, 8 işçi süreçle
+# kodlanma süresi. Her işçi sayısında listeleme, segmentler ve hatalar sıralı sonuçla aynı
+# olmalıdır. Tek işçili satır süreç açma ve pickle maliyetini gösterir; kazanç CPU sayısıyla
+# sınırlıdır (segment/listeleme kurulumu ana süreçte sıralı kalır).
+import contextlib
+import io
+import os
+import time
+
+from corpus import generate_source
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.parallel_pass2 import PARALLEL_MIN_LINES, pass_two_parallel
+
+NUM_LINES = 400_000
+WORKERS = [1, 2, 4, 8]
+
+
+def _snapshot(result):
+    listing, segments, errors = result
+    return ([(entry.line_num, entry.machine_code_hex, str(entry.error)) for entry in listing],
+            [(address, bytes(data)) for address, data in segments], errors)
+
+
+if __name__ == "__main__":
+    source = generate_source(NUM_LINES)
+    symbol_table, lines, errors_p1 = pass_one(source)
+    assert not errors_p1
+
+    start = time.perf_counter()
+    expected = _snapshot(pass_two(lines, symbol_table, workers=1))
+    baseline = time.perf_counter() - start
+    print(f"\n{len(lines)} satır, {os.cpu_count()} CPU (workers=None eşiği: {PARALLEL_MIN_LINES} satır)")
+    print(f"{'sıralı':<10} {baseline * 1000:8.1f} ms")
+    for workers in WORKERS:
+        start = time.perf_counter()
+        result = pass_two_parallel(lines, symbol_table, workers)
+        elapsed = time.perf_counter() - start
+        assert _snapshot(result) == expected, f"{workers} işçi sonucu sıralı pass_two'dan farklı"
+        print(f"{f'{workers} işçi':<10} {elapsed * 1000:8.1f} ms  ({baseline / elapsed:4.2f}x)  sonuç aynı")
@@ -0,0 +1,93 @@
+# benchmarks/bench_peephole.py
+# Üretilmiş koddaki tipik kalıplar (LDAA #0, yazılanı geri okuma, BRA üzerinden koşullu
+# dallanma, bir sonraki komuta JMP) içeren bir program tüm peephole kurallarıyla assemble
+# edilir. Sonuç, aynı programın elle iyileştirilmiş halinin normal assemble'ıyla
+# karşılaştırılır (makine kodu aynı olmalı); kazanılan byte/çevrim ve süre raporlanır.
+import contextlib
+import io
+import time
+
+from corpus import _BLOCK_TEMPLATE
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.peephole import RULE_NAMES, assemble_peephole
+
+NUM_BLOCKS = 300
+
+_PATTERN = [
+    "P{n}      LDAA    #0",
+    "        ADDA    V{v}",
+    "        STAA    W{n}",
+    "        LDAA    W{n}",
+    "        CMPA    #10",
+    "        BNE     S{n}",
+    "        BRA     N{n}",
+    "S{n}      INCA",
+    "        JMP     N{n}",
+    "N{n}      NOP",
+]
+
+# Aynı kalıbın elle iyileştirilmiş hali
+_PATTERN_OPTIMIZED = [
+    "P{n}      CLRA",
+    "        ADDA    V{v}",
+    "        STAA    W{n}",
+    "        CMPA    #10",
+    "        BEQ     N{n}",
+    "S{n}      INCA",
+    "N{n}      NOP",
+]
+
+
+def _program(pattern):
+    # Kod $4000'dan başlar: şablondaki sayısal adresler ($0800, $1234) kod bölümünün dışında
+    # kalır (kod içine düşen sayısal başvurular düzenlemeleri engellerdi).
+    lines = ["        ORG     $4000"]
+    for n in range(NUM_BLOCKS):
+        lines.extend(t.format(n=n) for t in _BLOCK_TEMPLATE)
+        lines.extend(t.format(n=n, v=n % 50) for t in pattern)
+    lines.append("        ORG     $0000")
+    lines.extend(f"V{k}      RMB     1" for k in range(50))
+    lines.append("        ORG     $8000")
+    lines.extend(f"W{k}      RMB     1" for k in range(NUM_BLOCKS))
+    lines.append("        END")
+    return lines
+
+
+def _assemble(source):
+    symbol_table, lines_p1, errors_p1 = pass_one(source)
+    _, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    assert not errors_p1 and not errors_p2
+    return segments
+
+
+def _code(segments):
+    return b"".join(bytes(data) for address, data in segments if 0x4000 <= address < 0x8000)
+
+
+if __name__ == "__main__":
+    source = _program(_PATTERN)
+    start = time.perf_counter()
+    plain = _assemble(source)
+    t_plain = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, _, segments, errors_p1, errors_p2, report = assemble_peephole(source, rules=RULE_NAMES)
+    t_peephole = time.perf_counter() - start
+    assert not errors_p1 and not errors_p2
+
+    expected = _assemble(_program(_PATTERN_OPTIMIZED))
+    assert _code(segments) == _code(expected), "peephole sonucu elle iyileştirilmiş koddan farklı"
+    assert len(_code(plain)) - len(_code(segments)) == report.bytes_saved
+
+    print(f"\n{len(source)} satır, {NUM_BLOCKS} kalıp bloğu:")
+    print(f"  normal   : {len(_code(plain)):6d} byte kod, {t_plain * 1000:7.1f} ms")
+    print(f"  peephole : {len(_code(segments)):6d} byte kod, {t_peephole * 1000:7.1f} ms  ({report.summary()})")
+    by_rule = {}
+    for rewrite in report.rewrites:
+        count, saved_bytes, saved_cycles = by_rule.get(rewrite.rule, (0, 0, 0))
+        by_rule[rewrite.rule] = (count + 1, saved_bytes + rewrite.bytes_saved, saved_cycles + rewrite.cycles_saved)
+    for rule, (count, saved_bytes, saved_cycles) in by_rule.items():
+        print(f"    {rule:<17}: {count:4d} kez, {saved_bytes:5d} byte, {saved_cycles:5d} çevrim")
+    print("  makine kodu elle iyileştirilmiş programla aynı")
@@ -0,0 +1,77 @@
+# benchmarks/bench_server.py
+# Dosya başına gecikme: her dosya için main.py'yi yeni bir süreçte çalıştırmak ile
+# sürekli çalışan sunucuya (main.py --serve --socket) istemci üzerinden istek göndermek.
+# tests/*.asm dosyalarının hepsi sırayla assemble edilir, ortalama/medyan süre raporlanır.
+import glob
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from corpus import TESTS_DIR, project_root
+
+from assembler_core.client import AssemblerClient
+
+ROUNDS = 3
+
+
+def _time_subprocess(paths, out_dir):
+    durations = []
+    for path in paths:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(project_root, "main.py"), path],
+                       cwd=out_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _time_client(client, paths, out_dir):
+    durations = []
+    for path in paths:
+        base = os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0])
+        start = time.perf_counter()
+        response = client.assemble_file(path, base + ".lst", base + ".hex", listing=False)
+        durations.append(time.perf_counter() - start)
+        assert response["ok"], response
+    return durations
+
+
+def _wait_for_socket(socket_path, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(socket_path):
+        if time.monotonic() > deadline:
+            raise RuntimeError("Sunucu soketi oluşmadı.")
+        time.sleep(0.02)
+
+
+def _report(name, durations):
+    print(f"{name:<32} ort: {statistics.mean(durations) * 1000:8.2f} ms  "
+          f"medyan: {statistics.median(durations) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    paths = sorted(glob.glob(os.path.join(TESTS_DIR, "*.asm")))
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "m6800.sock")
+        server = subprocess.Popen([sys.executable, os.path.join(project_root, "main.py"), "--serve",
+                                   "--socket", socket_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            _wait_for_socket(socket_path)
+            subprocess_times = []
+            client_times = []
+            with AssemblerClient(socket_path) as client:
+                for _ in range(ROUNDS):
+                    subprocess_times += _time_subprocess(paths, tmp)
+                    client_times += _time_client(client, paths, tmp)
+                client.request(op="shutdown")
+            server.wait(timeout=10)
+        finally:
+            if server.poll() is None:
+                server.kill()
+
+    print(f"\n{len(paths)} dosya x {ROUNDS} tur")
+    _report("Süreç başına (main.py dosya)", subprocess_times)
+    _report("Sunucu (istemci isteği)", client_times)
+    print(f"Hızlanma: {statistics.mean(subprocess_times) / statistics.mean(client_times):.1f}x")
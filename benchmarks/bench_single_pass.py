@@ -0,0 +1,38 @@
+# benchmarks/bench_single_pass.py
+# İki geçişli (pass_one + pass_two) yol ile tek geçişli fixup motorunun
+# büyük üretilmiş kaynaklar üzerindeki toplam süre karşılaştırması.
+import time
+
+from corpus import generate_source
+
+from assembler_core.assembler import pass_one, pass_two
+from assembler_core.single_pass import assemble_single_pass
+
+SIZES = [10_000, 100_000]
+
+
+def _two_pass(lines):
+    symbol_table, lines_p1, errors_p1 = pass_one(lines)
+    listing, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    return segments
+
+
+def _one_pass(lines):
+    return assemble_single_pass(lines)[2]
+
+
+def _timed(func, lines):
+    start = time.perf_counter()
+    result = func(lines)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    print()
+    for size in SIZES:
+        source = generate_source(size)
+        t_two, seg_two = _timed(_two_pass, source)
+        t_one, seg_one = _timed(_one_pass, source)
+        same = [(a, bytes(b)) for a, b in seg_two] == [(a, bytes(b)) for a, b in seg_one]
+        print(f"{size:>8} satır | iki geçiş: {t_two * 1000:8.1f} ms | tek geçiş: {t_one * 1000:8.1f} ms "
+              f"| oran: {t_one / t_two:.2f} | çıktı {'aynı' if same else 'FARKLI'}")
@@ -0,0 +1,63 @@
+# benchmarks/bench_srecord.py
+# S19 yazıcısı: pass_two segmentlerinden S19 üretme süresi. Karşılaştırma için
+# byte başına f-string ve kayıt başına write() yapan basit bir uygulama ile mevcut
+# hex dökümü yazıcısı da ölçülür. Sonuç read_s19 ile geri okunup doğrulanır.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import generate_source
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.output_files import HexDumpWriter
+    from assembler_core.srecord import S19Writer, read_s19
+
+NUM_LINES = 100_000
+RECORD_LENGTH = 16
+
+
+def _naive_s19(path, segments):
+    with open(path, 'w', encoding='ascii') as f:
+        f.write("S0030000FC\n")
+        for address, byte_codes in segments:
+            for offset in range(0, len(byte_codes), RECORD_LENGTH):
+                chunk = byte_codes[offset:offset + RECORD_LENGTH]
+                record_address = address + offset
+                count = len(chunk) + 3
+                checksum = ~(count + (record_address >> 8) + (record_address & 0xFF) + sum(chunk)) & 0xFF
+                data = "".join(f"{b:02X}" for b in chunk)
+                f.write(f"S1{count:02X}{record_address:04X}{data}{checksum:02X}\n")
+        f.write("S9030000FC\n")
+
+
+def _writer(writer, segments, **close_args):
+    for address, byte_codes in segments:
+        writer.write_segment(address, byte_codes)
+    writer.close(keep=True, **close_args)
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbol_table, lines_p1, _ = pass_one(generate_source(NUM_LINES))
+        _, segments, _ = pass_two(lines_p1, symbol_table)
+    total_bytes = sum(len(b) for _, b in segments)
+    print(f"\n{NUM_LINES} satır, {len(segments)} segment, {total_bytes} byte")
+    with tempfile.TemporaryDirectory() as tmp:
+        s19_path = os.path.join(tmp, "o.s19")
+        t_dump = _timed(_writer, HexDumpWriter(os.path.join(tmp, "o.hex"), "bench.asm"), segments)
+        t_naive = _timed(_naive_s19, os.path.join(tmp, "naive.s19"), segments)
+        t_s19 = _timed(_writer, S19Writer(s19_path, "bench", RECORD_LENGTH), segments, start_address=0)
+        loaded, _, _ = read_s19(s19_path)
+        assert sum(len(d) for _, d in loaded) == total_bytes
+        print(f"hex dökümü (mevcut)     : {t_dump * 1000:7.1f} ms")
+        print(f"S19 (byte başına f-str) : {t_naive * 1000:7.1f} ms")
+        print(f"S19Writer               : {t_s19 * 1000:7.1f} ms ({t_naive / t_s19:.1f}x)")
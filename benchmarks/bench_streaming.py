@@ -0,0 +1,76 @@
+# benchmarks/bench_streaming.py
+# main.assemble_file'ın akış (AssemblyStream) yolu ile listeleri bellekte tutan
+# pass_one + pass_two yolunun tepe bellek (peak RSS) karşılaştırması. Komut satırının
+# varsayılanı olan derleme önbellekli yol da ölçülür: boş önbellekle (ıska, kayıt yazılır)
+# ve aynı kaynağın ikinci assemble'ı (isabet); önbellek kaydının boyutu da yazdırılır.
+# Her ölçüm ayrı bir alt süreçte yapılır; kaynak dosyaya satır satır yazılır.
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+
+from corpus import iter_flat_source, project_root
+
+SIZES = [10_000, 100_000, 1_000_000]
+LIST_PATH_MAX_SIZE = 100_000 # Liste yolu 1M satırda GB mertebesinde bellek kullanır
+
+_CHILD = r"""
+import contextlib, io, os, resource, sys, time
+sys.path.insert(0, {root!r})
+mode, source, out_dir = sys.argv[1:4]
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+    from assembler_core.assembler import pass_one, pass_two
+    from assembler_core.build_cache import BuildCache
+    start = time.perf_counter()
+    if mode == "stream":
+        main.assemble_file(source, os.path.join(out_dir, "o.lst"), os.path.join(out_dir, "o.hex"))
+    elif mode == "cache":
+        cache = BuildCache(os.path.join(out_dir, "cache"))
+        main.assemble_file(source, os.path.join(out_dir, "o.lst"), os.path.join(out_dir, "o.hex"), cache=cache)
+        assert cache.hits + cache.misses == 1
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().strip().split('\n')
+        symbol_table, lines_p1, errors_p1 = pass_one(lines)
+        listing, segments, errors_p2 = pass_two(lines_p1, symbol_table)
+    elapsed = time.perf_counter() - start
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, elapsed)
+"""
+
+
+def _measure(mode, source_path, out_dir):
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(root=project_root), mode, source_path, out_dir],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+    return int(output[-2]) / 1024, float(output[-1]) # MiB (Linux'ta ru_maxrss KiB), saniye
+
+
+if __name__ == "__main__":
+    print()
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            source_path = os.path.join(tmp, f"src_{size}.asm")
+            with open(source_path, 'w', encoding='utf-8') as f:
+                for line in iter_flat_source(size):
+                    f.write(line + "\n")
+            rss_stream, t_stream = _measure("stream", source_path, tmp)
+            line = f"{size:>9} satır | akış: {rss_stream:7.1f} MiB ({t_stream:6.1f} s)"
+            cache_dir = os.path.join(tmp, "cache")
+            for path in glob.glob(os.path.join(cache_dir, "*")):
+                os.remove(path)
+            rss_miss, t_miss = _measure("cache", source_path, tmp)
+            entries = glob.glob(os.path.join(cache_dir, "*.jsonl"))
+            line += f" | önbellek ıska: {rss_miss:7.1f} MiB ({t_miss:6.1f} s)"
+            if entries:
+                rss_hit, t_hit = _measure("cache", source_path, tmp)
+                line += (f" | isabet: {rss_hit:7.1f} MiB ({t_hit:6.1f} s), "
+                         f"kayıt {os.path.getsize(entries[0]) / (1 << 20):.1f} MiB")
+            else:
+                line += " | kayıt boyut sınırını aştı, yazılmadı"
+            if size <= LIST_PATH_MAX_SIZE:
+                rss_list, t_list = _measure("list", source_path, tmp)
+                line += f" | listeler (yazmadan): {rss_list:7.1f} MiB ({t_list:6.1f} s)"
+            print(line)
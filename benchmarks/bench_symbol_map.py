@@ -0,0 +1,60 @@
+# benchmarks/bench_symbol_map.py
+# 50k sembollük bir tablonun .sym (metin) ve .map (ikili) dosyalarına yazılıp geri
+# yüklenmesi ve sembol tablosunun tekrar tekrar yazdırılması. Karşılaştırma için
+# eski __str__'in yaptığı gibi her çağrıda sıralayıp += ile birleştiren çıktı da ölçülür.
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from corpus import project_root # noqa: F401 (proje kökünü sys.path'e ekler)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from assembler_core.symbol_map import load_symbol_files, write_symbol_file
+    from assembler_core.symbol_table import SymbolTable
+
+NUM_SYMBOLS = 50_000
+PRINTS = 5
+
+
+def _table():
+    symbol_table = SymbolTable()
+    for n in range(NUM_SYMBOLS):
+        symbol_table.add_symbol(f"SYM{n:05d}", (n * 7) & 0xFFFF, n + 1)
+    return symbol_table
+
+
+def _concat_str(symbol_table):
+    output = "Sembol Tablosu:\n"
+    output += "--------------------\n"
+    output += "{:<15} | {:<10} | {:<10}\n".format("Etiket Adı", "Değer (Hex)", "Tanım Satırı")
+    output += "--------------------\n"
+    for name, value in sorted(symbol_table.table.items()):
+        output += "{:<15} | {:<10} | {:<10}\n".format(name, f"${value:04X}", symbol_table.definitions.get(name, '-'))
+    output += "--------------------\n"
+    return output
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    symbol_table = _table()
+    t_old, old = _timed(lambda: [_concat_str(symbol_table) for _ in range(PRINTS)][-1])
+    t_new, new = _timed(lambda: [str(symbol_table) for _ in range(PRINTS)][-1])
+    assert old == new
+    print(f"\n{NUM_SYMBOLS} sembol, {PRINTS} kez yazdırma: sırala + '+=' {t_old * 1000:7.1f} ms | "
+          f"önbellekli __str__ {t_new * 1000:6.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("bench.sym", "bench.map"):
+            path = os.path.join(tmp, name)
+            t_write, _ = _timed(write_symbol_file, path, symbol_table.local_symbols(), "bench.asm")
+            t_load, loaded = _timed(load_symbol_files, [path])
+            assert loaded.table == symbol_table.table
+            print(f"{name}: {os.path.getsize(path) // 1024:5d} KiB, yazma {t_write * 1000:6.1f} ms, "
+                  f"yükleme {t_load * 1000:6.1f} ms")
@@ -0,0 +1,96 @@
+# benchmarks/corpus.py
+# Benchmark script'lerinin ortak kullandığı büyük kaynak kod üreticileri.
+import glob
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+TESTS_DIR = os.path.join(project_root, "tests")
+
+# Her blok farklı adresleme modlarını, geri/ileri dallanmaları ve pseudo-op'ları içerir.
+# {n} blok numarasıyla değiştirilir, böylece etiketler tekrar etmez.
+_BLOCK_TEMPLATE = [
+    "L{n}     LDAA    #$10        ; immediate",
+    "        LDAB    $20         ; direct",
+    "        STAA    $1234       ; extended",
+    "        ADDA    1,X         ; indexed",
+    "        LDX     #T{n}       ; ileri referans",
+    "        DECA",
+    "        BNE     L{n}        ; geri dallanma",
+    "        BEQ     T{n}        ; ileri dallanma",
+    "        JSR     $0800",
+    "T{n}     FCB     $01,$02,$03",
+]
+
+# ORG aralığı: adres sayacının $FFFF'i aşmaması için her bu kadar blokta bir yeni ORG.
+_BLOCKS_PER_ORG = 200
+
+
+def generate_source(num_lines):
+    """
+    Yaklaşık num_lines satırlık, hatasız assemble edilebilen sentetik bir M6800 kaynağı üretir.
+
+    Returns:
+        list[str]: Kaynak satırları (END dahil).
+    """
+    lines = []
+    block = 0
+    while len(lines) < num_lines - 1:
+        if block % _BLOCKS_PER_ORG == 0:
+            lines.append("        ORG     $1000")
+        lines.extend(t.format(n=block) for t in _BLOCK_TEMPLATE)
+        block += 1
+    lines.append("        END")
+    return lines
+
+
+def load_tests_corpus():
+    """tests/ altındaki tüm .asm dosyalarının satırlarını tek bir liste olarak döndürür."""
+    lines = []
+    for path in sorted(glob.glob(os.path.join(TESTS_DIR, "*.asm"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            lines.extend(f.read().split('\n'))
+    return lines
+
+
+def replicate_tests_corpus(num_lines):
+    """tests/ derlemini num_lines satıra ulaşana kadar çoğaltır (sadece lexer ölçümleri için)."""
+    base = load_tests_corpus()
+    repeats = num_lines // len(base) + 1
+    return (base * repeats)[:num_lines]
+
+
+# Yeni etiket tanımlamayan blok: sembol tablosu kaynak büyüdükçe büyümez
+# (sadece satır sayısına bağlı bellek kullanımını ölçmek için).
+_FLAT_BLOCK_TEMPLATE = [
+    "        LDAA    #$10",
+    "        LDAB    $20",
+    "        STAA    $1234",
+    "        ADDA    1,X",
+    "        LDX     #START",
+    "        DECA",
+    "        JMP     START",
+    "        FCB     $01,$02,$03",
+]
+
+_FLAT_LINES_PER_ORG = 2000
+
+
+def iter_flat_source(num_lines):
+    """
+    generate_source gibi ama tek etiketli ve satır satır üreten (generator) kaynak.
+    Dosyaya yazmak için tüm satırları bellekte tutmak gerekmez.
+    """
+    yield "START   NOP"
+    emitted = 1
+    while emitted < num_lines - 1:
+        if emitted % _FLAT_LINES_PER_ORG < len(_FLAT_BLOCK_TEMPLATE):
+            yield "        ORG     $1000"
+            emitted += 1
+        for line in _FLAT_BLOCK_TEMPLATE:
+            yield line
+        emitted += len(_FLAT_BLOCK_TEMPLATE)
+    yield "        END"
@@ -7,14 +7,20 @@ import os # Dosya yolu işlemleri için
 # Proje kök dizininin Python path'ine eklenmiş olması gerekebilir
 # veya main.py'den çalıştırırken bu importlar sorunsuz olmalı.
 try:
-    from assembler_core import assembler
+    from assembler_core.incremental import IncrementalAssembler
+    from assembler_core.include import IncludeExpander
+    from assembler_core.listing import render_listing
+    from assembler_core.diagnostics import DiagnosticStore
 except ImportError:
     # Eğer doğrudan bu dosyayı çalıştırmaya çalışıyorsak (test amaçlı)
     # ve assembler_core bir üst dizindeyse, sys.path'i ayarlamamız gerekebilir.
     # Genellikle main.py üzerinden çalıştıracağımız için bu bloğa ihtiyaç olmayabilir.
     import sys
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-    from assembler_core import assembler
+    from assembler_core.incremental import IncrementalAssembler
+    from assembler_core.include import IncludeExpander
+    from assembler_core.listing import render_listing
+    from assembler_core.diagnostics import DiagnosticStore
 
 
 from .widgets import CodeEditor, OutputDisplay # Kendi widget'larımız
@@ -27,6 +33,8 @@ class MainWindow(tk.Tk):
         self.geometry("900x700")
 
         self.current_file_path = None # Açık olan dosyanın yolu
+        # F5'ler arasında değişmeyen satırların lexer/kodlama sonuçlarını saklayan oturum
+        self.assembler_session = IncrementalAssembler()
 
         self._setup_ui()
         self.menu_bar = AppMenuBar(self, self) # Menü çubuğunu oluştur ve app_logic olarak kendini (MainWindow) ver
@@ -79,6 +87,7 @@ class MainWindow(tk.Tk):
             self.symbol_table_display.clear_text()
             self.machine_code_display.clear_text()
             self.error_display.clear_text()
+            self.assembler_session.reset()
             self.current_file_path = None
             self.title("M6800 Assembler - Tkinter - Yeni Dosya")
             self._update_status("Yeni dosya oluşturuldu.")
@@ -104,6 +113,7 @@ class MainWindow(tk.Tk):
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     self.code_editor.set_code(f.read())
+                self.assembler_session.reset()
                 self.current_file_path = file_path
                 self.title(f"M6800 Assembler - Tkinter - {os.path.basename(file_path)}")
                 self._update_status(f"Dosya açıldı: {file_path}")
@@ -149,10 +159,16 @@ class MainWindow(tk.Tk):
             return
 
         source_lines = source_code.strip().split('\n')
+        if self.current_file_path: # INCLUDE/INCBIN yolları açık dosyanın dizinine göre çözülür
+            self.assembler_session.includes = IncludeExpander(os.path.dirname(self.current_file_path),
+                                                              os.path.basename(self.current_file_path))
 
         try:
-            # --- Pass 1 ---
-            sym_table, proc_lines_p1, errs_p1 = assembler.pass_one(source_lines)
+            # --- Pass 1 + Pass 2 (artımlı) ---
+            # Oturum, önceki F5'ten bu yana değişmeyen satırları yeniden lexer'dan geçirmez ve
+            # kullandığı semboller değişmediyse yeniden kodlamaz. Sonuç pass_one + pass_two ile aynıdır.
+            sym_table, final_listing, mc_segments, errs_p1, errs_p2_combined = \
+                self.assembler_session.assemble(source_lines)
 
             # --- Pass 1 Hatalarını Göster (Hatalar/Uyarılar Sekmesi) ---
             # errs_p1 listesi zaten formatlı mesajlar içermeli ("Satır X (Lexer): ..." veya "Satır X: ...")
@@ -161,87 +177,24 @@ class MainWindow(tk.Tk):
                 for err_msg in errs_p1:
                     self.error_display.append_text(err_msg)
 
-            # --- Pass 2 ---
-            # Pass 2'ye, Pass 1'den gelen işlenmiş satırları (hatalarıyla birlikte) ve sembol tablosunu veriyoruz.
-            final_listing, mc_segments, errs_p2_combined = assembler.pass_two(proc_lines_p1, sym_table)
-
             # --- Sembol Tablosunu Göster ---
             self.symbol_table_display.set_text(str(sym_table))
 
             # --- Listelemeyi Oluştur ve Göster ---
-            listing_text_lines = [] # Listeleme için satırları biriktireceğimiz liste
-            for entry in final_listing:
-                # Temel listeleme satırını oluştur
-                line = f"L:{entry['line_num']:<3} Adr:{entry['address_hex']:<6} Kod:{entry['machine_code_hex']:<10} "
-                line += f"{entry['label'] or '':<8} {entry['mnemonic'] or '':<6} {entry['operand_str'] or '':<15}"
-                if entry['comment']:
-                    line += f"; {entry['comment']}"
-                listing_text_lines.append(line)
-
-                # Eğer bu satır için bir hata varsa (Lexer, Pass 1 veya Pass 2'den), listelemeye ekle
-                # entry['error'] ham hata mesajını içerir (örn: "Tanımsız ifade...")
-                # errs_p1 zaten formatlı ("Satır X (Lexer): ...")
-                # errs_p2_combined da formatlı olabilir veya ham olabilir, assembler.py'ye bağlı.
-                # Şimdilik, entry['error']'ı doğrudan kullanalım.
-                # Pass 1'den gelen hatalar (lexer dahil) zaten entry['error'] içinde olmalı.
-                # Pass 2'de oluşan yeni hatalar da pass_two tarafından entry['error']'a eklenir.
-                if entry.get('error'):
-                    # Hatanın kaynağını (P1, P2) belirtmek için daha karmaşık bir mantık kurulabilir,
-                    # ama en basit haliyle hata mesajını yazdıralım.
-                    # Hata mesajının başına "HATA:" ekleyebiliriz.
-                    # `errs_p1` zaten genel hata ekranında gösteriliyor, bu yüzden burada
-                    # sadece satırın yanında hatayı göstermek yeterli olabilir.
-                    # Eğer `errs_p1` içindeki mesaj, `entry['error']` ile aynıysa (veya onu içeriyorsa),
-                    # bu bir Pass 1/Lexer hatasıdır.
-                    
-                    # Basitleştirilmiş gösterim:
-                    listing_text_lines.append(f"    HATA: {entry['error']}")
-
-            self.listing_display.set_text("\n".join(listing_text_lines))
+            # Satırlar (ve varsa satırın hatası "    HATA: ..." olarak) ortak renderer ile çevrilir.
+            self.listing_display.set_text("".join(render_listing(final_listing, "compact")).rstrip("\n"))
 
 
             # --- Sadece Pass 2'de Oluşan Farklı Hataları Göster (Hatalar/Uyarılar Sekmesi) ---
-            # errs_p2_combined, pass_two'dan dönen tüm Pass 2 hatalarını içerir.
-            # Bunlardan Pass 1'de zaten raporlanmamış olanları ayıklamaya gerek yok,
-            # çünkü Pass 1 hataları zaten errs_p1 ile yukarıda gösterildi.
-            # Sadece errs_p2_combined'daki (Pass 1'den gelenler hariç) hataları göstermek istiyorsak:
-            
-            unique_pass2_errors = []
-            if errs_p2_combined: # Eğer pass_two'dan herhangi bir hata mesajı listesi döndüyse
-                pass1_error_raw_messages = set() # Pass 1'den gelen ham hata mesajlarını tutmak için
-                for p1_entry in proc_lines_p1:
-                    if p1_entry.get('error'):
-                        pass1_error_raw_messages.add(p1_entry['error'])
-                
-                for p2_err_msg_from_pass_two in errs_p2_combined:
-                    # p2_err_msg_from_pass_two, "Satır X: mesaj" formatında olabilir.
-                    # Eğer bu mesajın özü, Pass 1'den gelen bir hatanın özü değilse,
-                    # o zaman bu gerçekten yeni bir Pass 2 hatasıdır.
-                    # Bu karşılaştırma biraz karmaşık olabilir.
-                    # Şimdilik, errs_p2_combined'ı olduğu gibi yazdıralım ve
-                    # assembler.py'nin pass_two fonksiyonunun sadece YENİ P2 hatalarını döndürdüğünü varsayalım.
-                    # (assembler.py'de `errors_pass2` listesi sadece P2'de oluşanları tutuyordu)
-                    is_already_in_p1_formatted_list = False
-                    for p1_formatted_err in errs_p1:
-                        # errs_p2_combined'daki mesajlar "Satır X: Hata" formatında olabilir
-                        # p1_formatted_err "Satır X (Lexer): Hata" veya "Satır X: Hata" formatında
-                        # Basit bir `in` kontrolü deneyebiliriz.
-                        if p2_err_msg_from_pass_two in p1_formatted_err or \
-                           p1_formatted_err in p2_err_msg_from_pass_two : # Çok kaba bir kontrol
-                            is_already_in_p1_formatted_list = True
-                            break
-                    if not is_already_in_p1_formatted_list:
-                         unique_pass2_errors.append(p2_err_msg_from_pass_two)
-
-
-            if unique_pass2_errors: # Eğer gerçekten sadece Pass 2'ye özgü yeni hatalar varsa
+            # Hatalar Diagnostic nesneleridir ve tek bir koleksiyonda toplanır: Pass 1'de aynı satırda
+            # aynı kod ve argümanlarla raporlanmış bir hata Pass 2 listesinde de varsa append_new()
+            # False döner (satır indeksinde arama, metin eşleştirmesi yok).
+            diagnostics = DiagnosticStore(errs_p1)
+            unique_pass2_errors = [err for err in errs_p2_combined if diagnostics.append_new(err)]
+            if unique_pass2_errors:
                 self.error_display.append_text("\n--- PASS 2 HATALARI ---")
                 for err_msg in unique_pass2_errors:
                     self.error_display.append_text(err_msg)
-            elif errs_p2_combined and not errs_p1: # Pass1'de hata yoktu ama Pass2'de var (bu durum unique_pass2_errors ile kapsanmalı)
-                 self.error_display.append_text("\n--- PASS 2 HATALARI ---")
-                 for err_msg in errs_p2_combined:
-                     self.error_display.append_text(err_msg)
 
 
             # --- Makine Kodunu Göster ---
@@ -250,16 +203,14 @@ class MainWindow(tk.Tk):
                 for addr, byte_codes in mc_segments:
                     hex_codes = " ".join([f"{b:02X}" for b in byte_codes])
                     mc_text.append(f"Segment @ ${addr:04X}: {hex_codes}")
-            elif not (errs_p1 or unique_pass2_errors or (errs_p2_combined and not errs_p1)): # Hata yoksa ve segment yoksa
+            elif not diagnostics: # Hata yoksa ve segment yoksa
                 mc_text.append("(Makine kodu üretilmedi - Muhtemelen sadece pseudo-op'lar veya boş kod.)")
             else: # Hata varsa ve segment yoksa
                 mc_text.append("(Hatalar nedeniyle makine kodu üretilmedi veya boş.)")
             self.machine_code_display.set_text("\n".join(mc_text))
 
             # --- Durum Mesajı ve Bilgilendirme ---
-            total_errors = len(errs_p1) + len(unique_pass2_errors)
-            if errs_p2_combined and not errs_p1 and not unique_pass2_errors: # Sadece P2 hataları varsa ve unique boşsa, P2'nin tamamını al
-                total_errors = len(errs_p2_combined)
+            total_errors = len(diagnostics)
 
 
             if total_errors == 0:
@@ -1,6 +1,7 @@
 # main.py
 
 import argparse # Komut satırı argümanlarını işlemek için
+import contextlib
 import os
 import sys
 
@@ -12,9 +13,34 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# --serve modunda stdout JSON-lines protokolüne ayrılmıştır; modüllerin import
+# sırasında yazdığı bilgi mesajları stderr'e yönlendirilir.
+_import_stdout = sys.stderr if "--serve" in sys.argv[1:] else sys.stdout
 try:
-    from assembler_core.assembler import pass_one, pass_two
-    # from assembler_core.symbol_table import SymbolTable # pass_one zaten döndürüyor
+    with contextlib.redirect_stdout(_import_stdout):
+        from assembler_core.single_pass import assemble_single_pass
+        from assembler_core.image_only import assemble_image
+        from assembler_core.layout import assemble_optimized
+        from assembler_core.peephole import assemble_peephole, resolve_rules, RULE_NAMES
+        from assembler_core.wcet import analyze_wcet
+        from assembler_core.streaming import AssemblyStream
+        from assembler_core.output_files import ListingWriter, HexDumpWriter, iter_assembled
+        from assembler_core.server import serve_stdio, serve_unix_socket
+        from assembler_core.batch import EXIT_ASSEMBLY_ERRORS, EXIT_FAILED, EXIT_OK, expand_inputs, is_batch_pattern, \
+                                          output_bases, run_batch
+        from assembler_core.srecord import S19Writer, DEFAULT_RECORD_LENGTH, end_start_address
+        from assembler_core.intel_hex import IntelHexWriter
+        from assembler_core.memory_image import BinWriter
+        from assembler_core.listing import LISTING_FORMATS, get_renderer
+        from assembler_core.diagnostics import DiagnosticStore
+        from assembler_core.build_cache import (BuildCache, cached_errors, cached_symbol_table, default_cache_dir,
+                                                file_chunks, files_fingerprint, include_dir_option,
+                                                iter_cached)
+        from assembler_core.symbol_map import load_symbol_files, write_symbol_file
+        from assembler_core.object_file import OBJECT_EXTENSION
+        from assembler_core.linker import link, load_module
+        from assembler_core.include import IncludeExpander
+        # from assembler_core.symbol_table import SymbolTable # pass_one zaten döndürüyor
 except ImportError as e:
     print(f"HATA: Gerekli modüller yüklenemedi. Proje yapınızı kontrol edin.")
     print(f"Detay: {e}")
@@ -22,9 +48,39 @@ except ImportError as e:
     print("bu script'i proje kök dizininden çalıştırdığınızdan emin olun.")
     sys.exit(1)
 
-def assemble_file(input_filepath, output_list_filepath=None, output_hex_filepath=None):
+def assemble_file(input_filepath, output_list_filepath=None, output_hex_filepath=None, single_pass=False,
+                  cache=None, output_s19_filepath=None, s19_record_length=DEFAULT_RECORD_LENGTH,
+                  output_ihex_filepath=None, ihex_record_length=DEFAULT_RECORD_LENGTH,
+                  output_bin_filepath=None, bin_fill=0xFF, listing_format="text", symbol_files=(),
+                  output_sym_filepath=None, image_only=False, optimize=False,
+                  peephole=None, pass2_workers=1):
     """
     Verilen assembly dosyasını assemble eder ve çıktıları üretir.
+    Varsayılan yolda kaynak AssemblyStream ile akış halinde işlenir: listeleme girdileri ve
+    makine kodu segmentleri üretildikçe .lst/.hex dosyalarına yazılır, listelemenin
+    tamamı bellekte tutulmaz.
+    single_pass=True ise iki geçiş yerine ileri referans fixup'lı tek geçişli motor kullanılır.
+    cache (BuildCache) verilirse aynı kaynak ve seçeneklerle daha önce üretilmiş çıktılar
+    önbellekten alınır (kaynak lex edilmez); ıskada sonuçlar önbelleğe yazılır.
+    output_s19_filepath verilirse makine kodu ayrıca Motorola S19 olarak yazılır (S9 başlangıç
+    adresi END operandından, yoksa reset vektöründen alınır). output_ihex_filepath verilirse
+    Intel HEX dosyası da yazılır. output_bin_filepath verilirse en düşük ve en yüksek dolu adres
+    arası ham .bin imajı olarak yazılır (boşluklar bin_fill ile doldurulur).
+    listing_format listeleme dosyasının biçimidir (text, compact, jsonl, csv); None ise listeleme
+    dosyası yazılmaz.
+    symbol_files verilirse bu .sym/.map dosyalarındaki semboller Pass 1'den önce tabloya yüklenir
+    (önceden assemble edilmiş bir programın etiketlerine kaynağı olmadan başvurulabilir).
+    output_sym_filepath verilirse kaynakta tanımlanan semboller bu dosyaya yazılır (uzantı .map
+    ise ikili, değilse metin .sym biçimi).
+    image_only=True ise listeleme hiç üretilmez (listing_format yok sayılır): kaynak assemble_image
+    ile assemble edilir ve sadece makine kodu/sembol dosyaları yazılır. Önbellek kullanılmaz
+    (önbellek kaydı listelemeyi de içerir).
+    optimize=True ise ileri referanslı EXTENDED komutlar, değerleri 8 bit'e sığıyorsa DIRECT'e
+    küçültülür (bkz. layout.py) ve kazanılan byte/çevrim sayısı yazdırılır.
+    peephole verilirse (kural adları listesi, bkz. peephole.py) Pass 1 ile Pass 2 arasında bu
+    kurallarla peephole iyileştirmesi yapılır ve her yeniden yazma kazancıyla yazdırılır.
+    pass2_workers optimize/peephole yollarında pass_two'ya iletilir (1: sıralı, >1: o kadar işçi
+    süreç, None: büyük kaynaklarda otomatik - bkz. parallel_pass2.py).
     """
     if not os.path.exists(input_filepath):
         print(f"HATA: Giriş dosyası bulunamadı: {input_filepath}")
@@ -32,17 +88,84 @@ def assemble_file(input_filepath, output_list_filepath=None, output_hex_filepath
 
     print(f"'{input_filepath}' dosyası assemble ediliyor...")
 
+    stream = cached = preloaded = image = None
+    if image_only:
+        listing_format = None
+        cache = None
     try:
-        with open(input_filepath, 'r', encoding='utf-8') as f:
-            source_lines = f.read().strip().split('\n')
+        if symbol_files:
+            preloaded = load_symbol_files(symbol_files)
+            print(f"Sembol dosyalarından {len(preloaded.table)} sembol yüklendi.")
+        if cache is not None:
+            options = {"single_pass": single_pass}
+            if optimize:
+                options["optimize"] = True
+            if peephole is not None:
+                options["peephole"] = sorted(peephole)
+            if symbol_files:
+                options["symbol_files"] = files_fingerprint(symbol_files)
+            # Kaynak parça parça okunur: akış yolunda büyük bir kaynak belleğe hiç alınmaz.
+            include_dir = include_dir_option(file_chunks(input_filepath), os.path.dirname(input_filepath))
+            if include_dir:
+                options["include_dir"] = include_dir
+            cache_key = cache.key(file_chunks(input_filepath), **options)
+            cached = cache.get(cache_key)
+        if cached is not None:
+            print("\n--- Önbellekten alındı (kaynak ve assembler değişmemiş) ---")
+            symbol_table = cached_symbol_table(cached)
+            errors_p1, errors_p2 = cached_errors(cached)
+            results = iter_cached(cached)
+        elif single_pass:
+            with open(input_filepath, 'r', encoding='utf-8') as f:
+                source_lines = f.read().strip().split('\n')
+            print("\n--- TEK GEÇİŞ Başlatılıyor ---")
+            includes = IncludeExpander(os.path.dirname(input_filepath), os.path.basename(input_filepath))
+            symbol_table, final_listing, machine_code_segments, errors_p1, errors_p2 = \
+                assemble_single_pass(source_lines, preloaded, includes)
+            results = iter_assembled(final_listing, machine_code_segments)
+        elif optimize:
+            with open(input_filepath, 'r', encoding='utf-8') as f:
+                source_lines = f.read().splitlines()
+            print("\n--- Optimize yerleşim (DIRECT küçültme) Başlatılıyor ---")
+            includes = IncludeExpander(os.path.dirname(input_filepath), os.path.basename(input_filepath))
+            symbol_table, final_listing, machine_code_segments, errors_p1, errors_p2, report = \
+                assemble_optimized(source_lines, preloaded, includes, pass2_workers)
+            print(report.summary())
+            results = iter_assembled(final_listing, machine_code_segments)
+        elif peephole is not None:
+            with open(input_filepath, 'r', encoding='utf-8') as f:
+                source_lines = f.read().splitlines()
+            print("\n--- Peephole iyileştirme Başlatılıyor ---")
+            includes = IncludeExpander(os.path.dirname(input_filepath), os.path.basename(input_filepath))
+            symbol_table, final_listing, machine_code_segments, errors_p1, errors_p2, report = \
+                assemble_peephole(source_lines, preloaded, includes, peephole, pass2_workers)
+            print(report.summary())
+            for rewrite in report.rewrites:
+                print(f"  {rewrite}")
+            for rule, line_num, crossing in report.referenced:
+                print(f"  Satır {line_num}: [{rule}] uygulanmadı - satır {crossing}'deki '*'/sayısal başvuru aşıyor")
+            results = iter_assembled(final_listing, machine_code_segments)
+        elif image_only:
+            with open(input_filepath, 'r', encoding='utf-8') as f:
+                source_lines = f.read().splitlines()
+            print("\n--- Sadece imaj (listelemesiz) assemble ---")
+            includes = IncludeExpander(os.path.dirname(input_filepath), os.path.basename(input_filepath))
+            image = assemble_image(source_lines, preloaded, includes)
+            symbol_table, errors_p1, errors_p2 = image.symbol_table, image.errors_p1, image.errors_p2
+            results = (("segment", segment) for segment in image.segments)
+        else:
+            # --- Pass 1 ---
+            print("\n--- PASS 1 Başlatılıyor ---")
+            results = stream = AssemblyStream(input_filepath, preloaded)
+            includes = stream.includes
+            symbol_table = stream.run_pass_one()
+            errors_p1 = stream.errors_p1
+        if cache is not None and cached is None:
+            results = cache.record(results)
     except Exception as e:
         print(f"HATA: Giriş dosyası okunurken bir sorun oluştu: {e}")
         return
 
-    # --- Pass 1 ---
-    print("\n--- PASS 1 Başlatılıyor ---")
-    symbol_table, processed_lines_p1, errors_p1 = pass_one(source_lines)
-
     print("\nSembol Tablosu (Pass 1 sonrası):")
     print(symbol_table) # SymbolTable'ın __str__ metodu çağrılacak
 
@@ -55,85 +178,372 @@ def assemble_file(input_filepath, output_list_filepath=None, output_hex_filepath
         # return
     else:
         print("\nPass 1 başarıyla tamamlandı, hata bulunamadı.")
+        if output_sym_filepath:
+            try:
+                write_symbol_file(output_sym_filepath, symbol_table.local_symbols(), input_filepath)
+                print(f"Sembol dosyası '{output_sym_filepath}' başarıyla oluşturuldu.")
+            except (OSError, ValueError) as e:
+                print(f"HATA: Sembol dosyası oluşturulurken bir sorun oluştu: {e}")
+
+    # Çıktı dosyalarını oluşturma
+    base_filename = os.path.splitext(os.path.basename(input_filepath))[0]
+    if output_list_filepath is None and listing_format is not None:
+        output_list_filepath = base_filename + get_renderer(listing_format).extension
+    # Makine kodu dosyası (.hex - şimdilik basit bir hex dökümü)
+    # Gerçek bir .hex dosyası (Intel HEX, S-Record) formatı daha karmaşıktır.
+    # Şimdilik sadece adres ve byte'ları yazdıracağız.
+    if output_hex_filepath is None:
+        output_hex_filepath = base_filename + ".hex"
 
-    # --- Pass 2 ---
-    print("\n--- PASS 2 Başlatılıyor ---")
-    final_listing, machine_code_segments, errors_p2 = pass_two(processed_lines_p1, symbol_table)
+    if stream is not None:
+        # --- Pass 2 --- (listeleme ve makine kodu aynı akışta yazılır)
+        print("\n--- PASS 2 Başlatılıyor ---")
+
+    if listing_format is not None:
+        print(f"\nListeleme dosyası oluşturuluyor: {output_list_filepath}")
+    lst_writer = hex_writer = s19_writer = ihex_writer = bin_writer = None
+    end_operand = image.end_operand if image is not None else None
+    try:
+        if listing_format is not None:
+            lst_writer = ListingWriter(output_list_filepath, input_filepath, listing_format)
+        if not errors_p1: # Pass 1 hatası varsa makine kodu dosyası hiç oluşturulmaz
+            hex_writer = HexDumpWriter(output_hex_filepath, input_filepath)
+            if output_s19_filepath:
+                s19_writer = S19Writer(output_s19_filepath, base_filename, s19_record_length)
+            if output_ihex_filepath:
+                ihex_writer = IntelHexWriter(output_ihex_filepath, ihex_record_length)
+            if output_bin_filepath:
+                bin_writer = BinWriter(output_bin_filepath, bin_fill)
+        for kind, payload in results:
+            if kind == "line":
+                if lst_writer is not None:
+                    lst_writer.write_entry(payload)
+                if s19_writer is not None and (payload['mnemonic'] or "").upper() == "END":
+                    end_operand = payload['operand_str']
+            elif hex_writer is not None:
+                hex_writer.write_segment(*payload)
+                if s19_writer is not None:
+                    s19_writer.write_segment(*payload)
+                if ihex_writer is not None:
+                    ihex_writer.write_segment(*payload)
+                if bin_writer is not None:
+                    bin_writer.write_segment(*payload)
+        if stream is not None:
+            errors_p2 = stream.errors_p2
+        if lst_writer is not None:
+            lst_writer.close(errors_p1, errors_p2)
+            print(f"Listeleme dosyası '{output_list_filepath}' başarıyla oluşturuldu.")
+    except Exception as e:
+        print(f"HATA: Listeleme dosyası oluşturulurken bir sorun oluştu: {e}")
+        if hex_writer is not None:
+            hex_writer.close(keep=False)
+        if s19_writer is not None:
+            s19_writer.close(keep=False)
+        if ihex_writer is not None:
+            ihex_writer.close(keep=False)
+        if bin_writer is not None:
+            bin_writer.close(keep=False)
+        if lst_writer is not None:
+            lst_writer.file.close()
+        if cache is not None and cached is None:
+            results.discard()
+        return
 
     if errors_p2: # Sadece Pass 2'de oluşan yeni/farklı hatalar
-        unique_p2_errors = [err for err in errors_p2 if err not in errors_p1]
+        diagnostics = DiagnosticStore(errors_p1)
+        unique_p2_errors = [err for err in errors_p2 if diagnostics.append_new(err)]
         if unique_p2_errors:
             print("\nPass 2 Hataları:")
             for err in unique_p2_errors:
                 print(f"  {err}")
-    
+
     if not errors_p1 and not errors_p2 : # Veya daha esnek bir hata kontrolü
          print("\nPass 2 başarıyla tamamlandı, ek hata bulunamadı.")
 
+    if hex_writer is not None:
+        try:
+            if hex_writer.close(keep=not errors_p2): # Hata yoksa oluştur
+                print(f"\nMakine kodu dosyası '{output_hex_filepath}' başarıyla oluşturuldu.")
+        except Exception as e:
+            print(f"HATA: Makine kodu dosyası oluşturulurken bir sorun oluştu: {e}")
+    if s19_writer is not None:
+        try:
+            if s19_writer.close(keep=not errors_p2, start_address=end_start_address(end_operand, symbol_table)):
+                print(f"S19 dosyası '{output_s19_filepath}' başarıyla oluşturuldu.")
+        except Exception as e:
+            print(f"HATA: S19 dosyası oluşturulurken bir sorun oluştu: {e}")
+    if ihex_writer is not None:
+        try:
+            if ihex_writer.close(keep=not errors_p2):
+                print(f"Intel HEX dosyası '{output_ihex_filepath}' başarıyla oluşturuldu.")
+        except Exception as e:
+            print(f"HATA: Intel HEX dosyası oluşturulurken bir sorun oluştu: {e}")
+    if bin_writer is not None:
+        try:
+            if bin_writer.close(keep=not errors_p2):
+                print(f"Ham imaj dosyası '{output_bin_filepath}' başarıyla oluşturuldu "
+                      f"(başlangıç adresi: ${bin_writer.start_address:04X}).")
+        except Exception as e:
+            print(f"HATA: Ham imaj dosyası oluşturulurken bir sorun oluştu: {e}")
+    if errors_p1 or errors_p2:
+        print("\nHatalar nedeniyle makine kodu dosyası oluşturulmadı.")
+    if cache is not None:
+        if cached is None:
+            cache.put(cache_key, results, symbol_table, errors_p1, errors_p2, includes.files)
+        print(f"\n{cache.summary()}")
 
-    # Çıktı dosyalarını oluşturma
-    base_filename = os.path.splitext(os.path.basename(input_filepath))[0]
 
-    # 1. Listeleme Dosyası (.lst)
-    if output_list_filepath is None:
-        output_list_filepath = base_filename + ".lst"
-    
-    print(f"\nListeleme dosyası oluşturuluyor: {output_list_filepath}")
-    try:
-        with open(output_list_filepath, 'w', encoding='utf-8') as lst_file:
-            lst_file.write(f"Kaynak Dosya: {os.path.basename(input_filepath)}\n")
-            lst_file.write("Assembler Listeleme Çıktısı\n")
-            lst_file.write("=" * 80 + "\n")
-            lst_file.write(f"{'Satır':<5} {'Adres':<7} {'Mak.Kodu':<12} {'Etiket':<10} {'Komut':<7} {'Operand':<20} {'Yorum'}\n")
-            lst_file.write("-" * 80 + "\n")
-            for entry in final_listing:
-                addr_hex = entry['address_hex'] if entry['address_hex'] != "----" else "      "
-                mc_hex = entry['machine_code_hex'] if entry['machine_code_hex'] else ""
-                label = entry['label'] if entry['label'] else ""
-                mnemonic = entry['mnemonic'] if entry['mnemonic'] else ""
-                operand = entry['operand_str'] if entry['operand_str'] else ""
-                comment = entry['comment'] if entry['comment'] else ""
-                
-                lst_file.write(f"{entry['line_num']:<5} {addr_hex:<7} {mc_hex:<12} {label:<10} {mnemonic:<7} {operand:<20} {comment}\n")
-                if entry['error']:
-                    lst_file.write(f"***** HATA: {entry['error']}\n")
-            lst_file.write("=" * 80 + "\n")
-            if errors_p1 or errors_p2:
-                 lst_file.write("\nToplam Hatalar:\n")
-                 for err in set(errors_p1 + errors_p2): # Tekrarları önle
-                     lst_file.write(f"- {err}\n")
-            lst_file.write("Listeleme Sonu.\n")
-        print(f"Listeleme dosyası '{output_list_filepath}' başarıyla oluşturuldu.")
-    except Exception as e:
-        print(f"HATA: Listeleme dosyası oluşturulurken bir sorun oluştu: {e}")
+def link_files(input_files, out_dir=".", link_only=False, base=0, symbol_files=(), output_hex_filepath=None,
+               output_s19_filepath=None, s19_record_length=DEFAULT_RECORD_LENGTH,
+               output_ihex_filepath=None, ihex_record_length=DEFAULT_RECORD_LENGTH,
+               output_bin_filepath=None, bin_fill=0xFF, output_sym_filepath=None):
+    """
+    Kaynakları nesne dosyalarına (.obj) çevirir ve link_only değilse bağlar. out_dir'deki .obj
+    kaynağından (ve sembol dosyalarından) yeniyse kaynak yeniden assemble edilmez; .obj
+    dosyaları doğrudan girdi olarak da verilebilir. Bağlanan program output_hex_filepath'e
+    (ve istenen S19 / Intel HEX / .bin / sembol dosyalarına) yazılır.
 
-    # 2. Makine Kodu Dosyası (.hex veya .bin - şimdilik basit bir hex formatı)
-    # Gerçek bir .hex dosyası (Intel HEX, S-Record) formatı daha karmaşıktır.
-    # Şimdilik sadece adres ve byte'ları yazdıracağız.
-    if machine_code_segments and not (errors_p1 or errors_p2): # Hata yoksa oluştur
-        if output_hex_filepath is None:
-            output_hex_filepath = base_filename + ".hex" # Basit hex dökümü
-        
-        print(f"\nMakine kodu dosyası oluşturuluyor: {output_hex_filepath}")
+    Returns:
+        int: Çıkış kodu (toplu moddaki gibi EXIT_OK / EXIT_ASSEMBLY_ERRORS / EXIT_FAILED).
+    """
+    input_paths = expand_inputs(input_files)
+    preloaded = load_symbol_files(symbol_files) if symbol_files else None
+    modules = []
+    status = EXIT_OK
+    for path, base_path in zip(input_paths, output_bases(input_paths, out_dir)):
         try:
-            with open(output_hex_filepath, 'w', encoding='utf-8') as hex_file:
-                hex_file.write(f"; {os.path.basename(input_filepath)} için makine kodu dökümü\n")
-                for address, byte_codes in machine_code_segments:
-                    hex_string = " ".join([f"{b:02X}" for b in byte_codes])
-                    hex_file.write(f"${address:04X}: {hex_string}\n")
-            print(f"Makine kodu dosyası '{output_hex_filepath}' başarıyla oluşturuldu.")
-        except Exception as e:
-            print(f"HATA: Makine kodu dosyası oluşturulurken bir sorun oluştu: {e}")
-    elif errors_p1 or errors_p2:
+            module, errors, reused = load_module(path, base_path + OBJECT_EXTENSION, preloaded, symbol_files)
+        except (OSError, ValueError) as e:
+            print(f"HATA: {path}: {e}")
+            status = EXIT_FAILED
+            continue
+        if module is None:
+            print(f"\n{path}: assemble hataları:")
+            for err in errors:
+                print(f"  {err}")
+            status = max(status, EXIT_ASSEMBLY_ERRORS)
+            continue
+        state = "güncel" if reused else "assemble edildi"
+        print(f"{path}: {state} ({module.text.size} byte text, {len(module.imports)} import, "
+              f"{len(module.relocations)} yer değiştirme)")
+        modules.append(module)
+    if link_only or status != EXIT_OK:
+        return status
+
+    result = link(modules, base)
+    for name, address in result.placement.items():
+        print(f"  {name:<24} text @ ${address:04X}")
+    if result.errors:
+        print("\nBağlama Hataları:")
+        for err in result.errors:
+            print(f"  {err}")
         print("\nHatalar nedeniyle makine kodu dosyası oluşturulmadı.")
+        return EXIT_ASSEMBLY_ERRORS
+
+    name = os.path.basename(input_paths[0])
+    writers = [HexDumpWriter(output_hex_filepath, name)]
+    if output_s19_filepath:
+        writers.append(S19Writer(output_s19_filepath, os.path.splitext(name)[0], s19_record_length))
+    if output_ihex_filepath:
+        writers.append(IntelHexWriter(output_ihex_filepath, ihex_record_length))
+    if output_bin_filepath:
+        writers.append(BinWriter(output_bin_filepath, bin_fill))
+    for writer in writers:
+        for address, data in result.segments:
+            writer.write_segment(address, data)
+        if writer.close(keep=True):
+            print(f"Çıktı dosyası '{writer.path}' başarıyla oluşturuldu.")
+    if output_sym_filepath:
+        write_symbol_file(output_sym_filepath, result.symbols, name)
+        print(f"Sembol dosyası '{output_sym_filepath}' başarıyla oluşturuldu.")
+    return EXIT_OK
+
+
+def wcet_file(input_filepath, entries=None, symbol_files=()):
+    """
+    Kaynağı assemble eder ve girişlerin (None ise kesme vektörlerinin) en kötü durum
+    çalışma süresini kritik yoluyla yazdırır (bkz. assembler_core/wcet.py).
+
+    Returns:
+        int: Çıkış kodu - EXIT_OK; assemble hatası varsa veya bir giriş sınırsızsa
+             EXIT_ASSEMBLY_ERRORS; dosya okunamazsa veya giriş çözülemezse EXIT_FAILED.
+    """
+    try:
+        preloaded = load_symbol_files(symbol_files) if symbol_files else None
+        with open(input_filepath, 'r', encoding='utf-8') as f:
+            source_lines = f.read().splitlines()
+        includes = IncludeExpander(os.path.dirname(input_filepath), os.path.basename(input_filepath))
+        results, errors = analyze_wcet(source_lines, entries, preloaded, includes)
+    except (OSError, ValueError) as e:
+        print(f"HATA: {input_filepath}: {e}")
+        return EXIT_FAILED
+    if errors:
+        print(f"\n{input_filepath}: assemble hataları:")
+        for err in errors:
+            print(f"  {err}")
+        return EXIT_ASSEMBLY_ERRORS
+    print(f"\n--- En kötü durum çalışma süresi (WCET): {input_filepath} ---")
+    for result in results:
+        print(result.summary())
+    return EXIT_OK if all(result.cycles is not None for result in results) else EXIT_ASSEMBLY_ERRORS
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Motorola M6800 Assembler")
-    parser.add_argument("input_file", help="Assemble edilecek .asm kaynak dosyası")
+    parser.add_argument("input_files", nargs="*", metavar="input_file",
+                        help="Assemble edilecek .asm kaynak dosyası (birden çok dosya, glob veya dizin: toplu mod)")
     parser.add_argument("-o_lst", "--output_list", help="Oluşturulacak listeleme dosyasının adı (örn: output.lst)", default=None)
     parser.add_argument("-o_hex", "--output_hex", help="Oluşturulacak makine kodu döküm dosyasının adı (örn: output.hex)", default=None)
+    parser.add_argument("--s19", action="store_true", help="Makine kodunu ayrıca Motorola S19 olarak yaz (<ad>.s19)")
+    parser.add_argument("-o_s19", "--output_s19", default=None, help="S19 dosyasının adı (--s19'u da açar)")
+    parser.add_argument("--s19-record-length", type=int, default=DEFAULT_RECORD_LENGTH,
+                        help=f"S1 kaydı başına veri byte'ı (varsayılan: {DEFAULT_RECORD_LENGTH})")
+    parser.add_argument("--ihex", action="store_true", help="Makine kodunu ayrıca Intel HEX olarak yaz (<ad>.ihx)")
+    parser.add_argument("-o_ihex", "--output_ihex", default=None, help="Intel HEX dosyasının adı (--ihex'i de açar)")
+    parser.add_argument("--ihex-record-length", type=int, default=DEFAULT_RECORD_LENGTH,
+                        help=f"Intel HEX veri kaydı başına byte (varsayılan: {DEFAULT_RECORD_LENGTH})")
+    parser.add_argument("--bin", action="store_true", help="Makine kodunu ayrıca ham ikili imaj olarak yaz (<ad>.bin)")
+    parser.add_argument("-o_bin", "--output_bin", default=None, help="Ham imaj dosyasının adı (--bin'i de açar)")
+    parser.add_argument("--bin-fill", type=lambda text: int(text, 0), default=0xFF,
+                        help="Ham imajda yazılmamış adreslerin değeri (varsayılan: 0xFF)")
+    parser.add_argument("--symbols", action="append", default=[], metavar="SYM_FILE",
+                        help="Pass 1'den önce yüklenecek sembol dosyası (.sym veya .map; birden çok verilebilir)")
+    parser.add_argument("--sym", action="store_true", help="Kaynakta tanımlanan sembolleri metin olarak yaz (<ad>.sym)")
+    parser.add_argument("--map", action="store_true", help="Kaynakta tanımlanan sembolleri ikili olarak yaz (<ad>.map)")
+    parser.add_argument("-o_sym", "--output_sym", default=None,
+                        help="Sembol dosyasının adı (uzantı .map ise ikili, değilse metin biçimi)")
+    parser.add_argument("--listing-format", choices=LISTING_FORMATS, default="text",
+                        help="Listeleme dosyasının biçimi (varsayılan: text; jsonl/csv için uzantı .jsonl/.csv)")
+    parser.add_argument("--no-listing", action="store_true", help="Listeleme dosyası yazma (sadece makine kodu)")
+    parser.add_argument("--image-only", action="store_true",
+                        help="Listeleme hiç üretilmeden sadece makine kodu ve sembol çıktılarını yaz "
+                             "(CI derlemeleri için; önbellek kullanılmaz)")
+    parser.add_argument("--object", action="store_true",
+                        help="Kaynakları yer değiştirilebilir nesne dosyalarına (.obj, --out-dir altında) çevir, bağlama")
+    parser.add_argument("--link", action="store_true",
+                        help="Kaynakları/.obj dosyalarını tek programa bağla (güncel .obj'ler yeniden assemble edilmez)")
+    parser.add_argument("--link-base", type=lambda text: int(text, 0), default=0,
+                        help="--link ile: ilk modülün text bölümünün adresi (varsayılan: 0)")
+    parser.add_argument("--single-pass", action="store_true", help="İleri referans fixup listesiyle tek geçişli assemble et")
+    parser.add_argument("--optimize", action="store_true",
+                        help="Değeri 8 bit'e sığan ileri referanslı komutları DIRECT'e küçült ve kazancı raporla")
+    parser.add_argument("--peephole", action="store_true",
+                        help="Pass 1 ile Pass 2 arasında varsayılan kurallarla peephole iyileştirmesi yap ve raporla")
+    parser.add_argument("--peephole-rules", default=None, metavar="KURALLAR",
+                        help=f"Açılacak peephole kuralları, virgülle ayrılmış (--peephole'u da açar; "
+                             f"geçerli: {', '.join(RULE_NAMES)})")
+    parser.add_argument("--wcet", action="store_true",
+                        help="Kesme vektörlerinin (IRQ/SWI/NMI/RESET) en kötü durum çevrimini ve kritik yolunu yazdır")
+    parser.add_argument("--wcet-entry", action="append", default=[], metavar="ETİKET",
+                        help="--wcet analizini bu etiketten/adresten başlat (tekrarlanabilir; vektörlerin yerine)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Sunucu modu: JSON-lines assemble isteklerini stdin/stdout (veya --socket) üzerinden karşıla")
+    parser.add_argument("--socket", default=None, help="--serve ile: stdin/stdout yerine bu Unix soketini dinle")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Toplu modda paralel işçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--pass2-jobs", type=int, default=1, metavar="N",
+                        help="--optimize/--peephole ile Pass 2'yi N işçi süreçte kodla (0: kaynak "
+                             "M6800_PASS2_PARALLEL_LINES satıra ulaşırsa CPU sayısı kadar; varsayılan: 1, sıralı)")
+    parser.add_argument("--no-cache", action="store_true", help="Derleme önbelleğini kullanma")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Derleme önbelleği dizini (varsayılan: $M6800_CACHE_DIR veya ~/.cache/m6800_assembler)")
+    parser.add_argument("--out-dir", default=".", help="Toplu modda .lst/.hex çıktılarının yazılacağı dizin")
     
-    args = parser.parse_args()
-    
-    assemble_file(args.input_file, args.output_list, args.output_hex)
\ No newline at end of file
+    args = parser.parse_intermixed_args()
+
+    if args.serve:
+        if args.socket:
+            print(f"Assembler sunucusu dinliyor: {args.socket}", file=sys.stderr)
+            serve_unix_socket(args.socket)
+        else:
+            serve_stdio()
+        sys.exit(0)
+    if not args.input_files:
+        parser.error("input_file gerekli (veya --serve)")
+
+    if not 1 <= args.s19_record_length <= 252:
+        parser.error("--s19-record-length 1-252 aralığında olmalı")
+    if not 1 <= args.ihex_record_length <= 255:
+        parser.error("--ihex-record-length 1-255 aralığında olmalı")
+    if not 0 <= args.bin_fill <= 0xFF:
+        parser.error("--bin-fill 0-255 aralığında olmalı")
+    if (args.no_listing or args.image_only) and args.output_list:
+        parser.error("-o_lst ile --no-listing/--image-only birlikte kullanılamaz")
+    if args.image_only and args.single_pass:
+        parser.error("--image-only ile --single-pass birlikte kullanılamaz")
+    if args.optimize and (args.single_pass or args.image_only):
+        parser.error("--optimize, --single-pass ve --image-only ile birlikte kullanılamaz")
+    peephole = None
+    if args.peephole or args.peephole_rules is not None:
+        names = None if args.peephole_rules is None else \
+            [name.strip() for name in args.peephole_rules.split(",") if name.strip()]
+        try:
+            peephole = [rule.name for rule in resolve_rules(names)]
+        except ValueError as e:
+            parser.error(str(e))
+        if args.single_pass or args.image_only or args.optimize:
+            parser.error("--peephole, --single-pass, --image-only ve --optimize ile birlikte kullanılamaz")
+    if args.pass2_jobs < 0:
+        parser.error("--pass2-jobs negatif olamaz")
+    listing_format = None if args.no_listing or args.image_only else args.listing_format
+
+    output_s19 = args.output_s19
+    if args.s19 and not output_s19:
+        output_s19 = os.path.splitext(os.path.basename(args.input_files[0]))[0] + ".s19"
+    output_ihex = args.output_ihex
+    if args.ihex and not output_ihex:
+        output_ihex = os.path.splitext(os.path.basename(args.input_files[0]))[0] + ".ihx"
+    output_bin = args.output_bin
+    if args.bin and not output_bin:
+        output_bin = os.path.splitext(os.path.basename(args.input_files[0]))[0] + ".bin"
+    if args.sym and args.map:
+        parser.error("--sym ve --map birlikte kullanılamaz (-o_sym ile dosya adı verin)")
+    output_sym = args.output_sym
+    if (args.sym or args.map) and not output_sym:
+        output_sym = os.path.splitext(os.path.basename(args.input_files[0]))[0] + (".map" if args.map else ".sym")
+
+    if args.wcet or args.wcet_entry:
+        if len(args.input_files) != 1 or args.object or args.link or args.single_pass or args.optimize or \
+                peephole is not None or args.image_only:
+            parser.error("--wcet tek bir kaynak dosyayla ve diğer assemble modları olmadan kullanılır")
+        sys.exit(wcet_file(args.input_files[0], args.wcet_entry or None, args.symbols))
+
+    if args.object or args.link:
+        if args.object and args.link:
+            parser.error("--object ve --link birlikte kullanılamaz")
+        if args.single_pass or args.output_list or args.jobs is not None or args.image_only or args.optimize or \
+                peephole is not None:
+            parser.error("--single-pass, -o_lst, --jobs, --image-only, --optimize ve --peephole --object/--link ile "
+                         "kullanılamaz")
+        if not 0 <= args.link_base <= 0xFFFF:
+            parser.error("--link-base 0-$FFFF aralığında olmalı")
+        output_hex = args.output_hex or os.path.splitext(os.path.basename(args.input_files[0]))[0] + ".hex"
+        sys.exit(link_files(args.input_files, args.out_dir, link_only=args.object, base=args.link_base,
+                            symbol_files=args.symbols, output_hex_filepath=output_hex,
+                            output_s19_filepath=output_s19, s19_record_length=args.s19_record_length,
+                            output_ihex_filepath=output_ihex, ihex_record_length=args.ihex_record_length,
+                            output_bin_filepath=output_bin, bin_fill=args.bin_fill, output_sym_filepath=output_sym))
+
+    if len(args.input_files) > 1 or args.jobs is not None or is_batch_pattern(args.input_files[0]):
+        if args.output_list or args.output_hex or args.output_s19 or args.output_ihex or args.output_bin or args.output_sym:
+            parser.error("-o_lst/-o_hex/-o_s19/-o_ihex/-o_bin/-o_sym toplu modda kullanılamaz (--out-dir kullanın)")
+        if args.map:
+            parser.error("--map toplu modda kullanılamaz (--sym kullanın)")
+        if args.jobs is not None and args.jobs < 1:
+            parser.error("--jobs en az 1 olmalı")
+        sys.exit(run_batch(args.input_files, args.out_dir, args.jobs, single_pass=args.single_pass,
+                           cache_dir=None if args.no_cache else (args.cache_dir or default_cache_dir()),
+                           image_outputs=[field for field, wanted in (("output_s19", args.s19), ("output_ihex", args.ihex),
+                                                                      ("output_bin", args.bin), ("output_sym", args.sym))
+                                          if wanted],
+                           s19_record_length=args.s19_record_length, ihex_record_length=args.ihex_record_length,
+                           bin_fill=args.bin_fill, listing_format=listing_format, symbol_files=args.symbols,
+                           image_only=args.image_only, optimize=args.optimize, peephole=peephole))
+
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+    assemble_file(args.input_files[0], args.output_list, args.output_hex, single_pass=args.single_pass, cache=cache,
+                  output_s19_filepath=output_s19, s19_record_length=args.s19_record_length,
+                  output_ihex_filepath=output_ihex, ihex_record_length=args.ihex_record_length,
+                  output_bin_filepath=output_bin, bin_fill=args.bin_fill, listing_format=listing_format,
+                  symbol_files=args.symbols, output_sym_filepath=output_sym, image_only=args.image_only,
+                  optimize=args.optimize, peephole=peephole, pass2_workers=args.pass2_jobs or None)
@@ -0,0 +1,24 @@
+; tests/expression_ops.asm
+; Operand İfadesi Testleri (öncelik, parantez, '*', '<' / '>')
+
+        ORG     $0400
+
+BUF_LEN EQU     4*8+2       ; Öncelik: 34
+HERE    EQU     *           ; Konum sayacı: $0400
+
+START   LDAA    #BUF_LEN-2  ; Immediate ifade
+        LDAB    #(BUF_LEN-2)/4
+        LDX     #TABLE+2    ; İleri referanslı ifade
+        LDAA    #<TABLE     ; Düşük byte
+        LDAB    #>TABLE     ; Yüksek byte
+        STAA    <VAR        ; '<' ile Direct
+        LDAA    $10+2       ; Sabit ifade: Direct
+        JMP     *+3         ; Sonraki komuta atla
+WAIT    BRA     *           ; Kendine dallanma
+
+VAR     EQU     $0080
+        ORG     $0500
+TABLE   FCB     1+2, %11<<2, $F0|$0F
+        FDB     TABLE+BUF_LEN, *, START_END-START
+START_END
+        END